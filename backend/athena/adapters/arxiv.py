@@ -219,6 +219,11 @@ class ArxivProvider(BaseSearchProvider):
             arxiv_id = self._extract_arxiv_id(entry_id)
 
             external_id = doi if doi else arxiv_id
+            identifiers = {}
+            if doi:
+                identifiers["doi"] = doi
+            if arxiv_id:
+                identifiers["arxiv"] = arxiv_id
 
             # PDF URL
             pdf_url = self._extract_pdf_url(entry.get("links", []))
@@ -237,6 +242,7 @@ class ArxivProvider(BaseSearchProvider):
                 source=PaperSource.ARXIV,
                 external_id=external_id,
                 pdf_url=pdf_url,
+                identifiers=identifiers,
             )
             papers.append(paper)
 
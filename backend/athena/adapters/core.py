@@ -165,6 +165,11 @@ class CoreProvider(BaseSearchProvider):
             # External ID: DOI varsa DOI, yoksa CORE ID
             core_id = str(item.get("id", ""))
             external_id = doi if doi else core_id
+            identifiers = {}
+            if doi:
+                identifiers["doi"] = doi
+            if core_id:
+                identifiers["core"] = core_id
 
             # PDF URL (downloadUrl alanini kullan)
             pdf_url = item.get("downloadUrl")
@@ -187,6 +192,7 @@ class CoreProvider(BaseSearchProvider):
                 source=PaperSource.CORE,
                 external_id=external_id,
                 pdf_url=pdf_url,
+                identifiers=identifiers,
             )
             papers.append(paper)
 
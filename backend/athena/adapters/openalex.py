@@ -163,6 +163,13 @@ class OpenAlexProvider(BaseSearchProvider):
             if doi and doi.startswith("https://doi.org/"):
                 doi = doi.replace("https://doi.org/", "")
 
+            # Tum kimlikler (OpenAlex work ID: https://openalex.org/W...)
+            identifiers = {}
+            if doi:
+                identifiers["doi"] = doi
+            if item.get("id"):
+                identifiers["openalex"] = item["id"]
+
             # PDF URL mapping (best_oa_location.pdf_url)
             best_oa_location = item.get("best_oa_location") or {}
             pdf_url = best_oa_location.get("pdf_url")
@@ -184,6 +191,7 @@ class OpenAlexProvider(BaseSearchProvider):
                 source=PaperSource.OPENALEX,
                 external_id=doi,
                 pdf_url=pdf_url,
+                identifiers=identifiers,
             )
             papers.append(paper)
 
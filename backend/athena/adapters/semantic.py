@@ -153,6 +153,15 @@ class SemanticScholarProvider(BaseSearchProvider):
             # External ID mapping (DOI oncelikli, yoksa paperId)
             external_ids = item.get("externalIds") or {}
             external_id = external_ids.get("DOI") or item.get("paperId")
+            identifiers = {
+                scheme: str(value)
+                for scheme, value in (
+                    ("doi", external_ids.get("DOI")),
+                    ("arxiv", external_ids.get("ArXiv")),
+                    ("s2", item.get("paperId")),
+                )
+                if value
+            }
 
             # PDF URL mapping
             open_access_pdf = item.get("openAccessPdf") or {}
@@ -168,6 +177,7 @@ class SemanticScholarProvider(BaseSearchProvider):
                 source=PaperSource.SEMANTIC,
                 external_id=external_id,
                 pdf_url=pdf_url,
+                identifiers=identifiers,
             )
             results.append(paper)
 
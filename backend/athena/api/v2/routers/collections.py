@@ -9,7 +9,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from athena.core.database import get_db
+from athena.core.database import get_db, get_read_db
 from athena.models.associations import collection_entries
 from athena.models.collection import Collection
 from athena.models.library import LibraryEntry
@@ -138,7 +138,7 @@ class EntryCollectionsResponse(BaseModel):
     response_description="Tüm koleksiyonlar ve makale sayıları",
 )
 async def list_collections(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CollectionListResponse:
     """Sistemdeki tüm koleksiyonları (projeleri) listeler.
 
@@ -399,7 +399,7 @@ async def remove_entry_from_collection(
 )
 async def get_entry_collections(
     entry_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> EntryCollectionsResponse:
     """Belirtilen library entry'nin hangi koleksiyonlara ait olduğunu döndürür.
 
@@ -1,3 +1,5 @@
+import asyncio
+from dataclasses import asdict
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
@@ -12,98 +14,43 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from athena.core.cache import get_redis
+from athena.core.celery_app import queue_depths
 from athena.core.config import get_settings
-from athena.core.database import get_db
-from athena.core.file_paths import resolve_data_file_path, to_relative_data_path
-from athena.models.associations import collection_entries
-from athena.models.author import Author
+from athena.core.database import get_db, get_read_db
+from athena.core.download_telemetry import ANALYTICS_MAX_HOURS
+from athena.core.file_paths import resolve_data_file_path
+from athena.core.oa_cache import OaLookupCache
+from athena.core.task_queues import QUEUE_BULK, QUEUE_INTERACTIVE
 from athena.models.library import DownloadStatus, LibraryEntry
+from athena.models.library_read_model import LibraryReadModel
 from athena.models.paper import Paper
-from athena.models.tag import Tag
 from athena.schemas.library import (
+    DownloadAnalyticsResponse,
     LibraryEntrySchema,
+    LibraryFacetsResponse,
     LibraryListResponse,
-    PaperDetailSchema,
-    TagSchema,
 )
-from athena.schemas.search import AuthorSchema, PaperResponse, PaperSource
+from athena.schemas.search import PaperResponse
+from athena.services.download_analytics import DownloadAnalyticsService
+from athena.services.enrichment import MetadataEnrichmentService
 from athena.services.export import ExportService
+from athena.services.facets import LibraryFacetService
+from athena.services.ingest import IngestJobService
 from athena.services.library import LibraryService
+from athena.services.saved_index import SavedPaperIndex
 from athena.tasks.downloader import (
     download_paper_task,
+    enqueue_downloads,
     retry_all_incomplete_downloads,
     retry_stuck_downloads,
 )
+from athena.tasks.enrichment import enrich_metadata_task
+from athena.tasks.ingest import ingest_papers_task
 
 router = APIRouter(prefix="/library", tags=["Library"])
 
 
-def _apply_library_filters(
-    query,
-    tag: Optional[str] = None,
-    status: Optional[str] = None,
-    min_citations: Optional[int] = None,
-    year_start: Optional[int] = None,
-    year_end: Optional[int] = None,
-    search: Optional[str] = None,
-    collection_id: Optional[int] = None,
-):
-    """Library listeleme ve ZIP indirme endpointleri icin ortak filtre uygulayici."""
-    query = query.join(LibraryEntry.paper)
-
-    if collection_id is not None:
-        query = query.where(
-            LibraryEntry.id.in_(
-                select(collection_entries.c.entry_id).where(
-                    collection_entries.c.collection_id == collection_id
-                )
-            )
-        )
-
-    if status:
-        try:
-            status_enum = DownloadStatus(status.lower())
-            query = query.where(LibraryEntry.download_status == status_enum)
-        except ValueError:
-            pass
-
-    if tag:
-        query = query.join(LibraryEntry.tags).where(Tag.name == tag.lower())
-
-    if min_citations is not None:
-        query = query.where(Paper.citation_count >= min_citations)
-
-    if year_start is not None:
-        query = query.where(Paper.year >= year_start)
-    if year_end is not None:
-        query = query.where(Paper.year <= year_end)
-
-    if search:
-        search_term = f"%{search.lower()}%"
-        ts_query = func.websearch_to_tsquery("english", search)
-        fts_match = Paper.search_vector.op("@@")(ts_query)
-        author_subquery = (
-            select(LibraryEntry.id)
-            .join(LibraryEntry.paper)
-            .join(Paper.authors)
-            .where(func.lower(Author.name).like(search_term))
-        )
-        tag_subquery = (
-            select(LibraryEntry.id)
-            .join(LibraryEntry.tags)
-            .where(func.lower(Tag.name).like(search_term))
-        )
-        fallback_match = (
-            func.lower(Paper.title).like(search_term)
-            | func.lower(func.coalesce(Paper.abstract, "")).like(search_term)
-            | LibraryEntry.id.in_(author_subquery)
-            | LibraryEntry.id.in_(tag_subquery)
-        )
-        query = query.where(fts_match | fallback_match)
-
-    return query
-
-
 class IngestRequest(BaseModel):
     """Kütüphaneye makale ekleme isteği."""
 
@@ -149,6 +96,7 @@ async def ingest_paper(
     logger.info(
         f"Paper added to library: entry_id={entry.id}, paper_id={entry.paper_id}"
     )
+    await SavedPaperIndex().add([request.paper])
 
     # 2. Download task'i kuyruğa ekle (broker bağlantı hatası olabilir)
     status = "queued"
@@ -163,14 +111,18 @@ async def ingest_paper(
     return IngestResponse(status=status, entry_id=entry.id)
 
 
+# Toplu eklemede tek istekte kabul edilen makale sayısı
+BULK_INGEST_MAX_PAPERS = 5000
+
+
 class BulkIngestRequest(BaseModel):
     """Toplu kütüphaneye ekleme isteği."""
 
     papers: list[PaperResponse] = Field(
         ...,
         min_length=1,
-        max_length=100,
-        description="Eklenecek makale listesi (maks. 100)",
+        max_length=BULK_INGEST_MAX_PAPERS,
+        description=f"Eklenecek makale listesi (maks. {BULK_INGEST_MAX_PAPERS})",
     )
     search_query: str = Field(
         default="",
@@ -206,8 +158,11 @@ class CheckLibraryRequest(BaseModel):
         ...,
         min_length=1,
         max_length=5000,
-        description="Kontrol edilecek external ID (DOI) listesi",
-        examples=[["10.1038/s41586-021-03819-2", "10.48550/arXiv.1706.03762"]],
+        description=(
+            "Kontrol edilecek external ID listesi "
+            "(DOI, arXiv, Semantic Scholar, OpenAlex veya CORE ID)"
+        ),
+        examples=[["10.1038/s41586-021-03819-2", "1706.03762"]],
     )
 
 
@@ -229,11 +184,12 @@ class CheckLibraryResponse(BaseModel):
 )
 async def check_library_papers(
     request: CheckLibraryRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CheckLibraryResponse:
     """Verilen external ID listesinin kütüphanede kayıtlı olup olmadığını toplu kontrol eder.
 
     Frontend'de arama sonuçlarındaki \"zaten kayıtlı\" durumunu göstermek için kullanılır.
+    Her ID, türü tahmin edilip `paper_identifiers` tablosunda indeksli olarak aranır.
     """
     service = LibraryService(db)
     saved_ids = await service.get_saved_external_ids(request.external_ids)
@@ -305,52 +261,192 @@ async def bulk_ingest_papers(
 ) -> BulkIngestResponse:
     """Birden fazla makaleyi tek seferde kütüphaneye ekler.
 
-    - Maksimum 100 makale gönderilebilir.
-    - Her makale için tekilleştirme kontrolü yapılır.
-    - Mükerrer makaleler atlanır, başarısız olanlar sayılır.
-    - Başarılı eklemeler için PDF indirme görevleri kuyruğa eklenir.
+    - Maksimum 5000 makale gönderilebilir.
+    - Tekilleştirme (DOI / başlık) ve kayıt, tablo başına toplu
+      `INSERT ... ON CONFLICT` sorgularıyla tek transaction'da yapılır.
+    - Mükerrer makaleler atlanır; transaction başarısız olursa tüm
+      makaleler başarısız sayılır.
+    - Başarılı eklemelerin PDF indirmeleri, worker başına eşzamanlı çalışan
+      toplu indirme görevleri olarak kuyruğa eklenir. Tek batch'e sığan küçük
+      eklemeler interaktif kuyruğa, daha büyükleri toplu kuyruğa gider.
     """
     service = LibraryService(db)
-    entry_ids: list[int] = []
-    duplicate_count = 0
-    failed_count = 0
+    result = await service.bulk_add_papers(request.papers, request.search_query)
+    if not result.failed_count:
+        await SavedPaperIndex().add(request.papers)
 
-    for idx, paper in enumerate(request.papers):
+    if result.entry_ids:
+        small = len(result.entry_ids) <= get_settings().download_batch_size
         try:
-            # Duplikasyon kontrolu
-            if await service.is_paper_in_library(paper):
-                duplicate_count += 1
-                continue
-
-            # add_paper_to_library her başarılı makaleyi kendi commit'ler.
-            # Hata durumunda session rollback ile temizlenir,
-            # önceden commit'lenmiş makaleler güvende kalır.
-            entry = await service.add_paper_to_library(
-                paper, request.search_query
+            enqueue_downloads(
+                result.entry_ids, queue=QUEUE_INTERACTIVE if small else QUEUE_BULK
             )
-            entry_ids.append(entry.id)
-            try:
-                download_paper_task.delay(entry_id=entry.id)
-            except Exception:
-                pass
         except Exception as e:
+            # Broker hatası olursa makaleler yine de kaydedilmiş olur
             logger.warning(
-                f"Bulk ingest skipped [{idx+1}/{len(request.papers)}]: "
-                f"{paper.title[:80]} - {type(e).__name__}: {e}"
+                f"Could not queue {len(result.entry_ids)} download tasks: {e}"
             )
-            failed_count += 1
-            try:
-                await db.rollback()
-            except Exception:
-                logger.error("Rollback failed during bulk ingest, recreating session state")
-            continue
+
+    logger.info(
+        f"Bulk ingest: added={len(result.entry_ids)}, "
+        f"duplicates={result.duplicate_count}, failed={result.failed_count}"
+    )
 
     return BulkIngestResponse(
-        status="queued" if entry_ids else "no_new_papers",
-        added_count=len(entry_ids),
-        duplicate_count=duplicate_count,
-        failed_count=failed_count,
-        entry_ids=entry_ids,
+        status="queued" if result.entry_ids else "no_new_papers",
+        added_count=len(result.entry_ids),
+        duplicate_count=result.duplicate_count,
+        failed_count=result.failed_count,
+        entry_ids=result.entry_ids,
+    )
+
+
+# Arka plan ingest job'inda tek istekte kabul edilen makale sayısı
+INGEST_JOB_MAX_PAPERS = 20000
+
+
+class IngestJobRequest(BaseModel):
+    """Arka plan toplu ekleme job isteği."""
+
+    papers: list[PaperResponse] = Field(
+        ...,
+        min_length=1,
+        max_length=INGEST_JOB_MAX_PAPERS,
+        description=f"Eklenecek makale listesi (maks. {INGEST_JOB_MAX_PAPERS})",
+    )
+    search_query: str = Field(
+        default="",
+        max_length=500,
+        description="Arama terimi (etiketleme için)",
+        examples=["neural networks"],
+    )
+
+
+class IngestJobCreateResponse(BaseModel):
+    """Toplu ekleme job'i başlatma yanıtı."""
+
+    status: str = Field(
+        ..., description="İşlem durumu (queued veya error)", examples=["queued"]
+    )
+    message: str = Field(
+        ...,
+        description="Sonuç mesajı",
+        examples=["Toplu ekleme islemi kuyruga eklendi"],
+    )
+    job_id: int = Field(..., description="Ingest job ID", examples=[12])
+    total: int = Field(..., description="Eklenecek makale sayısı", examples=[2000])
+
+
+class IngestJobResponse(BaseModel):
+    """Toplu ekleme job ilerleme yanıtı."""
+
+    id: int = Field(..., description="Job ID", examples=[12])
+    status: str = Field(
+        ...,
+        description="Job durumu (queued, running, completed, failed)",
+        examples=["running"],
+    )
+    total: int = Field(default=0, description="Toplam makale sayısı", examples=[2000])
+    processed: int = Field(
+        default=0, description="İşlenen makale sayısı", examples=[500]
+    )
+    added_count: int = Field(
+        default=0, description="Yeni eklenen makale sayısı", examples=[420]
+    )
+    duplicate_count: int = Field(
+        default=0, description="Zaten kayıtlı mükerrer sayısı", examples=[75]
+    )
+    failed_count: int = Field(
+        default=0, description="Başarısız ekleme sayısı", examples=[5]
+    )
+    progress: float = Field(
+        default=0.0, description="İlerleme yüzdesi (0-100)", examples=[25.0]
+    )
+    entry_ids: list[int] = Field(
+        default_factory=list,
+        description="Şu ana kadar eklenen makalelerin entry ID listesi",
+    )
+    error_message: Optional[str] = Field(
+        default=None, description="Job hata mesajı (varsa)"
+    )
+    created_at: datetime = Field(..., description="Job oluşturulma tarihi")
+    updated_at: datetime = Field(..., description="Son ilerleme tarihi")
+    finished_at: Optional[datetime] = Field(
+        default=None, description="Job bitiş tarihi"
+    )
+
+
+@router.post(
+    "/ingest-jobs",
+    response_model=IngestJobCreateResponse,
+    summary="Arka Planda Toplu Makale Ekleme",
+    response_description="Başlatılan ingest job'inin ID'si",
+)
+async def create_ingest_job(
+    request: IngestJobRequest,
+    db: AsyncSession = Depends(get_db),
+) -> IngestJobCreateResponse:
+    """Büyük makale listelerini arka planda kütüphaneye ekler.
+
+    - İstek hemen döner; ekleme Celery worker'ında batch'ler halinde yapılır.
+    - İlerleme, mükerrer ve başarısız sayıları
+      `GET /library/ingest-jobs/{job_id}` ile takip edilir.
+    - İstemci bağlantısı kopsa da job çalışmaya devam eder.
+    """
+    service = IngestJobService(db)
+    job = await service.create_job(request.papers, request.search_query)
+    # Worker'in job'i gorebilmesi icin kuyruga eklemeden once commit et
+    await db.commit()
+
+    try:
+        ingest_papers_task.delay(job_id=job.id)
+        logger.info(f"Ingest task queued: job_id={job.id}, total={job.total}")
+        status = "queued"
+        message = "Toplu ekleme islemi kuyruga eklendi"
+    except Exception as e:
+        logger.error(f"Failed to queue ingest task: job_id={job.id}, {e}")
+        status = "error"
+        message = f"Gorev kuyruga eklenemedi: {e}"
+
+    return IngestJobCreateResponse(
+        status=status, message=message, job_id=job.id, total=job.total
+    )
+
+
+@router.get(
+    "/ingest-jobs/{job_id}",
+    response_model=IngestJobResponse,
+    summary="Toplu Ekleme Job Durumu",
+    response_description="Job ilerlemesi ve sayaçları",
+)
+async def get_ingest_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> IngestJobResponse:
+    """Arka planda çalışan toplu ekleme job'inin ilerlemesini döndürür."""
+    service = IngestJobService(db)
+    job = await service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingest job bulunamadi")
+
+    progress = 100.0 if job.status == "completed" else 0.0
+    if job.total and job.status != "completed":
+        progress = round(min(job.processed / job.total, 1.0) * 100, 1)
+
+    return IngestJobResponse(
+        id=job.id,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        added_count=job.added,
+        duplicate_count=job.duplicates,
+        failed_count=job.failed,
+        progress=progress,
+        entry_ids=job.entry_ids,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
     )
 
 
@@ -383,7 +479,18 @@ async def list_library(
     collection_id: Optional[int] = Query(
         default=None, description="Koleksiyon ID filtresi"
     ),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Önceki yanıttaki next_cursor (verilirse page yok sayılır)",
+    ),
+    count_mode: Literal["exact", "auto"] = Query(
+        default="exact",
+        description=(
+            "Toplam sayım modu: exact (tam sayım) veya auto "
+            "(büyük sonuçlarda planner tahmini)"
+        ),
+    ),
+    db: AsyncSession = Depends(get_read_db),
 ) -> LibraryListResponse:
     """Kütüphanedeki makaleleri filtreli ve sayfalanmış olarak listeler.
 
@@ -394,9 +501,19 @@ async def list_library(
     - `year_start` / `year_end`: Yayın yılı aralığı
     - `search`: PostgreSQL FTS ile başlık/özet/yazar/etiket araması
     - `collection_id`: Belirli bir koleksiyondaki makaleler
+
+    **Sayfalama:** `page`/`limit` geriye dönük uyumluluk için desteklenir.
+    Büyük kütüphanelerde yanıttaki `next_cursor` değeri `cursor` parametresiyle
+    gönderilerek keyset sayfalama yapılır; her sayfanın maliyeti sabittir.
+
+    **Toplam Sayım:** `count_mode=auto` ile eşik değerin üzerindeki sonuçlarda
+    `total` PostgreSQL planner tahmininden gelir; `total_is_exact` bunu belirtir.
+
+    **Dosya Durumu:** Liste isteği dosya sistemine erişmez; eksik PDF'ler ve
+    legacy path'ler periyodik uzlaştırma görevi tarafından düzeltilir.
     """
     service = LibraryService(db)
-    entries, total = await service.get_library_entries(
+    library_page = await service.get_library_entries(
         page=page,
         limit=limit,
         tag=tag,
@@ -406,67 +523,67 @@ async def list_library(
         year_end=year_end,
         search=search,
         collection_id=collection_id,
+        cursor=cursor,
+        count_mode=count_mode,
     )
-
-    # "completed" kayitlarin file_path degerini normalize et ve
-    # fiziksel dosyasi olmayanlari otomatik iyilestir.
-    settings = get_settings()
-    data_dir = Path(settings.data_dir)
-    status_repaired = False
-    for entry in entries:
-        if entry.download_status == DownloadStatus.COMPLETED and entry.file_path:
-            resolved = resolve_data_file_path(entry.file_path, data_dir)
-            if resolved is None:
-                entry.download_status = DownloadStatus.FAILED
-                entry.file_path = None
-                status_repaired = True
-                continue
-
-            # Legacy absolute path'leri relative formata cevir.
-            normalized_relative = to_relative_data_path(resolved, data_dir)
-
-            if normalized_relative != entry.file_path:
-                entry.file_path = normalized_relative
-                status_repaired = True
-
-    if status_repaired:
-        await db.commit()
-
-    # Convert to schema
-    items = []
-    for entry in entries:
-        # Paper authors'ı yükle
-        await db.refresh(entry.paper, ["authors"])
-
-        paper_schema = PaperDetailSchema(
-            id=entry.paper.id,
-            title=entry.paper.title,
-            abstract=entry.paper.abstract,
-            year=entry.paper.year,
-            citation_count=entry.paper.citation_count,
-            venue=entry.paper.venue,
-            doi=entry.paper.doi,
-            pdf_url=entry.paper.pdf_url,
-            authors=[AuthorSchema(name=a.name) for a in entry.paper.authors],
-            created_at=entry.paper.created_at,
-        )
-
-        entry_schema = LibraryEntrySchema(
-            id=entry.id,
-            source=PaperSource(entry.source.value),
-            download_status=entry.download_status.value,
-            file_path=entry.file_path,
-            is_favorite=entry.is_favorite,
-            tags=[TagSchema(id=t.id, name=t.name) for t in entry.tags],
-            paper=paper_schema,
-        )
-        items.append(entry_schema)
+    # Okuma modelindeki display JSON'u LibraryEntrySchema ile birebir aynidir
+    items = [
+        LibraryEntrySchema.model_validate(row.display) for row in library_page.entries
+    ]
 
     return LibraryListResponse(
         items=items,
-        total=total,
+        total=library_page.total,
+        total_is_exact=library_page.total_is_exact,
         page=page,
         limit=limit,
+        next_cursor=library_page.next_cursor,
+    )
+
+
+@router.get(
+    "/facets",
+    response_model=LibraryFacetsResponse,
+    summary="Kütüphane Facet Sayıları",
+    response_description="Yıl, etiket, durum, kaynak ve koleksiyon dağılımları",
+)
+async def get_library_facets(
+    tag: Optional[str] = Query(default=None, description="Etikete göre filtrele"),
+    status: Optional[str] = Query(
+        default=None, description="İndirme durumuna göre filtrele"
+    ),
+    min_citations: Optional[int] = Query(
+        default=None, ge=0, description="Minimum atıf sayısı"
+    ),
+    year_start: Optional[int] = Query(
+        default=None, ge=1900, le=2100, description="Başlangıç yılı"
+    ),
+    year_end: Optional[int] = Query(
+        default=None, ge=1900, le=2100, description="Bitiş yılı"
+    ),
+    search: Optional[str] = Query(
+        default=None, description="Başlık, yazar veya etiket araması"
+    ),
+    collection_id: Optional[int] = Query(
+        default=None, description="Koleksiyon ID filtresi"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> LibraryFacetsResponse:
+    """Filtrelenmiş kütüphane için facet histogramlarını döndürür.
+
+    Kütüphane listeleme ile aynı filtre parametrelerini destekler. Tüm
+    dağılımlar tek bir GROUPING SETS sorgusuyla hesaplanır ve filtre imzası
+    başına cache'lenir; kütüphanedeki her değişiklik cache'i geçersiz kılar.
+    """
+    service = LibraryFacetService(db)
+    return await service.get_facets(
+        tag=tag,
+        status=status,
+        min_citations=min_citations,
+        year_start=year_start,
+        year_end=year_end,
+        search=search,
+        collection_id=collection_id,
     )
 
 
@@ -495,18 +612,19 @@ async def download_zip_archive(
     collection_id: Optional[int] = Query(
         default=None, description="Koleksiyon ID filtresi"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> StreamingResponse:
     """Filtrelenmiş ve indirilmeye hazır PDF dosyalarını ZIP arşivi olarak döndürür.
 
     Yalnızca `download_status=completed` olan ve fiziksel dosyası mevcut olan makaleler dahil edilir.
     Kütüphane listeleme ile aynı filtre parametrelerini destekler.
     """
-    query = select(LibraryEntry).options(
-        joinedload(LibraryEntry.paper),
-        joinedload(LibraryEntry.tags),
+    # Yalnizca dosya yolu gereken kolonlar okuma modelinden cekilir
+    query = select(LibraryReadModel.entry_id, LibraryReadModel.file_path).where(
+        LibraryReadModel.download_status == DownloadStatus.COMPLETED.value,
+        LibraryReadModel.file_path.is_not(None),
     )
-    query = _apply_library_filters(
+    query, _ = LibraryService.apply_library_filters(
         query=query,
         tag=tag,
         status=status,
@@ -515,10 +633,11 @@ async def download_zip_archive(
         year_end=year_end,
         search=search,
         collection_id=collection_id,
-    ).order_by(LibraryEntry.id.desc())
+    )
+    query = query.order_by(LibraryReadModel.entry_id.desc())
 
     result = await db.execute(query)
-    entries = result.unique().scalars().all()
+    rows = result.all()
 
     settings = get_settings()
     data_dir = Path(settings.data_dir)
@@ -527,17 +646,12 @@ async def download_zip_archive(
     added_count = 0
 
     with ZipFile(zip_buffer, mode="w", compression=ZIP_DEFLATED) as archive:
-        for entry in entries:
-            if entry.download_status != DownloadStatus.COMPLETED:
-                continue
-            if not entry.file_path:
-                continue
-
-            resolved = resolve_data_file_path(entry.file_path, data_dir)
+        for entry_id, file_path in rows:
+            resolved = resolve_data_file_path(file_path, data_dir)
             if not resolved:
                 continue
 
-            arc_name = f"{entry.id}_{resolved.name}"
+            arc_name = f"{entry_id}_{resolved.name}"
             archive.write(resolved, arcname=arc_name)
             added_count += 1
 
@@ -620,18 +734,40 @@ class DownloadStatsResponse(BaseModel):
     failed: int = Field(default=0, description="Başarısız indirme sayısı", examples=[5])
     total: int = Field(default=0, description="Toplam kayıt sayısı", examples=[129])
     failed_entries: list[dict] = Field(
-        default_factory=list, description="Başarısız kayıtların detayları"
+        default_factory=list,
+        description=(
+            "Başarısız kayıtların detayları; `oa_location` cache'lenmiş "
+            "Unpaywall/CORE sonucudur (url null ise açık erişim bulunamadı)"
+        ),
+    )
+    queues: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Celery kuyruklarında bekleyen görev sayısı (interactive, bulk, "
+            "maintenance, enrichment); broker erişilemezse boş"
+        ),
+        examples=[{"interactive": 0, "bulk": 42, "maintenance": 0, "enrichment": 0}],
     )
 
 
 class EnrichMetadataResponse(BaseModel):
-    """Eksik metadata tamamlama yanıtı."""
+    """Eksik metadata tamamlama job'i başlatma yanıtı."""
 
-    status: str = Field(..., description="İşlem durumu", examples=["completed"])
+    status: str = Field(
+        ...,
+        description="İşlem durumu (queued, running veya error)",
+        examples=["queued"],
+    )
     message: str = Field(
         ...,
         description="Sonuç mesajı",
-        examples=["Eksik metadata tamamlama islemi tamamlandi"],
+        examples=["Eksik metadata tamamlama islemi kuyruga eklendi"],
+    )
+    job_id: Optional[int] = Field(
+        default=None, description="Metadata tamamlama job ID", examples=[7]
+    )
+    total: int = Field(
+        default=0, description="Tamamlanacak toplam kayıt sayısı", examples=[1200]
     )
     processed: int = Field(default=0, description="İşlenen kayıt sayısı", examples=[20])
     updated: int = Field(
@@ -639,8 +775,41 @@ class EnrichMetadataResponse(BaseModel):
     )
     skipped: int = Field(default=0, description="Atlanan kayıt sayısı", examples=[3])
     failed: int = Field(default=0, description="Başarısız kayıt sayısı", examples=[2])
-    details: list[dict] = Field(
-        default_factory=list, description="Kayıt bazlı işlem detayları"
+
+
+class EnrichmentJobResponse(BaseModel):
+    """Metadata tamamlama job ilerleme yanıtı."""
+
+    id: int = Field(..., description="Job ID", examples=[7])
+    status: str = Field(
+        ...,
+        description="Job durumu (queued, running, completed, failed)",
+        examples=["running"],
+    )
+    total: int = Field(
+        default=0, description="Tamamlanacak toplam kayıt sayısı", examples=[1200]
+    )
+    processed: int = Field(
+        default=0, description="İşlenen kayıt sayısı", examples=[350]
+    )
+    updated: int = Field(
+        default=0, description="Güncellenen kayıt sayısı", examples=[280]
+    )
+    skipped: int = Field(default=0, description="Atlanan kayıt sayısı", examples=[60])
+    failed: int = Field(default=0, description="Başarısız kayıt sayısı", examples=[10])
+    progress: float = Field(
+        default=0.0, description="İlerleme yüzdesi (0-100)", examples=[29.2]
+    )
+    last_entry_id: int = Field(
+        default=0, description="Son işlenen entry ID (checkpoint)", examples=[4512]
+    )
+    error_message: Optional[str] = Field(
+        default=None, description="Job hata mesajı (varsa)"
+    )
+    created_at: datetime = Field(..., description="Job oluşturulma tarihi")
+    updated_at: datetime = Field(..., description="Son ilerleme tarihi")
+    finished_at: Optional[datetime] = Field(
+        default=None, description="Job bitiş tarihi"
     )
 
 
@@ -648,29 +817,87 @@ class EnrichMetadataResponse(BaseModel):
     "/enrich-metadata",
     response_model=EnrichMetadataResponse,
     summary="Eksik Metadata Tamamlama",
-    response_description="İşlenen, güncellenen, atlanan ve başarısız kayıt sayıları",
+    response_description="Başlatılan arka plan job'inin ID'si ve durumu",
 )
 async def enrich_metadata(
-    limit: int = Query(
-        default=20, ge=1, le=100, description="Maksimum islenecek kayit"
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        description="Maksimum islenecek kayit (bos birakilirsa tum kutuphane)",
     ),
     db: AsyncSession = Depends(get_db),
 ) -> EnrichMetadataResponse:
-    """Kütüphanedeki eksik metadata alanlarını (yıl, atıf, özet vb.) dış kaynaklardan tamamlar.
+    """Kütüphanedeki eksik metadata alanlarını (yıl, atıf, özet vb.) arka planda tamamlar.
 
-    DOI veya başlık kullanarak Crossref ve OpenAlex'ten güncel bilgileri çeker.
+    DOI veya başlık kullanarak dış kaynaklardan güncel bilgileri çeker.
+    İşlem Celery üzerinde batch'ler halinde çalışır; ilerleme
+    `GET /library/enrich-metadata/jobs/{job_id}` ile takip edilir.
+    Tamamlanmamış bir job varsa yenisi açılmaz, mevcut job kaldığı yerden devam eder.
     """
-    service = LibraryService(db)
-    result = await service.enrich_missing_metadata(limit=limit)
+    service = MetadataEnrichmentService(db)
+    job, should_enqueue = await service.create_or_resume_job(max_entries=limit)
+    # Worker'in job'i gorebilmesi icin kuyruga eklemeden once commit et
+    await db.commit()
+
+    status = job.status
+    message = "Metadata tamamlama islemi zaten devam ediyor"
+    if should_enqueue:
+        try:
+            enrich_metadata_task.delay(job_id=job.id)
+            logger.info(f"Enrichment task queued: job_id={job.id}")
+            status = "queued"
+            message = "Eksik metadata tamamlama islemi kuyruga eklendi"
+        except Exception as e:
+            logger.error(f"Failed to queue enrichment task: job_id={job.id}, {e}")
+            status = "error"
+            message = f"Gorev kuyruga eklenemedi: {e}"
 
     return EnrichMetadataResponse(
-        status="completed",
-        message="Eksik metadata tamamlama islemi tamamlandi",
-        processed=result["processed"],
-        updated=result["updated"],
-        skipped=result["skipped"],
-        failed=result["failed"],
-        details=result["details"],
+        status=status,
+        message=message,
+        job_id=job.id,
+        total=job.total,
+        processed=job.processed,
+        updated=job.updated,
+        skipped=job.skipped,
+        failed=job.failed,
+    )
+
+
+@router.get(
+    "/enrich-metadata/jobs/{job_id}",
+    response_model=EnrichmentJobResponse,
+    summary="Metadata Tamamlama Job Durumu",
+    response_description="Job ilerlemesi ve sayaçları",
+)
+async def get_enrichment_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> EnrichmentJobResponse:
+    """Arka planda çalışan metadata tamamlama job'inin ilerlemesini döndürür."""
+    service = MetadataEnrichmentService(db)
+    job = await service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Enrichment job bulunamadi")
+
+    progress = 100.0 if job.status == "completed" else 0.0
+    if job.total and job.status != "completed":
+        progress = round(min(job.processed / job.total, 1.0) * 100, 1)
+
+    return EnrichmentJobResponse(
+        id=job.id,
+        status=job.status,
+        total=job.total,
+        processed=job.processed,
+        updated=job.updated,
+        skipped=job.skipped,
+        failed=job.failed,
+        progress=progress,
+        last_entry_id=job.last_entry_id,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        finished_at=job.finished_at,
     )
 
 
@@ -681,12 +908,14 @@ async def enrich_metadata(
     response_description="Durum bazlı indirme sayıları ve başarısız kayıt detayları",
 )
 async def download_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> DownloadStatsResponse:
     """PDF indirme durumu istatistiklerini döndürür.
 
     Her durum (pending, downloading, completed, failed) için sayım yapar.
-    Başarısız kayıtların detaylarını (id, başlık, son güncelleme) içerir.
+    Başarısız kayıtların detaylarını (id, başlık, son güncelleme) ve DOI'leri
+    için cache'lenmiş açık erişim arama sonucunu içerir. `queues` alanı
+    kuyruk başına bekleyen görev sayısıdır.
     """
     # Status bazli sayimlar
     count_query = select(
@@ -712,8 +941,16 @@ async def download_stats(
     failed_result = await db.execute(failed_query)
     failed_entries_list = failed_result.unique().scalars().all()
 
+    # Indirme worker'larinin cache'ledigi OA sonuclari (tek MGET)
+    dois = [e.paper.doi for e in failed_entries_list if e.paper and e.paper.doi]
+    oa_lookups = await OaLookupCache(get_redis()).get_many(dois)
+
     failed_entries = []
     for entry in failed_entries_list:
+        lookups = oa_lookups.get(entry.paper.doi, []) if entry.paper else []
+        # Bulunan URL varsa o, yoksa "bulunamadi" cevabi gosterilir
+        found = [lookup for lookup in lookups if lookup.url]
+        oa_location = (found or lookups or [None])[0]
         failed_entries.append(
             {
                 "id": entry.id,
@@ -722,6 +959,7 @@ async def download_stats(
                 "updated_at": entry.updated_at.isoformat()
                 if entry.updated_at
                 else None,
+                "oa_location": asdict(oa_location) if oa_location else None,
             }
         )
 
@@ -732,6 +970,37 @@ async def download_stats(
         failed=failed,
         total=pending + downloading + completed + failed,
         failed_entries=failed_entries,
+        queues=await asyncio.to_thread(queue_depths),
+    )
+
+
+@router.get(
+    "/download-analytics",
+    response_model=DownloadAnalyticsResponse,
+    summary="İndirme Stratejisi Analizi",
+    response_description="Strateji ve host bazında başarı oranı, süre ve byte",
+)
+async def download_analytics(
+    hours: int = Query(
+        default=24,
+        ge=1,
+        le=ANALYTICS_MAX_HOURS,
+        description="Zaman penceresi (saat, en fazla 30 gün)",
+    ),
+    host_limit: int = Query(
+        default=50, ge=1, le=500, description="En çok denenen kaç host döndürülür"
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> DownloadAnalyticsResponse:
+    """İndirme denemesi telemetrisini strateji ve host bazında özetler.
+
+    Her fallback stratejisi, orijinal URL ve EZProxy denemesi kaydedilir.
+    Başarı oranı hedged modda iptal edilen denemeler hariç hesaplanır;
+    p50/p95 süreleri başarılı denemelerindir. `timeline` 48 saate kadar
+    saatlik, daha uzun pencerelerde günlük dilimlerdir.
+    """
+    return await DownloadAnalyticsService(db).get_analytics(
+        hours=hours, host_limit=host_limit
     )
 
 
@@ -752,7 +1021,7 @@ async def export_library(
     collection_id: Optional[int] = Query(
         default=None, description="Koleksiyon ID filtresi"
     ),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> StreamingResponse:
     """Kütüphane verilerini CSV veya XLSX formatında dışa aktarır.
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from athena.core.database import get_db
+from athena.core.database import get_read_db
 from athena.schemas.search import SearchFilters, SearchResponse
 from athena.services.search import SearchService
 
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/search", tags=["Search"])
 )
 async def search_papers(
     filters: SearchFilters,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> SearchResponse:
     """Birden fazla akademik kaynaktan paralel makale araması yapar.
 
@@ -30,6 +30,7 @@ async def search_papers(
     Sonuçlar birleştirilir, DOI ve başlık bazında tekilleştirilir,
     alaka düzeyi düşük sonuçlar filtrelenir.
     `meta` alanında her kaynaktan gelen ham sayılar ve eleme istatistikleri döner.
+    Kütüphanede kayıtlı sonuçlar `in_library` alanı ile işaretlenir.
     """
     service = SearchService(db)
-    return await service.search_papers(filters)
+    return await service.search_papers(filters, annotate_saved=True)
@@ -0,0 +1,120 @@
+"""Celery worker'lari icin process basina asenkron calisma ortami.
+
+asyncpg ve redis.asyncio baglantilari olusturulduklari event loop'a
+baglidir. Indirme task'lari bu yuzden her cagrida `asyncio.run` ile yeni
+bir loop, engine ve Redis istemcisi kurmaz; process basina tek bir event
+loop uzerinde calisir ve engine havuzu ile Redis baglantilarini task'lar
+arasinda yeniden kullanir.
+
+Ortam `worker_process_init` sinyalinde fork sonrasi kurulur ve
+`worker_process_shutdown` sinyalinde kapatilir (bkz.
+`athena.core.celery_app`). Sinyal disinda (eager task, script) ilk
+kullanimda tembel olusturulur; fork ile devralinan ortam parent'in
+soketlerine dokunmadan birakilip yeniden kurulur.
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from loguru import logger
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from athena.core.config import get_settings
+from athena.core.query_counter import install_query_counter
+
+T = TypeVar("T")
+
+
+@dataclass
+class AsyncWorkerRuntime:
+    """Process'in event loop'u ve bu loop'a bagli istemciler."""
+
+    loop: asyncio.AbstractEventLoop
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    redis: Redis
+    pid: int
+
+
+_lock = threading.Lock()
+# Loop ayni anda tek coroutine calistirir (thread havuzlu worker'lar icin)
+_run_lock = threading.Lock()
+_runtime: AsyncWorkerRuntime | None = None
+
+
+def init_async_runtime() -> AsyncWorkerRuntime:
+    """Process'in ortamini olusturur; zaten varsa mevcut ortami dondurur."""
+    global _runtime
+
+    with _lock:
+        if _runtime is not None and _runtime.pid == os.getpid():
+            return _runtime
+
+        settings = get_settings()
+        loop = asyncio.new_event_loop()
+        engine = create_async_engine(
+            settings.database_url,
+            pool_pre_ping=True,
+            pool_size=settings.worker_async_db_pool_size,
+            max_overflow=settings.worker_async_db_max_overflow,
+            pool_recycle=settings.worker_db_pool_recycle,
+        )
+        install_query_counter(engine.sync_engine)
+        _runtime = AsyncWorkerRuntime(
+            loop=loop,
+            engine=engine,
+            session_factory=async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+            ),
+            # Host hiz sinirlari ve geri cekilmeler worker'lar arasinda paylasilir
+            redis=Redis.from_url(settings.redis_url),
+            pid=os.getpid(),
+        )
+        logger.debug(
+            f"Async worker runtime initialized: pid={_runtime.pid}, "
+            f"pool_size={settings.worker_async_db_pool_size}"
+        )
+        return _runtime
+
+
+def dispose_async_runtime() -> None:
+    """Process'in ortamini kapatir (worker shutdown)."""
+    global _runtime
+
+    with _lock:
+        runtime, _runtime = _runtime, None
+    if runtime is None or runtime.pid != os.getpid():
+        return
+
+    async def close() -> None:
+        await runtime.redis.aclose()
+        await runtime.engine.dispose()
+
+    with _run_lock:
+        try:
+            runtime.loop.run_until_complete(close())
+        finally:
+            runtime.loop.close()
+    logger.info(f"Async worker runtime disposed: pid={runtime.pid}")
+
+
+def run_in_worker_loop(
+    job: Callable[[AsyncWorkerRuntime], Awaitable[T]],
+) -> T:
+    """`job(runtime)` coroutine'ini process'in event loop'unda calistirir."""
+    runtime = init_async_runtime()
+    with _run_lock:
+        return runtime.loop.run_until_complete(job(runtime))
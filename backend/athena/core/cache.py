@@ -0,0 +1,44 @@
+"""Redis tabanli JSON cache yardimcilari.
+
+Cache her zaman opsiyoneldir: Redis erisilemezse hata loglanir ve cagiran
+taraf degeri yeniden hesaplar.
+"""
+
+import json
+from typing import Any
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from athena.core.config import get_settings
+
+_redis_client: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Process genelinde paylasilan async Redis istemcisini dondurur."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = Redis.from_url(get_settings().redis_url)
+    return _redis_client
+
+
+async def cache_get_json(key: str) -> Any | None:
+    """Cache'ten JSON degeri okur; yoksa veya Redis hatasinda None doner."""
+    try:
+        raw = await get_redis().get(key)
+    except RedisError as exc:
+        logger.warning(f"Cache read failed: key={key}, {type(exc).__name__}: {exc}")
+        return None
+    if raw is None:
+        return None
+    return json.loads(raw)
+
+
+async def cache_set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """JSON degeri TTL ile cache'e yazar; Redis hatalari yutulur."""
+    try:
+        await get_redis().set(key, json.dumps(value), ex=ttl_seconds)
+    except RedisError as exc:
+        logger.warning(f"Cache write failed: key={key}, {type(exc).__name__}: {exc}")
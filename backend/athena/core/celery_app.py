@@ -1,6 +1,18 @@
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+from kombu import Queue
+from loguru import logger
 
+from athena.core.async_worker import dispose_async_runtime, init_async_runtime
 from athena.core.config import get_settings
+from athena.core.sync_database import dispose_sync_engine, init_sync_engine
+from athena.core.task_queues import (
+    QUEUE_BULK,
+    QUEUE_ENRICHMENT,
+    QUEUE_INTERACTIVE,
+    QUEUE_MAINTENANCE,
+    TASK_QUEUES,
+)
 
 settings = get_settings()
 
@@ -8,7 +20,13 @@ celery_app = Celery(
     "athena",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=["athena.tasks.downloader"],
+    include=[
+        "athena.tasks.downloader",
+        "athena.tasks.enrichment",
+        "athena.tasks.ingest",
+        "athena.tasks.reconciler",
+        "athena.tasks.saved_index",
+    ],
 )
 
 # Celery yapılandırması
@@ -23,4 +41,72 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
     # Rate limiting
     worker_prefetch_multiplier=1,
+    # Kuyruklar: -Q verilmeyen worker hepsini tuketir
+    task_queues=[Queue(name) for name in TASK_QUEUES],
+    task_default_queue=QUEUE_BULK,
+    task_routes={
+        "athena.tasks.downloader.download_paper_task": {"queue": QUEUE_INTERACTIVE},
+        "athena.tasks.downloader.download_papers_batch_task": {"queue": QUEUE_BULK},
+        "athena.tasks.downloader.retry_stuck_downloads": {"queue": QUEUE_MAINTENANCE},
+        "athena.tasks.downloader.retry_all_incomplete_downloads": {
+            "queue": QUEUE_MAINTENANCE
+        },
+        "athena.tasks.downloader.purge_download_attempts": {"queue": QUEUE_MAINTENANCE},
+        "athena.tasks.enrichment.*": {"queue": QUEUE_ENRICHMENT},
+        # Kullanicinin baslattigi ve ilerlemesini izledigi job'lar
+        "athena.tasks.ingest.*": {"queue": QUEUE_INTERACTIVE},
+        "athena.tasks.reconciler.*": {"queue": QUEUE_MAINTENANCE},
+        "athena.tasks.saved_index.*": {"queue": QUEUE_MAINTENANCE},
+    },
+    # Periyodik görevler (celery beat)
+    beat_schedule={
+        "reconcile-library-files": {
+            "task": "athena.tasks.reconciler.reconcile_library_files_task",
+            "schedule": settings.file_reconcile_interval_minutes * 60,
+        },
+        "purge-download-attempts": {
+            "task": "athena.tasks.downloader.purge_download_attempts",
+            "schedule": settings.download_attempts_purge_interval_hours * 3600,
+        },
+        # Filtre TTL dolmadan yenilenir; aramalar boş filtreye nadiren düşer
+        "rebuild-saved-index": {
+            "task": "athena.tasks.saved_index.rebuild_saved_index_task",
+            "schedule": settings.saved_index_ttl // 2,
+        },
+    },
 )
+
+
+@worker_process_init.connect
+def _init_worker_db(**kwargs) -> None:
+    """Her worker process'i fork sonrası kendi havuzlarını ve event loop'unu kurar."""
+    init_sync_engine()
+    init_async_runtime()
+
+
+@worker_process_shutdown.connect
+def _dispose_worker_db(**kwargs) -> None:
+    """Worker process'i kapanırken havuzlardaki bağlantıları kapatır."""
+    dispose_async_runtime()
+    dispose_sync_engine()
+
+
+def queue_depths() -> dict[str, int]:
+    """Kuyruk başına broker'da bekleyen mesaj sayısı.
+
+    Worker'lara teslim edilmiş (prefetch/çalışan) mesajlar sayılmaz. Broker'a
+    erişilemezse boş sözlük döner. Bloklayan çağrıdır.
+    """
+    depths: dict[str, int] = {}
+    try:
+        # Producer havuzundaki bağlantı kullanılır; broker yoksa tek deneme
+        with celery_app.pool.acquire(block=True, timeout=2) as connection:
+            connection.ensure_connection(max_retries=1)
+            channel = connection.default_channel
+            for name in TASK_QUEUES:
+                declared = channel.queue_declare(queue=name, passive=True)
+                depths[name] = declared.message_count
+    except Exception as e:
+        logger.warning(f"Could not read queue depths: {type(e).__name__}: {e}")
+        return {}
+    return depths
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 
 from athena.core.config import get_settings
+from athena.core.query_counter import install_query_counter
 
 settings = get_settings()
 
@@ -15,6 +16,27 @@ engine = create_async_engine(
     pool_size=5,
     max_overflow=10,
 )
+install_query_counter(engine.sync_engine)
+
+# Read engine: replica tanimliysa ayri pool, degilse primary pool paylasilir.
+# Salt okunur REPEATABLE READ: istek icindeki sorgular (or. sayim + sayfa)
+# ayni snapshot'i gorur; hot standby replikalarda da desteklenir.
+if settings.database_read_url:
+    _read_base_engine = create_async_engine(
+        settings.database_read_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+    )
+    install_query_counter(_read_base_engine.sync_engine)
+else:
+    _read_base_engine = engine
+
+read_engine = _read_base_engine.execution_options(
+    isolation_level="REPEATABLE READ",
+    postgresql_readonly=True,
+)
 
 # Create async session factory
 async_session_factory = async_sessionmaker(
@@ -25,6 +47,15 @@ async_session_factory = async_sessionmaker(
     autoflush=False,
 )
 
+# Salt okunur session factory (GET endpoint'leri)
+read_session_factory = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy 2.0 style declarative base class."""
@@ -50,3 +81,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection for read-only FastAPI routes.
+
+    Commit yapilmaz; transaction salt okunurdur ve `database_read_url`
+    tanimliysa replikaya gider. Replika gecikmesi olabileceginden yazma
+    sonrasi hemen okunmasi gereken endpoint'ler `get_db` kullanmalidir.
+
+    Usage:
+        @router.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    async with read_session_factory() as session:
+        yield session
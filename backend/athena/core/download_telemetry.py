@@ -0,0 +1,141 @@
+"""PDF indirme denemeleri icin telemetri kaydi.
+
+Fallback chain'in her adimi (URL aramasi sonucsuz kaldiysa arama, aksi
+halde indirme) bir `AttemptRecord` olarak bellekte toplanir; indirme
+motoru bunlari `download_attempts` tablosuna toplu INSERT'lerle yazar.
+Kayit tutmak indirmeyi asla basarisiz kilmaz.
+
+Sonuc (`outcome`) degerleri:
+
+  success        Gecerli PDF indirildi
+  not_found      Strateji indirilecek URL bulamadi
+  invalid        Sunucu yanit verdi ama icerik PDF degil ya da cok buyuk
+  http_error     HTTP 4xx/5xx
+  network_error  Zaman asimi veya baglanti hatasi
+  backoff        Host geri cekilmede oldugu icin istek gonderilmedi
+  cancelled      Hedged modda baska bir aday once kazandi
+  error          Beklenmeyen hata
+"""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from athena.core.exceptions import DownloadError
+from athena.core.host_scheduler import HostBackoffError, host_of
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_NOT_FOUND = "not_found"
+OUTCOME_INVALID = "invalid"
+OUTCOME_HTTP_ERROR = "http_error"
+OUTCOME_NETWORK_ERROR = "network_error"
+OUTCOME_BACKOFF = "backoff"
+OUTCOME_CANCELLED = "cancelled"
+OUTCOME_ERROR = "error"
+
+# download-analytics endpoint'inin en uzun penceresi (30 gun)
+ANALYTICS_MAX_HOURS = 720
+
+
+def attempt_retention(adaptive_window_days: int) -> timedelta:
+    """Denemelerin saklanma suresi: okuyan pencerelerin en uzunu.
+
+    Analiz endpoint'i en fazla `ANALYTICS_MAX_HOURS`, strateji siralamasi
+    `download_adaptive_window_days` geriye bakar; daha eski satirlar silinir.
+    """
+    return max(
+        timedelta(hours=ANALYTICS_MAX_HOURS), timedelta(days=adaptive_window_days)
+    )
+
+
+@dataclass
+class AttemptRecord:
+    """Tek bir strateji denemesi."""
+
+    entry_id: int | None
+    strategy: str
+    outcome: str = OUTCOME_ERROR
+    host: str = ""
+    http_status: int | None = None
+    # Bu denemede aktarilan byte (devam ettirilen indirmede yalnizca kalan kisim)
+    bytes: int = 0
+    duration_ms: int = 0
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def classify_error(error: BaseException) -> str:
+    """Hatayi `outcome` degerine cevirir."""
+    if isinstance(error, asyncio.CancelledError):
+        return OUTCOME_CANCELLED
+    if isinstance(error, DownloadError):
+        return OUTCOME_INVALID
+    if isinstance(error, HostBackoffError):
+        return OUTCOME_BACKOFF
+    if isinstance(error, httpx.HTTPStatusError):
+        return OUTCOME_HTTP_ERROR
+    if isinstance(error, httpx.RequestError):
+        return OUTCOME_NETWORK_ERROR
+    return OUTCOME_ERROR
+
+
+class AttemptRecorder:
+    """Denemeleri bellekte biriktirir; `drain()` ile toplu yazilmak uzere alinir."""
+
+    def __init__(self) -> None:
+        self._attempts: list[AttemptRecord] = []
+
+    def __len__(self) -> int:
+        return len(self._attempts)
+
+    def record(
+        self,
+        entry_id: int | None,
+        strategy: str,
+        outcome: str,
+        url: str | None = None,
+        duration: float = 0.0,
+    ) -> AttemptRecord:
+        """Tamamlanmis bir denemeyi ekler (`duration` saniye)."""
+        attempt = AttemptRecord(
+            entry_id=entry_id,
+            strategy=strategy,
+            outcome=outcome,
+            host=host_of(url),
+            duration_ms=round(duration * 1000),
+            started_at=datetime.now(timezone.utc) - timedelta(seconds=duration),
+        )
+        self._attempts.append(attempt)
+        return attempt
+
+    @contextmanager
+    def track(
+        self, entry_id: int | None, strategy: str, url: str
+    ) -> Iterator[AttemptRecord]:
+        """Blok suresince bir indirme denemesini olcer.
+
+        Blok icinde `http_status` ve `bytes` doldurulur; sonuc blogun
+        hatasiz bitmesine veya firlatilan hataya gore belirlenir.
+        """
+        attempt = AttemptRecord(entry_id=entry_id, strategy=strategy, host=host_of(url))
+        started = time.monotonic()
+        try:
+            yield attempt
+            attempt.outcome = OUTCOME_SUCCESS
+        except BaseException as exc:
+            attempt.outcome = classify_error(exc)
+            if isinstance(exc, httpx.HTTPStatusError):
+                attempt.http_status = exc.response.status_code
+            raise
+        finally:
+            attempt.duration_ms = round((time.monotonic() - started) * 1000)
+            self._attempts.append(attempt)
+
+    def drain(self) -> list[AttemptRecord]:
+        """Biriken denemeleri dondurur ve tamponu bosaltir."""
+        attempts, self._attempts = self._attempts, []
+        return attempts
@@ -29,6 +29,8 @@ class ErrorCode(str, enum.Enum):
     DOWNLOAD_NO_PDF_URL = "DOWNLOAD_NO_PDF_URL"
     DOWNLOAD_FAILED = "DOWNLOAD_FAILED"
     DOWNLOAD_TIMEOUT = "DOWNLOAD_TIMEOUT"
+    DOWNLOAD_INVALID_PDF = "DOWNLOAD_INVALID_PDF"
+    DOWNLOAD_TOO_LARGE = "DOWNLOAD_TOO_LARGE"
 
 
 class AthenaError(Exception):
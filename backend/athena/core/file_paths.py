@@ -1,3 +1,5 @@
+import os
+import posixpath
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -46,9 +48,79 @@ def resolve_data_file_path(raw_path: str | None, data_dir: Path) -> Path | None:
     return None
 
 
+# Icerik adresli PDF'lerin data_dir altindaki koku
+BLOB_DIR = "objects"
+
+
+def blob_relative_path(sha256: str) -> str:
+    """Icerik adresli PDF'in relative yolu: objects/ab/cd/<sha256>.pdf.
+
+    Iki seviyeli dagitim tek dizinde on binlerce dosya birikmesini onler.
+    """
+    return f"{BLOB_DIR}/{sha256[:2]}/{sha256[2:4]}/{sha256}.pdf"
+
+
 def to_relative_data_path(file_path: Path, data_dir: Path) -> str:
     """Data dir altindaki dosya yolunu relative string'e cevirir."""
     try:
         return str(file_path.resolve().relative_to(data_dir.resolve()))
     except Exception:
         return str(file_path)
+
+
+def data_path_candidates(raw_path: str | None, data_dir: Path) -> list[str]:
+    """Kayitli path'in data_dir'e gore olasi relative karsiliklarini dondurur.
+
+    `resolve_data_file_path` ile ayni formatlari destekler ancak dosya
+    sistemine dokunmaz; toplu karsilastirmada tarama sonucuyla eslestirilir.
+    `data_dir` onceden `resolve()` edilmis olmalidir.
+    """
+    raw = unquote((raw_path or "").strip())
+    if not raw:
+        return []
+
+    normalized = raw.replace("\\", "/")
+    candidates: list[str] = [normalized]
+
+    if normalized.startswith("/data/library/"):
+        candidates.append(normalized[len("/data/library/") :])
+    if normalized.startswith("data/library/"):
+        candidates.append(normalized[len("data/library/") :])
+    root_prefix = data_dir.as_posix().rstrip("/") + "/"
+    if normalized.startswith(root_prefix):
+        candidates.append(normalized[len(root_prefix) :])
+
+    result: list[str] = []
+    for candidate in candidates:
+        candidate = posixpath.normpath(candidate.strip("/"))
+        if candidate in (".", "") or candidate.startswith(".."):
+            continue
+        if candidate not in result:
+            result.append(candidate)
+    return result
+
+
+def scan_data_files(data_dir: Path) -> set[str]:
+    """data_dir altindaki tum dosyalarin relative path'lerini toplar.
+
+    Dizinler `os.scandir` ile tek geciste gezilir; sembolik link dizinler
+    takip edilmez.
+    """
+    root = data_dir.resolve()
+    files: set[str] = set()
+    stack: list[tuple[str, str]] = [(str(root), "")]
+
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        try:
+            with os.scandir(abs_dir) as it:
+                for item in it:
+                    rel_path = f"{rel_dir}/{item.name}" if rel_dir else item.name
+                    if item.is_dir(follow_symlinks=False):
+                        stack.append((item.path, rel_path))
+                    elif item.is_file():
+                        files.add(rel_path)
+        except OSError:
+            continue
+
+    return files
@@ -0,0 +1,220 @@
+"""Alan adı bazlı PDF indirme zamanlayıcısı (politeness).
+
+Aynı yayıncıya (arxiv.org, mdpi.com vb.) aynı anda çok sayıda istek atmak
+ban ve 403/429 yanıtlarına yol açar. `HostScheduler` indirme istemcisinin
+event hook'larına bağlanır ve yönlendirmeler dahil her istekte:
+
+  - host başına saniyelik istek sayısını tüm worker'lar arasında sınırlar
+    (Redis'te saniyelik sayaç),
+  - 429/403 alan host'u tüm worker'lar için bir süre geri çeker; bu sürede
+    o host'a istek atılmaz, `HostBackoffError` fırlatılır.
+
+Host başına eşzamanlı indirme sayısı ise worker içinde `slot` ile sınırlanır.
+Redis erişilemezse sınırlar yalnızca worker içinde uygulanır.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from athena.core.config import get_settings
+
+BACKOFF_KEY = "download:host:backoff:{host}"
+RATE_KEY = "download:host:rate:{host}:{window}"
+
+# Bu yanıtlar host'un bizi sınırladığını gösterir
+BACKOFF_STATUS_CODES = (403, 429)
+
+# Retry-After ne derse desin en fazla bu kadar beklenir (saniye)
+MAX_BACKOFF_SECONDS = 900
+
+
+class HostBackoffError(httpx.RequestError):
+    """Host geri çekilme süresindeyken istek yapılmadı."""
+
+    def __init__(
+        self,
+        host: str,
+        retry_after: float,
+        request: httpx.Request | None = None,
+    ) -> None:
+        super().__init__(
+            f"Host geri çekilmede: {host} ({math.ceil(retry_after)} sn)",
+            request=request,
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+def host_of(url: str | None) -> str:
+    """URL'nin host'unu küçük harfle döndürür; geçersizse boş string."""
+    if not url:
+        return ""
+    try:
+        return httpx.URL(url).host.lower()
+    except httpx.InvalidURL:
+        return ""
+
+
+def direct_download_host(pdf_url: str | None, doi: str | None) -> str:
+    """Doğrudan indirmenin (PrimaryDownload/Original) gideceği host.
+
+    `pdf_url` yoksa doğrudan deneme DOI çözümlemesiyle `doi.org`'a gider.
+    Strateji sıralaması istatistikleri ve atlama kararı aynı host'u kullanır.
+    """
+    return host_of(pdf_url) or ("doi.org" if doi else "")
+
+
+def interleave_by_host(items: Iterable[tuple[int, str]]) -> list[int]:
+    """(id, host) çiftlerini host'lar arasında round-robin sıralar.
+
+    Her host içindeki sıra korunur: [a1, a2, a3, b1] -> [a1, b1, a2, a3].
+    """
+    queues: dict[str, deque[int]] = {}
+    for item_id, host in items:
+        queues.setdefault(host, deque()).append(item_id)
+
+    ordered: list[int] = []
+    while queues:
+        for host in list(queues):
+            queue = queues[host]
+            ordered.append(queue.popleft())
+            if not queue:
+                del queues[host]
+    return ordered
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Retry-After başlığını (saniye veya HTTP tarihi) saniyeye çevirir."""
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class HostScheduler:
+    """Host başına eşzamanlılık, hız ve geri çekilme sınırlarını uygular."""
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        max_concurrency: int | None = None,
+        rate_per_second: int | None = None,
+        backoff_seconds: int | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.redis = redis
+        self.max_concurrency = max(
+            1, max_concurrency or settings.download_host_concurrency
+        )
+        self.rate_per_second = (
+            settings.download_host_rate if rate_per_second is None else rate_per_second
+        )
+        self.backoff_seconds = backoff_seconds or settings.download_host_backoff_seconds
+
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        # Redis yoksa/erişilemezse kullanılan worker içi durum
+        self._local_backoff: dict[str, float] = {}
+        self._local_windows: dict[str, tuple[int, int]] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """URL'nin host'u için eşzamanlı indirme slotu ayırır."""
+        host = host_of(url)
+        semaphore = self._semaphores.setdefault(
+            host, asyncio.Semaphore(self.max_concurrency)
+        )
+        async with semaphore:
+            yield
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """httpx request hook: geri çekilme kontrolü ve hız sınırı."""
+        host = request.url.host.lower()
+        remaining = await self.backoff_remaining(host)
+        if remaining > 0:
+            raise HostBackoffError(host, remaining, request=request)
+        await self._acquire_rate(host)
+
+    async def on_response(self, response: httpx.Response) -> None:
+        """httpx response hook: 429/403 alan host'u geri çeker."""
+        if response.status_code in BACKOFF_STATUS_CODES:
+            await self.back_off(
+                response.request.url.host.lower(), _retry_after_seconds(response)
+            )
+
+    async def backoff_remaining(self, host: str) -> float:
+        """Host'un geri çekilme süresinden kalan saniye (yoksa 0)."""
+        remaining = self._local_backoff.get(host, 0.0) - time.monotonic()
+        if self.redis is not None:
+            try:
+                ttl_ms = await self.redis.pttl(BACKOFF_KEY.format(host=host))
+                if ttl_ms > 0:
+                    remaining = max(remaining, ttl_ms / 1000)
+            except RedisError as exc:
+                logger.debug(f"[HostScheduler] Backoff check failed: {exc}")
+        return max(remaining, 0.0)
+
+    async def back_off(self, host: str, seconds: float | None = None) -> None:
+        """Host'u tüm worker'lar için `seconds` (varsayılan ayar) geri çeker."""
+        seconds = min(seconds or self.backoff_seconds, MAX_BACKOFF_SECONDS)
+        deadline = time.monotonic() + seconds
+        self._local_backoff[host] = max(self._local_backoff.get(host, 0.0), deadline)
+        logger.warning(f"[HostScheduler] Backing off host={host} for {seconds:.0f}s")
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    BACKOFF_KEY.format(host=host), 1, ex=math.ceil(seconds)
+                )
+            except RedisError as exc:
+                logger.debug(f"[HostScheduler] Backoff publish failed: {exc}")
+
+    async def _acquire_rate(self, host: str) -> None:
+        """Host'un saniyelik istek kotasından yer açılana kadar bekler."""
+        if self.rate_per_second <= 0:
+            return
+
+        while True:
+            now = time.time()
+            window = int(now)
+            if await self._count_request(host, window) <= self.rate_per_second:
+                return
+            # Sonraki saniyeye kadar bekle; jitter worker'ların aynı anda
+            # uyanmasını önler
+            await asyncio.sleep(window + 1 - now + random.uniform(0, 0.1))
+
+    async def _count_request(self, host: str, window: int) -> int:
+        if self.redis is not None:
+            key = RATE_KEY.format(host=host, window=window)
+            try:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(key)
+                    pipe.expire(key, 2)
+                    count, _ = await pipe.execute()
+                return int(count)
+            except RedisError as exc:
+                logger.debug(f"[HostScheduler] Rate counter failed: {exc}")
+
+        current_window, count = self._local_windows.get(host, (window, 0))
+        count = count + 1 if current_window == window else 1
+        self._local_windows[host] = (window, count)
+        return count
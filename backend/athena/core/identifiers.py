@@ -0,0 +1,123 @@
+"""Makale dis kimlikleri (DOI, arXiv, Semantic Scholar, OpenAlex, CORE).
+
+Her saglayicinin kimlikleri `paper_identifiers` tablosunda (scheme, value)
+cifti olarak tutulur. Degerler burada normalize edilir; boylece arama
+sonuclarindan gelen `external_id` ile kayitli kimlik tek bir indeksli
+sorguyla eslestirilebilir.
+"""
+
+import enum
+import re
+
+# Kolon uzunlugu (paper_identifiers.value)
+MAX_IDENTIFIER_LENGTH = 255
+
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "http://dx.doi.org/", "doi:")
+_ARXIV_NEW_RE = re.compile(r"^\d{4}\.\d{4,5}$")
+_ARXIV_OLD_RE = re.compile(r"^[a-z][a-z\-]*(\.[A-Z]{2})?/\d{7}$")
+_ARXIV_VERSION_RE = re.compile(r"v\d+$")
+_S2_RE = re.compile(r"^[0-9a-f]{40}$")
+_OPENALEX_RE = re.compile(r"^W\d+$")
+
+
+class IdentifierScheme(str, enum.Enum):
+    """Desteklenen kimlik turleri."""
+
+    DOI = "doi"
+    ARXIV = "arxiv"
+    S2 = "s2"
+    OPENALEX = "openalex"
+    CORE = "core"
+
+
+_SCHEME_VALUES = frozenset(scheme.value for scheme in IdentifierScheme)
+
+# external_id DOI degilse hangi kimlik turu oldugu kaynaga gore belirlenir
+SOURCE_SCHEMES: dict[str, IdentifierScheme] = {
+    "semantic": IdentifierScheme.S2,
+    "arxiv": IdentifierScheme.ARXIV,
+    "openalex": IdentifierScheme.OPENALEX,
+    "core": IdentifierScheme.CORE,
+}
+
+
+def normalize_identifier(scheme: str, value: str | None) -> str | None:
+    """Kimligi karsilastirilabilir forma getirir; gecersizse None doner."""
+    if not value:
+        return None
+    value = value.strip()
+
+    if scheme == IdentifierScheme.DOI:
+        lowered = value.lower()
+        for prefix in _DOI_PREFIXES:
+            if lowered.startswith(prefix):
+                lowered = lowered[len(prefix) :]
+                break
+        value = lowered if lowered.startswith("10.") else ""
+    elif scheme == IdentifierScheme.ARXIV:
+        value = value.removeprefix("arXiv:").removeprefix("arxiv:")
+        value = _ARXIV_VERSION_RE.sub("", value)
+    elif scheme == IdentifierScheme.OPENALEX:
+        value = value.rsplit("/", 1)[-1].upper()
+
+    if not value or len(value) > MAX_IDENTIFIER_LENGTH:
+        return None
+    return value
+
+
+def guess_scheme(external_id: str) -> IdentifierScheme | None:
+    """Kaynagi bilinmeyen bir external_id'nin kimlik turunu tahmin eder."""
+    value = external_id.strip()
+    if normalize_identifier(IdentifierScheme.DOI, value):
+        return IdentifierScheme.DOI
+    arxiv_id = _ARXIV_VERSION_RE.sub("", value.removeprefix("arXiv:"))
+    if _ARXIV_NEW_RE.match(arxiv_id) or _ARXIV_OLD_RE.match(arxiv_id):
+        return IdentifierScheme.ARXIV
+    if _S2_RE.match(value):
+        return IdentifierScheme.S2
+    if _OPENALEX_RE.match(value.rsplit("/", 1)[-1].upper()):
+        return IdentifierScheme.OPENALEX
+    if value.isdigit():
+        return IdentifierScheme.CORE
+    return None
+
+
+def external_id_key(external_id: str) -> tuple[str, str] | None:
+    """Tek bir external_id icin (scheme, value) anahtari dondurur."""
+    scheme = guess_scheme(external_id)
+    if scheme is None:
+        return None
+    value = normalize_identifier(scheme, external_id)
+    return (scheme.value, value) if value else None
+
+
+def collect_identifiers(
+    external_id: str | None,
+    source: str | None,
+    identifiers: dict[str, str] | None = None,
+) -> set[tuple[str, str]]:
+    """Bir arama sonucunun tum (scheme, value) kimliklerini toplar.
+
+    `identifiers` saglayicinin dondurdugu tum kimliklerdir; `external_id`
+    DOI degilse turu `source` uzerinden belirlenir.
+    """
+    keys: set[tuple[str, str]] = set()
+
+    for scheme, value in (identifiers or {}).items():
+        if scheme not in _SCHEME_VALUES:
+            continue
+        normalized = normalize_identifier(scheme, value)
+        if normalized:
+            keys.add((scheme, normalized))
+
+    if external_id:
+        doi = normalize_identifier(IdentifierScheme.DOI, external_id)
+        if doi:
+            keys.add((IdentifierScheme.DOI.value, doi))
+        elif source in SOURCE_SCHEMES:
+            scheme = SOURCE_SCHEMES[source]
+            normalized = normalize_identifier(scheme, external_id)
+            if normalized:
+                keys.add((scheme.value, normalized))
+
+    return keys
@@ -3,6 +3,7 @@
 Sprint 4.2 - Her HTTP isteği için:
 - Unique request_id (UUID) oluşturur
 - İstek süresini (process_time) ölçer
+- Çalışan SQL statement sayısını (query_count) ölçer
 - Detaylı log kaydı tutar
 """
 
@@ -15,6 +16,7 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from athena.core.logging import clear_request_id, set_request_id
+from athena.core.query_counter import clear_query_count, start_query_count
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -39,8 +41,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # 2. Client IP
         client_ip = self._get_client_ip(request)
 
-        # 3. Başlangıç zamanı
+        # 3. Başlangıç zamanı ve SQL sayacı
         start_time = time.perf_counter()
+        query_counter = start_query_count()
 
         # 4. İsteği işle
         try:
@@ -59,6 +62,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 path=request.url.path,
                 status_code=response.status_code,
                 process_time_ms=round(process_time, 2),
+                query_count=query_counter.count,
                 client_ip=client_ip,
             )
 
@@ -80,6 +84,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         finally:
             # Context'i temizle
             clear_request_id()
+            clear_query_count()
 
     def _get_client_ip(self, request: Request) -> str:
         """Client IP adresini döner.
@@ -0,0 +1,96 @@
+"""DOI bazli acik erisim (OA) arama sonucu cache'i.
+
+Unpaywall ve CORE sorgulari her indirme denemesinde (Celery retry'lari ve
+toplu tekrar denemeler dahil) ayni cevabi dondurur. Sonuclar kaynak ve
+DOI'ye gore Redis'te tutulur: bulunan URL'ler `oa_cache_ttl`, "acik erisim
+degil / URL yok" cevaplari daha kisa `oa_cache_negative_ttl` boyunca. API
+hatalari cache'lenmez.
+
+Redis verilmezse veya erisilemezse her arama API'ye gider.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from athena.core.config import get_settings
+from athena.core.identifiers import IdentifierScheme, normalize_identifier
+
+OA_CACHE_KEY = "download:oa:{source}:{doi}"
+
+# Cache'lenen arama kaynaklari (download-stats bu sirayla okur)
+OA_SOURCES = ("unpaywall", "core")
+
+
+@dataclass
+class OaLookup:
+    """Bir DOI icin cache'lenmis OA arama sonucu; `url` None ise bulunamadi."""
+
+    source: str
+    url: str | None
+    checked_at: str
+
+
+def _cache_key(source: str, doi: str) -> str:
+    normalized = normalize_identifier(IdentifierScheme.DOI, doi) or doi.lower()
+    return OA_CACHE_KEY.format(source=source, doi=normalized)
+
+
+class OaLookupCache:
+    """OA arama sonuclarini okur ve yazar; Redis hatalari yutulur."""
+
+    def __init__(self, redis: Redis | None = None) -> None:
+        self.redis = redis
+
+    async def get(self, source: str, doi: str) -> OaLookup | None:
+        """Cache'teki sonucu dondurur; yoksa None (API sorgulanmali)."""
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(_cache_key(source, doi))
+        except RedisError as exc:
+            logger.debug(f"[OaCache] Read failed: {type(exc).__name__}: {exc}")
+            return None
+        if raw is None:
+            return None
+        return OaLookup(**json.loads(raw))
+
+    async def set(self, source: str, doi: str, url: str | None) -> None:
+        """API cevabini yazar; bulunamayan sonuclar daha kisa sure tutulur."""
+        if self.redis is None:
+            return
+        settings = get_settings()
+        lookup = OaLookup(
+            source=source,
+            url=url,
+            checked_at=datetime.now(timezone.utc).isoformat(),
+        )
+        ttl = settings.oa_cache_ttl if url else settings.oa_cache_negative_ttl
+        try:
+            await self.redis.set(
+                _cache_key(source, doi), json.dumps(asdict(lookup)), ex=ttl
+            )
+        except RedisError as exc:
+            logger.debug(f"[OaCache] Write failed: {type(exc).__name__}: {exc}")
+
+    async def get_many(self, dois: list[str]) -> dict[str, list[OaLookup]]:
+        """DOI'ler icin tum kaynaklarin cache'lenmis sonuclarini tek MGET ile okur."""
+        if self.redis is None or not dois:
+            return {}
+        keys = [_cache_key(source, doi) for doi in dois for source in OA_SOURCES]
+        try:
+            values = await self.redis.mget(keys)
+        except RedisError as exc:
+            logger.warning(f"[OaCache] Read failed: {type(exc).__name__}: {exc}")
+            return {}
+
+        lookups: dict[str, list[OaLookup]] = {}
+        for index, raw in enumerate(values):
+            if raw is not None:
+                doi = dois[index // len(OA_SOURCES)]
+                lookups.setdefault(doi, []).append(OaLookup(**json.loads(raw)))
+        return lookups
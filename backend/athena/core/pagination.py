@@ -0,0 +1,63 @@
+"""Keyset (cursor) sayfalama yardimcilari.
+
+Cursor, istemciye opak bir string olarak verilir; icinde son satirin
+siralama anahtari (entry id ve FTS aramalarinda rank) tasinir.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+
+from athena.core.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class LibraryCursor:
+    """Kutuphane listesindeki son satirin siralama anahtari."""
+
+    id: int
+    rank: float | None = None
+
+
+def encode_cursor(cursor: LibraryCursor) -> str:
+    """Cursor'i URL-safe opak string'e cevirir."""
+    payload: dict = {"id": cursor.id}
+    if cursor.rank is not None:
+        payload["rank"] = cursor.rank
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, require_rank: bool = False) -> LibraryCursor:
+    """Opak cursor string'ini cozer.
+
+    Raises:
+        ValidationError: Cursor bozuksa veya arama modu ile uyusmuyorsa
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        entry_id = int(payload["id"])
+        rank = payload.get("rank")
+        rank = float(rank) if rank is not None else None
+    except (
+        binascii.Error,
+        UnicodeError,
+        ValueError,
+        TypeError,
+        KeyError,
+    ) as exc:
+        raise ValidationError(
+            message="Geçersiz sayfalama cursor'ı",
+            suggestion="İlk sayfadan tekrar başlayın",
+            details=str(exc),
+        ) from exc
+
+    if require_rank and rank is None:
+        raise ValidationError(
+            message="Cursor arama sorgusu ile uyuşmuyor",
+            suggestion="Arama değiştiğinde ilk sayfadan tekrar başlayın",
+        )
+
+    return LibraryCursor(id=entry_id, rank=rank)
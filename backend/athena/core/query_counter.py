@@ -0,0 +1,78 @@
+"""Istek bazli SQL statement sayaci.
+
+N+1 sorgu regresyonlarini yakalamak icin her istekte calisan SQL
+statement'lari sayilir. Middleware sayaci istek basina acar ve
+"Request completed" loguna `query_count` olarak ekler; testlerde
+`count_queries()` context manager'i ile endpoint basina sabit sorgu sayisi
+dogrulanabilir:
+
+    with count_queries() as counter:
+        await list_library(...)
+    assert counter.count <= 4
+
+SQL metinleri yalnizca `record_statements=True` ile istendiginde saklanir;
+middleware sadece sayar.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryCounter:
+    """Aktif scope'ta calistirilan SQL statement'lari."""
+
+    count: int = 0
+    record_statements: bool = False
+    statements: list[str] = field(default_factory=list)
+
+
+# Sayac nesnesi mutable oldugu icin child task/greenlet'lerde de ayni
+# nesne guncellenir.
+query_counter_ctx: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter", default=None
+)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    counter = query_counter_ctx.get()
+    if counter is not None:
+        counter.count += 1
+        if counter.record_statements:
+            counter.statements.append(statement)
+
+
+def install_query_counter(engine: Engine) -> None:
+    """Sayaci (sync) engine'e baglar. Birden fazla cagri guvenlidir."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def start_query_count() -> QueryCounter:
+    """Mevcut context icin yeni bir sayac baslatir (middleware kullanir)."""
+    counter = QueryCounter()
+    query_counter_ctx.set(counter)
+    return counter
+
+
+def clear_query_count() -> None:
+    """Mevcut context'teki sayaci kaldirir."""
+    query_counter_ctx.set(None)
+
+
+@contextmanager
+def count_queries(record_statements: bool = False) -> Iterator[QueryCounter]:
+    """Blok icinde calisan SQL statement'larini sayar (istenirse saklar)."""
+    counter = QueryCounter(record_statements=record_statements)
+    token = query_counter_ctx.set(counter)
+    try:
+        yield counter
+    finally:
+        query_counter_ctx.reset(token)
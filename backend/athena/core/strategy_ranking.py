@@ -0,0 +1,103 @@
+"""Gecmis basari oranlarina gore indirme stratejisi siralamasi.
+
+`download_attempts` telemetrisinden iki tur istatistik kullanilir:
+
+- Dogrudan indirme (`PrimaryDownload` ve son denemedeki `Original`) icin
+  PDF URL'sinin host'u bazinda basari orani. Dogrudan indirmeyi neredeyse
+  her zaman reddeden yayinci host'larinda `PrimaryDownload` atlanir ve
+  EZProxy tanimliysa dogrudan ona gecilir.
+- URL arayan stratejiler (Unpaywall, CORE) icin host'tan bagimsiz genel
+  basari orani; zincir bu oranlara gore siralanir.
+
+Oranlar az veriyle yaniltmasin diye `PRIOR_RATE`'e dogru yumusatilir.
+Yeterli verisi olmayan host'larda dogrudan indirme eskisi gibi ilk denenir;
+veri yokken varsayilan sira korunur. Atlanan host'lar `explore_rate`
+olasilikla yine de (zincirin sonunda) denenir, boylece istatistikler
+guncel kalir ve engeli kalkan host'lar tekrar one alinir.
+"""
+
+import random
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+# Ayni URL'ye giden (host'u bilinen) stratejiler
+DIRECT_STRATEGIES = ("PrimaryDownload", "Original")
+
+# Yumusatma: veri yokken oran PRIOR_RATE, PRIOR_WEIGHT deneme kadar agirlikli
+PRIOR_RATE = 0.5
+PRIOR_WEIGHT = 5
+
+# Atlanan host'larin yine de denenme olasiligi
+EXPLORE_RATE = 0.1
+
+
+@dataclass
+class SuccessStats:
+    """Bir host veya stratejinin pencere icindeki deneme sayilari."""
+
+    attempts: int = 0
+    successes: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Onsel orana dogru yumusatilmis basari orani."""
+        return (self.successes + PRIOR_RATE * PRIOR_WEIGHT) / (
+            self.attempts + PRIOR_WEIGHT
+        )
+
+
+@dataclass
+class StrategyRanking:
+    """Telemetriden olusan siralama kararlari."""
+
+    direct_by_host: dict[str, SuccessStats] = field(default_factory=dict)
+    by_strategy: dict[str, SuccessStats] = field(default_factory=dict)
+    min_attempts: int = 20
+    skip_rate: float = 0.05
+    explore_rate: float = EXPLORE_RATE
+    rng: Callable[[], float] = random.random
+
+    def blocks_direct(self, host: str) -> bool:
+        """Host dogrudan indirmeleri (neredeyse) her zaman reddediyor mu?
+
+        `min_attempts` kucuk orneklemleri eledigi icin ham oran kullanilir.
+        """
+        stats = self.direct_by_host.get(host)
+        return (
+            stats is not None
+            and stats.attempts >= self.min_attempts
+            and stats.successes < self.skip_rate * stats.attempts
+        )
+
+    def skip_direct(self, host: str) -> bool:
+        """Dogrudan indirme bu sefer atlanmali mi (kesif olasiligi dahil)?
+
+        Her cagri yeni bir kesif cekilisi yapar; bir kayit icin bir kez
+        cagrilip karar zincire ve son denemeye aktarilmalidir.
+        """
+        return self.blocks_direct(host) and self.rng() >= self.explore_rate
+
+    def score(self, strategy: str, direct_host: str) -> float:
+        """Stratejinin beklenen basari orani.
+
+        Yeterli verisi olmayan host'a dogrudan indirme 1.0 alir (ilk denenir).
+        """
+        if strategy not in DIRECT_STRATEGIES:
+            return self.by_strategy.get(strategy, SuccessStats()).rate
+        stats = self.direct_by_host.get(direct_host)
+        if stats is None or stats.attempts < self.min_attempts:
+            return 1.0
+        return stats.rate
+
+    def arrange(
+        self, strategies: Sequence[str], direct_host: str, skip_direct: bool = False
+    ) -> list[str]:
+        """Strateji adlarini beklenen basariya gore siralar.
+
+        Esit skorlarda verilen sira korunur. `skip_direct` ise (bkz.
+        `skip_direct()`) dogrudan stratejiler cikarilir.
+        """
+        ordered = sorted(strategies, key=lambda name: -self.score(name, direct_host))
+        if not skip_direct:
+            return ordered
+        return [name for name in ordered if name not in DIRECT_STRATEGIES]
@@ -0,0 +1,129 @@
+"""Celery worker'lari icin havuzlu senkron veritabani engine'i.
+
+Her worker process'i tek bir engine ve session factory kullanir; task'lar
+baglantilari bu havuzdan alir, her cagrida yeni engine (ve yeni TCP/TLS +
+auth el sikismasi) kurulmaz. Engine `worker_process_init` sinyalinde fork
+sonrasi olusturulur ve `worker_process_shutdown` sinyalinde kapatilir
+(bkz. `athena.core.celery_app`). Sinyal disinda (beat, eager task, script)
+ilk kullanimda tembel olusturulur; fork ile devralinan bir engine ise
+parent'in soketlerini paylasmamak icin atilip yeniden kurulur.
+
+Havuz metrikleri `sync_pool_stats()` ile okunur.
+"""
+
+import os
+import threading
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from athena.core.config import get_settings
+from athena.core.query_counter import install_query_counter
+
+_lock = threading.Lock()
+_engine: Engine | None = None
+_session_factory: sessionmaker[Session] | None = None
+_engine_pid: int | None = None
+
+# Engine olusturuldugundan beri sayilan havuz olaylari
+_counters = {"connects": 0, "checkouts": 0, "invalidations": 0}
+
+
+def sync_database_url() -> str:
+    """asyncpg URL'sinin senkron (psycopg2) karsiligi."""
+    return get_settings().database_url.replace("+asyncpg", "")
+
+
+def _install_pool_metrics(engine: Engine) -> None:
+    """Havuz olaylarini `_counters` uzerinde sayar."""
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        _counters["connects"] += 1
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        _counters["checkouts"] += 1
+
+    def on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        _counters["invalidations"] += 1
+
+    event.listen(engine, "connect", on_connect)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "invalidate", on_invalidate)
+
+
+def init_sync_engine() -> Engine:
+    """Process'in engine'ini olusturur; zaten varsa mevcut engine'i dondurur."""
+    global _engine, _session_factory, _engine_pid
+
+    with _lock:
+        if _engine is not None and _engine_pid == os.getpid():
+            return _engine
+        if _engine is not None:
+            # Fork ile devralindi: parent'in baglantilarini kapatmadan birak
+            _engine.dispose(close=False)
+
+        settings = get_settings()
+        engine = create_engine(
+            sync_database_url(),
+            pool_pre_ping=True,
+            pool_size=settings.worker_db_pool_size,
+            max_overflow=settings.worker_db_max_overflow,
+            pool_recycle=settings.worker_db_pool_recycle,
+        )
+        install_query_counter(engine)
+        _install_pool_metrics(engine)
+        for key in _counters:
+            _counters[key] = 0
+
+        _engine = engine
+        _session_factory = sessionmaker(bind=engine)
+        _engine_pid = os.getpid()
+        logger.debug(
+            f"Sync engine initialized: pid={_engine_pid}, "
+            f"pool_size={settings.worker_db_pool_size}, "
+            f"max_overflow={settings.worker_db_max_overflow}"
+        )
+        return engine
+
+
+def dispose_sync_engine() -> None:
+    """Process'in engine'ini kapatir (worker shutdown)."""
+    global _engine, _session_factory, _engine_pid
+
+    with _lock:
+        if _engine is None:
+            return
+        if _engine_pid == os.getpid():
+            logger.info(f"Sync engine disposed: {sync_pool_stats()}")
+            _engine.dispose()
+        else:
+            _engine.dispose(close=False)
+        _engine = None
+        _session_factory = None
+        _engine_pid = None
+
+
+def get_sync_session() -> Session:
+    """Process'in havuzundan yeni bir senkron session dondurur."""
+    if _session_factory is None or _engine_pid != os.getpid():
+        init_sync_engine()
+    assert _session_factory is not None
+    return _session_factory()
+
+
+def sync_pool_stats() -> dict[str, Any]:
+    """Havuz doluluk ve olay sayaclari; engine yoksa bos sozluk."""
+    engine = _engine
+    if engine is None:
+        return {}
+    pool = engine.pool
+    stats: dict[str, Any] = {"pid": _engine_pid, **_counters}
+    # QueuePool disindaki havuzlarda (or. NullPool) bu metodlar yok
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if method is not None:
+            stats[name] = method()
+    return stats
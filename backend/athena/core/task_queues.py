@@ -0,0 +1,19 @@
+"""Celery kuyruk adlari.
+
+Kullanicinin bekledigi tekil indirmeler, toplu indirme yiginlarinin
+arkasinda kalmasin diye gorevler dort kuyruga ayrilir; her kuyrugu kendi
+concurrency ayariyla calisan ayri bir worker tuketir (bkz. docker-compose).
+Kuyruk yonlendirmesi `athena.core.celery_app` icindedir; bu modul Celery
+import etmez, boylece task modulleri kuyruk adlarini dogrudan kullanabilir.
+"""
+
+# Kullanici istegiyle baslayan tekil/kucuk indirmeler ve ingest job'lari
+QUEUE_INTERACTIVE = "interactive"
+# Toplu ekleme ve retry taramalarinin indirme batch'leri
+QUEUE_BULK = "bulk"
+# Periyodik bakim isleri (uzlastirma, saved index, retry taramalari)
+QUEUE_MAINTENANCE = "maintenance"
+# Uzun suren metadata enrichment kosulari; bakim islerini bekletmesin diye ayri
+QUEUE_ENRICHMENT = "enrichment"
+
+TASK_QUEUES = (QUEUE_INTERACTIVE, QUEUE_BULK, QUEUE_MAINTENANCE, QUEUE_ENRICHMENT)
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class DownloadAttempt(Base):
+    """Bir PDF indirme stratejisi denemesi (telemetri).
+
+    Indirme motoru denemeleri toplu INSERT'lerle yazar; tablo yalnizca
+    eklenir ve zaman penceresine gore okunur (bkz. download-analytics).
+    Okuyan pencerelerin en uzunundan eski satirlar periyodik olarak silinir
+    (bkz. `purge_download_attempts`).
+    Kayit silinse de host/strateji istatistikleri korunsun diye `entry_id`
+    foreign key degildir.
+    """
+
+    __tablename__ = "download_attempts"
+    __table_args__ = (
+        # Ekleme sirasi ~ zaman sirasi: BRIN indeksi kucuk ve yeterli
+        Index(
+            "ix_download_attempts_started_at",
+            "started_at",
+            postgresql_using="brin",
+        ),
+        # Strateji siralamasi: host bazinda son pencerenin basari orani
+        Index("ix_download_attempts_host_started_at", "host", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    entry_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    strategy: Mapped[str] = mapped_column(String(32), nullable=False)
+    host: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    outcome: Mapped[str] = mapped_column(String(16), nullable=False)
+    http_status: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -0,0 +1,52 @@
+import enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class EnrichmentJobStatus(str, enum.Enum):
+    """Metadata tamamlama job durumlari."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class EnrichmentJob(Base):
+    """Arka planda calisan metadata tamamlama job'i.
+
+    `last_entry_id` keyset checkpoint'idir: worker yeniden basladiginda
+    islenmis kayitlari atlayip kaldigi yerden devam eder.
+    """
+
+    __tablename__ = "enrichment_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=EnrichmentJobStatus.QUEUED.value
+    )
+    max_entries: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_entry_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_message: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class LibraryFileCheck(Base):
+    """Bir kutuphane kaydinin PDF dosyasinin diskte son dogrulandigi an.
+
+    Dosya sistemi uzlastirma task'i tarafindan toplu olarak guncellenir.
+    """
+
+    __tablename__ = "library_file_checks"
+
+    entry_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("library_entries.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    verified_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
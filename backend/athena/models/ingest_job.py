@@ -0,0 +1,62 @@
+import enum
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class IngestJobStatus(str, enum.Enum):
+    """Toplu ekleme job durumlari."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class IngestJob(Base):
+    """Arka planda calisan toplu kutuphaneye ekleme job'i.
+
+    `papers` istekte gelen makale listesini (PaperResponse JSON) tutar.
+    `next_index` checkpoint'idir: worker yeniden basladiginda islenmis
+    batch'leri atlayip kaldigi yerden devam eder. `queued_count` ise
+    indirmeleri kuyruga eklenmis kayit sayisidir; commit ile kuyruklama
+    arasinda kalan kayitlar devam edildiginde tekrar kuyruga eklenir.
+    """
+
+    __tablename__ = "ingest_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=IngestJobStatus.QUEUED.value
+    )
+    search_query: Mapped[str] = mapped_column(String(500), nullable=False, default="")
+    papers: Mapped[list[dict]] = mapped_column(JSONB, nullable=False)
+    next_index: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    added: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duplicates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    entry_ids: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer), nullable=False, default=list
+    )
+    # entry_ids'in indirme kuyruguna eklenmis on eki (kuyruklama checkpoint'i)
+    queued_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_message: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class LibraryEntryPdf(Base):
+    """Bir kutuphane kaydinin PDF'ine (icerik adresli blob) referansi.
+
+    `library_entries.file_path` ayrica blob'un yolunu tutar; boylece dosya
+    okuyan endpoint'ler bu tabloya join yapmak zorunda kalmaz.
+    """
+
+    __tablename__ = "library_entry_pdfs"
+
+    entry_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("library_entries.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sha256: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("pdf_blobs.sha256", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+    )
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class LibraryReadModel(Base):
+    """Kutuphane listesi icin denormalize okuma modeli.
+
+    Satirlar statement bazli veritabani trigger'lari ile guncellenir (bkz.
+    `refresh_library_read_model`); toplu yazimlarda statement basina tek
+    yenileme yapilir ve okuma modeline girmeyen kolonlarin degisimi
+    (or. `updated_at`) atlanir. Uygulama bu tabloya yazmaz. `display`
+    kolonu `LibraryEntrySchema` ile birebir ayni JSON'u tutar.
+    """
+
+    __tablename__ = "library_read_model"
+
+    entry_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("library_entries.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    paper_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    abstract: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    citation_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    download_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    source: Mapped[str] = mapped_column(String(20), nullable=False)
+    file_path: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    tag_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    tag_names: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
+    collection_ids: Mapped[list[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    # Yazar ve etiket adlari (\x1f ile ayrilmis) - trigram substring aramasi icin
+    search_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True)
+    display: Mapped[dict] = mapped_column(JSONB, nullable=False)
@@ -0,0 +1,24 @@
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class PaperIdentifier(Base):
+    """Bir makalenin dis kimligi (DOI, arXiv ID, Semantic Scholar ID vb.).
+
+    (scheme, value) birincil anahtardir; her kimlik tek bir makaleye aittir
+    ve uyelik kontrolleri tek indeksli sorguyla yapilir. Degerler
+    `athena.core.identifiers.normalize_identifier` ile normalize edilir.
+    """
+
+    __tablename__ = "paper_identifiers"
+
+    scheme: Mapped[str] = mapped_column(String(20), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255), primary_key=True)
+    paper_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("papers.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, delete, func, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from athena.core.database import Base
+
+
+class PdfBlob(Base):
+    """Icerik adresli saklanan PDF dosyasi.
+
+    Dosya `objects/ab/cd/<sha256>.pdf` yolunda bir kez tutulur; ayni PDF'e
+    ulasan tum kutuphane kayitlari `library_entry_pdfs` uzerinden bu satiri
+    referans alir. `ref_count` bu referanslarin sayisidir ve veritabani
+    trigger'i ile guncellenir; sifira dusen dosyalar silinebilir.
+
+    Ayni sha256 icin dosya yerlestirme + baglama ile blob silme + dosya
+    silme islemleri `lock_blob` kilidi altinda yapilir; aksi halde silinmek
+    uzere olan dosya yeni bir kayda baglanabilir.
+    """
+
+    __tablename__ = "pdf_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Dosyanin ilk indirildigi URL; ayni URL tekrar indirilmez
+    source_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+def lock_blob(sha256: str):
+    """Blob'u transaction sonuna kadar kilitleyen sorgu (advisory lock).
+
+    Satir henuz yokken de calisir; `SELECT ... FOR UPDATE` bunu saglamaz.
+    """
+    return select(func.pg_advisory_xact_lock(func.hashtext(sha256)))
+
+
+def purge_orphan_blobs(cutoff: datetime):
+    """`cutoff`'tan once olusturulmus, referanssiz blob'lari silen sorgu.
+
+    Baska bir transaction'in kilitledigi blob'lar atlanir (bir sonraki
+    calismada tekrar denenir). Dosyalar kilit birakilmadan, yani commit
+    oncesinde silinmelidir.
+    """
+    return (
+        delete(PdfBlob)
+        .where(
+            PdfBlob.ref_count == 0,
+            PdfBlob.created_at < cutoff,
+            func.pg_try_advisory_xact_lock(func.hashtext(PdfBlob.sha256)),
+        )
+        .returning(PdfBlob.file_path)
+    )
@@ -102,7 +102,7 @@ class LibraryEntrySchema(BaseModel):
 
 
 class LibraryListResponse(BaseModel):
-    """Kütüphane listeleme yanıtı - Pagination destekli."""
+    """Kütüphane listeleme yanıtı - Offset ve keyset (cursor) pagination destekli."""
 
     items: list[LibraryEntrySchema] = Field(
         ...,
@@ -113,6 +113,11 @@ class LibraryListResponse(BaseModel):
         description="Toplam kayıt sayısı (filtrelenmiş)",
         examples=[156],
     )
+    total_is_exact: bool = Field(
+        default=True,
+        description="total tam sayım mı, yoksa planner tahmini mi",
+        examples=[True],
+    )
     page: int = Field(
         ...,
         description="Mevcut sayfa numarası",
@@ -123,3 +128,113 @@ class LibraryListResponse(BaseModel):
         description="Sayfa başına öğe sayısı",
         examples=[20],
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Sonraki sayfa için opak keyset cursor'ı (son sayfada null). "
+            "`cursor` parametresi ile gönderildiğinde derin sayfalar da "
+            "ilk sayfa kadar hızlı döner."
+        ),
+        examples=["eyJpZCI6MTIzfQ"],
+    )
+
+
+class FacetBucket(BaseModel):
+    """Tek bir facet değeri ve kayıt sayısı."""
+
+    value: int | str | None = Field(
+        ...,
+        description="Facet değeri (yıl, etiket/koleksiyon ID, durum veya kaynak)",
+        examples=[2017],
+    )
+    label: Optional[str] = Field(
+        default=None,
+        description="Görünen ad (etiket ve koleksiyon adları için)",
+        examples=["machine learning"],
+    )
+    count: int = Field(..., description="Eşleşen kayıt sayısı", examples=[12])
+
+
+class LibraryFacetsResponse(BaseModel):
+    """Kütüphane filtreleri için facet sayıları."""
+
+    total: int = Field(
+        ..., description="Filtrelenmiş toplam kayıt sayısı", examples=[156]
+    )
+    years: list[FacetBucket] = Field(
+        default_factory=list, description="Yayın yılına göre dağılım"
+    )
+    tags: list[FacetBucket] = Field(
+        default_factory=list, description="Etiketlere göre dağılım"
+    )
+    download_statuses: list[FacetBucket] = Field(
+        default_factory=list, description="İndirme durumuna göre dağılım"
+    )
+    sources: list[FacetBucket] = Field(
+        default_factory=list, description="Kaynağa göre dağılım"
+    )
+    collections: list[FacetBucket] = Field(
+        default_factory=list, description="Koleksiyonlara göre dağılım"
+    )
+
+
+class DownloadAttemptStats(BaseModel):
+    """Bir strateji veya host için indirme denemesi istatistikleri."""
+
+    key: str = Field(..., description="Strateji adı veya host", examples=["Unpaywall"])
+    attempts: int = Field(..., description="Toplam deneme sayısı", examples=[240])
+    successes: int = Field(..., description="Başarılı deneme sayısı", examples=[180])
+    cancelled: int = Field(
+        ...,
+        description="Hedged modda başka aday kazandığı için iptal edilen denemeler",
+        examples=[12],
+    )
+    success_rate: Optional[float] = Field(
+        default=None,
+        description="successes / (attempts - cancelled); deneme yoksa null",
+        examples=[0.79],
+    )
+    outcomes: dict[str, int] = Field(
+        default_factory=dict,
+        description="Sonuç türüne göre deneme sayıları",
+        examples=[{"success": 180, "not_found": 30, "http_error": 18}],
+    )
+    p50_ms: Optional[float] = Field(
+        default=None, description="Başarılı denemelerin medyan süresi", examples=[850]
+    )
+    p95_ms: Optional[float] = Field(
+        default=None, description="Başarılı denemelerin p95 süresi", examples=[4200]
+    )
+    bytes: int = Field(..., description="Aktarılan toplam byte", examples=[52428800])
+
+
+class DownloadAttemptBucket(BaseModel):
+    """Zaman dilimi başına strateji deneme ve başarı sayıları."""
+
+    bucket: datetime = Field(..., description="Dilim başlangıcı (UTC)")
+    strategy: str = Field(..., description="Strateji adı", examples=["CoreAPI"])
+    attempts: int = Field(
+        ..., description="Deneme sayısı (iptal edilenler hariç)", examples=[20]
+    )
+    successes: int = Field(..., description="Başarılı deneme sayısı", examples=[9])
+
+
+class DownloadAnalyticsResponse(BaseModel):
+    """İndirme denemesi telemetrisinden strateji ve host analizi."""
+
+    since: datetime = Field(..., description="Pencerenin başlangıcı (UTC)")
+    hours: int = Field(..., description="Pencere uzunluğu (saat)", examples=[24])
+    bucket: str = Field(
+        ..., description="Zaman serisi dilimi (hour veya day)", examples=["hour"]
+    )
+    strategies: list[DownloadAttemptStats] = Field(
+        default_factory=list, description="Strateji bazında istatistikler"
+    )
+    hosts: list[DownloadAttemptStats] = Field(
+        default_factory=list,
+        description="En çok denenen host'ların istatistikleri",
+    )
+    timeline: list[DownloadAttemptBucket] = Field(
+        default_factory=list,
+        description="Strateji bazında zaman serisi",
+    )
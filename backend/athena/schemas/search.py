@@ -70,6 +70,16 @@ class PaperResponse(BaseModel):
         description="PDF indirme bağlantısı (varsa)",
         examples=["https://arxiv.org/pdf/2301.00001.pdf"],
     )
+    identifiers: dict[str, str] = Field(
+        default_factory=dict,
+        description="Kaynağın döndürdüğü tüm kimlikler (scheme -> değer)",
+        examples=[{"doi": "10.48550/arXiv.1706.03762", "arxiv": "1706.03762"}],
+    )
+    in_library: bool = Field(
+        default=False,
+        description="Makale kütüphanede kayıtlı mı (arama sonuçlarında doldurulur)",
+        examples=[False],
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -1,13 +1,33 @@
+try:
+    from athena.services.enrichment import MetadataEnrichmentService
+except ModuleNotFoundError:
+    MetadataEnrichmentService = None
+
 try:
     from athena.services.export import ExportService
 except ModuleNotFoundError:
     ExportService = None
 
+try:
+    from athena.services.facets import LibraryFacetService
+except ModuleNotFoundError:
+    LibraryFacetService = None
+
+try:
+    from athena.services.ingest import IngestJobService
+except ModuleNotFoundError:
+    IngestJobService = None
+
 try:
     from athena.services.library import LibraryService
 except ModuleNotFoundError:
     LibraryService = None
 
+try:
+    from athena.services.saved_index import SavedPaperIndex
+except ModuleNotFoundError:
+    SavedPaperIndex = None
+
 try:
     from athena.services.search import SearchService
 except ModuleNotFoundError:
@@ -15,6 +35,10 @@ except ModuleNotFoundError:
 
 __all__ = [
     "ExportService",
+    "IngestJobService",
+    "LibraryFacetService",
     "LibraryService",
+    "MetadataEnrichmentService",
+    "SavedPaperIndex",
     "SearchService",
 ]
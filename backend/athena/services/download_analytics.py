@@ -0,0 +1,151 @@
+"""Indirme denemesi telemetrisi analizi.
+
+`download_attempts` tablosundan strateji ve host bazinda basari orani,
+sure yuzdelikleri (p50/p95) ve aktarilan byte hesaplanir; timeout ve
+strateji sirasi ayarlari bu verilere gore yapilir. Strateji ve host
+gruplari tek GROUPING SETS sorgusuyla, zaman serisi ayri bir sorguyla
+okunur.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from athena.core.download_telemetry import OUTCOME_CANCELLED, OUTCOME_SUCCESS
+from athena.models.download_attempt import DownloadAttempt
+from athena.schemas.library import (
+    DownloadAnalyticsResponse,
+    DownloadAttemptBucket,
+    DownloadAttemptStats,
+)
+
+# Bu pencereye kadar saatlik, daha uzun pencerelerde gunluk zaman serisi
+HOURLY_BUCKET_MAX_HOURS = 48
+
+
+def fold_attempt_stats(
+    rows: Iterable[tuple[str, str, int, int, float | None, float | None]],
+) -> list[DownloadAttemptStats]:
+    """(anahtar, sonuc, sayi, byte, p50, p95) satirlarini anahtar bazinda toplar.
+
+    Sure yuzdelikleri yalnizca basarili denemelerin satirindan alinir.
+    Sonuc deneme sayisina gore azalan siradadir.
+    """
+    stats: dict[str, DownloadAttemptStats] = {}
+    for key, outcome, count, total_bytes, p50, p95 in rows:
+        item = stats.get(key)
+        if item is None:
+            item = stats[key] = DownloadAttemptStats(
+                key=key, attempts=0, successes=0, cancelled=0, bytes=0
+            )
+        item.attempts += count
+        item.bytes += total_bytes or 0
+        item.outcomes[outcome] = item.outcomes.get(outcome, 0) + count
+        if outcome == OUTCOME_SUCCESS:
+            item.successes += count
+            item.p50_ms, item.p95_ms = p50, p95
+        elif outcome == OUTCOME_CANCELLED:
+            item.cancelled += count
+
+    for item in stats.values():
+        finished = item.attempts - item.cancelled
+        if finished:
+            item.success_rate = round(item.successes / finished, 4)
+
+    return sorted(stats.values(), key=lambda s: (-s.attempts, s.key))
+
+
+class DownloadAnalyticsService:
+    """Indirme denemelerini zaman penceresinde ozetler."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_analytics(
+        self, hours: int = 24, host_limit: int = 50
+    ) -> DownloadAnalyticsResponse:
+        """Son `hours` saatin strateji, host ve zaman serisi istatistikleri."""
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        bucket = "hour" if hours <= HOURLY_BUCKET_MAX_HOURS else "day"
+
+        strategies, hosts = await self._group_stats(since)
+        return DownloadAnalyticsResponse(
+            since=since,
+            hours=hours,
+            bucket=bucket,
+            strategies=strategies,
+            # URL bulunamayan denemelerin host'u yoktur
+            hosts=[h for h in hosts if h.key][:host_limit],
+            timeline=await self._timeline(since, bucket),
+        )
+
+    async def _group_stats(
+        self, since: datetime
+    ) -> tuple[list[DownloadAttemptStats], list[DownloadAttemptStats]]:
+        """Strateji ve host gruplarini tek GROUPING SETS sorgusuyla hesaplar."""
+        duration = DownloadAttempt.duration_ms
+        stmt = (
+            select(
+                func.grouping(DownloadAttempt.strategy).label("g_strategy"),
+                DownloadAttempt.strategy,
+                DownloadAttempt.host,
+                DownloadAttempt.outcome,
+                func.count().label("attempt_count"),
+                func.sum(DownloadAttempt.bytes).label("total_bytes"),
+                func.percentile_cont(0.5).within_group(duration).label("p50"),
+                func.percentile_cont(0.95).within_group(duration).label("p95"),
+            )
+            .where(DownloadAttempt.started_at >= since)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(DownloadAttempt.strategy, DownloadAttempt.outcome),
+                    tuple_(DownloadAttempt.host, DownloadAttempt.outcome),
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+
+        strategy_rows = []
+        host_rows = []
+        for row in result.all():
+            values = (row.attempt_count, row.total_bytes, row.p50, row.p95)
+            if not row.g_strategy:
+                strategy_rows.append((row.strategy, row.outcome, *values))
+            else:
+                host_rows.append((row.host, row.outcome, *values))
+
+        return fold_attempt_stats(strategy_rows), fold_attempt_stats(host_rows)
+
+    async def _timeline(
+        self, since: datetime, bucket: str
+    ) -> list[DownloadAttemptBucket]:
+        """Strateji bazinda dilim basina deneme ve basari sayilari."""
+        bucket_start = func.date_trunc(bucket, DownloadAttempt.started_at)
+        stmt = (
+            select(
+                bucket_start.label("bucket"),
+                DownloadAttempt.strategy,
+                func.count().label("attempt_count"),
+                func.count()
+                .filter(DownloadAttempt.outcome == OUTCOME_SUCCESS)
+                .label("success_count"),
+            )
+            .where(
+                DownloadAttempt.started_at >= since,
+                DownloadAttempt.outcome != OUTCOME_CANCELLED,
+            )
+            .group_by(bucket_start, DownloadAttempt.strategy)
+            .order_by(bucket_start, DownloadAttempt.strategy)
+        )
+        result = await self.db.execute(stmt)
+        return [
+            DownloadAttemptBucket(
+                bucket=row.bucket,
+                strategy=row.strategy,
+                attempts=row.attempt_count,
+                successes=row.success_count,
+            )
+            for row in result.all()
+        ]
@@ -0,0 +1,217 @@
+"""Arka plan metadata tamamlama servisi.
+
+Eksik metadata'ya sahip kayitlari keyset sayfalama ile batch'ler halinde
+isler. Her batch sonunda job satirindaki `last_entry_id` checkpoint'i ayni
+transaction icinde guncellenir; worker yeniden basladiginda job kaldigi
+yerden devam eder.
+
+Eslesen kaynaktan makaleye baglanan kimlikler commit sonrasi kayitli makale
+filtresine de eklenir (bkz. `SavedPaperIndex`).
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from athena.core.config import get_settings
+from athena.models.enrichment_job import EnrichmentJob, EnrichmentJobStatus
+from athena.models.library import LibraryEntry
+from athena.models.paper import Paper
+from athena.schemas.search import PaperResponse, SearchFilters
+from athena.services.jobs import CheckpointedJobService
+from athena.services.library import LibraryService, paper_identifier_keys
+from athena.services.saved_index import SavedPaperIndex
+
+# Bu sureden uzun suredir ilerleme kaydetmeyen aktif job'lar terk edilmis sayilir
+STALE_JOB_AFTER = timedelta(minutes=10)
+
+ACTIVE_JOB_STATUSES = (
+    EnrichmentJobStatus.QUEUED.value,
+    EnrichmentJobStatus.RUNNING.value,
+)
+
+
+class MetadataEnrichmentService(CheckpointedJobService):
+    """Metadata tamamlama job'larini olusturur, takip eder ve calistirir."""
+
+    job_model = EnrichmentJob
+    status_enum = EnrichmentJobStatus
+    log_tag = "Enrichment"
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        saved_index: SavedPaperIndex | None = None,
+    ) -> None:
+        super().__init__(db)
+        settings = get_settings()
+        self.library_service = LibraryService(db)
+        self.batch_size = batch_size or settings.enrichment_batch_size
+        self.concurrency = concurrency or settings.enrichment_concurrency
+        self.saved_index = saved_index
+
+    async def create_or_resume_job(
+        self, max_entries: int | None = None
+    ) -> tuple[EnrichmentJob, bool]:
+        """Yeni job olusturur veya tamamlanmamis son job'i dondurur.
+
+        Returns:
+            (job, should_enqueue): Aktif ve ilerleyen bir job varsa tekrar
+            kuyruga eklenmez; terk edilmis (stale) job ise checkpoint'ten
+            devam etmesi icin yeniden kuyruga eklenmelidir.
+        """
+        stmt = (
+            select(EnrichmentJob)
+            .where(EnrichmentJob.status.in_(ACTIVE_JOB_STATUSES))
+            .order_by(EnrichmentJob.id.desc())
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        active_job = result.scalar_one_or_none()
+
+        if active_job:
+            cutoff = datetime.now(timezone.utc) - STALE_JOB_AFTER
+            is_stale = active_job.updated_at is None or active_job.updated_at < cutoff
+            return active_job, is_stale
+
+        job = EnrichmentJob(
+            status=EnrichmentJobStatus.QUEUED.value,
+            max_entries=max_entries,
+            total=await self._count_candidates(after_id=0, max_entries=max_entries),
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job, True
+
+    async def _run_batches(self, job: EnrichmentJob) -> None:
+        """Eksik metadata'li kayitlari `last_entry_id` sonrasindan isler."""
+        if job.last_entry_id:
+            logger.info(
+                f"[Enrichment] Resuming job_id={job.id} "
+                f"from entry_id>{job.last_entry_id}"
+            )
+
+        await self.library_service.search_service.preload_runtime_settings()
+
+        while True:
+            batch_limit = self.batch_size
+            if job.max_entries is not None:
+                remaining = job.max_entries - job.processed
+                if remaining <= 0:
+                    break
+                batch_limit = min(batch_limit, remaining)
+
+            entries = await self._fetch_batch(job.last_entry_id, batch_limit)
+            if not entries:
+                break
+
+            identifier_keys = await self._process_batch(job, entries)
+            job.last_entry_id = entries[-1].id
+            await self.db.commit()
+
+            if self.saved_index and identifier_keys:
+                await self.saved_index.add_identifiers(identifier_keys)
+            self._log_progress(job)
+
+    def _counters(self, job: EnrichmentJob) -> str:
+        return f"updated={job.updated}, skipped={job.skipped}, failed={job.failed}"
+
+    async def _count_candidates(self, after_id: int, max_entries: int | None) -> int:
+        """Checkpoint sonrasinda tamamlanacak kayit sayisini dondurur."""
+        stmt = (
+            select(func.count(LibraryEntry.id))
+            .join(LibraryEntry.paper)
+            .where(LibraryEntry.id > after_id)
+            .where(LibraryService.missing_metadata_clause())
+        )
+        result = await self.db.execute(stmt)
+        total = result.scalar() or 0
+        if max_entries is not None:
+            return min(total, max_entries)
+        return total
+
+    async def _fetch_batch(self, after_id: int, limit: int) -> list[LibraryEntry]:
+        """Checkpoint'ten sonraki eksik metadata'li kayitlari getirir (keyset)."""
+        stmt = (
+            select(LibraryEntry)
+            .options(
+                selectinload(LibraryEntry.paper).selectinload(Paper.authors),
+            )
+            .join(LibraryEntry.paper)
+            .where(LibraryEntry.id > after_id)
+            .where(LibraryService.missing_metadata_clause())
+            .order_by(LibraryEntry.id.asc())
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _process_batch(
+        self, job: EnrichmentJob, entries: list[LibraryEntry]
+    ) -> set[tuple[str, str]]:
+        """Batch'teki kayitlari paralel arar, sonuclari sirayla uygular.
+
+        Dis kaynak aramalari semaphore ile sinirlandirilarak paralel yapilir;
+        AsyncSession paylasilamadigi icin veritabani guncellemeleri siralidir.
+
+        Returns:
+            Makalelere baglanan eslesme kimlikleri (`(scheme, value)`)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        search_service = self.library_service.search_service
+
+        async def _search(paper: Paper) -> list[PaperResponse]:
+            async with semaphore:
+                query = paper.doi if paper.doi else paper.title
+                response = await search_service.search_papers(
+                    SearchFilters(query=query)
+                )
+                return response.results
+
+        results = await asyncio.gather(
+            *(_search(entry.paper) for entry in entries),
+            return_exceptions=True,
+        )
+        identifier_keys: set[tuple[str, str]] = set()
+
+        for entry, candidates in zip(entries, results):
+            job.processed += 1
+            if isinstance(candidates, Exception):
+                job.failed += 1
+                logger.warning(
+                    f"[Enrichment] Search failed: entry_id={entry.id}, "
+                    f"{type(candidates).__name__}: {candidates}"
+                )
+                continue
+
+            paper = entry.paper
+            match = self.library_service._find_best_match(paper, candidates)
+            if not match:
+                job.skipped += 1
+                continue
+
+            try:
+                changed = await self.library_service._apply_metadata_update(
+                    paper, match
+                )
+            except Exception as exc:
+                job.failed += 1
+                logger.warning(
+                    f"[Enrichment] Update failed: entry_id={entry.id}, "
+                    f"{type(exc).__name__}: {exc}"
+                )
+                continue
+
+            identifier_keys |= paper_identifier_keys(match)
+            if changed:
+                job.updated += 1
+            else:
+                job.skipped += 1
+
+        return identifier_keys
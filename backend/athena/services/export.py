@@ -14,11 +14,9 @@ import pandas as pd
 from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from athena.models.associations import collection_entries
-from athena.models.library import LibraryEntry
-from athena.models.tag import Tag
+from athena.models.library_read_model import LibraryReadModel
+from athena.schemas.library import LibraryEntrySchema
 
 
 class ExportService:
@@ -52,21 +50,18 @@ class ExportService:
         self,
         search_query: str | None = None,
         collection_id: int | None = None,
-    ) -> list[LibraryEntry]:
-        """Filtrelenmiş kütüphane girişlerini veritabanından çeker."""
-        query = select(LibraryEntry).options(
-            joinedload(LibraryEntry.paper),
-            joinedload(LibraryEntry.tags),
-        )
+    ) -> list[LibraryEntrySchema]:
+        """Filtrelenmiş kütüphane girişlerini okuma modelinden çeker.
+
+        Her satırın `display` JSON'u yazar ve etiketleri de içerdiğinden
+        kayıt sayısından bağımsız olarak tek sorgu çalışır.
+        """
+        query = select(LibraryReadModel.display)
 
         # Koleksiyon filtresi
         if collection_id is not None:
             query = query.where(
-                LibraryEntry.id.in_(
-                    select(collection_entries.c.entry_id).where(
-                        collection_entries.c.collection_id == collection_id
-                    )
-                )
+                LibraryReadModel.collection_ids.contains([collection_id])
             )
 
         # Tag filtresi (search_query varsa)
@@ -75,21 +70,18 @@ class ExportService:
                 t.strip().lower() for t in search_query.split(",") if t.strip()
             ]
             if tag_names:
-                query = query.join(LibraryEntry.tags).where(Tag.name.in_(tag_names))
+                query = query.where(LibraryReadModel.tag_names.overlap(tag_names))
 
-        query = query.order_by(LibraryEntry.id.desc())
+        query = query.order_by(LibraryReadModel.entry_id.desc())
 
         result = await self.db.execute(query)
-        entries = result.unique().scalars().all()
-
-        # Authors'ı yükle (async lazy loading için)
-        for entry in entries:
-            await self.db.refresh(entry.paper, ["authors"])
-
-        return list(entries)
+        return [
+            LibraryEntrySchema.model_validate(display)
+            for display in result.scalars().all()
+        ]
 
-    def _create_dataframe(self, entries: list[LibraryEntry]) -> pd.DataFrame:
-        """LibraryEntry listesinden Sprint 12.1 kolon yapisinda DataFrame olusturur."""
+    def _create_dataframe(self, entries: list[LibraryEntrySchema]) -> pd.DataFrame:
+        """Kutuphane kayitlarindan Sprint 12.1 kolon yapisinda DataFrame olusturur."""
         data = []
         citation_col = f"Citation as of {datetime.now().strftime('%d.%m.%Y')}"
 
@@ -118,7 +110,7 @@ class ExportService:
                 citation_col: paper.citation_count,
                 "Source": entry.source.value.title(),
                 "Downloaded": "EVET"
-                if entry.download_status.value == "completed"
+                if entry.download_status == "completed"
                 else "HAYIR",
                 "Kod/Veri Erişilebilirliği": self._code_data_availability(
                     paper.pdf_url,
@@ -0,0 +1,190 @@
+"""Kutuphane facet sayilari servisi.
+
+Yil, etiket, indirme durumu, kaynak ve koleksiyon dagilimlari okuma modeli
+uzerinde tek bir GROUPING SETS sorgusuyla hesaplanir. Sonuclar filtre
+imzasi ve kutuphane revizyonu (`library_revision_seq`) ile cache'lenir;
+her kutuphane yazimi revizyonu artirdigi icin eski cache anahtarlari
+kendiliginden gecersiz kalir.
+"""
+
+import hashlib
+import json
+
+from sqlalchemy import distinct, func, select, text, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from athena.core.cache import cache_get_json, cache_set_json
+from athena.core.config import get_settings
+from athena.models.collection import Collection
+from athena.models.library_read_model import LibraryReadModel
+from athena.schemas.library import FacetBucket, LibraryFacetsResponse
+from athena.services.library import LibraryService
+
+FACETS_CACHE_PREFIX = "library:facets"
+
+
+class LibraryFacetService:
+    """Filtrelenmis kutuphane icin facet histogramlarini hesaplar."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_facets(
+        self,
+        tag: str | None = None,
+        status: str | None = None,
+        min_citations: int | None = None,
+        year_start: int | None = None,
+        year_end: int | None = None,
+        search: str | None = None,
+        collection_id: int | None = None,
+    ) -> LibraryFacetsResponse:
+        """Facet sayilarini cache'ten veya veritabanindan dondurur."""
+        filters = {
+            "tag": tag,
+            "status": status,
+            "min_citations": min_citations,
+            "year_start": year_start,
+            "year_end": year_end,
+            "search": search,
+            "collection_id": collection_id,
+        }
+
+        cache_key = await self._cache_key(filters)
+        cached = await cache_get_json(cache_key)
+        if cached is not None:
+            return LibraryFacetsResponse.model_validate(cached)
+
+        facets = await self._compute_facets(filters)
+        await cache_set_json(
+            cache_key,
+            facets.model_dump(mode="json"),
+            get_settings().library_facets_cache_ttl,
+        )
+        return facets
+
+    async def _cache_key(self, filters: dict) -> str:
+        """Filtre imzasi + kutuphane revizyonundan cache anahtari uretir."""
+        result = await self.db.execute(
+            text("SELECT last_value FROM library_revision_seq")
+        )
+        revision = result.scalar() or 0
+        signature = json.dumps(filters, sort_keys=True, default=str)
+        digest = hashlib.sha1(signature.encode("utf-8")).hexdigest()
+        return f"{FACETS_CACHE_PREFIX}:{revision}:{digest}"
+
+    async def _compute_facets(self, filters: dict) -> LibraryFacetsResponse:
+        """Tum facet'leri tek GROUPING SETS sorgusuyla hesaplar.
+
+        Etiket ve koleksiyon dizileri LATERAL unnest ile satirlara acildigi
+        icin sayimlar `count(DISTINCT entry_id)` ile yapilir.
+        """
+        base_query, _ = LibraryService.apply_library_filters(
+            select(
+                LibraryReadModel.entry_id,
+                LibraryReadModel.year,
+                LibraryReadModel.download_status,
+                LibraryReadModel.source,
+                LibraryReadModel.tag_ids,
+                LibraryReadModel.tag_names,
+                LibraryReadModel.collection_ids,
+            ),
+            **filters,
+        )
+        base = base_query.subquery("filtered")
+
+        tags = (
+            func.unnest(base.c.tag_ids, base.c.tag_names)
+            .table_valued("tag_id", "tag_name")
+            .render_derived()
+            .lateral("t")
+        )
+        collections = (
+            func.unnest(base.c.collection_ids)
+            .table_valued("collection_id")
+            .render_derived()
+            .lateral("c")
+        )
+
+        stmt = (
+            select(
+                func.grouping(base.c.year).label("g_year"),
+                func.grouping(tags.c.tag_id).label("g_tag"),
+                func.grouping(base.c.download_status).label("g_status"),
+                func.grouping(base.c.source).label("g_source"),
+                func.grouping(collections.c.collection_id).label("g_collection"),
+                base.c.year,
+                tags.c.tag_id,
+                tags.c.tag_name,
+                base.c.download_status,
+                base.c.source,
+                collections.c.collection_id,
+                Collection.name.label("collection_name"),
+                func.count(distinct(base.c.entry_id)).label("entry_count"),
+            )
+            .select_from(base)
+            .outerjoin(tags, true())
+            .outerjoin(collections, true())
+            .outerjoin(Collection, Collection.id == collections.c.collection_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(),
+                    tuple_(base.c.year),
+                    tuple_(tags.c.tag_id, tags.c.tag_name),
+                    tuple_(base.c.download_status),
+                    tuple_(base.c.source),
+                    tuple_(collections.c.collection_id, Collection.name),
+                )
+            )
+        )
+
+        result = await self.db.execute(stmt)
+
+        facets = LibraryFacetsResponse(total=0)
+        for row in result.all():
+            grouped = (
+                row.g_year,
+                row.g_tag,
+                row.g_status,
+                row.g_source,
+                row.g_collection,
+            )
+            if all(grouped):
+                facets.total = row.entry_count
+            elif not row.g_year:
+                facets.years.append(FacetBucket(value=row.year, count=row.entry_count))
+            elif not row.g_tag:
+                # Etiketi olmayan kayitlar unnest'te NULL satir uretir
+                if row.tag_id is not None:
+                    facets.tags.append(
+                        FacetBucket(
+                            value=row.tag_id, label=row.tag_name, count=row.entry_count
+                        )
+                    )
+            elif not row.g_status:
+                facets.download_statuses.append(
+                    FacetBucket(value=row.download_status, count=row.entry_count)
+                )
+            elif not row.g_source:
+                facets.sources.append(
+                    FacetBucket(value=row.source, count=row.entry_count)
+                )
+            elif row.collection_id is not None:
+                facets.collections.append(
+                    FacetBucket(
+                        value=row.collection_id,
+                        label=row.collection_name,
+                        count=row.entry_count,
+                    )
+                )
+
+        facets.years.sort(key=lambda b: (b.value is None, -(b.value or 0)))
+        for buckets in (
+            facets.tags,
+            facets.download_statuses,
+            facets.sources,
+            facets.collections,
+        ):
+            buckets.sort(key=lambda b: (-b.count, str(b.label or b.value)))
+
+        return facets
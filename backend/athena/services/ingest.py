@@ -0,0 +1,136 @@
+"""Arka plan toplu ekleme (ingest) servisi.
+
+Buyuk makale listeleri API isteginde islenmez: istek job satirina yazilir,
+Celery worker'i listeyi `ingest_batch_size`'lik batch'ler halinde
+`LibraryService.stage_bulk_papers` ile ekler. Her batch'in sonucu ve
+`next_index` checkpoint'i ayni transaction'da commit edilir; worker yeniden
+basladiginda job kaldigi yerden devam eder ve ayni batch iki kez sayilmaz.
+
+Indirmeler commit'ten sonra kuyruga eklenir ve `queued_count` checkpoint'i
+ile takip edilir: kuyruklama ile checkpoint arasinda cokme veya broker
+hatasi olursa eksik kalan kayitlar sonraki batch'te ya da job devam
+ettiginde tekrar kuyruga eklenir.
+"""
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from athena.core.config import get_settings
+from athena.models.ingest_job import IngestJob, IngestJobStatus
+from athena.schemas.search import PaperResponse
+from athena.services.jobs import CheckpointedJobService
+from athena.services.library import LibraryService
+from athena.services.saved_index import SavedPaperIndex
+from athena.tasks.downloader import enqueue_downloads
+
+
+class IngestJobService(CheckpointedJobService):
+    """Toplu ekleme job'larini olusturur, takip eder ve calistirir."""
+
+    job_model = IngestJob
+    status_enum = IngestJobStatus
+    log_tag = "Ingest"
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int | None = None,
+        saved_index: SavedPaperIndex | None = None,
+    ) -> None:
+        super().__init__(db)
+        self.library_service = LibraryService(db)
+        self.batch_size = batch_size or get_settings().ingest_batch_size
+        self.saved_index = saved_index
+
+    async def create_job(
+        self, papers: list[PaperResponse], search_query: str
+    ) -> IngestJob:
+        """Makale listesini job olarak kaydeder (commit cagirana aittir)."""
+        job = IngestJob(
+            status=IngestJobStatus.QUEUED.value,
+            search_query=search_query,
+            papers=[paper.model_dump(mode="json") for paper in papers],
+            total=len(papers),
+        )
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def _run_batches(self, job: IngestJob) -> None:
+        """Makaleleri `next_index`'ten baslayarak batch'ler halinde ekler.
+
+        Bir batch'in transaction'i basarisiz olursa o batch'teki makaleler
+        `failed` sayilir ve job sonraki batch ile devam eder.
+        """
+        if job.next_index:
+            logger.info(
+                f"[Ingest] Resuming job_id={job.id} from index {job.next_index}"
+            )
+        # Onceki calismada commit edilip kuyruga eklenemeyen indirmeler
+        await self._enqueue_pending_downloads(job)
+
+        while job.next_index < job.total:
+            start = job.next_index
+            end = min(start + self.batch_size, job.total)
+            papers = [
+                PaperResponse.model_validate(item) for item in job.papers[start:end]
+            ]
+
+            failed_before = job.failed
+            await self._process_batch(job, papers, start)
+            job.next_index = end
+            job.processed += len(papers)
+            await self.db.commit()
+
+            await self._enqueue_pending_downloads(job)
+            if self.saved_index and job.failed == failed_before:
+                await self.saved_index.add(papers)
+            self._log_progress(job)
+
+    def _counters(self, job: IngestJob) -> str:
+        return f"added={job.added}, duplicates={job.duplicates}, failed={job.failed}"
+
+    async def _process_batch(
+        self, job: IngestJob, papers: list[PaperResponse], start: int
+    ) -> list[int]:
+        """Batch'i ekler ve job sayaclarini gunceller (commit etmez)."""
+        try:
+            result = await self.library_service.stage_bulk_papers(
+                papers, job.search_query
+            )
+        except Exception as exc:
+            logger.warning(
+                f"[Ingest] job_id={job.id} batch {start}-{start + len(papers)} "
+                f"failed: {type(exc).__name__}: {exc}"
+            )
+            await self.db.rollback()
+            # Rollback job'i expire eder; son commit'lenmis checkpoint'i yukle
+            await self.db.refresh(job)
+            job.failed += len(papers)
+            return []
+
+        job.added += len(result.entry_ids)
+        job.duplicates += result.duplicate_count
+        job.entry_ids = [*job.entry_ids, *result.entry_ids]
+        return result.entry_ids
+
+    async def _enqueue_pending_downloads(self, job: IngestJob) -> None:
+        """Commit edilmis ama henuz kuyruga eklenmemis indirmeleri ekler.
+
+        `queued_count` kuyruklamadan sonra commit edilir; arada cokme olursa
+        ayni kayitlar tekrar kuyruga eklenebilir, indirme task'i tamamlanmis
+        kayitlari atladigi icin bu zararsizdir.
+        """
+        pending_ids = job.entry_ids[job.queued_count :]
+        if not pending_ids:
+            return
+        try:
+            enqueue_downloads(pending_ids)
+        except Exception as e:
+            # Sonraki batch'te tekrar denenir; job biterse retry-downloads ile
+            logger.warning(
+                f"[Ingest] Could not queue {len(pending_ids)} downloads: {e}"
+            )
+            return
+        job.queued_count = len(job.entry_ids)
+        await self.db.commit()
@@ -0,0 +1,88 @@
+"""Checkpoint'li arka plan job'lari icin ortak yasam dongusu.
+
+Metadata tamamlama ve toplu ekleme job'lari ayni akisi izler:
+`queued -> running -> completed | failed`. Job batch'ler halinde ilerler ve
+her batch checkpoint'iyle birlikte commit edilir; task yeniden teslim
+edilirse (worker restart, acks_late) job kaldigi yerden devam eder.
+Alt siniflar yalnizca batch dongusunu (`_run_batches`) ve log sayaclarini
+(`_counters`) tanimlar.
+"""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CheckpointedJobService:
+    """Job satirinin durum gecislerini ve hata kaydini yonetir."""
+
+    job_model: Any
+    status_enum: type[Enum]
+    log_tag: str
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_job(self, job_id: int):
+        """Job kaydini ID ile getirir."""
+        return await self.db.get(self.job_model, job_id, populate_existing=True)
+
+    async def run_job(self, job_id: int):
+        """Job'i checkpoint'ten baslayarak tamamlanana kadar calistirir.
+
+        Beklenmeyen hata job'i `failed` isaretler ve yeniden firlatilir.
+        """
+        job = await self.get_job(job_id)
+        if not job:
+            logger.warning(f"[{self.log_tag}] Job not found: job_id={job_id}")
+            return None
+
+        if job.status in (
+            self.status_enum.COMPLETED.value,
+            self.status_enum.FAILED.value,
+        ):
+            return job
+
+        job.status = self.status_enum.RUNNING.value
+        await self.db.commit()
+
+        try:
+            await self._run_batches(job)
+            job.status = self.status_enum.COMPLETED.value
+            job.finished_at = datetime.now(timezone.utc)
+            await self.db.commit()
+        except Exception as exc:
+            logger.error(
+                f"[{self.log_tag}] job_id={job_id} aborted: "
+                f"{type(exc).__name__}: {exc}"
+            )
+            await self.db.rollback()
+            job = await self.get_job(job_id)
+            if job:
+                job.status = self.status_enum.FAILED.value
+                job.error_message = f"{type(exc).__name__}: {exc}"[:1000]
+                job.finished_at = datetime.now(timezone.utc)
+                await self.db.commit()
+            raise
+
+        logger.info(
+            f"[{self.log_tag}] job_id={job_id} completed: {self._counters(job)}"
+        )
+        return job
+
+    def _log_progress(self, job) -> None:
+        logger.info(
+            f"[{self.log_tag}] job_id={job.id} progress: "
+            f"{job.processed}/{job.total}, {self._counters(job)}"
+        )
+
+    async def _run_batches(self, job) -> None:
+        """Batch'leri isler; her batch sonunda checkpoint'i commit eder."""
+        raise NotImplementedError
+
+    def _counters(self, job) -> str:
+        """Log satirlarindaki job sayaclari."""
+        raise NotImplementedError
@@ -1,18 +1,32 @@
+import json
 import re
 import unicodedata
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 from loguru import logger
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, delete, func, inspect, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
 
-from athena.models.associations import collection_entries
+from athena.core.config import get_settings
+from athena.core.identifiers import (
+    IdentifierScheme,
+    collect_identifiers,
+    external_id_key,
+)
+from athena.core.pagination import LibraryCursor, decode_cursor, encode_cursor
+from athena.models.associations import library_tags, paper_authors
 from athena.models.author import Author
 from athena.models.library import DownloadStatus, LibraryEntry, SourceType
+from athena.models.library_entry_pdf import LibraryEntryPdf
+from athena.models.library_read_model import LibraryReadModel
 from athena.models.paper import Paper
+from athena.models.paper_identifier import PaperIdentifier
+from athena.models.pdf_blob import PdfBlob, lock_blob
 from athena.models.tag import Tag
-from athena.schemas.search import PaperResponse, PaperSource, SearchFilters
+from athena.schemas.search import PaperResponse, PaperSource
 from athena.services.search import SearchService
 
 
@@ -38,6 +52,92 @@ def slugify(text: str) -> str:
     return text[:255]
 
 
+CountMode = Literal["exact", "auto"]
+
+
+@dataclass
+class LibraryPage:
+    """Kutuphane listeleme sonucu."""
+
+    entries: list[LibraryReadModel]
+    total: int
+    total_is_exact: bool
+    next_cursor: str | None
+
+
+@dataclass
+class BulkIngestResult:
+    """Toplu ekleme sonucu."""
+
+    entry_ids: list[int]
+    duplicate_count: int
+    failed_count: int
+
+
+# Tek INSERT statement'ina konan satir sayisi (asyncpg parametre limiti 32767)
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def _chunked(items: list, size: int = BULK_INSERT_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _doi_of(paper_data: PaperResponse) -> str | None:
+    """external_id DOI ise dondurur (papers.doi kolonuna sigmayanlar haric)."""
+    external_id = paper_data.external_id
+    if external_id and external_id.startswith("10.") and len(external_id) <= 255:
+        return external_id
+    return None
+
+
+def _bounded(value: str | None, max_length: int) -> str | None:
+    """Kolona sigmayan URL'leri kirpmak yerine atar (kirpik URL gecersizdir)."""
+    if value and len(value) <= max_length:
+        return value
+    return None
+
+
+def _paper_values(paper_data: PaperResponse, title_slug: str) -> dict:
+    """Arama sonucunu papers kolonlarina sigacak sekilde normalize eder.
+
+    Tekli ekleme ve toplu ekleme ayni degerleri yazar: venue kirpilir,
+    kolona sigmayan DOI ve PDF URL'leri atilir.
+    """
+    return {
+        "doi": _doi_of(paper_data),
+        "title": paper_data.title,
+        "title_slug": title_slug,
+        "abstract": paper_data.abstract,
+        "year": paper_data.year,
+        "citation_count": paper_data.citation_count or 0,
+        "venue": (paper_data.venue or "")[:500] or None,
+        "pdf_url": _bounded(paper_data.pdf_url, 1000),
+    }
+
+
+@dataclass
+class _IngestCandidate:
+    """Toplu eklemede tekillestirilmis tek makale."""
+
+    paper: PaperResponse
+    doi: str | None
+    slug: str
+    keys: set[tuple[str, str]]
+
+
+def paper_identifier_keys(paper_data: PaperResponse) -> set[tuple[str, str]]:
+    """Arama sonucunun paper_identifiers tablosundaki (scheme, value) anahtarlari."""
+    return collect_identifiers(
+        paper_data.external_id, paper_data.source, paper_data.identifiers
+    )
+
+
+def _identifier_in(keys: set[tuple[str, str]] | list[tuple[str, str]]):
+    """(scheme, value) ciftleri icin paper_identifiers birincil anahtar eslesmesi."""
+    return tuple_(PaperIdentifier.scheme, PaperIdentifier.value).in_(list(keys))
+
+
 def map_source(paper_source: PaperSource) -> SourceType:
     """PaperSource (schema) -> SourceType (model) dönüşümü."""
     mapping = {
@@ -69,94 +169,209 @@ class LibraryService:
         year_end: int | None = None,
         search: str | None = None,
         collection_id: int | None = None,
-    ) -> tuple[list[LibraryEntry], int]:
-        """Kutuphane kayitlarini filtreleyerek getirir.
+        cursor: str | None = None,
+        count_mode: CountMode = "exact",
+    ) -> LibraryPage:
+        """Kutuphane kayitlarini okuma modelinden filtreleyerek getirir.
 
+        Filtreler ve arama tek tablo (`library_read_model`) uzerindeki indeksli
+        kolonlara uygulanir; join veya iliski yuklemesi yapilmaz.
         Search doluysa PostgreSQL Full-Text Search + fallback ilike uygular.
+        `cursor` verilirse OFFSET yerine keyset sayfalama kullanilir
+        (id veya FTS aramalarinda (rank, id)); `page` yok sayilir.
+        `count_mode="auto"` ise buyuk sonuc kumelerinde toplam sayi planner
+        tahmininden alinir (bkz. `_count_entries`).
         """
-        query = select(LibraryEntry).options(
-            joinedload(LibraryEntry.paper),
-            joinedload(LibraryEntry.tags),
+        filters = {
+            "tag": tag,
+            "status": status,
+            "min_citations": min_citations,
+            "year_start": year_start,
+            "year_end": year_end,
+            "search": search,
+            "collection_id": collection_id,
+        }
+
+        # Sayim icin ORDER BY icermeyen yalin sorgu
+        id_query, _ = self.apply_library_filters(
+            select(LibraryReadModel.entry_id), **filters
         )
-        query = query.join(LibraryEntry.paper)
+        total, total_is_exact = await self._count_entries(id_query, count_mode)
 
-        if collection_id is not None:
-            query = query.where(
-                LibraryEntry.id.in_(
-                    select(collection_entries.c.entry_id).where(
-                        collection_entries.c.collection_id == collection_id
+        query, rank_expr = self.apply_library_filters(
+            select(LibraryReadModel), **filters
+        )
+        entry_id = LibraryReadModel.entry_id
+
+        if rank_expr is not None:
+            query = query.add_columns(rank_expr).order_by(
+                rank_expr.desc(), entry_id.desc()
+            )
+        else:
+            query = query.order_by(entry_id.desc())
+
+        if cursor:
+            position = decode_cursor(cursor, require_rank=rank_expr is not None)
+            if rank_expr is not None:
+                query = query.where(
+                    or_(
+                        rank_expr < position.rank,
+                        and_(rank_expr == position.rank, entry_id < position.id),
                     )
                 )
+            else:
+                query = query.where(entry_id < position.id)
+        else:
+            query = query.offset((page - 1) * limit)
+
+        # Sonraki sayfanin varligini anlamak icin bir fazla satir cek
+        query = query.limit(limit + 1)
+
+        result = await self.db.execute(query)
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                LibraryCursor(
+                    id=last[0].entry_id,
+                    rank=float(last[1]) if rank_expr is not None else None,
+                )
             )
 
+        return LibraryPage(
+            entries=[row[0] for row in rows],
+            total=total,
+            total_is_exact=total_is_exact,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def apply_library_filters(
+        query,
+        tag: str | None = None,
+        status: str | None = None,
+        min_citations: int | None = None,
+        year_start: int | None = None,
+        year_end: int | None = None,
+        search: str | None = None,
+        collection_id: int | None = None,
+    ):
+        """Listeleme filtrelerini okuma modeli sorgusuna uygular.
+
+        Liste ve ZIP endpoint'leri ayni filtreleri kullanir. Arama; FTS,
+        baslik/ozet ve yazar/etiket adlari (`search_text`) uzerinde tek
+        tablodaki GIN indeksleriyle calisir.
+
+        Returns:
+            (query, rank_expr) - rank_expr sadece search doluysa tanimlidir.
+        """
+        read_model = LibraryReadModel
+
+        if collection_id is not None:
+            query = query.where(read_model.collection_ids.contains([collection_id]))
+
         if status:
             try:
                 query = query.where(
-                    LibraryEntry.download_status == DownloadStatus(status.lower())
+                    read_model.download_status == DownloadStatus(status.lower()).value
                 )
             except ValueError:
                 pass
 
         if tag:
-            query = query.join(LibraryEntry.tags).where(Tag.name == tag.lower())
+            query = query.where(read_model.tag_names.contains([tag.lower()]))
 
         if min_citations is not None:
-            query = query.where(Paper.citation_count >= min_citations)
+            query = query.where(read_model.citation_count >= min_citations)
 
         if year_start is not None:
-            query = query.where(Paper.year >= year_start)
+            query = query.where(read_model.year >= year_start)
         if year_end is not None:
-            query = query.where(Paper.year <= year_end)
+            query = query.where(read_model.year <= year_end)
 
         rank_expr = None
         if search:
-            search_term = f"%{search.lower()}%"
             ts_query = func.websearch_to_tsquery("english", search)
-            fts_match = Paper.search_vector.op("@@")(ts_query)
-
-            author_subquery = (
-                select(LibraryEntry.id)
-                .join(LibraryEntry.paper)
-                .join(Paper.authors)
-                .where(func.lower(Author.name).like(search_term))
+            escaped = (
+                search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
             )
-            tag_subquery = (
-                select(LibraryEntry.id)
-                .join(LibraryEntry.tags)
-                .where(func.lower(Tag.name).like(search_term))
+            pattern = f"%{escaped}%"
+            query = query.where(
+                or_(
+                    read_model.search_vector.op("@@")(ts_query),
+                    read_model.title.ilike(pattern, escape="\\"),
+                    read_model.abstract.ilike(pattern, escape="\\"),
+                    read_model.search_text.ilike(pattern, escape="\\"),
+                )
             )
-
-            fallback_match = (
-                func.lower(Paper.title).like(search_term)
-                | func.lower(func.coalesce(Paper.abstract, "")).like(search_term)
-                | LibraryEntry.id.in_(author_subquery)
-                | LibraryEntry.id.in_(tag_subquery)
+            # FTS eslesmesi olmayan fallback satirlarinda ts_rank 0 doner;
+            # NULL olmamasi keyset karsilastirmasini tutarli kilar.
+            rank_expr = func.coalesce(
+                func.ts_rank(read_model.search_vector, ts_query), 0.0
             )
 
-            query = query.where(fts_match | fallback_match)
-            rank_expr = func.ts_rank(Paper.search_vector, ts_query)
+        return query, rank_expr
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+    async def _count_entries(
+        self, id_query, count_mode: CountMode = "exact"
+    ) -> tuple[int, bool]:
+        """Filtrelenmis kayit sayisini dondurur.
 
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+        `auto` modunda once PostgreSQL planner tahmini alinir; tahmin esik
+        degerinin ustundeyse tam sayim yapilmaz ve tahmin dondurulur.
 
-        if rank_expr is not None:
-            query = query.order_by(rank_expr.desc(), LibraryEntry.id.desc())
-        else:
-            query = query.order_by(LibraryEntry.id.desc())
+        Returns:
+            (total, is_exact)
+        """
+        if count_mode == "auto":
+            estimate = await self._estimate_row_count(id_query)
+            threshold = get_settings().library_count_exact_threshold
+            if estimate is not None and estimate > threshold:
+                return estimate, False
+
+        result = await self.db.execute(
+            select(func.count()).select_from(id_query.subquery())
+        )
+        return result.scalar() or 0, True
 
-        result = await self.db.execute(query)
-        entries = result.unique().scalars().all()
-        return list(entries), total
+    async def _estimate_row_count(self, query) -> int | None:
+        """EXPLAIN ciktisindan planner'in satir tahminini okur.
+
+        Sorgu bind parametreleriyle derlenir ve degerler surucuye ayri
+        iletilir; kullanici girdisi SQL metnine gomulmez.
+        """
+        compiled = query.compile(
+            dialect=self.db.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        params = compiled.params
+        if compiled.positional:
+            params = tuple(params[name] for name in compiled.positiontup)
+
+        conn = await self.db.connection()
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
 
     async def delete_library_entry(
         self, entry_id: int, data_dir: Path
     ) -> bool:
         """Kütüphane kaydını ve varsa PDF dosyasını siler.
 
+        İçerik adresli PDF başka kayıtlarca da kullanılıyorsa dosya korunur;
+        son referans silindiğinde blob ve dosyası da silinir.
+
         Returns:
             True: Başarıyla silindi, False: Kayıt bulunamadı
         """
@@ -167,22 +382,47 @@ class LibraryService:
         if not entry:
             return False
 
-        # Fiziksel PDF dosyasını sil
-        if entry.file_path:
-            from athena.core.file_paths import resolve_data_file_path
-
-            resolved = resolve_data_file_path(entry.file_path, data_dir)
-            if resolved and resolved.is_file():
-                try:
-                    resolved.unlink()
-                    logger.info(f"PDF deleted: {resolved}")
-                except OSError as e:
-                    logger.warning(f"PDF silinemedi: {resolved} - {e}")
+        file_path = entry.file_path
+        sha256 = await self.db.scalar(
+            select(LibraryEntryPdf.sha256).where(LibraryEntryPdf.entry_id == entry_id)
+        )
 
+        # Referans CASCADE ile silinir, trigger ref_count'u dusurur
         await self.db.delete(entry)
         await self.db.commit()
+
+        if sha256 is None:
+            # Icerik adresli olmayan (legacy) dosya yalnizca bu kayda aittir
+            self._unlink_pdf(file_path, data_dir)
+            return True
+
+        # Dosya kilit birakilmadan silinir; o sirada ayni blob'a baglanan
+        # bir indirme kilidi bekler ve dosyayi yeniden yerlestirir
+        await self.db.execute(lock_blob(sha256))
+        result = await self.db.execute(
+            delete(PdfBlob)
+            .where(PdfBlob.sha256 == sha256, PdfBlob.ref_count == 0)
+            .returning(PdfBlob.file_path)
+        )
+        self._unlink_pdf(result.scalar_one_or_none(), data_dir)
+        await self.db.commit()
         return True
 
+    @staticmethod
+    def _unlink_pdf(file_path: str | None, data_dir: Path) -> None:
+        """Fiziksel PDF dosyasını siler; hata silme işlemini bozmaz."""
+        if not file_path:
+            return
+        from athena.core.file_paths import resolve_data_file_path
+
+        resolved = resolve_data_file_path(file_path, data_dir)
+        if resolved and resolved.is_file():
+            try:
+                resolved.unlink()
+                logger.info(f"PDF deleted: {resolved}")
+            except OSError as e:
+                logger.warning(f"PDF silinemedi: {resolved} - {e}")
+
     async def update_tags(
         self, entry_id: int, tag_names: list[str]
     ) -> LibraryEntry | None:
@@ -223,145 +463,46 @@ class LibraryService:
         await self.db.refresh(entry, ["tags"])
         return entry
 
-    async def enrich_missing_metadata(self, limit: int = 20) -> dict:
-        """Kutuphanedeki eksik metadata'lari dis kaynaklardan tamamlar.
+    async def get_saved_external_ids(self, external_ids: list[str]) -> set[str]:
+        """Verilen external_id'lerden kutuphanede kayitli olanlari dondurur.
 
-        Is kurali:
-        - Sadece eksik metadata'ya sahip paper'lar islenir.
-        - DOI varsa DOI ile, yoksa baslik ile arama yapilir.
-        - Eslesmelerde once DOI, sonra normalize baslik kullanilir.
-        - Sadece eksik alanlar guncellenir.
+        DOI, arXiv, Semantic Scholar, OpenAlex ve CORE ID'leri
+        `paper_identifiers` birincil anahtari uzerinden tek sorguda eslesir.
         """
-        stmt = (
-            select(LibraryEntry)
-            .options(
-                selectinload(LibraryEntry.paper).selectinload(Paper.authors),
-            )
-            .join(LibraryEntry.paper)
-            .order_by(LibraryEntry.id.desc())
-        )
-        result = await self.db.execute(stmt)
-        entries = result.scalars().all()
+        keys_by_id: dict[str, tuple[str, str]] = {}
+        for external_id in external_ids:
+            key = external_id_key(external_id)
+            if key:
+                keys_by_id[external_id] = key
 
-        processed = 0
-        updated = 0
-        skipped = 0
-        failed = 0
-        details: list[dict] = []
-
-        for entry in entries:
-            if processed >= limit:
-                break
-
-            paper = entry.paper
-            if paper is None:
-                skipped += 1
-                continue
-
-            if not self._needs_metadata_enrichment(paper):
-                skipped += 1
-                continue
-
-            processed += 1
-            query = paper.doi if paper.doi else paper.title
-
-            try:
-                search_response = await self.search_service.search_papers(
-                    SearchFilters(query=query)
-                )
-                match = self._find_best_match(paper, search_response.results)
-                if not match:
-                    skipped += 1
-                    details.append(
-                        {
-                            "entry_id": entry.id,
-                            "paper_id": paper.id,
-                            "status": "no_match",
-                        }
-                    )
-                    continue
-
-                changed = await self._apply_metadata_update(paper, match)
-                if changed:
-                    updated += 1
-                    details.append(
-                        {
-                            "entry_id": entry.id,
-                            "paper_id": paper.id,
-                            "status": "updated",
-                        }
-                    )
-                else:
-                    skipped += 1
-                    details.append(
-                        {
-                            "entry_id": entry.id,
-                            "paper_id": paper.id,
-                            "status": "no_change",
-                        }
-                    )
-            except Exception as exc:
-                failed += 1
-                details.append(
-                    {
-                        "entry_id": entry.id,
-                        "paper_id": paper.id,
-                        "status": "failed",
-                        "error": f"{type(exc).__name__}: {exc}",
-                    }
-                )
-
-        await self.db.commit()
-
-        return {
-            "processed": processed,
-            "updated": updated,
-            "skipped": skipped,
-            "failed": failed,
-            "details": details,
-        }
-
-    async def get_saved_external_ids(self, external_ids: list[str]) -> set[str]:
-        """Verilen external_id'lerden kutuphanede kayitli olanlari dondurur."""
-        if not external_ids:
+        if not keys_by_id:
             return set()
 
-        # DOI'ler (10. ile baslayanlar) ve diger ID'ler
-        dois = [eid for eid in external_ids if eid.startswith("10.")]
-        other_ids = [eid for eid in external_ids if not eid.startswith("10.")]
-
-        saved: set[str] = set()
-
-        # DOI ile kontrol
-        if dois:
+        found: set[tuple[str, str]] = set()
+        for chunk in _chunked(list(set(keys_by_id.values())), 5000):
             stmt = (
-                select(Paper.doi)
-                .join(LibraryEntry, LibraryEntry.paper_id == Paper.id)
-                .where(Paper.doi.in_(dois))
+                select(PaperIdentifier.scheme, PaperIdentifier.value)
+                .join(LibraryEntry, LibraryEntry.paper_id == PaperIdentifier.paper_id)
+                .where(_identifier_in(chunk))
             )
             result = await self.db.execute(stmt)
-            saved.update(row[0] for row in result.all() if row[0])
-
-        # Diger external_id'ler icin title_slug ile kontrol
-        # (Semantic Scholar paperId gibi DOI olmayan ID'ler)
-        if other_ids:
-            # Bu ID'ler genelde paperId, bunlari title_slug'a cevirip kontrol edemeyiz
-            # Ama paper tablosunda DOI olmadan kaydedilmis olabilirler
-            # Simdilik sadece DOI bazli kontrol yeterli
-            pass
+            found.update((scheme, value) for scheme, value in result.all())
 
-        return saved
+        return {eid for eid, key in keys_by_id.items() if key in found}
 
     async def is_paper_in_library(self, paper_data: PaperResponse) -> bool:
         """Makalenin kutuphanede kayitli olup olmadigini kontrol eder."""
-        title_slug = slugify(paper_data.title)
-
-        # DOI ile kontrol
-        if paper_data.external_id and paper_data.external_id.startswith("10."):
+        # Dis kimliklerden herhangi biri ile kontrol
+        keys = paper_identifier_keys(paper_data)
+        if keys:
             stmt = (
                 select(LibraryEntry.id)
-                .join(Paper, LibraryEntry.paper_id == Paper.id)
-                .where(Paper.doi == paper_data.external_id)
+                .join(
+                    PaperIdentifier,
+                    PaperIdentifier.paper_id == LibraryEntry.paper_id,
+                )
+                .where(_identifier_in(keys))
+                .limit(1)
             )
             result = await self.db.execute(stmt)
             if result.scalar_one_or_none():
@@ -371,7 +512,8 @@ class LibraryService:
         stmt = (
             select(LibraryEntry.id)
             .join(Paper, LibraryEntry.paper_id == Paper.id)
-            .where(Paper.title_slug == title_slug)
+            .where(Paper.title_slug == slugify(paper_data.title))
+            .limit(1)
         )
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
@@ -403,21 +545,296 @@ class LibraryService:
 
         return library_entry
 
+    async def bulk_add_papers(
+        self, papers: list[PaperResponse], search_query: str
+    ) -> BulkIngestResult:
+        """Makaleleri set tabanli upsert'lerle tek transaction'da ekler.
+
+        Paper basina sorgu atmak yerine her tablo icin toplu SELECT ve
+        INSERT ... ON CONFLICT calistirilir; sorgu sayisi makale sayisindan
+        bagimsizdir. Tekillestirme `add_paper_to_library` ile aynidir: DOI
+        veya title_slug eslesmesi ayni makale sayilir.
+        """
+        try:
+            result = await self.stage_bulk_papers(papers, search_query)
+            await self.db.commit()
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(
+                f"Bulk ingest failed for {len(papers)} papers: "
+                f"{type(exc).__name__}: {exc}"
+            )
+            return BulkIngestResult([], 0, len(papers))
+
+        return result
+
+    async def stage_bulk_papers(
+        self, papers: list[PaperResponse], search_query: str
+    ) -> BulkIngestResult:
+        """bulk_add_papers'in commit etmeyen hali.
+
+        Cagiran kendi kayitlarini (or. ingest job ilerlemesi) ayni
+        transaction'da commit edebilir. Hata durumunda exception yukari
+        firlatilir; rollback cagirana aittir.
+        """
+        # 1. Batch ici tekillestirme (herhangi bir kimlik veya title_slug)
+        candidates: list[_IngestCandidate] = []
+        seen_keys: set[tuple[str, str]] = set()
+        seen_slugs: set[str] = set()
+        duplicate_count = 0
+        for paper_data in papers:
+            candidate = _IngestCandidate(
+                paper=paper_data,
+                doi=_doi_of(paper_data),
+                slug=slugify(paper_data.title),
+                keys=paper_identifier_keys(paper_data),
+            )
+            if candidate.keys & seen_keys or candidate.slug in seen_slugs:
+                duplicate_count += 1
+                continue
+            seen_keys.update(candidate.keys)
+            seen_slugs.add(candidate.slug)
+            candidates.append(candidate)
+
+        if not candidates:
+            return BulkIngestResult([], duplicate_count, 0)
+
+        entry_ids, existing_count = await self._bulk_upsert(candidates, search_query)
+        return BulkIngestResult(entry_ids, duplicate_count + existing_count, 0)
+
+    async def _bulk_upsert(
+        self, candidates: list[_IngestCandidate], search_query: str
+    ) -> tuple[list[int], int]:
+        """bulk_add_papers icin upsert adimlari.
+
+        Returns:
+            (yeni entry id'leri, zaten kutuphanede olan makale sayisi)
+        """
+        # 2. Mevcut paper'lar: once dis kimlikler, sonra title_slug
+        paper_ids_by_key: dict[tuple[str, str], int] = {}
+        paper_ids_by_slug: dict[str, int] = {}
+        all_keys = [key for candidate in candidates for key in candidate.keys]
+        for chunk in _chunked(all_keys):
+            result = await self.db.execute(
+                select(
+                    PaperIdentifier.scheme,
+                    PaperIdentifier.value,
+                    PaperIdentifier.paper_id,
+                ).where(_identifier_in(chunk))
+            )
+            for scheme, value, paper_id in result.all():
+                paper_ids_by_key[(scheme, value)] = paper_id
+
+        for chunk in _chunked([candidate.slug for candidate in candidates]):
+            result = await self.db.execute(
+                select(Paper.id, Paper.title_slug)
+                .where(Paper.title_slug.in_(chunk))
+                .order_by(Paper.id)
+            )
+            for paper_id, title_slug in result.all():
+                paper_ids_by_slug.setdefault(title_slug, paper_id)
+
+        def _existing_paper_id(candidate: _IngestCandidate) -> int | None:
+            for key in candidate.keys:
+                if key in paper_ids_by_key:
+                    return paper_ids_by_key[key]
+            return paper_ids_by_slug.get(candidate.slug)
+
+        # 3. Yeni paper'lari ekle (DOI cakismasinda eszamanli ekleme kazanir)
+        new_papers = [c for c in candidates if _existing_paper_id(c) is None]
+        new_paper_ids: set[int] = set()
+        for chunk in _chunked(new_papers):
+            stmt = (
+                pg_insert(Paper)
+                .values(
+                    [
+                        _paper_values(candidate.paper, candidate.slug)
+                        for candidate in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Paper.doi])
+                .returning(Paper.id, Paper.title_slug)
+            )
+            result = await self.db.execute(stmt)
+            for paper_id, title_slug in result.all():
+                new_paper_ids.add(paper_id)
+                paper_ids_by_slug.setdefault(title_slug, paper_id)
+
+        # DOI cakismasi yuzunden eklenemeyenler eszamanli eklenen paper'a baglanir
+        missing_dois = [
+            c.doi for c in new_papers if c.doi and _existing_paper_id(c) is None
+        ]
+        if missing_dois:
+            result = await self.db.execute(
+                select(Paper.id, Paper.doi).where(Paper.doi.in_(missing_dois))
+            )
+            for paper_id, doi in result.all():
+                paper_ids_by_key[(IdentifierScheme.DOI.value, doi.lower())] = paper_id
+
+        # 4. Yeni paper'larin yazarlari ve tum kimlikler
+        await self._bulk_add_authors(
+            [
+                (paper_ids_by_slug[c.slug], c.paper)
+                for c in new_papers
+                if paper_ids_by_slug.get(c.slug) in new_paper_ids
+            ]
+        )
+
+        identifier_rows: list[dict] = []
+        for candidate in candidates:
+            paper_id = _existing_paper_id(candidate)
+            if paper_id is not None:
+                identifier_rows.extend(
+                    {"scheme": scheme, "value": value, "paper_id": paper_id}
+                    for scheme, value in candidate.keys
+                )
+        for chunk in _chunked(identifier_rows):
+            await self.db.execute(
+                pg_insert(PaperIdentifier).values(chunk).on_conflict_do_nothing()
+            )
+
+        # 5. Library entry'ler (paper_id unique; mevcutlar mukerrer sayilir)
+        source_by_paper_id: dict[int, SourceType] = {}
+        for candidate in candidates:
+            paper_id = _existing_paper_id(candidate)
+            if paper_id is not None:
+                source_by_paper_id.setdefault(
+                    paper_id, map_source(candidate.paper.source)
+                )
+
+        entry_ids: list[int] = []
+        entry_rows = list(source_by_paper_id.items())
+        for chunk in _chunked(entry_rows):
+            stmt = (
+                pg_insert(LibraryEntry)
+                .values(
+                    [
+                        {
+                            "paper_id": paper_id,
+                            "source": source,
+                            "download_status": DownloadStatus.PENDING,
+                            "is_favorite": False,
+                        }
+                        for paper_id, source in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[LibraryEntry.paper_id])
+                .returning(LibraryEntry.id)
+            )
+            result = await self.db.execute(stmt)
+            entry_ids.extend(row[0] for row in result.all())
+
+        # 6. Etiketler
+        await self._bulk_add_tags(entry_ids, search_query)
+
+        existing_count = len(candidates) - len(entry_ids)
+        return entry_ids, existing_count
+
+    async def _bulk_add_authors(self, papers: list[tuple[int, PaperResponse]]) -> None:
+        """Yazarlari slug ile toplu bulur/olusturur ve paper'lara baglar."""
+        names_by_slug: dict[str, str] = {}
+        for _, paper_data in papers:
+            for author_data in paper_data.authors:
+                author_slug = slugify(author_data.name)
+                if author_slug:
+                    names_by_slug.setdefault(author_slug, author_data.name[:255])
+
+        if not names_by_slug:
+            return
+
+        author_ids: dict[str, int] = {}
+        all_slugs = list(names_by_slug)
+        for chunk in _chunked(all_slugs):
+            result = await self.db.execute(
+                select(Author.id, Author.slug)
+                .where(Author.slug.in_(chunk))
+                .order_by(Author.id)
+            )
+            for author_id, author_slug in result.all():
+                author_ids.setdefault(author_slug, author_id)
+
+        missing_slugs = [slug for slug in all_slugs if slug not in author_ids]
+        for chunk in _chunked(missing_slugs):
+            result = await self.db.execute(
+                pg_insert(Author)
+                .values([{"name": names_by_slug[slug], "slug": slug} for slug in chunk])
+                .returning(Author.id, Author.slug)
+            )
+            for author_id, author_slug in result.all():
+                author_ids[author_slug] = author_id
+
+        links = []
+        for paper_id, paper_data in papers:
+            for position, author_data in enumerate(paper_data.authors):
+                author_id = author_ids.get(slugify(author_data.name))
+                if author_id is not None:
+                    links.append(
+                        {
+                            "paper_id": paper_id,
+                            "author_id": author_id,
+                            "position": position,
+                        }
+                    )
+
+        for chunk in _chunked(links):
+            await self.db.execute(
+                pg_insert(paper_authors).values(chunk).on_conflict_do_nothing()
+            )
+
+    async def _bulk_add_tags(self, entry_ids: list[int], search_query: str) -> None:
+        """Arama terimlerinden etiketleri toplu olusturur ve entry'lere baglar."""
+        tag_names = list(
+            dict.fromkeys(
+                tag.strip().lower()[:100]
+                for tag in search_query.split(",")
+                if tag.strip()
+            )
+        )
+        if not tag_names or not entry_ids:
+            return
+
+        await self.db.execute(
+            pg_insert(Tag)
+            .values([{"name": name} for name in tag_names])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+        )
+        result = await self.db.execute(select(Tag.id).where(Tag.name.in_(tag_names)))
+        tag_ids = [row[0] for row in result.all()]
+
+        links = [
+            {"entry_id": entry_id, "tag_id": tag_id}
+            for entry_id in entry_ids
+            for tag_id in tag_ids
+        ]
+        for chunk in _chunked(links):
+            await self.db.execute(
+                pg_insert(library_tags).values(chunk).on_conflict_do_nothing()
+            )
+
     async def _find_or_create_paper(self, paper_data: PaperResponse) -> Paper:
         """Makaleyi veritabanında bulur veya yeni oluşturur.
 
         Deduplication önceliği:
-        1. DOI ile kontrol (varsa)
+        1. Dış kimliklerle kontrol (DOI, arXiv, Semantic Scholar vb.)
         2. title_slug ile kontrol
+
+        Bulunan veya oluşturulan makaleye isteğin tüm kimlikleri eklenir.
         """
         title_slug = slugify(paper_data.title)
+        keys = paper_identifier_keys(paper_data)
 
-        # DOI ile kontrol
-        if paper_data.external_id and paper_data.external_id.startswith("10."):
-            stmt = select(Paper).where(Paper.doi == paper_data.external_id)
+        # Dış kimliklerle kontrol (paper_identifiers birincil anahtarı)
+        if keys:
+            stmt = (
+                select(Paper)
+                .join(PaperIdentifier, PaperIdentifier.paper_id == Paper.id)
+                .where(_identifier_in(keys))
+                .limit(1)
+            )
             result = await self.db.execute(stmt)
             existing_paper = result.scalar_one_or_none()
             if existing_paper:
+                await self._add_identifiers(existing_paper.id, keys)
                 return existing_paper
 
         # title_slug ile kontrol
@@ -425,29 +842,36 @@ class LibraryService:
         result = await self.db.execute(stmt)
         existing_paper = result.scalar_one_or_none()
         if existing_paper:
+            await self._add_identifiers(existing_paper.id, keys)
             return existing_paper
 
         # Yeni Paper oluştur
-        paper = Paper(
-            doi=paper_data.external_id
-            if paper_data.external_id and paper_data.external_id.startswith("10.")
-            else None,
-            title=paper_data.title,
-            title_slug=title_slug,
-            abstract=paper_data.abstract,
-            year=paper_data.year,
-            citation_count=paper_data.citation_count,
-            venue=paper_data.venue,
-            pdf_url=paper_data.pdf_url,
-        )
+        paper = Paper(**_paper_values(paper_data, title_slug))
         self.db.add(paper)
         await self.db.flush()  # ID almak için
 
+        await self._add_identifiers(paper.id, keys)
+
         # Yazarları ekle
         await self._add_authors(paper, paper_data)
 
         return paper
 
+    async def _add_identifiers(self, paper_id: int, keys: set[tuple[str, str]]) -> None:
+        """Kimlikleri makaleye baglar; baska makaleye ait olanlar atlanir."""
+        if not keys:
+            return
+        await self.db.execute(
+            pg_insert(PaperIdentifier)
+            .values(
+                [
+                    {"scheme": scheme, "value": value, "paper_id": paper_id}
+                    for scheme, value in keys
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+
     async def _add_authors(self, paper: Paper, paper_data: PaperResponse) -> None:
         """Yazarları veritabanına ekler ve makaleyle ilişkilendirir.
 
@@ -549,18 +973,19 @@ class LibraryService:
         return normalized
 
     @staticmethod
-    def _needs_metadata_enrichment(paper: Paper) -> bool:
-        """Paper'da eksik metadata olup olmadigini kontrol eder."""
-        has_no_authors = len(paper.authors) == 0
-        return any(
-            [
-                not paper.abstract,
-                not paper.year,
-                not paper.venue,
-                (paper.citation_count or 0) == 0,
-                not paper.pdf_url,
-                has_no_authors,
-            ]
+    def missing_metadata_clause():
+        """Eksik metadata'ya sahip paper'lari secen SQL kosulu.
+
+        Python tarafinda filtrelemek yerine veritabaninda uygulanir; boylece
+        buyuk kutuphanelerde tum kayitlari bellege yuklemeye gerek kalmaz.
+        """
+        return or_(
+            func.coalesce(Paper.abstract, "") == "",
+            func.coalesce(Paper.year, 0) == 0,
+            func.coalesce(Paper.venue, "") == "",
+            func.coalesce(Paper.citation_count, 0) == 0,
+            func.coalesce(Paper.pdf_url, "") == "",
+            ~Paper.authors.any(),
         )
 
     def _find_best_match(
@@ -586,6 +1011,7 @@ class LibraryService:
     async def _apply_metadata_update(self, paper: Paper, match: PaperResponse) -> bool:
         """Eslesen kayittan sadece eksik alanlari gunceller."""
         changed = False
+        values = _paper_values(match, paper.title_slug)
 
         if not paper.abstract and match.abstract:
             paper.abstract = match.abstract
@@ -595,25 +1021,29 @@ class LibraryService:
             paper.year = match.year
             changed = True
 
-        if not paper.venue and match.venue:
-            paper.venue = match.venue
+        if not paper.venue and values["venue"]:
+            paper.venue = values["venue"]
             changed = True
 
         if (paper.citation_count or 0) == 0 and (match.citation_count or 0) > 0:
             paper.citation_count = match.citation_count
             changed = True
 
-        if not paper.pdf_url and match.pdf_url:
-            paper.pdf_url = match.pdf_url
+        if not paper.pdf_url and values["pdf_url"]:
+            paper.pdf_url = values["pdf_url"]
             changed = True
 
         # DOI yoksa ve eslesen kayit DOI ise doldur
-        if not paper.doi and match.external_id and match.external_id.startswith("10."):
-            paper.doi = match.external_id
+        if not paper.doi and values["doi"]:
+            paper.doi = values["doi"]
             changed = True
 
+        # Eslesen kaynagin kimlikleri sonraki uyelik kontrollerinde kullanilir
+        await self._add_identifiers(paper.id, paper_identifier_keys(match))
+
         # Author'lari sadece bossa tamamla
-        await self.db.refresh(paper, ["authors"])
+        if "authors" in inspect(paper).unloaded:
+            await self.db.refresh(paper, ["authors"])
         if len(paper.authors) == 0 and match.authors:
             for author_data in match.authors:
                 author_slug = slugify(author_data.name)
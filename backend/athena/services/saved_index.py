@@ -0,0 +1,310 @@
+"""Kutuphanede kayitli makaleler icin Redis Bloom filtresi.
+
+Arama sonuclarinin "zaten kayitli" isaretlemesi icin her aramada veritabani
+sorgusu atmak yerine kayitli makalelerin kimlikleri (`scheme:value`) ve
+baslik slug'lari (`slug:...`) Redis'te sabit boyutlu bir bitmap Bloom
+filtresinde tutulur. Filtrede olmayan sonuclar (yaygin durum) veritabanina
+hic gitmeden "kayitli degil" sayilir; pozitifler tek sorguyla dogrulanir,
+boylece yanlis pozitifler ve silinen kayitlar sonucu etkilemez.
+
+Filtre Celery beat ile `saved_index_ttl` dolmadan veritabanindan yeniden
+uretilir (silinen kayitlar bu sekilde temizlenir). Filtre yoksa arama
+beklemez: tum sonuclar veritabanindan dogrulanir ve yeniden uretim
+maintenance kuyruguna eklenir. Yeniden uretim sirasinda yapilan eklemeler
+`delta` bitmap'inde de tutulur ve yeni filtreye OR'lanir.
+"""
+
+import hashlib
+from collections.abc import Iterable
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from athena.core.cache import get_redis
+from athena.core.config import get_settings
+from athena.models.library import LibraryEntry
+from athena.models.paper import Paper
+from athena.models.paper_identifier import PaperIdentifier
+from athena.schemas.search import PaperResponse
+from athena.services.library import paper_identifier_keys, slugify
+from athena.tasks.saved_index import rebuild_saved_index_task
+
+SAVED_INDEX_KEY = "library:saved:bloom"
+SAVED_INDEX_DELTA_KEY = "library:saved:bloom:delta"
+SAVED_INDEX_TMP_KEY = "library:saved:bloom:tmp"
+SAVED_INDEX_LOCK_KEY = "library:saved:bloom:lock"
+SAVED_INDEX_SCHEDULED_KEY = "library:saved:bloom:scheduled"
+
+# 2^23 bit (1 MiB), 7 hash: 200k kayitta yanlis pozitif orani ~1e-6,
+# 1M kayitta ~%2
+BLOOM_BITS = 1 << 23
+BLOOM_HASHES = 7
+
+# Yeniden uretim kilidi (saniye); takilan bir rebuild'in kilidi duser.
+# Kuyruga eklenen rebuild isareti de ayni surede duser.
+REBUILD_LOCK_TTL = 300
+
+# Filtre yoksa bit'lere dokunma (SETBIT anahtari sifirdan yaratirdi);
+# delta her durumda guncellenir.
+_ADD_SCRIPT = """
+local live = redis.call('EXISTS', KEYS[1])
+for _, offset in ipairs(ARGV) do
+    if live == 1 then
+        redis.call('SETBIT', KEYS[1], offset, 1)
+    end
+    redis.call('SETBIT', KEYS[2], offset, 1)
+end
+return live
+"""
+
+# Filtre yoksa {-1}, varsa her offset icin bit degeri
+_CHECK_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return {-1}
+end
+local bits = {}
+for i, offset in ipairs(ARGV) do
+    bits[i] = redis.call('GETBIT', KEYS[1], offset)
+end
+return bits
+"""
+
+
+def saved_index_members(paper: PaperResponse) -> set[str]:
+    """Bir arama sonucunun filtrede aranacak/eklenecek elemanlari."""
+    members = {f"{scheme}:{value}" for scheme, value in paper_identifier_keys(paper)}
+    title_slug = slugify(paper.title)
+    if title_slug:
+        members.add(f"slug:{title_slug}")
+    return members
+
+
+def _bit_offsets(member: str) -> list[int]:
+    """Eleman icin BLOOM_HASHES adet bit offset'i (double hashing)."""
+    digest = hashlib.blake2b(member.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % BLOOM_BITS for i in range(BLOOM_HASHES)]
+
+
+def _build_bitmap(members: Iterable[str]) -> bytearray:
+    """Elemanlarin bit'leri set edilmis, Redis bitmap duzeninde filtre."""
+    bitmap = bytearray(BLOOM_BITS // 8)
+    for member in members:
+        for offset in _bit_offsets(member):
+            # Redis bitmap'lerinde offset 0, ilk byte'in en anlamli bitidir
+            bitmap[offset >> 3] |= 0x80 >> (offset & 7)
+    return bitmap
+
+
+class SavedPaperIndex:
+    """Kayitli makale Bloom filtresini gunceller ve sorgular.
+
+    Redis hatalari yutulur; filtre kullanilamazsa tum sonuclar veritabanindan
+    dogrulanir.
+    """
+
+    def __init__(self, redis: Redis | None = None) -> None:
+        self.redis = redis or get_redis()
+
+    async def add(self, papers: Iterable[PaperResponse]) -> None:
+        """Kutuphaneye eklenen makaleleri filtreye ekler (commit sonrasi)."""
+        await self._add_members(
+            member for paper in papers for member in saved_index_members(paper)
+        )
+
+    async def add_identifiers(self, keys: Iterable[tuple[str, str]]) -> None:
+        """Kayitli makalelere sonradan eklenen kimlikleri filtreye ekler.
+
+        Metadata tamamlama eslesen kaynagin kimliklerini mevcut makaleye
+        baglar; bunlar da filtreye girmezse o kimlikle gelen arama sonuclari
+        bir sonraki yeniden uretime kadar "kayitli degil" gorunur.
+        """
+        await self._add_members(f"{scheme}:{value}" for scheme, value in keys)
+
+    async def _add_members(self, members: Iterable[str]) -> None:
+        offsets = {offset for member in members for offset in _bit_offsets(member)}
+        if not offsets:
+            return
+        try:
+            await self.redis.eval(
+                _ADD_SCRIPT,
+                2,
+                SAVED_INDEX_KEY,
+                SAVED_INDEX_DELTA_KEY,
+                *offsets,
+            )
+        except RedisError as exc:
+            logger.warning(f"Saved index add failed: {type(exc).__name__}: {exc}")
+
+    async def annotate(self, db: AsyncSession, papers: list[PaperResponse]) -> None:
+        """Arama sonuclarinin `in_library` alanini doldurur.
+
+        Filtrede hicbir elemani olmayan sonuclar veritabanina sorulmaz.
+        Filtre yoksa yeniden uretim kuyruga eklenir ve tum sonuclar
+        veritabanindan dogrulanir.
+        """
+        if not papers:
+            return
+
+        members = [saved_index_members(paper) for paper in papers]
+        positives = await self._might_contain(members)
+        if positives is None:
+            await self._schedule_rebuild()
+            positives = [True] * len(papers)
+
+        candidates = [paper for paper, hit in zip(papers, positives) if hit]
+        if not candidates:
+            return
+
+        saved = await self._confirm(db, candidates)
+        for paper, in_library in zip(candidates, saved):
+            paper.in_library = in_library
+
+    async def rebuild(self, db: AsyncSession) -> bool:
+        """Filtreyi veritabanindan yeniden uretir.
+
+        Returns:
+            Filtre yenilendiyse True; baska bir process yeniden uretiyorsa
+            veya Redis erisilemezse False.
+        """
+        try:
+            acquired = await self.redis.set(
+                SAVED_INDEX_LOCK_KEY, "1", nx=True, ex=REBUILD_LOCK_TTL
+            )
+            if not acquired:
+                return False
+            # Bu andan sonraki eklemeler delta'da birikir
+            await self.redis.delete(SAVED_INDEX_DELTA_KEY)
+        except RedisError as exc:
+            logger.warning(f"Saved index rebuild failed: {type(exc).__name__}: {exc}")
+            return False
+
+        try:
+            members = await self._load_members(db)
+        except Exception:
+            await self.redis.delete(SAVED_INDEX_LOCK_KEY)
+            raise
+
+        bitmap = _build_bitmap(members)
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(SAVED_INDEX_TMP_KEY, bytes(bitmap))
+                pipe.bitop(
+                    "OR", SAVED_INDEX_KEY, SAVED_INDEX_TMP_KEY, SAVED_INDEX_DELTA_KEY
+                )
+                pipe.expire(SAVED_INDEX_KEY, get_settings().saved_index_ttl)
+                pipe.delete(
+                    SAVED_INDEX_TMP_KEY, SAVED_INDEX_LOCK_KEY, SAVED_INDEX_SCHEDULED_KEY
+                )
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning(f"Saved index rebuild failed: {type(exc).__name__}: {exc}")
+            return False
+
+        logger.info(f"Saved index rebuilt: members={len(members)}")
+        return True
+
+    async def _schedule_rebuild(self) -> None:
+        """Yeniden uretimi maintenance kuyruguna ekler.
+
+        Filtre yokken gelen aramalar ayni anda tek task kuyruga ekler.
+        """
+        try:
+            scheduled = await self.redis.set(
+                SAVED_INDEX_SCHEDULED_KEY, "1", nx=True, ex=REBUILD_LOCK_TTL
+            )
+        except RedisError as exc:
+            logger.warning(f"Saved index check failed: {type(exc).__name__}: {exc}")
+            return
+        if not scheduled:
+            return
+
+        try:
+            rebuild_saved_index_task.delay()
+        except Exception as exc:
+            await self.redis.delete(SAVED_INDEX_SCHEDULED_KEY)
+            logger.warning(
+                f"Saved index rebuild could not be queued: "
+                f"{type(exc).__name__}: {exc}"
+            )
+
+    async def _might_contain(self, members: list[set[str]]) -> list[bool] | None:
+        """Her sonuc icin filtrede en az bir elemani olup olmadigini dondurur.
+
+        Filtre yoksa veya Redis erisilemezse None doner.
+        """
+        flat = [member for paper_members in members for member in paper_members]
+        offsets = [offset for member in flat for offset in _bit_offsets(member)]
+        if not offsets:
+            return [False] * len(members)
+
+        try:
+            bits = await self.redis.eval(_CHECK_SCRIPT, 1, SAVED_INDEX_KEY, *offsets)
+        except RedisError as exc:
+            logger.warning(f"Saved index check failed: {type(exc).__name__}: {exc}")
+            return None
+        if bits and bits[0] == -1:
+            return None
+
+        hits: list[bool] = []
+        position = 0
+        for paper_members in members:
+            hit = False
+            for _ in paper_members:
+                member_bits = bits[position : position + BLOOM_HASHES]
+                position += BLOOM_HASHES
+                hit = hit or all(member_bits)
+            hits.append(hit)
+        return hits
+
+    @staticmethod
+    async def _load_members(db: AsyncSession) -> list[str]:
+        """Kutuphanedeki tum makalelerin kimlik ve slug elemanlari."""
+        identifiers = await db.execute(
+            select(PaperIdentifier.scheme, PaperIdentifier.value).join(
+                LibraryEntry, LibraryEntry.paper_id == PaperIdentifier.paper_id
+            )
+        )
+        slugs = await db.execute(
+            select(Paper.title_slug).join(
+                LibraryEntry, LibraryEntry.paper_id == Paper.id
+            )
+        )
+        members = [f"{scheme}:{value}" for scheme, value in identifiers.all()]
+        members.extend(f"slug:{title_slug}" for (title_slug,) in slugs.all())
+        return members
+
+    @staticmethod
+    async def _confirm(db: AsyncSession, papers: list[PaperResponse]) -> list[bool]:
+        """Filtre pozitiflerini veritabaninda dogrular (papers ile ayni sirada)."""
+        keys = [paper_identifier_keys(paper) for paper in papers]
+        slugs = [slugify(paper.title) for paper in papers]
+
+        all_keys = list(set().union(*keys))
+        found_keys: set[tuple[str, str]] = set()
+        if all_keys:
+            result = await db.execute(
+                select(PaperIdentifier.scheme, PaperIdentifier.value)
+                .join(LibraryEntry, LibraryEntry.paper_id == PaperIdentifier.paper_id)
+                .where(
+                    tuple_(PaperIdentifier.scheme, PaperIdentifier.value).in_(all_keys)
+                )
+            )
+            found_keys = {(scheme, value) for scheme, value in result.all()}
+
+        result = await db.execute(
+            select(Paper.title_slug)
+            .join(LibraryEntry, LibraryEntry.paper_id == Paper.id)
+            .where(Paper.title_slug.in_(set(slugs)))
+        )
+        found_slugs = {title_slug for (title_slug,) in result.all()}
+
+        return [
+            bool(paper_keys & found_keys) or title_slug in found_slugs
+            for paper_keys, title_slug in zip(keys, slugs)
+        ]
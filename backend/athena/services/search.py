@@ -40,6 +40,7 @@ class SearchService:
 
     def __init__(self, db: AsyncSession | None = None) -> None:
         self.db = db
+        self._runtime_cache: RuntimeSearchSettings | None = None
         self.providers: list[BaseSearchProvider] = [
             SemanticScholarProvider(),
             OpenAlexProvider(),
@@ -48,11 +49,14 @@ class SearchService:
             CoreProvider(),
         ]
 
-    async def search_papers(self, filters: SearchFilters) -> SearchResponse:
+    async def search_papers(
+        self, filters: SearchFilters, annotate_saved: bool = False
+    ) -> SearchResponse:
         """Tum adaptorlerden paralel arama yapar ve sonuclari birlestirir.
 
         Args:
             filters: Arama kriterleri
+            annotate_saved: Sonuclarin `in_library` alanini doldur (db gerekir)
 
         Returns:
             SearchResponse: Tekillestirilmis makale listesi + meta istatistikler
@@ -162,6 +166,9 @@ class SearchService:
         raw_total = sum(raw_counts.values())
         duplicates_removed = raw_total - relevance_removed - len(unique_papers)
 
+        if annotate_saved and self.db is not None:
+            await self._annotate_saved(unique_papers)
+
         meta = SearchMeta(
             **raw_counts,
             relevance_removed=relevance_removed,
@@ -172,7 +179,33 @@ class SearchService:
 
         return SearchResponse(results=unique_papers, meta=meta)
 
+    async def _annotate_saved(self, papers: list[PaperResponse]) -> None:
+        """Kutuphanede kayitli sonuclari Bloom filtresiyle isaretler.
+
+        Hata durumunda arama sonuclari isaretlenmeden doner.
+        """
+        # services.library bu modulu import ettigi icin gec import
+        from athena.services.saved_index import SavedPaperIndex
+
+        try:
+            await SavedPaperIndex().annotate(self.db, papers)
+        except Exception as exc:
+            logger.warning(
+                f"Saved paper annotation failed: {type(exc).__name__}: {exc}"
+            )
+
+    async def preload_runtime_settings(self) -> None:
+        """Runtime ayarlarini bir kez yukleyip instance uzerinde sabitler.
+
+        Ayni servisle paralel arama yapilacaksa (or. metadata tamamlama),
+        her aramanin ayni AsyncSession uzerinden UserSettings okumasini onler.
+        """
+        self._runtime_cache = await self._load_runtime_settings()
+
     async def _load_runtime_settings(self) -> RuntimeSearchSettings:
+        if self._runtime_cache is not None:
+            return self._runtime_cache
+
         env = get_env_settings()
         runtime = RuntimeSearchSettings(
             enabled_providers=list(DEFAULT_ENABLED_PROVIDERS),
@@ -184,7 +217,11 @@ class SearchService:
         if not self.db:
             return runtime
 
-        settings_row = await UserSettingsService(self.db).get_settings()
+        # Kayit yoksa varsayilanlar zaten .env degerleridir; arama salt okunur
+        # session ile de calisabilsin diye kayit burada olusturulmaz
+        settings_row = await UserSettingsService(self.db).find_settings()
+        if not settings_row:
+            return runtime
         runtime.enabled_providers = settings_row.enabled_providers or list(
             DEFAULT_ENABLED_PROVIDERS
         )
@@ -287,6 +324,7 @@ class SearchService:
             if doi_key and doi_key in seen_dois:
                 idx = seen_dois[doi_key]
                 existing = unique_papers[idx]
+                self._merge_identifiers(existing, paper)
                 if self._has_higher_priority(paper, existing):
                     unique_papers[idx] = paper
                     seen_dois[doi_key] = idx
@@ -301,6 +339,7 @@ class SearchService:
             if norm_title and norm_title in seen_titles:
                 idx = seen_titles[norm_title]
                 existing = unique_papers[idx]
+                self._merge_identifiers(existing, paper)
                 if self._has_higher_priority(paper, existing):
                     unique_papers[idx] = paper
                     seen_titles[norm_title] = idx
@@ -319,6 +358,17 @@ class SearchService:
 
         return unique_papers
 
+    @staticmethod
+    def _merge_identifiers(a: PaperResponse, b: PaperResponse) -> None:
+        """Ayni makalenin iki kaydindaki kimlikleri birlestirir.
+
+        Hangisi korunursa korunsun diger saglayicilarin kimlikleri de
+        kutuphaneye kaydedilir; sonraki aramalarda her iki ID ile eslesir.
+        """
+        merged = {**b.identifiers, **a.identifiers}
+        a.identifiers = merged
+        b.identifiers = dict(merged)
+
     def _has_higher_priority(self, new: PaperResponse, existing: PaperResponse) -> bool:
         """Yeni paper'in mevcut paper'dan daha yuksek oncelikli olup olmadigini kontrol eder."""
         new_priority = self.SOURCE_PRIORITY.get(new.source, 99)
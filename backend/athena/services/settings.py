@@ -26,12 +26,16 @@ class UserSettingsService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def get_settings(self) -> UserSettings:
-        """Ayar kaydini getirir; yoksa .env degerlerinden olusturur."""
+    async def find_settings(self) -> UserSettings | None:
+        """Ayar kaydini getirir; yoksa None (salt okunur session'lar icin)."""
         result = await self.db.execute(
             select(UserSettings).order_by(UserSettings.id.asc())
         )
-        settings_row = result.scalars().first()
+        return result.scalars().first()
+
+    async def get_settings(self) -> UserSettings:
+        """Ayar kaydini getirir; yoksa .env degerlerinden olusturur."""
+        settings_row = await self.find_settings()
         if settings_row:
             return settings_row
 
@@ -1,5 +1,12 @@
-from athena.tasks.downloader import download_paper_task
+from athena.tasks.downloader import download_paper_task, download_papers_batch_task
+from athena.tasks.enrichment import enrich_metadata_task
+from athena.tasks.ingest import ingest_papers_task
+from athena.tasks.reconciler import reconcile_library_files_task
 
 __all__ = [
     "download_paper_task",
+    "download_papers_batch_task",
+    "enrich_metadata_task",
+    "ingest_papers_task",
+    "reconcile_library_files_task",
 ]
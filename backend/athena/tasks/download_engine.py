@@ -0,0 +1,815 @@
+"""Asenkron PDF indirme motoru.
+
+Bir Celery worker'ı, tek bir event loop üzerinde çok sayıda indirmeyi aynı
+anda yürütür. HTTP bağlantı havuzları (`DownloadClients`) tüm indirmeler
+arasında paylaşılır, eşzamanlılık `download_concurrency` ile sınırlanır.
+
+Her kayıt için akış:
+
+  1. Fallback Chain (PrimaryDownload → Unpaywall → CoreAPI); varsayılan
+     hedged modda adaylar kademeli olarak yarışır
+  2. Zincir başarısızsa orijinal URL'ye son deneme; HTTP hatasında EZProxy
+  3. EZProxy de başarısızsa kayıt tekrar denenmek üzere `pending` olur,
+     son denemede `failed` işaretlenir
+
+PDF'ler parça parça geçici dosyaya yazılır ve doğrulandıktan sonra son
+yola atomik olarak taşınır (bkz. `download_strategies._download_url`).
+Tamamlanan dosyalar SHA-256'ya göre içerik adresli saklanır
+(`objects/ab/cd/<sha256>.pdf`); aynı PDF'e ulaşan kayıtlar tek dosyayı
+paylaşır ve daha önce indirilmiş bir URL tekrar indirilmez.
+
+Veritabanı bağlantısı yalnızca kısa durum güncellemeleri için alınır;
+HTTP beklemeleri sırasında bağlantı tutulmaz.
+"""
+
+import asyncio
+import json
+import os
+import re
+import unicodedata
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from athena.core.config import get_settings
+from athena.core.download_telemetry import (
+    OUTCOME_BACKOFF,
+    OUTCOME_CANCELLED,
+    OUTCOME_SUCCESS,
+    AttemptRecorder,
+)
+from athena.core.exceptions import DownloadError
+from athena.core.file_paths import blob_relative_path, resolve_data_file_path
+from athena.core.host_scheduler import (
+    HostBackoffError,
+    direct_download_host,
+    interleave_by_host,
+)
+from athena.core.strategy_ranking import (
+    DIRECT_STRATEGIES,
+    StrategyRanking,
+    SuccessStats,
+)
+from athena.models.download_attempt import DownloadAttempt
+from athena.models.library import DownloadStatus, LibraryEntry
+from athena.models.library_entry_pdf import LibraryEntryPdf
+from athena.models.paper import Paper
+from athena.models.pdf_blob import PdfBlob, lock_blob
+from athena.tasks.download_strategies import (
+    DownloadClients,
+    DownloadedFile,
+    PaperMeta,
+    _browser_headers,
+    _download_url,
+    _fsync_dir,
+    open_download_clients,
+    run_fallback_chain,
+)
+
+# İndirme sonucu durumları (task sonuçlarında döner)
+RESULT_COMPLETED = "completed"
+RESULT_FAILED = "failed"
+RESULT_RETRY = "retry"
+RESULT_SKIPPED = "skipped"
+RESULT_ERROR = "error"
+
+# Bu kadar deneme kaydı biriktiğinde `download_attempts`'e yazılır
+ATTEMPT_FLUSH_SIZE = 200
+
+# Strateji sıralamasında sayılmayan sonuçlar (host'un başarısını yansıtmaz)
+RANKING_IGNORED_OUTCOMES = (OUTCOME_CANCELLED, OUTCOME_BACKOFF)
+
+# URL arayan stratejilerin genel başarı oranları tüm batch'lerde aynıdır
+STRATEGY_STATS_KEY = "download:strategy_stats"
+STRATEGY_STATS_TTL = 600
+
+
+@dataclass
+class DownloadSettings:
+    """Kullanıcı ayarlarından çözümlenen indirme ayarları."""
+
+    proxy_url: str | None = None
+    core_api_key: str | None = None
+    ezproxy: dict | None = None
+
+
+@dataclass
+class DownloadResult:
+    """Tek bir kaydın indirme sonucu."""
+
+    entry_id: int
+    status: str
+    file_path: str | None = None
+    file_size: int | None = None
+    sha256: str | None = None
+    message: str | None = None
+    # Host geri çekilmedeyse tekrar denemeden önce beklenecek süre (saniye)
+    retry_after: float | None = None
+
+    def as_dict(self) -> dict:
+        result: dict = {"status": self.status, "entry_id": self.entry_id}
+        if self.file_path is not None:
+            result["file_path"] = self.file_path
+        if self.file_size is not None:
+            result["file_size"] = self.file_size
+        if self.sha256 is not None:
+            result["sha256"] = self.sha256
+        if self.message is not None:
+            result["message"] = self.message
+        return result
+
+
+def slugify(text: str) -> str:
+    """Metni URL-friendly slug formatına dönüştürür."""
+    text = unicodedata.normalize("NFKD", text)
+    text = text.encode("ascii", "ignore").decode("ascii")
+    text = text.lower()
+    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = text.strip("-")
+    return text[:100]
+
+
+def generate_file_path(paper, settings) -> Path:
+    """İndirme sırasında kullanılan PDF dosya yolunu oluşturur.
+
+    Format: {data_dir}/{paper_id}/{year}_{author_slug}_{title_slug}.pdf
+
+    Yarım indirmeler bu dizinde tutulur; tamamlanan dosya içerik adresli
+    yola taşınır (bkz. `_store_blob`).
+    """
+    year = paper.year or "unknown"
+
+    author_slug = "unknown"
+    if paper.authors:
+        author_slug = slugify(paper.authors[0].name)
+
+    title_slug = slugify(paper.title)
+    filename = f"{year}_{author_slug}_{title_slug}.pdf"
+
+    base_dir = Path(settings.data_dir)
+    paper_dir = base_dir / str(paper.id)
+
+    return paper_dir / filename
+
+
+class AsyncDownloadEngine:
+    """Kayıtları paylaşılan HTTP havuzlarıyla eşzamanlı indirir."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        download_settings: DownloadSettings,
+        concurrency: int | None = None,
+        redis: Redis | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.download_settings = download_settings
+        self.concurrency = max(1, concurrency or get_settings().download_concurrency)
+        self.redis = redis
+
+    async def run(
+        self, entry_ids: list[int], final_attempt: bool = True
+    ) -> list[DownloadResult]:
+        """Kayıtları indirir; sonuçlar `entry_ids` ile aynı sıradadır.
+
+        Kayıtlar PDF host'larına göre round-robin sırayla başlatılır; böylece
+        aynı yayıncıya ait kayıtlar eşzamanlılık slotlarını doldurmaz.
+
+        Args:
+            entry_ids: İndirilecek LibraryEntry ID'leri
+            final_attempt: True ise HTTP hataları tekrar denenmez, kayıt
+                `failed` işaretlenir
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        hosts = await self._load_hosts(entry_ids)
+        ordered_ids = interleave_by_host(
+            (entry_id, hosts.get(entry_id, "")) for entry_id in entry_ids
+        )
+        ranking = await self._load_ranking(set(hosts.values()))
+
+        async with open_download_clients(
+            proxy_url=self.download_settings.proxy_url,
+            max_connections=self.concurrency,
+            redis=self.redis,
+        ) as clients:
+
+            async def bounded(entry_id: int) -> DownloadResult:
+                async with semaphore:
+                    result = await self._download_entry(
+                        entry_id, clients, final_attempt, ranking
+                    )
+                if len(clients.attempts) >= ATTEMPT_FLUSH_SIZE:
+                    await self._flush_attempts(clients.attempts)
+                return result
+
+            results = await asyncio.gather(*(bounded(i) for i in ordered_ids))
+            await self._flush_attempts(clients.attempts)
+
+        by_id = {result.entry_id: result for result in results}
+        return [by_id[entry_id] for entry_id in entry_ids]
+
+    async def _load_hosts(self, entry_ids: list[int]) -> dict[int, str]:
+        """Kayıtların ilk denenecek URL'sinin (pdf_url veya doi.org) host'u."""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(LibraryEntry.id, Paper.pdf_url, Paper.doi)
+                .join(Paper, LibraryEntry.paper_id == Paper.id)
+                .where(LibraryEntry.id.in_(entry_ids))
+            )
+            return {
+                entry_id: direct_download_host(pdf_url, doi)
+                for entry_id, pdf_url, doi in result.all()
+            }
+
+    async def _load_ranking(self, hosts: set[str]) -> StrategyRanking | None:
+        """Telemetriden strateji sıralamasını yükler.
+
+        Kapalıysa veya okunamazsa None döner; zincir varsayılan sırayla çalışır.
+        """
+        settings = get_settings()
+        if not settings.download_adaptive:
+            return None
+
+        since = datetime.now(timezone.utc) - timedelta(
+            days=settings.download_adaptive_window_days
+        )
+        try:
+            by_strategy = await self._strategy_stats(since)
+            direct_by_host = await self._direct_host_stats(since, hosts - {""})
+        except Exception as e:
+            logger.warning(
+                f"[Download] Strategy stats unavailable: {type(e).__name__}: {e}"
+            )
+            return None
+
+        return StrategyRanking(
+            direct_by_host=direct_by_host,
+            by_strategy=by_strategy,
+            min_attempts=settings.download_adaptive_min_attempts,
+            skip_rate=settings.download_adaptive_skip_rate,
+        )
+
+    async def _direct_host_stats(
+        self, since: datetime, hosts: set[str]
+    ) -> dict[str, SuccessStats]:
+        """Host başına doğrudan indirme (PrimaryDownload + Original) sayıları."""
+        if not hosts:
+            return {}
+        async with self.session_factory() as db:
+            result = await db.execute(
+                _success_counts(DownloadAttempt.host, since).where(
+                    DownloadAttempt.host.in_(hosts),
+                    DownloadAttempt.strategy.in_(DIRECT_STRATEGIES),
+                )
+            )
+            return {
+                host: SuccessStats(attempts, successes)
+                for host, attempts, successes in result.all()
+            }
+
+    async def _strategy_stats(self, since: datetime) -> dict[str, SuccessStats]:
+        """URL arayan stratejilerin genel sayıları (Redis'te kısa süre cache'lenir)."""
+        if self.redis is not None:
+            try:
+                cached = await self.redis.get(STRATEGY_STATS_KEY)
+            except RedisError:
+                cached = None
+            if cached:
+                return {
+                    name: SuccessStats(*counts)
+                    for name, counts in json.loads(cached).items()
+                }
+
+        async with self.session_factory() as db:
+            result = await db.execute(
+                _success_counts(DownloadAttempt.strategy, since).where(
+                    DownloadAttempt.strategy.not_in(DIRECT_STRATEGIES)
+                )
+            )
+            counts = {
+                name: [attempts, successes]
+                for name, attempts, successes in result.all()
+            }
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    STRATEGY_STATS_KEY, json.dumps(counts), ex=STRATEGY_STATS_TTL
+                )
+            except RedisError:
+                pass
+        return {name: SuccessStats(*values) for name, values in counts.items()}
+
+    async def _download_entry(
+        self,
+        entry_id: int,
+        clients: DownloadClients,
+        final_attempt: bool,
+        ranking: StrategyRanking | None = None,
+    ) -> DownloadResult:
+        """Tek kaydı indirir ve durumunu günceller; hata fırlatmaz."""
+        try:
+            return await self._download(entry_id, clients, final_attempt, ranking)
+        except Exception as e:
+            error_type = type(e).__name__
+            logger.error(
+                f"[Download] Unexpected error: entry_id={entry_id}, "
+                f"type={error_type}, detail={e}"
+            )
+            try:
+                await self._update_entry(
+                    entry_id,
+                    download_status=DownloadStatus.FAILED,
+                    error_message=f"Beklenmeyen hata ({error_type}): {str(e)[:200]}",
+                )
+            except Exception:
+                pass
+            return DownloadResult(entry_id, RESULT_FAILED, message=str(e))
+
+    async def _download(
+        self,
+        entry_id: int,
+        clients: DownloadClients,
+        final_attempt: bool,
+        ranking: StrategyRanking | None = None,
+    ) -> DownloadResult:
+        settings = get_settings()
+
+        # 1. LibraryEntry'yi al ve downloading olarak işaretle
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(LibraryEntry)
+                .options(selectinload(LibraryEntry.paper).selectinload(Paper.authors))
+                .where(LibraryEntry.id == entry_id)
+            )
+            entry = result.scalar_one_or_none()
+
+            if not entry:
+                logger.error(f"[Download] LibraryEntry not found: entry_id={entry_id}")
+                return DownloadResult(
+                    entry_id, RESULT_ERROR, message="LibraryEntry not found"
+                )
+
+            # Task yeniden teslim edildiyse tamamlanmış kayıtları tekrar indirme
+            if entry.download_status == DownloadStatus.COMPLETED:
+                return DownloadResult(
+                    entry_id, RESULT_SKIPPED, file_path=entry.file_path
+                )
+
+            paper = entry.paper
+            known_blob = await self._find_known_blob(db, paper.pdf_url)
+            if known_blob is None:
+                entry.download_status = DownloadStatus.DOWNLOADING
+                await db.commit()
+
+        # Aynı URL daha önce indirildiyse dosya yeniden indirilmez
+        if known_blob is not None:
+            reused = await self._reuse_blob(entry_id, known_blob)
+            if reused is not None:
+                return reused
+            await self._update_entry(
+                entry_id, download_status=DownloadStatus.DOWNLOADING
+            )
+
+        logger.info(
+            f"[Download] Paper: id={paper.id}, title='{paper.title[:80]}', doi={paper.doi}"
+        )
+
+        # 2. Fallback Chain ile indir
+        file_path = generate_file_path(paper, settings)
+        meta = PaperMeta(
+            pdf_url=paper.pdf_url,
+            doi=paper.doi,
+            title=paper.title,
+            entry_id=entry_id,
+        )
+        # Atlama/keşif kararı kayıt başına bir kez verilir; zincir ve son
+        # deneme aynı kararı kullanır
+        direct_host = direct_download_host(meta.pdf_url, meta.doi)
+        skip_direct = ranking is not None and ranking.skip_direct(direct_host)
+        downloaded = await run_fallback_chain(
+            meta=meta,
+            file_path=file_path,
+            clients=clients,
+            core_api_key=self.download_settings.core_api_key,
+            ranking=ranking,
+            skip_direct=skip_direct,
+        )
+        if downloaded:
+            return await self._mark_completed(entry_id, downloaded)
+
+        # 3. PDF/DOI yoksa direkt fail
+        if not paper.pdf_url and not paper.doi:
+            await self._update_entry(
+                entry_id,
+                download_status=DownloadStatus.FAILED,
+                error_message=(
+                    "PDF URL ve DOI bulunamadı. Makale muhtemelen açık erişim değil."
+                ),
+            )
+            logger.warning(
+                f"[Download] No PDF URL or DOI: entry_id={entry_id}, paper_id={paper.id}"
+            )
+            return DownloadResult(entry_id, RESULT_FAILED, message="No PDF URL or DOI")
+
+        # 4. Orijinal URL'ye son deneme; HTTP hatası EZProxy/retry'a yönlendirir
+        logger.warning(
+            f"[Download] Fallback chain tükenmiş, EZProxy/retry denenecek: "
+            f"entry_id={entry_id}"
+        )
+        # Doğrudan indirmeyi reddettiği bilinen host'ta orijinal URL yerine
+        # EZProxy denenir; EZProxy yoksa host'a hiç gidilmez (403 yanıtı tüm
+        # host için backoff başlatır)
+        ezproxy = self.download_settings.ezproxy
+        if skip_direct and not ezproxy:
+            logger.info(
+                f"[Download] Host doğrudan indirmeyi reddediyor, orijinal URL "
+                f"atlanıyor: entry_id={entry_id}, host={direct_host}"
+            )
+            return await self._retry_or_fail(
+                entry_id,
+                final_attempt,
+                error_message=(
+                    "Yayıncı doğrudan indirmeyi reddediyor ve EZProxy tanımlı değil."
+                ),
+                message=f"direct download blocked by {direct_host}",
+            )
+        try:
+            if skip_direct:
+                downloaded = await _download_via_ezproxy(
+                    ezproxy, file_path, paper, paper.pdf_url, clients, entry_id
+                )
+            else:
+                downloaded = await self._download_original(meta, clients, file_path)
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            return await self._handle_http_error(
+                e,
+                entry_id,
+                paper,
+                file_path,
+                clients,
+                final_attempt,
+                try_ezproxy=not skip_direct,
+            )
+        except DownloadError as e:
+            # Sunucu yanıt verdi ama içerik PDF değil (HTML, paywall) ya da çok büyük
+            await self._update_entry(
+                entry_id,
+                download_status=DownloadStatus.FAILED,
+                error_message=e.message,
+            )
+            return DownloadResult(entry_id, RESULT_FAILED, message=e.message)
+
+        return await self._mark_completed(entry_id, downloaded)
+
+    async def _handle_http_error(
+        self,
+        error: httpx.HTTPError,
+        entry_id: int,
+        paper,
+        file_path: Path,
+        clients: DownloadClients,
+        final_attempt: bool,
+        try_ezproxy: bool = True,
+    ) -> DownloadResult:
+        error_type = type(error).__name__
+        logger.warning(
+            f"[Download] HTTP error: entry_id={entry_id}, type={error_type}, "
+            f"detail={error}"
+        )
+
+        ezproxy = self.download_settings.ezproxy
+        if try_ezproxy and _should_try_ezproxy(error, paper.pdf_url, paper, ezproxy):
+            try:
+                downloaded = await _download_via_ezproxy(
+                    ezproxy, file_path, paper, paper.pdf_url, clients, entry_id
+                )
+                logger.info(f"[Download] Completed via EZProxy: entry_id={entry_id}")
+                return await self._mark_completed(entry_id, downloaded)
+            except Exception as ez_err:
+                logger.warning(
+                    f"[Download] EZProxy fallback failed: entry_id={entry_id}, "
+                    f"reason={ez_err}"
+                )
+
+        return await self._retry_or_fail(
+            entry_id,
+            final_attempt,
+            error_message=f"HTTP hatası ({error_type}): {str(error)[:200]}",
+            message=f"HTTP error: {error}",
+            retry_after=(
+                error.retry_after if isinstance(error, HostBackoffError) else None
+            ),
+        )
+
+    async def _retry_or_fail(
+        self,
+        entry_id: int,
+        final_attempt: bool,
+        error_message: str,
+        message: str,
+        retry_after: float | None = None,
+    ) -> DownloadResult:
+        """Son denemede kaydı `failed`, aksi halde yeniden denenmek üzere
+        `pending` işaretler.
+
+        Args:
+            error_message: Kayda yazılan, kullanıcıya gösterilen hata
+            message: Sonuç mesajı
+            retry_after: Host backoff'u varsa beklenecek süre (saniye)
+        """
+        if final_attempt:
+            await self._update_entry(
+                entry_id,
+                download_status=DownloadStatus.FAILED,
+                error_message=error_message,
+            )
+            logger.error(
+                f"[Download] Max retries reached, marked FAILED: entry_id={entry_id}"
+            )
+            return DownloadResult(
+                entry_id, RESULT_FAILED, message=f"Max retries reached after {message}"
+            )
+
+        await self._update_entry(entry_id, download_status=DownloadStatus.PENDING)
+        logger.info(f"[Download] Marked pending for retry: entry_id={entry_id}")
+        return DownloadResult(
+            entry_id, RESULT_RETRY, message=message, retry_after=retry_after
+        )
+
+    async def _mark_completed(
+        self, entry_id: int, downloaded: DownloadedFile
+    ) -> DownloadResult:
+        """İndirilen dosyayı blob deposuna yerleştirir ve kayda bağlar.
+
+        Dosya yerleştirme ile bağlama aynı blob kilidi altında yapılır;
+        böylece o sırada aynı blob'u silen GC dosyayı kayıttan önce silemez.
+        """
+        data_dir = Path(get_settings().data_dir)
+        async with self.session_factory() as db:
+            await db.execute(lock_blob(downloaded.sha256))
+            stored_path = await asyncio.to_thread(_store_blob, downloaded, data_dir)
+            await self._link_blob(
+                db,
+                entry_id,
+                downloaded.sha256,
+                stored_path,
+                downloaded.size,
+                source_url=downloaded.url,
+            )
+            await db.commit()
+
+        logger.info(
+            f"[Download] Completed: entry_id={entry_id}, "
+            f"size={downloaded.size} bytes, path={stored_path}"
+        )
+        return _completed_result(
+            entry_id, downloaded.sha256, stored_path, downloaded.size
+        )
+
+    async def _reuse_blob(self, entry_id: int, blob: PdfBlob) -> DownloadResult | None:
+        """Kaydı daha önce saklanan blob'a bağlar.
+
+        Blob kilit alınana kadar GC tarafından silinmiş olabilir; bu durumda
+        None döner ve PDF yeniden indirilir.
+        """
+        data_dir = Path(get_settings().data_dir)
+        async with self.session_factory() as db:
+            await db.execute(lock_blob(blob.sha256))
+            still_stored = await db.scalar(
+                select(PdfBlob.sha256).where(PdfBlob.sha256 == blob.sha256)
+            )
+            if (
+                still_stored is None
+                or resolve_data_file_path(blob.file_path, data_dir) is None
+            ):
+                return None
+            await self._link_blob(db, entry_id, blob.sha256, blob.file_path, blob.size)
+            await db.commit()
+
+        logger.info(
+            f"[Download] Reusing stored PDF: entry_id={entry_id}, "
+            f"sha256={blob.sha256}"
+        )
+        return _completed_result(entry_id, blob.sha256, blob.file_path, blob.size)
+
+    @staticmethod
+    async def _link_blob(
+        db: AsyncSession,
+        entry_id: int,
+        sha256: str,
+        file_path: str,
+        size: int,
+        source_url: str | None = None,
+    ) -> None:
+        """Kaydı blob'a bağlar ve `completed` işaretler.
+
+        Çağıran transaction'ı blob kilidini tutmalı ve commit etmelidir.
+        `ref_count` `library_entry_pdfs` trigger'ı ile güncellenir.
+        """
+        await db.execute(
+            pg_insert(PdfBlob)
+            .values(
+                sha256=sha256,
+                file_path=file_path,
+                size=size,
+                source_url=source_url,
+            )
+            .on_conflict_do_nothing(index_elements=[PdfBlob.sha256])
+        )
+        ref_stmt = pg_insert(LibraryEntryPdf).values(entry_id=entry_id, sha256=sha256)
+        await db.execute(
+            ref_stmt.on_conflict_do_update(
+                index_elements=[LibraryEntryPdf.entry_id],
+                set_={"sha256": ref_stmt.excluded.sha256},
+            )
+        )
+        await db.execute(
+            update(LibraryEntry)
+            .where(LibraryEntry.id == entry_id)
+            .values(
+                download_status=DownloadStatus.COMPLETED,
+                file_path=file_path,
+                error_message=None,
+            )
+        )
+
+    @staticmethod
+    async def _find_known_blob(db: AsyncSession, pdf_url: str | None) -> PdfBlob | None:
+        """`pdf_url`'den daha önce indirilmiş ve diskte duran blob'u bulur."""
+        if not pdf_url:
+            return None
+        result = await db.execute(
+            select(PdfBlob).where(PdfBlob.source_url == pdf_url).limit(1)
+        )
+        blob = result.scalar_one_or_none()
+        if blob is None:
+            return None
+        data_dir = Path(get_settings().data_dir)
+        if resolve_data_file_path(blob.file_path, data_dir) is None:
+            return None
+        return blob
+
+    async def _flush_attempts(self, recorder: AttemptRecorder) -> None:
+        """Biriken strateji denemelerini toplu INSERT ile yazar.
+
+        Telemetri hatası indirmeleri etkilemez; yazılamayan kayıtlar atılır.
+        """
+        attempts = recorder.drain()
+        if not attempts:
+            return
+        try:
+            async with self.session_factory() as db:
+                await db.execute(
+                    insert(DownloadAttempt), [asdict(attempt) for attempt in attempts]
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(
+                f"[Download] Could not record {len(attempts)} attempts: "
+                f"{type(e).__name__}: {e}"
+            )
+
+    async def _update_entry(self, entry_id: int, **values) -> None:
+        async with self.session_factory() as db:
+            await db.execute(
+                update(LibraryEntry).where(LibraryEntry.id == entry_id).values(**values)
+            )
+            await db.commit()
+
+    @staticmethod
+    async def _download_original(
+        meta: PaperMeta, clients: DownloadClients, file_path: Path
+    ) -> DownloadedFile:
+        """Orijinal URL'den (pdf_url veya doi.org) son kez indirmeyi dener.
+
+        HTTP hatası varsa retry/EZProxy kararı için HTTPStatusError veya
+        RequestError fırlatır.
+        """
+        if meta.pdf_url:
+            url = meta.pdf_url
+        elif meta.doi:
+            url = f"https://doi.org/{meta.doi}"
+        else:
+            raise ValueError("PDF URL ve DOI bulunamadı")
+        return await _download_url(
+            clients, url, file_path, strategy="Original", entry_id=meta.entry_id
+        )
+
+
+def _completed_result(
+    entry_id: int, sha256: str, file_path: str, size: int
+) -> DownloadResult:
+    return DownloadResult(
+        entry_id,
+        RESULT_COMPLETED,
+        file_path=file_path,
+        file_size=size,
+        sha256=sha256,
+    )
+
+
+def _store_blob(downloaded: DownloadedFile, data_dir: Path) -> str:
+    """İndirilen dosyayı içerik adresli yola taşır, relative yolu döndürür.
+
+    Aynı içerik zaten saklanıyorsa yeni dosya silinir (deduplikasyon).
+    """
+    relative_path = blob_relative_path(downloaded.sha256)
+    target = data_dir / relative_path
+    if target.is_file():
+        downloaded.path.unlink(missing_ok=True)
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(downloaded.path, target)
+        _fsync_dir(target.parent)
+
+    # Boş kalan {paper_id} dizinini temizle (yarım indirme varsa kalır)
+    try:
+        downloaded.path.parent.rmdir()
+    except OSError:
+        pass
+    return relative_path
+
+
+def _success_counts(key, since: datetime):
+    """`key` bazında deneme ve başarı sayılarını seçen sorgu."""
+    return (
+        select(
+            key,
+            func.count(),
+            func.count().filter(DownloadAttempt.outcome == OUTCOME_SUCCESS),
+        )
+        .where(
+            DownloadAttempt.started_at >= since,
+            DownloadAttempt.outcome.not_in(RANKING_IGNORED_OUTCOMES),
+        )
+        .group_by(key)
+    )
+
+
+def _should_try_ezproxy(
+    error: Exception, pdf_url: str | None, paper, ezproxy_settings: dict | None
+) -> bool:
+    """EZProxy fallback şartlarını kontrol eder."""
+    if not ezproxy_settings:
+        return False
+    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code not in (
+        401,
+        402,
+        403,
+    ):
+        return False
+    if not pdf_url and not paper.doi:
+        return False
+    return True
+
+
+def _build_ezproxy_target(prefix: str, pdf_url: str | None, paper) -> str:
+    if pdf_url:
+        return f"{prefix}{pdf_url}"
+    if paper.doi:
+        doi_url = paper.doi
+        if not doi_url.startswith("http"):
+            doi_url = f"https://doi.org/{doi_url}"
+        return f"{prefix}{doi_url}"
+    raise ValueError("EZProxy target could not be built")
+
+
+async def _download_via_ezproxy(
+    ezproxy_settings: dict,
+    file_path: Path,
+    paper,
+    original_pdf_url: str | None,
+    clients: DownloadClients,
+    entry_id: int | None,
+) -> DownloadedFile:
+    """EZProxy üzerinden indirme.
+
+    Diğer kaynaklarla aynı doğrulamadan geçer; EZProxy giriş sayfası (HTML)
+    PDF olarak kaydedilmez.
+    """
+    target = _build_ezproxy_target(ezproxy_settings["prefix"], original_pdf_url, paper)
+    logger.info(
+        f"[Download] EZProxy fallback attempted: entry_id={entry_id}, "
+        f"target={target[:120]}"
+    )
+    headers = _browser_headers()
+    headers["Cookie"] = ezproxy_settings["cookie"]
+
+    return await _download_url(
+        clients,
+        target,
+        file_path,
+        headers=headers,
+        strategy="EZProxy",
+        entry_id=entry_id,
+    )
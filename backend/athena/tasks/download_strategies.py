@@ -1,23 +1,50 @@
 """PDF indirme stratejileri — Fallback Chain mimarisi.
 
-Her strateji, verilen makale metadata'sından PDF indirmeyi dener.
-Başarısız olursa bir sonraki stratejiye geçilir.
+Her strateji, verilen makale metadata'sından PDF URL'si bulur ve indirir.
+Başarısız olursa bir sonraki stratejiye geçilir; hedged modda stratejiler
+kademeli olarak aynı anda çalışır ve ilk geçerli PDF kazanır.
 
 Zincir sırası:
   1. PrimaryDownloadStrategy  — Kaydedilmiş pdf_url'den doğrudan indir
   2. UnpaywallStrategy        — DOI ile Unpaywall OA PDF ara ve indir
   3. CoreApiStrategy          — DOI ile CORE açık erişim deposundan ara ve indir
+
+Stratejiler asenkrondur ve `DownloadClients` içindeki paylaşılan
+`httpx.AsyncClient` havuzlarını kullanır; böylece bir worker aynı anda
+çok sayıda indirmeyi tek event loop üzerinde yürütebilir.
 """
 
 from __future__ import annotations
 
+import asyncio
+import fcntl
+import hashlib
+import json
+import os
 import random
+import re
+import tempfile
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import httpx
 from loguru import logger
+from redis.asyncio import Redis
+
+from athena.core.config import get_settings
+from athena.core.download_telemetry import (
+    OUTCOME_NOT_FOUND,
+    AttemptRecord,
+    AttemptRecorder,
+)
+from athena.core.exceptions import DownloadError, ErrorCode
+from athena.core.host_scheduler import HostScheduler, direct_download_host
+from athena.core.oa_cache import OaLookupCache
+from athena.core.strategy_ranking import StrategyRanking
 
 # Gerçekçi tarayıcı User-Agent rotasyonu
 USER_AGENTS = [
@@ -34,6 +61,26 @@ UNPAYWALL_EMAIL = "kalem-kasghar@academic-tool.org"
 # İndirme sonucu minimum geçerli PDF boyutu (byte)
 MIN_VALID_PDF_SIZE = 1024
 
+# PDF dosyaları bu magic byte'larla başlar
+PDF_MAGIC = b"%PDF"
+
+# Ağdan okunan parça boyutu (byte)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Parçalar bu boyuta ulaşınca tek seferde thread'de diske yazılır (byte)
+WRITE_FLUSH_SIZE = 1024 * 1024
+
+# Bu boyuttan küçük yarım indirmeler devam için saklanmaz (byte)
+RESUME_MIN_BYTES = 1024 * 1024
+
+# Parça dosya adındaki URL özeti uzunluğu
+PARTIAL_KEY_LENGTH = 16
+
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-\d+/(\d+|\*)$")
+
+# Unpaywall / CORE API'lerine aynı anda yapılan sorgu sayısı
+API_LOOKUP_CONCURRENCY = 4
+
 
 @dataclass
 class PaperMeta:
@@ -45,15 +92,228 @@ class PaperMeta:
     entry_id: int | None = None
 
 
-def is_valid_pdf(content: bytes) -> bool:
-    """İndirilen verinin gerçek PDF olup olmadığını kontrol eder.
+@dataclass
+class DownloadedFile:
+    """Diske yazılmış ve doğrulanmış PDF."""
+
+    path: Path
+    size: int
+    sha256: str
+    # İndirildiği URL (yönlendirmelerden önceki)
+    url: str | None = None
+
 
-    PDF dosyaları ``%PDF`` magic byte'ı ile başlar.
-    Cloudflare challenge, paywall HTML veya boş yanıtlar ``False`` döner.
+class _PartialDownload:
+    """Bir URL için yarıda kalmış indirmenin parçası ve doğrulayıcısı.
+
+    Parça (`.part`) ve ETag/Last-Modified bilgisi (`.part.json`) hedef
+    dizinde tutulur. Adlar URL'den türetilir; böylece aynı kaydın farklı
+    kaynaklardan (birincil URL, Unpaywall, EZProxy) inen parçaları
+    birbirine karışmaz ve hedef dosya adı değişse de devam edilebilir.
     """
-    if len(content) < MIN_VALID_PDF_SIZE:
-        return False
-    return content[:5].startswith(b"%PDF")
+
+    def __init__(self, file_path: Path, url: str) -> None:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:PARTIAL_KEY_LENGTH]
+        self.url = url
+        self.path = file_path.parent / f".{key}.part"
+        self.meta_path = self.path.with_name(f"{self.path.name}.json")
+        # If-Range doğrulayıcısı (güçlü ETag veya Last-Modified)
+        self.validator: str | None = None
+
+    @classmethod
+    def load(cls, file_path: Path, url: str) -> _PartialDownload:
+        """Varsa diskteki doğrulayıcıyı okur."""
+        partial = cls(file_path, url)
+        try:
+            meta = json.loads(partial.meta_path.read_text())
+        except (OSError, ValueError):
+            return partial
+        if meta.get("url") == url:
+            partial.validator = meta.get("validator")
+        return partial
+
+    def range_headers(self, offset: int) -> dict[str, str]:
+        """`offset`'ten sonrasını isteyen header'lar.
+
+        Dosya sunucuda değiştiyse If-Range sayesinde tam içerik (200) döner.
+        Sıkıştırma kapatılır; aksi halde byte offset'leri tutmaz.
+        """
+        return {
+            "Range": f"bytes={offset}-",
+            "If-Range": self.validator or "",
+            "Accept-Encoding": "identity",
+        }
+
+    def save(self, response: httpx.Response) -> None:
+        """Yanıt devam ettirilebiliyorsa doğrulayıcısını diske yazar."""
+        headers = response.headers
+        etag = headers.get("ETag", "")
+        # Zayıf ETag'ler If-Range'de kullanılamaz
+        validator = (
+            etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+        )
+        resumable = (
+            validator is not None
+            and headers.get("Accept-Ranges", "").lower() == "bytes"
+            and headers.get("Content-Encoding", "identity").lower() == "identity"
+        )
+        if not resumable:
+            self.validator = None
+            self.meta_path.unlink(missing_ok=True)
+            return
+
+        self.validator = validator
+        self.meta_path.write_text(json.dumps({"url": self.url, "validator": validator}))
+
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+
+
+class _PdfFileWriter:
+    """PDF'i hedef dizindeki geçici dosyaya yazar ve doğrular.
+
+    İlk byte'lar ``%PDF`` değilse (Cloudflare challenge, paywall HTML vb.)
+    veya boyut sınırı aşılırsa yazma hemen kesilir. `commit` dosyayı fsync
+    edip son yola atomik olarak taşır; yarıda kalan indirme son yolda bozuk
+    dosya bırakmaz.
+
+    `partial` verilirse geçici dosya olarak parça dosyası kilitlenerek
+    kullanılır ve `begin(resume=True)` ile mevcut içeriğin sonundan devam
+    edilebilir. Parçayı başka bir process yazıyorsa anonim geçici dosyaya
+    düşülür.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        max_bytes: int,
+        partial: _PartialDownload | None = None,
+    ) -> None:
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.partial: _PartialDownload | None = None
+        self._head = b""
+        self._sha256 = hashlib.sha256()
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = self._lock_partial(partial) if partial else None
+        if fd is None:
+            fd, tmp_name = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part"
+            )
+            self.tmp_path = Path(tmp_name)
+            # mkstemp dosyayı 0600 oluşturur; API ve reconciler de okuyabilmeli
+            os.fchmod(fd, 0o644)
+        self._file = os.fdopen(fd, "r+b")
+
+    def _lock_partial(self, partial: _PartialDownload) -> int | None:
+        fd = os.open(partial.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        self.partial = partial
+        self.tmp_path = partial.path
+        return fd
+
+    @property
+    def resume_offset(self) -> int:
+        """Devam edilebilecek parçanın boyutu (yoksa 0)."""
+        if self.partial is None or self.partial.validator is None:
+            return 0
+        return os.fstat(self._file.fileno()).st_size
+
+    def begin(self, resume: bool = False) -> None:
+        """Yazmaya baştan ya da parçanın sonundan başlar."""
+        offset = self.resume_offset if resume else 0
+        self._file.seek(0)
+        while self.size < offset:
+            chunk = self._file.read(min(DOWNLOAD_CHUNK_SIZE, offset - self.size))
+            if not chunk:
+                break
+            self._track(chunk)
+        self._file.truncate(self.size)
+        self._file.seek(self.size)
+
+    def _track(self, chunk: bytes) -> None:
+        if len(self._head) < len(PDF_MAGIC):
+            self._head += chunk[: len(PDF_MAGIC) - len(self._head)]
+            if len(self._head) == len(PDF_MAGIC) and self._head != PDF_MAGIC:
+                raise _invalid_pdf_error()
+
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise _too_large_error(self.max_bytes)
+
+        self._sha256.update(chunk)
+
+    def write(self, chunk: bytes) -> None:
+        self._track(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> DownloadedFile:
+        """Dosyayı doğrular, diske senkronlar ve son yola taşır."""
+        if self._head != PDF_MAGIC or self.size < MIN_VALID_PDF_SIZE:
+            raise _invalid_pdf_error()
+
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.tmp_path, self.file_path)
+        _fsync_dir(self.file_path.parent)
+        _remove_partials(self.file_path.parent)
+        return DownloadedFile(self.file_path, self.size, self._sha256.hexdigest())
+
+    def keep(self) -> bool:
+        """Parçayı sonraki deneme için bırakır; devam edilemeyecekse siler."""
+        if self._file.closed:
+            return False
+        self._file.flush()
+        if self.resume_offset < RESUME_MIN_BYTES:
+            self.discard()
+            return False
+        self._file.close()
+        return True
+
+    def discard(self) -> None:
+        self._file.close()
+        if self.partial is not None:
+            self.partial.discard()
+        else:
+            self.tmp_path.unlink(missing_ok=True)
+
+
+def _remove_partials(directory: Path) -> None:
+    """Tamamlanan dosyanın diğer kaynaklardan kalan parçalarını siler."""
+    key_pattern = "?" * PARTIAL_KEY_LENGTH
+    for stale in directory.glob(f".{key_pattern}.part*"):
+        stale.unlink(missing_ok=True)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Rename'in kalıcı olması için dizin girdisini diske senkronlar."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _invalid_pdf_error() -> DownloadError:
+    return DownloadError(
+        code=ErrorCode.DOWNLOAD_INVALID_PDF,
+        message="İndirilen içerik geçerli bir PDF değil.",
+    )
+
+
+def _too_large_error(max_bytes: int) -> DownloadError:
+    return DownloadError(
+        code=ErrorCode.DOWNLOAD_TOO_LARGE,
+        message=f"PDF boyutu sınırı aşıyor ({max_bytes // (1024 * 1024)} MB).",
+    )
 
 
 def _browser_headers() -> dict[str, str]:
@@ -70,21 +330,184 @@ def _browser_headers() -> dict[str, str]:
     }
 
 
-def _download_url(url: str, proxy_url: str | None = None) -> bytes:
-    """URL'den byte içerik indirir (streaming)."""
-    client_kwargs: dict = {
+@dataclass
+class DownloadClients:
+    """Stratejilerin paylaştığı HTTP istemcileri.
+
+    API sorguları (Unpaywall, CORE) proxy'siz, PDF indirmeleri ise varsa
+    proxy üzerinden yapılır. İndirme istemcisinin her isteği (yönlendirmeler
+    dahil) `hosts` zamanlayıcısından geçer; API sonuçları `oa_cache`'te
+    DOI'ye göre tutulur. Strateji denemeleri `attempts`'te biriktirilir.
+    """
+
+    api: httpx.AsyncClient
+    download: httpx.AsyncClient
+    api_semaphore: asyncio.Semaphore
+    hosts: HostScheduler
+    oa_cache: OaLookupCache
+    attempts: AttemptRecorder = field(default_factory=AttemptRecorder)
+
+
+@asynccontextmanager
+async def open_download_clients(
+    proxy_url: str | None = None,
+    max_connections: int = 10,
+    redis: Redis | None = None,
+) -> AsyncIterator[DownloadClients]:
+    """İndirme süresince yaşayan bağlantı havuzlarını açar ve kapatır.
+
+    `redis` verilirse host hız sınırları, geri çekilmeler ve OA arama
+    sonuçları tüm worker'lar arasında paylaşılır.
+    """
+    hosts = HostScheduler(redis)
+    download_kwargs: dict = {
         "timeout": DOWNLOAD_TIMEOUT,
         "follow_redirects": True,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        "event_hooks": {
+            "request": [hosts.on_request],
+            "response": [hosts.on_response],
+        },
     }
     if proxy_url:
-        client_kwargs["proxy"] = proxy_url
+        download_kwargs["proxy"] = proxy_url
+
+    api_limits = httpx.Limits(max_connections=API_LOOKUP_CONCURRENCY)
+    async with (
+        httpx.AsyncClient(**download_kwargs) as download_client,
+        httpx.AsyncClient(
+            timeout=20.0, follow_redirects=True, limits=api_limits
+        ) as api_client,
+    ):
+        yield DownloadClients(
+            api=api_client,
+            download=download_client,
+            api_semaphore=asyncio.Semaphore(API_LOOKUP_CONCURRENCY),
+            hosts=hosts,
+            oa_cache=OaLookupCache(redis),
+        )
 
-    headers = _browser_headers()
 
-    with httpx.Client(**client_kwargs) as client:
-        with client.stream("GET", url, headers=headers) as response:
-            response.raise_for_status()
-            return response.read()
+async def _download_url(
+    clients: DownloadClients,
+    url: str,
+    file_path: Path,
+    headers: dict[str, str] | None = None,
+    strategy: str = "direct",
+    entry_id: int | None = None,
+) -> DownloadedFile:
+    """URL'deki PDF'i parça parça diske yazar.
+
+    İndirme yarıda kalırsa (zaman aşımı, bağlantı kopması, worker yeniden
+    başlatma) parça diskte kalır; sonraki denemede sunucu destekliyorsa
+    `Range` isteğiyle yalnızca kalan kısım indirilir.
+
+    HTTP hataları `httpx.HTTPStatusError` / `httpx.RequestError` (host geri
+    çekilmedeyse `HostBackoffError`), içerik PDF değilse veya boyut sınırını
+    aşıyorsa `DownloadError` fırlatır. Deneme `strategy` adıyla
+    `clients.attempts`'e kaydedilir.
+    """
+    with clients.attempts.track(entry_id, strategy, url) as attempt:
+        return await _download_to_writer(clients, url, file_path, headers, attempt)
+
+
+async def _download_to_writer(
+    clients: DownloadClients,
+    url: str,
+    file_path: Path,
+    headers: dict[str, str] | None,
+    attempt: AttemptRecord,
+) -> DownloadedFile:
+    max_bytes = get_settings().download_max_size_mb * 1024 * 1024
+    partial = _PartialDownload.load(file_path, url)
+    writer = await asyncio.to_thread(_PdfFileWriter, file_path, max_bytes, partial)
+
+    try:
+        return await _stream_to_writer(
+            clients, url, headers, writer, max_bytes, attempt
+        )
+    except DownloadError:
+        writer.discard()
+        raise
+    except BaseException:
+        # Zaman aşımı, bağlantı kopması, iptal: parça sonraki denemeye kalır
+        if writer.keep():
+            logger.info(
+                f"[Download] Kept partial download ({writer.size} bytes): url={url}"
+            )
+        raise
+
+
+async def _stream_to_writer(
+    clients: DownloadClients,
+    url: str,
+    headers: dict[str, str] | None,
+    writer: _PdfFileWriter,
+    max_bytes: int,
+    attempt: AttemptRecord,
+) -> DownloadedFile:
+    offset = writer.resume_offset
+    request_headers = dict(headers or _browser_headers())
+    if offset:
+        request_headers.update(writer.partial.range_headers(offset))
+        logger.info(f"[Download] Resuming at byte {offset}: url={url}")
+
+    async with (
+        clients.hosts.slot(url),
+        clients.download.stream("GET", url, headers=request_headers) as response,
+    ):
+        attempt.http_status = response.status_code
+        resumed = response.status_code == 206 and offset > 0
+        if resumed and _content_range(response)[0] != offset:
+            # Parça sunucudaki dosyayla uyuşmuyor; sonraki deneme baştan başlar
+            writer.partial.validator = None
+            raise httpx.HTTPStatusError(
+                f"Beklenmeyen Content-Range: {response.headers.get('Content-Range')}",
+                request=response.request,
+                response=response,
+            )
+        if response.status_code == 416 and writer.partial is not None:
+            writer.partial.validator = None
+        response.raise_for_status()
+
+        total_size = _content_range(response)[1] if resumed else None
+        content_length = response.headers.get("Content-Length", "")
+        if total_size is None and content_length.isdigit():
+            total_size = int(content_length) + (offset if resumed else 0)
+        if total_size is not None and total_size > max_bytes:
+            raise _too_large_error(max_bytes)
+
+        if not resumed and writer.partial is not None:
+            await asyncio.to_thread(writer.partial.save, response)
+        await asyncio.to_thread(writer.begin, resumed)
+
+        # Disk yazımı event loop'u bloklamasın: parçalar biriktirilip
+        # thread'de yazılır. İlk parça hemen yazılır; PDF olmayan içerik
+        # (HTML challenge sayfası vb.) tampon dolmadan reddedilir.
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+            attempt.bytes += len(chunk)
+            buffer += chunk
+            if len(buffer) >= WRITE_FLUSH_SIZE or not writer.size:
+                await asyncio.to_thread(writer.write, bytes(buffer))
+                buffer.clear()
+        if buffer:
+            await asyncio.to_thread(writer.write, bytes(buffer))
+        downloaded = await asyncio.to_thread(writer.commit)
+        downloaded.url = url
+        return downloaded
+
+
+def _content_range(response: httpx.Response) -> tuple[int | None, int | None]:
+    """`Content-Range: bytes <başlangıç>-<bitiş>/<toplam>` değerlerini okur."""
+    match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+    if not match:
+        return None, None
+    total = match.group(2)
+    return int(match.group(1)), None if total == "*" else int(total)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -96,14 +519,46 @@ class BaseDownloadStrategy(ABC):
 
     name: str = "base"
 
+    def applies_to(self, meta: PaperMeta) -> bool:
+        """Strateji bu makale için denenebilir mi (ör. DOI var mı).
+
+        Denenemeyen stratejiler telemetriye "not_found" olarak yazılmaz.
+        """
+        return True
+
     @abstractmethod
-    def execute(
+    async def resolve_url(
+        self, meta: PaperMeta, clients: DownloadClients
+    ) -> str | None:
+        """İndirilecek PDF URL'sini bulur; kaynak yoksa ``None``."""
+        ...
+
+    async def lookup(self, meta: PaperMeta, clients: DownloadClients) -> str | None:
+        """`resolve_url`'i çağırır; sonuçsuz aramayı telemetriye kaydeder."""
+        started = time.monotonic()
+        url = await self.resolve_url(meta, clients)
+        if not url and self.applies_to(meta):
+            clients.attempts.record(
+                meta.entry_id,
+                self.name,
+                OUTCOME_NOT_FOUND,
+                duration=time.monotonic() - started,
+            )
+        return url
+
+    async def execute(
         self,
         meta: PaperMeta,
-        proxy_url: str | None = None,
-    ) -> bytes | None:
-        """PDF byte içeriği döndürür, başarısız olursa ``None``."""
-        ...
+        clients: DownloadClients,
+        file_path: Path,
+    ) -> DownloadedFile | None:
+        """PDF'i `file_path`'e indirir; kaynak bulunamazsa ``None``."""
+        url = await self.lookup(meta, clients)
+        if not url:
+            return None
+        return await _download_url(
+            clients, url, file_path, strategy=self.name, entry_id=meta.entry_id
+        )
 
 
 # ─────────────────────────────────────────────────────────────
@@ -115,7 +570,12 @@ class PrimaryDownloadStrategy(BaseDownloadStrategy):
 
     name = "PrimaryDownload"
 
-    def execute(self, meta: PaperMeta, proxy_url: str | None = None) -> bytes | None:
+    def applies_to(self, meta: PaperMeta) -> bool:
+        return bool(meta.pdf_url)
+
+    async def resolve_url(
+        self, meta: PaperMeta, clients: DownloadClients
+    ) -> str | None:
         if not meta.pdf_url:
             logger.debug(f"[{self.name}] PDF URL yok, atlanıyor: entry_id={meta.entry_id}")
             return None
@@ -124,8 +584,7 @@ class PrimaryDownloadStrategy(BaseDownloadStrategy):
             f"[{self.name}] İndirme deneniyor: entry_id={meta.entry_id}, "
             f"url={meta.pdf_url[:120]}"
         )
-        content = _download_url(meta.pdf_url, proxy_url)
-        return content
+        return meta.pdf_url
 
 
 # ─────────────────────────────────────────────────────────────
@@ -136,18 +595,32 @@ class UnpaywallStrategy(BaseDownloadStrategy):
     """DOI üzerinden Unpaywall API'den açık erişim PDF bulma ve indirme."""
 
     name = "Unpaywall"
+    cache_source = "unpaywall"
+
+    def applies_to(self, meta: PaperMeta) -> bool:
+        return bool(meta.doi)
+
+    async def _fetch_oa_pdf_url(self, doi: str, clients: DownloadClients) -> str | None:
+        cached = await clients.oa_cache.get(self.cache_source, doi)
+        if cached is not None:
+            logger.debug(f"[{self.name}] Cache'ten: DOI={doi}, url={cached.url}")
+            return cached.url
 
-    def _fetch_oa_pdf_url(self, doi: str) -> str | None:
         api_url = f"https://api.unpaywall.org/v2/{doi}?email={UNPAYWALL_EMAIL}"
         try:
-            with httpx.Client(timeout=15.0, follow_redirects=True) as client:
-                resp = client.get(api_url)
-                resp.raise_for_status()
-                data = resp.json()
+            async with clients.api_semaphore:
+                resp = await clients.api.get(api_url, timeout=15.0)
+            resp.raise_for_status()
+            data = resp.json()
         except Exception as e:
             logger.warning(f"[{self.name}] API hatası: DOI={doi}, {type(e).__name__}: {e}")
             return None
 
+        pdf_url = self._pick_pdf_url(doi, data)
+        await clients.oa_cache.set(self.cache_source, doi, pdf_url)
+        return pdf_url
+
+    def _pick_pdf_url(self, doi: str, data: dict) -> str | None:
         if not data.get("is_oa"):
             logger.debug(f"[{self.name}] Makale açık erişim değil: DOI={doi}")
             return None
@@ -177,7 +650,9 @@ class UnpaywallStrategy(BaseDownloadStrategy):
         logger.debug(f"[{self.name}] OA ama kullanılabilir URL bulunamadı: DOI={doi}")
         return None
 
-    def execute(self, meta: PaperMeta, proxy_url: str | None = None) -> bytes | None:
+    async def resolve_url(
+        self, meta: PaperMeta, clients: DownloadClients
+    ) -> str | None:
         if not meta.doi:
             logger.debug(f"[{self.name}] DOI yok, atlanıyor: entry_id={meta.entry_id}")
             return None
@@ -186,12 +661,7 @@ class UnpaywallStrategy(BaseDownloadStrategy):
             f"[{self.name}] Unpaywall API kullanılarak alternatif link aranıyor... "
             f"entry_id={meta.entry_id}, DOI={meta.doi}"
         )
-        oa_url = self._fetch_oa_pdf_url(meta.doi)
-        if not oa_url:
-            return None
-
-        content = _download_url(oa_url, proxy_url)
-        return content
+        return await self._fetch_oa_pdf_url(meta.doi, clients)
 
 
 # ─────────────────────────────────────────────────────────────
@@ -202,29 +672,45 @@ class CoreApiStrategy(BaseDownloadStrategy):
     """DOI üzerinden CORE API'den açık erişim PDF bulma ve indirme."""
 
     name = "CoreAPI"
+    cache_source = "core"
     CORE_API_BASE = "https://api.core.ac.uk/v3"
 
     def __init__(self, core_api_key: str | None = None) -> None:
         self.core_api_key = core_api_key
 
-    def _fetch_core_pdf_url(self, doi: str) -> str | None:
+    def applies_to(self, meta: PaperMeta) -> bool:
+        return bool(meta.doi and self.core_api_key)
+
+    async def _fetch_core_pdf_url(
+        self, doi: str, clients: DownloadClients
+    ) -> str | None:
         if not self.core_api_key:
             logger.debug(f"[{self.name}] CORE API key yok, atlanıyor")
             return None
 
+        cached = await clients.oa_cache.get(self.cache_source, doi)
+        if cached is not None:
+            logger.debug(f"[{self.name}] Cache'ten: DOI={doi}, url={cached.url}")
+            return cached.url
+
         search_url = f"{self.CORE_API_BASE}/search/works"
         headers = {"Authorization": f"Bearer {self.core_api_key}"}
         params = {"q": f'doi:"{doi}"', "limit": 1}
 
         try:
-            with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-                resp = client.get(search_url, headers=headers, params=params)
-                resp.raise_for_status()
-                data = resp.json()
+            async with clients.api_semaphore:
+                resp = await clients.api.get(search_url, headers=headers, params=params)
+            resp.raise_for_status()
+            data = resp.json()
         except Exception as e:
             logger.warning(f"[{self.name}] API hatası: DOI={doi}, {type(e).__name__}: {e}")
             return None
 
+        pdf_url = self._pick_pdf_url(doi, data)
+        await clients.oa_cache.set(self.cache_source, doi, pdf_url)
+        return pdf_url
+
+    def _pick_pdf_url(self, doi: str, data: dict) -> str | None:
         results = data.get("results") or []
         if not results:
             logger.debug(f"[{self.name}] CORE'da sonuç bulunamadı: DOI={doi}")
@@ -252,7 +738,9 @@ class CoreApiStrategy(BaseDownloadStrategy):
         logger.debug(f"[{self.name}] CORE'da PDF URL bulunamadı: DOI={doi}")
         return None
 
-    def execute(self, meta: PaperMeta, proxy_url: str | None = None) -> bytes | None:
+    async def resolve_url(
+        self, meta: PaperMeta, clients: DownloadClients
+    ) -> str | None:
         if not meta.doi:
             logger.debug(f"[{self.name}] DOI yok, atlanıyor: entry_id={meta.entry_id}")
             return None
@@ -261,70 +749,215 @@ class CoreApiStrategy(BaseDownloadStrategy):
             f"[{self.name}] CORE API'de açık erişim aranıyor... "
             f"entry_id={meta.entry_id}, DOI={meta.doi}"
         )
-        core_url = self._fetch_core_pdf_url(meta.doi)
-        if not core_url:
-            return None
-
-        content = _download_url(core_url, proxy_url)
-        return content
+        return await self._fetch_core_pdf_url(meta.doi, clients)
 
 
 # ─────────────────────────────────────────────────────────────
 # Fallback Chain Yöneticisi
 # ─────────────────────────────────────────────────────────────
 
-def run_fallback_chain(
+async def run_fallback_chain(
     meta: PaperMeta,
     file_path: Path,
-    proxy_url: str | None = None,
+    clients: DownloadClients,
     core_api_key: str | None = None,
-) -> bool:
-    """Stratejileri sırasıyla deneyerek PDF indirmeyi gerçekleştirir.
+    hedged: bool | None = None,
+    ranking: StrategyRanking | None = None,
+    skip_direct: bool = False,
+) -> DownloadedFile | None:
+    """Stratejileri deneyerek PDF indirmeyi gerçekleştirir.
+
+    Varsayılan (`download_hedged`) hedged modda stratejiler yarışır:
+    Unpaywall/CORE URL aramaları birincil indirmeyle birlikte başlar, bir
+    sonraki aday `download_hedge_delay` sonra (önceki başarısız olursa
+    hemen) indirilmeye başlanır ve ilk geçerli PDF kazanır. Aksi halde
+    stratejiler sırasıyla denenir.
+
+    `ranking` verilirse stratejiler geçmiş başarı oranlarına göre sıralanır;
+    `skip_direct` ise PrimaryDownload atlanır. Atlama kararı (keşif olasılığı
+    dahil) çağıran tarafından kayıt başına bir kez verilir.
 
     Args:
         meta: Makale metadata'sı
         file_path: Kaydedilecek dosya yolu
-        proxy_url: Opsiyonel proxy URL
+        clients: Paylaşılan HTTP istemcileri
         core_api_key: Opsiyonel CORE API anahtarı
+        hedged: Modu ayardan bağımsız seçer
+        ranking: Telemetriden oluşan strateji sıralaması
+        skip_direct: Doğrudan indirme bu kayıt için atlansın mı
 
     Returns:
-        True ise geçerli PDF indirildi ve dosya kaydedildi.
-        False ise tüm stratejiler başarısız oldu.
+        Geçerli PDF indirildiyse kaydedilen dosya, tüm stratejiler
+        başarısız olduysa ``None``.
     """
     strategies: list[BaseDownloadStrategy] = [
         PrimaryDownloadStrategy(),
         UnpaywallStrategy(),
         CoreApiStrategy(core_api_key=core_api_key),
     ]
+    if ranking is not None:
+        strategies = _arrange_strategies(strategies, meta, ranking, skip_direct)
+
+    settings = get_settings()
+    if settings.download_hedged if hedged is None else hedged:
+        downloaded = await _run_hedged(
+            strategies, meta, file_path, clients, settings.download_hedge_delay
+        )
+    else:
+        downloaded = await _run_sequential(strategies, meta, file_path, clients)
+
+    if downloaded is None:
+        logger.warning(
+            f"[FallbackChain] Tüm stratejiler başarısız — entry_id={meta.entry_id}, "
+            f"doi={meta.doi}"
+        )
+    return downloaded
+
+
+def _arrange_strategies(
+    strategies: list[BaseDownloadStrategy],
+    meta: PaperMeta,
+    ranking: StrategyRanking,
+    skip_direct: bool = False,
+) -> list[BaseDownloadStrategy]:
+    """Stratejileri `ranking` sırasına dizer, atlananları loglar."""
+    by_name = {strategy.name: strategy for strategy in strategies}
+    direct_host = direct_download_host(meta.pdf_url, meta.doi)
+    names = ranking.arrange(list(by_name), direct_host, skip_direct)
+    skipped = [name for name in by_name if name not in names]
+    if skipped:
+        logger.info(
+            f"[FallbackChain] Geçmiş başarı oranı düşük, atlanıyor: "
+            f"{', '.join(skipped)} — host={direct_host}, entry_id={meta.entry_id}"
+        )
+    return [by_name[name] for name in names]
+
 
+async def _run_sequential(
+    strategies: list[BaseDownloadStrategy],
+    meta: PaperMeta,
+    file_path: Path,
+    clients: DownloadClients,
+) -> DownloadedFile | None:
     for strategy in strategies:
         try:
-            content = strategy.execute(meta, proxy_url)
-            if content is None:
+            downloaded = await strategy.execute(meta, clients, file_path)
+        except Exception as e:
+            _log_strategy_failure(strategy, meta, e)
+            continue
+        if downloaded is not None:
+            _log_strategy_success(strategy, meta, downloaded)
+            return downloaded
+    return None
+
+
+async def _run_hedged(
+    strategies: list[BaseDownloadStrategy],
+    meta: PaperMeta,
+    file_path: Path,
+    clients: DownloadClients,
+    hedge_delay: float,
+) -> DownloadedFile | None:
+    """Stratejileri kademeli başlatır; ilk geçerli PDF diğerlerini iptal eder.
+
+    Her aday kendi geçici hedef dosyasına yazar; aynı URL'yi bulan ikinci
+    aday indirme başlatmaz.
+    """
+    loop = asyncio.get_running_loop()
+    lookups = [
+        asyncio.create_task(strategy.lookup(meta, clients)) for strategy in strategies
+    ]
+    started_urls: set[str] = set()
+    running: dict[asyncio.Task, BaseDownloadStrategy] = {}
+    next_index = 0
+    hedge_at = loop.time()
+    downloaded: DownloadedFile | None = None
+    candidate_paths = [
+        file_path.with_name(f"{file_path.stem}.{s.name.lower()}{file_path.suffix}")
+        for s in strategies
+    ]
+
+    async def attempt(index: int) -> DownloadedFile | None:
+        url = await lookups[index]
+        if not url or url in started_urls:
+            return None
+        started_urls.add(url)
+        return await _download_url(
+            clients,
+            url,
+            candidate_paths[index],
+            strategy=strategies[index].name,
+            entry_id=meta.entry_id,
+        )
+
+    try:
+        while downloaded is None and (next_index < len(strategies) or running):
+            if next_index < len(strategies) and (
+                not running or loop.time() >= hedge_at
+            ):
+                task = asyncio.create_task(attempt(next_index))
+                running[task] = strategies[next_index]
+                next_index += 1
+                hedge_at = loop.time() + hedge_delay
                 continue
 
-            if is_valid_pdf(content):
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_path.write_bytes(content)
-                logger.info(
-                    f"[FallbackChain] Başarılı — strateji={strategy.name}, "
-                    f"entry_id={meta.entry_id}, boyut={len(content)} bytes"
-                )
-                return True
-            else:
-                logger.warning(
-                    f"[FallbackChain] {strategy.name} geçersiz dosya (PDF değil) döndürdü. "
-                    f"entry_id={meta.entry_id}. Bir sonraki stratejiye geçiliyor..."
-                )
-        except Exception as e:
-            logger.warning(
-                f"[FallbackChain] {strategy.name} başarısız oldu: "
-                f"{type(e).__name__}: {e}. entry_id={meta.entry_id}. "
-                f"Bir sonrakine geçiliyor..."
+            timeout = (
+                max(hedge_at - loop.time(), 0) if next_index < len(strategies) else None
             )
-
-    logger.warning(
-        f"[FallbackChain] Tüm stratejiler başarısız — entry_id={meta.entry_id}, "
-        f"doi={meta.doi}"
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                strategy = running.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    _log_strategy_failure(strategy, meta, e)
+                    continue
+                if result is not None and downloaded is None:
+                    _log_strategy_success(strategy, meta, result)
+                    downloaded = result
+    finally:
+        pending = [task for task in [*running, *lookups] if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if downloaded is not None:
+        # Aynı anda tamamlanan diğer adayları ve iptal edilenlerin
+        # bıraktığı parçaları temizle
+        stale_paths = [p for p in candidate_paths if p != downloaded.path]
+        await asyncio.to_thread(_remove_candidates, file_path.parent, stale_paths)
+    return downloaded
+
+
+def _remove_candidates(directory: Path, paths: list[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+    _remove_partials(directory)
+
+
+def _log_strategy_success(
+    strategy: BaseDownloadStrategy, meta: PaperMeta, downloaded: DownloadedFile
+) -> None:
+    logger.info(
+        f"[FallbackChain] Başarılı — strateji={strategy.name}, "
+        f"entry_id={meta.entry_id}, boyut={downloaded.size} bytes, "
+        f"sha256={downloaded.sha256[:12]}"
     )
-    return False
+
+
+def _log_strategy_failure(
+    strategy: BaseDownloadStrategy, meta: PaperMeta, error: Exception
+) -> None:
+    if isinstance(error, DownloadError):
+        logger.warning(
+            f"[FallbackChain] {strategy.name} geçersiz dosya döndürdü: {error} "
+            f"entry_id={meta.entry_id}. Bir sonraki stratejiye geçiliyor..."
+        )
+    else:
+        logger.warning(
+            f"[FallbackChain] {strategy.name} başarısız oldu: "
+            f"{type(error).__name__}: {error}. entry_id={meta.entry_id}. "
+            f"Bir sonrakine geçiliyor..."
+        )
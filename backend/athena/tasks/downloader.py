@@ -8,88 +8,132 @@ Başarısız indirmeler için Fallback Chain (Yedekleme Zinciri) kullanır:
   3. CoreAPI         — DOI ile CORE deposundan bul ve indir
 
 Fallback chain başarısız olursa EZProxy fallback denenir (ayrı mekanizma).
+
+İndirmeler `AsyncDownloadEngine` ile yürütülür: `download_paper_task` tek
+kaydı, `download_papers_batch_task` ise bir kayıt grubunu aynı event loop
+üzerinde eşzamanlı indirir.
 """
 
-import re
-import unicodedata
+import math
+from collections import Counter
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
-import httpx
 from celery import shared_task
-from celery.exceptions import MaxRetriesExceededError
 from loguru import logger
-from sqlalchemy import or_, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
+from athena.core.async_worker import AsyncWorkerRuntime, run_in_worker_loop
 from athena.core.config import get_settings
+from athena.core.download_telemetry import attempt_retention
+from athena.core.host_scheduler import host_of, interleave_by_host
+from athena.core.sync_database import get_sync_session
+from athena.core.task_queues import QUEUE_BULK
+from athena.models.download_attempt import DownloadAttempt
 from athena.models.library import DownloadStatus, LibraryEntry
+from athena.models.paper import Paper
 from athena.models.settings import UserSettings
-from athena.tasks.download_strategies import PaperMeta, run_fallback_chain
+from athena.tasks.download_engine import (
+    RESULT_RETRY,
+    AsyncDownloadEngine,
+    DownloadResult,
+    DownloadSettings,
+)
+
+# HTTP hatalarında tekrar deneme sayısı ve üstel bekleme üst sınırı (saniye)
+DOWNLOAD_MAX_RETRIES = 5
+RETRY_BACKOFF_MAX = 600
+
+# Retry taramalarında tek UPDATE ile pending'e çekilip kuyruklanan kayıt sayısı
+RETRY_SWEEP_CHUNK = 5000
 
+# Telemetri temizliğinde tek DELETE ile silinen deneme satırı sayısı
+ATTEMPT_PURGE_CHUNK = 10000
 
-def slugify(text: str) -> str:
-    """Metni URL-friendly slug formatına dönüştürür."""
-    text = unicodedata.normalize("NFKD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = text.strip("-")
-    return text[:100]
 
+def get_sync_db_session() -> Session:
+    """Worker process'inin bağlantı havuzundan senkron session döndürür."""
+    return get_sync_session()
 
-def get_sync_db_session():
-    """Senkron veritabanı bağlantısı oluşturur (Celery worker için)."""
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
 
+def _load_download_settings() -> DownloadSettings:
+    """Proxy, EZProxy ve CORE ayarlarını kullanıcı ayarlarından okur."""
     settings = get_settings()
-    # asyncpg -> psycopg2 dönüşümü
-    sync_url = settings.database_url.replace("+asyncpg", "")
-    engine = create_engine(sync_url)
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    db: Session = get_sync_db_session()
+    try:
+        return DownloadSettings(
+            proxy_url=_resolve_runtime_proxy_url(db, settings.outbound_proxy),
+            core_api_key=_load_core_api_key(db, settings),
+            ezproxy=_load_ezproxy_settings(db),
+        )
+    finally:
+        db.close()
 
 
-def generate_file_path(paper, settings) -> Path:
-    """PDF dosya yolunu oluşturur.
+def _run_downloads(
+    entry_ids: list[int],
+    download_settings: DownloadSettings,
+    final_attempt: bool,
+    concurrency: int | None = None,
+) -> list[DownloadResult]:
+    """Kayıtları worker process'inin event loop'u, havuzu ve Redis'iyle indirir.
 
-    Format: {data_dir}/{paper_id}/{year}_{author_slug}_{title_slug}.pdf
+    Bağlantılar task'lar arasında yeniden kullanılır; bkz.
+    `athena.core.async_worker`.
     """
-    year = paper.year or "unknown"
 
-    author_slug = "unknown"
-    if paper.authors:
-        author_slug = slugify(paper.authors[0].name)
+    async def run(runtime: AsyncWorkerRuntime) -> list[DownloadResult]:
+        download_engine = AsyncDownloadEngine(
+            runtime.session_factory,
+            download_settings,
+            concurrency=concurrency,
+            redis=runtime.redis,
+        )
+        return await download_engine.run(entry_ids, final_attempt=final_attempt)
 
-    title_slug = slugify(paper.title)
-    filename = f"{year}_{author_slug}_{title_slug}.pdf"
+    return run_in_worker_loop(run)
 
-    base_dir = Path(settings.data_dir)
-    paper_dir = base_dir / str(paper.id)
 
-    return paper_dir / filename
+def _retry_countdown(retries: int, retry_after: float | None = None) -> int:
+    """Celery `retry_backoff` ile aynı üstel bekleme (full jitter).
 
+    Host geri çekilmedeyse en az geri çekilme süresi kadar beklenir.
+    """
+    from celery.utils.time import get_exponential_backoff_interval
 
-@shared_task(
-    bind=True,
-    autoretry_for=(httpx.HTTPStatusError, httpx.RequestError),
-    retry_backoff=True,
-    retry_backoff_max=600,
-    retry_jitter=True,
-    max_retries=5,
-)
+    countdown = get_exponential_backoff_interval(
+        factor=1, retries=retries, maximum=RETRY_BACKOFF_MAX, full_jitter=True
+    )
+    return max(countdown, math.ceil(retry_after or 0))
+
+
+def enqueue_downloads(entry_ids: list[int], queue: str = QUEUE_BULK) -> None:
+    """Kayıtları `download_batch_size`'lık batch task'ları olarak kuyruğa ekler.
+
+    Kullanıcının beklediği küçük gruplar `QUEUE_INTERACTIVE` ile toplu
+    işlerin önüne alınabilir. Broker hatası çağırana fırlatılır.
+    """
+    from celery import group
+
+    if not entry_ids:
+        return
+
+    batch_size = get_settings().download_batch_size
+    group(
+        download_papers_batch_task.s(
+            entry_ids=entry_ids[i : i + batch_size], queue=queue
+        ).set(queue=queue)
+        for i in range(0, len(entry_ids), batch_size)
+    ).apply_async()
+
+
+@shared_task(bind=True, max_retries=DOWNLOAD_MAX_RETRIES)
 def download_paper_task(self, entry_id: int) -> dict:
     """PDF indirme Celery task'i.
 
     Fallback Chain ile indirme dener, başarısız olursa EZProxy'ye düşer.
+    HTTP hatalarında üstel bekleme ile tekrar denenir.
     """
-    settings = get_settings()
-    db: Session = get_sync_db_session()
-    runtime_proxy_url = _resolve_runtime_proxy_url(db, settings.outbound_proxy)
-    ezproxy_settings = _load_ezproxy_settings(db)
-    core_api_key = _load_core_api_key(db, settings)
-
     retry_info = (
         f"(attempt {self.request.retries + 1}/{self.max_retries + 1})"
         if self.request.retries > 0
@@ -98,171 +142,72 @@ def download_paper_task(self, entry_id: int) -> dict:
     logger.info(f"[Download] Starting entry_id={entry_id} {retry_info}")
 
     try:
-        # 1. LibraryEntry'yi al
-        stmt = select(LibraryEntry).where(LibraryEntry.id == entry_id)
-        result = db.execute(stmt)
-        entry = result.scalar_one_or_none()
-
-        if not entry:
-            logger.error(f"[Download] LibraryEntry not found: entry_id={entry_id}")
-            return {"status": "error", "message": "LibraryEntry not found"}
-
-        paper = entry.paper
-        logger.info(
-            f"[Download] Paper: id={paper.id}, title='{paper.title[:80]}', doi={paper.doi}"
+        download_settings = _load_download_settings()
+        [result] = _run_downloads(
+            [entry_id],
+            download_settings,
+            final_attempt=self.request.retries >= self.max_retries,
+            concurrency=1,
         )
+    except Exception as e:
+        logger.error(f"[Download] Error: entry_id={entry_id}, {type(e).__name__} - {e}")
+        return {"status": "failed", "entry_id": entry_id, "message": str(e)}
 
-        # 2. Status güncelle: downloading
-        entry.download_status = DownloadStatus.DOWNLOADING
-        db.commit()
+    if result.status == RESULT_RETRY:
+        raise self.retry(
+            countdown=_retry_countdown(self.request.retries, result.retry_after)
+        )
+    return result.as_dict()
 
-        # 3. Dosya yolu oluştur
-        file_path = generate_file_path(paper, settings)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 4. Fallback Chain ile indir
-        meta = PaperMeta(
-            pdf_url=paper.pdf_url,
-            doi=paper.doi,
-            title=paper.title,
-            entry_id=entry_id,
-        )
-        success = run_fallback_chain(
-            meta=meta,
-            file_path=file_path,
-            proxy_url=runtime_proxy_url,
-            core_api_key=core_api_key,
-        )
+@shared_task(bind=True, acks_late=True)
+def download_papers_batch_task(
+    self, entry_ids: list[int], attempt: int = 0, queue: str = QUEUE_BULK
+) -> dict:
+    """Bir kayıt grubunu tek worker'da eşzamanlı indirir.
 
-        if success:
-            file_size = file_path.stat().st_size
-            try:
-                stored_path = str(file_path.relative_to(settings.data_dir))
-            except ValueError:
-                stored_path = str(file_path)
-
-            entry.download_status = DownloadStatus.COMPLETED
-            entry.file_path = stored_path
-            entry.error_message = None
-            db.commit()
-
-            logger.info(
-                f"[Download] Completed: entry_id={entry_id}, "
-                f"size={file_size} bytes, path={stored_path}"
-            )
-            return {
-                "status": "completed",
-                "entry_id": entry_id,
-                "file_path": stored_path,
-                "file_size": file_size,
-            }
-
-        # 5. Fallback chain başarısız — PDF/DOI yoksa direkt fail
-        if not paper.pdf_url and not paper.doi:
-            entry.download_status = DownloadStatus.FAILED
-            entry.error_message = (
-                "PDF URL ve DOI bulunamadı. Makale muhtemelen açık erişim değil."
-            )
-            db.commit()
-            logger.warning(
-                f"[Download] No PDF URL or DOI: entry_id={entry_id}, paper_id={paper.id}"
-            )
-            return {"status": "failed", "message": "No PDF URL or DOI"}
+    HTTP hatası alan kayıtlar üstel beklemeyle yeni bir batch task olarak
+    aynı kuyruğa (`queue`) tekrar eklenir; `DOWNLOAD_MAX_RETRIES` sonunda
+    failed olur.
+    """
+    logger.info(
+        f"[DownloadBatch] Starting {len(entry_ids)} downloads (attempt {attempt + 1})"
+    )
 
-        # 6. Fallback chain başarısız — HTTP üzerinden son deneme ve EZProxy fallback
-        #    için orijinal hata zincirini tetikle (Celery retry mekanizması için)
-        logger.warning(
-            f"[Download] Fallback chain tükenmiş, EZProxy/retry denenecek: "
-            f"entry_id={entry_id}"
+    try:
+        download_settings = _load_download_settings()
+        results = _run_downloads(
+            entry_ids,
+            download_settings,
+            final_attempt=attempt >= DOWNLOAD_MAX_RETRIES,
         )
-        _raise_for_retry(meta, runtime_proxy_url)
+    except Exception as e:
+        # Takılı kalan kayıtlar retry_stuck_downloads ile tekrar kuyruğa alınır
+        logger.error(f"[DownloadBatch] Error: {type(e).__name__} - {e}")
+        return {"status": "error", "message": str(e)}
 
-    except (httpx.HTTPStatusError, httpx.RequestError) as e:
-        error_type = type(e).__name__
-        logger.warning(
-            f"[Download] HTTP error: entry_id={entry_id}, type={error_type}, detail={e}"
-        )
-        # EZProxy fallback (mevcut mantık korunuyor, dokunulmadı)
-        if _should_try_ezproxy(e, paper.pdf_url, paper, ezproxy_settings):
-            try:
-                _download_via_ezproxy(
-                    ezproxy_settings,
-                    file_path,
-                    paper,
-                    paper.pdf_url,
-                    runtime_proxy_url,
-                    entry_id,
-                )
-                entry.download_status = DownloadStatus.COMPLETED
-                entry.error_message = None
-                try:
-                    stored_path = str(file_path.relative_to(settings.data_dir))
-                except ValueError:
-                    stored_path = str(file_path)
-                entry.file_path = stored_path
-                db.commit()
-                logger.info(f"[Download] Completed via EZProxy: entry_id={entry_id}")
-                return {
-                    "status": "completed",
-                    "entry_id": entry_id,
-                    "file_path": stored_path,
-                }
-            except Exception as ez_err:
-                logger.warning(
-                    f"[Download] EZProxy fallback failed: entry_id={entry_id}, "
-                    f"reason={ez_err}"
-                )
+    retries = [r for r in results if r.status == RESULT_RETRY]
+    retry_ids = [r.entry_id for r in retries]
+    if retry_ids:
+        retry_after = max(r.retry_after or 0 for r in retries)
         try:
-            if self.request.retries >= self.max_retries:
-                entry.download_status = DownloadStatus.FAILED
-                entry.error_message = f"HTTP hatası ({error_type}): {str(e)[:200]}"
-                db.commit()
-                logger.error(
-                    f"[Download] Max retries reached, marked FAILED: entry_id={entry_id}"
-                )
-                return {
-                    "status": "failed",
-                    "entry_id": entry_id,
-                    "message": f"Max retries reached after HTTP error: {e}",
-                }
-
-            entry.download_status = DownloadStatus.PENDING
-            db.commit()
-            logger.info(
-                f"[Download] Marked pending for retry: entry_id={entry_id}, "
-                f"next_attempt={self.request.retries + 2}"
+            download_papers_batch_task.apply_async(
+                kwargs={
+                    "entry_ids": retry_ids,
+                    "attempt": attempt + 1,
+                    "queue": queue,
+                },
+                queue=queue,
+                countdown=_retry_countdown(attempt, retry_after),
             )
-        except Exception as mark_err:
-            logger.error(
-                f"[Download] Could not update status after HTTP error: {mark_err}"
+        except Exception as e:
+            logger.warning(
+                f"[DownloadBatch] Could not re-queue {len(retry_ids)} downloads: {e}"
             )
 
-        # Celery otomatik retry yapacak
-        raise
-
-    except MaxRetriesExceededError:
-        entry.download_status = DownloadStatus.FAILED
-        entry.error_message = "Maksimum deneme sayısı aşıldı. PDF erişilemiyor."
-        db.commit()
-        logger.error(f"[Download] Max retries exceeded: entry_id={entry_id}")
-        return {"status": "failed", "message": "Max retries exceeded"}
-
-    except Exception as e:
-        error_type = type(e).__name__
-        logger.error(
-            f"[Download] Unexpected error: entry_id={entry_id}, "
-            f"type={error_type}, detail={e}"
-        )
-        try:
-            entry.download_status = DownloadStatus.FAILED
-            entry.error_message = f"Beklenmeyen hata ({error_type}): {str(e)[:200]}"
-            db.commit()
-        except Exception:
-            pass
-        return {"status": "failed", "message": str(e)}
-
-    finally:
-        db.close()
+    counts = Counter(r.status for r in results)
+    logger.info(f"[DownloadBatch] Finished: {dict(counts)}")
+    return {"status": "ok", "attempt": attempt, "counts": dict(counts)}
 
 
 @shared_task(bind=True)
@@ -273,48 +218,22 @@ def retry_stuck_downloads(self) -> dict:
     - download_status = 'downloading' veya 'pending'
     - updated_at değeri 1 saatten eski
     """
-    db: Session = get_sync_db_session()
     cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
+    db: Session = get_sync_db_session()
 
     try:
-        stmt = select(LibraryEntry).where(
-            or_(
-                LibraryEntry.download_status == DownloadStatus.PENDING,
-                LibraryEntry.download_status == DownloadStatus.DOWNLOADING,
+        retried_count = _requeue_downloads(
+            db,
+            LibraryEntry.download_status.in_(
+                [DownloadStatus.PENDING, DownloadStatus.DOWNLOADING]
             ),
             LibraryEntry.updated_at < cutoff,
         )
-        result = db.execute(stmt)
-        stuck_entries = result.scalars().all()
-
-        if not stuck_entries:
-            logger.info("[RetryStuck] No stuck downloads found")
-            return {"status": "ok", "retried_count": 0}
-
-        logger.info(f"[RetryStuck] Found {len(stuck_entries)} stuck downloads")
-
-        retried_ids = []
-        for entry in stuck_entries:
-            entry.download_status = DownloadStatus.PENDING
-            retried_ids.append(entry.id)
-            logger.info(
-                f"[RetryStuck] Resetting entry_id={entry.id}, paper_id={entry.paper_id}"
-            )
-
-        db.commit()
-
-        for entry_id in retried_ids:
-            download_paper_task.delay(entry_id=entry_id)
-            logger.info(f"[RetryStuck] Re-queued entry_id={entry_id}")
-
-        logger.info(f"[RetryStuck] Retried {len(retried_ids)} stuck downloads")
-        return {
-            "status": "ok",
-            "retried_count": len(retried_ids),
-            "entry_ids": retried_ids,
-        }
+        logger.info(f"[RetryStuck] Retried {retried_count} stuck downloads")
+        return {"status": "ok", "retried_count": retried_count}
 
     except Exception as e:
+        db.rollback()
         logger.error(f"[RetryStuck] Error: {type(e).__name__} - {e}")
         return {"status": "error", "message": str(e)}
 
@@ -332,69 +251,124 @@ def retry_all_incomplete_downloads(self) -> dict:
     db: Session = get_sync_db_session()
 
     try:
-        stmt = select(LibraryEntry).where(
-            or_(
-                LibraryEntry.download_status == DownloadStatus.PENDING,
-                LibraryEntry.download_status == DownloadStatus.DOWNLOADING,
-                LibraryEntry.download_status == DownloadStatus.FAILED,
+        retried_count = _requeue_downloads(
+            db,
+            LibraryEntry.download_status.in_(
+                [
+                    DownloadStatus.PENDING,
+                    DownloadStatus.DOWNLOADING,
+                    DownloadStatus.FAILED,
+                ]
             ),
         )
-        result = db.execute(stmt)
-        entries = result.scalars().all()
+        logger.info(f"[RetryAll] Retried {retried_count} incomplete downloads")
+        return {"status": "ok", "retried_count": retried_count}
 
-        if not entries:
-            logger.info("[RetryAll] No incomplete downloads found")
-            return {"status": "ok", "retried_count": 0}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[RetryAll] Error: {type(e).__name__} - {e}")
+        return {"status": "error", "message": str(e)}
 
-        logger.info(f"[RetryAll] Found {len(entries)} incomplete downloads")
+    finally:
+        db.close()
 
-        retried_ids = []
-        for entry in entries:
-            entry.download_status = DownloadStatus.PENDING
-            retried_ids.append(entry.id)
-            logger.info(
-                f"[RetryAll] Resetting entry_id={entry.id}, paper_id={entry.paper_id}"
-            )
 
-        db.commit()
+@shared_task(bind=True)
+def purge_download_attempts(self) -> dict:
+    """Saklama süresini aşan indirme denemesi satırlarını siler.
 
-        for entry_id in retried_ids:
-            download_paper_task.delay(entry_id=entry_id)
-            logger.info(f"[RetryAll] Re-queued entry_id={entry_id}")
+    Süre, denemeleri okuyan pencerelerin en uzunudur (bkz.
+    `attempt_retention`): analiz endpoint'i ve strateji sıralaması.
+    """
+    retention = attempt_retention(get_settings().download_adaptive_window_days)
+    cutoff = datetime.now(timezone.utc) - retention
+    db: Session = get_sync_db_session()
 
-        logger.info(f"[RetryAll] Retried {len(retried_ids)} incomplete downloads")
-        return {
-            "status": "ok",
-            "retried_count": len(retried_ids),
-            "entry_ids": retried_ids,
-        }
+    try:
+        deleted_count = _purge_attempts_before(db, cutoff)
+        logger.info(
+            f"[PurgeAttempts] Deleted {deleted_count} attempts older than {cutoff}"
+        )
+        return {"status": "ok", "deleted_count": deleted_count}
 
     except Exception as e:
-        logger.error(f"[RetryAll] Error: {type(e).__name__} - {e}")
+        db.rollback()
+        logger.error(f"[PurgeAttempts] Error: {type(e).__name__} - {e}")
         return {"status": "error", "message": str(e)}
 
     finally:
         db.close()
 
 
-# ─────────────────────────────────────────────────────────────
-# Yardımcı fonksiyonlar
-# ─────────────────────────────────────────────────────────────
+def _purge_attempts_before(db: Session, cutoff: datetime) -> int:
+    """`cutoff`'tan eski denemeleri `ATTEMPT_PURGE_CHUNK`'lık parçalarla siler.
+
+    Her parça ayrı commit edilir; kilitler ve WAL kısa transaction'larda kalır.
+    """
+    attempts = DownloadAttempt.__table__
+    total = 0
+
+    while True:
+        chunk_ids = (
+            select(attempts.c.id)
+            .where(attempts.c.started_at < cutoff)
+            .limit(ATTEMPT_PURGE_CHUNK)
+            .scalar_subquery()
+        )
+        deleted = db.execute(
+            delete(attempts).where(attempts.c.id.in_(chunk_ids))
+        ).rowcount
+        db.commit()
+        total += deleted
+        if deleted < ATTEMPT_PURGE_CHUNK:
+            return total
 
 
-def _raise_for_retry(meta: PaperMeta, proxy_url: str | None) -> None:
-    """Fallback chain başarısız olduktan sonra, Celery retry mekanizmasını
-    tetiklemek için orijinal URL'ye bir kez daha istek atarak HTTPStatusError
-    veya RequestError fırlatır."""
-    from athena.tasks.download_strategies import _browser_headers, _download_url
+def _requeue_downloads(db: Session, *criteria) -> int:
+    """Koşula uyan kayıtları pending'e çekip batch task'lar olarak kuyruğa ekler.
 
-    if meta.pdf_url:
-        _download_url(meta.pdf_url, proxy_url)
-    elif meta.doi:
-        doi_url = f"https://doi.org/{meta.doi}"
-        _download_url(doi_url, proxy_url)
-    else:
-        raise ValueError("PDF URL ve DOI bulunamadı")
+    Kayıtlar id sırasıyla `RETRY_SWEEP_CHUNK`'lık parçalar halinde işlenir:
+    her parça tek `UPDATE ... RETURNING` ile güncellenip commit edilir, ardından
+    host'lara göre karıştırılarak kuyruğa eklenir. Kuyruklama yarıda kalırsa
+    kalan kayıtlar pending kalır ve sonraki taramada yeniden ele alınır.
+
+    Returns:
+        Kuyruğa eklenen kayıt sayısı.
+    """
+    entries = LibraryEntry.__table__
+    papers = Paper.__table__
+    last_id = 0
+    total = 0
+
+    while True:
+        chunk_ids = (
+            select(entries.c.id)
+            .where(*criteria, entries.c.id > last_id)
+            .order_by(entries.c.id)
+            .limit(RETRY_SWEEP_CHUNK)
+            .scalar_subquery()
+        )
+        rows = db.execute(
+            update(entries)
+            .where(entries.c.id.in_(chunk_ids), entries.c.paper_id == papers.c.id)
+            .values(download_status=DownloadStatus.PENDING)
+            .returning(entries.c.id, papers.c.pdf_url)
+        ).all()
+        db.commit()
+        if not rows:
+            return total
+
+        enqueue_downloads(
+            interleave_by_host((entry_id, host_of(url)) for entry_id, url in rows)
+        )
+        last_id = max(entry_id for entry_id, _ in rows)
+        total += len(rows)
+        logger.info(f"[RetrySweep] Re-queued {total} downloads (last_id={last_id})")
+
+
+# ─────────────────────────────────────────────────────────────
+# Yardımcı fonksiyonlar
+# ─────────────────────────────────────────────────────────────
 
 
 def _resolve_runtime_proxy_url(db: Session, fallback_proxy: str | None) -> str | None:
@@ -446,63 +420,3 @@ def _load_core_api_key(db: Session, settings) -> str | None:
     except Exception:
         pass
     return getattr(settings, "core_api_key", None)
-
-
-def _should_try_ezproxy(
-    error: Exception, pdf_url: str | None, paper, ezproxy_settings: dict | None
-) -> bool:
-    """EZProxy fallback şartlarını kontrol eder."""
-    if not ezproxy_settings:
-        return False
-    if isinstance(error, httpx.HTTPStatusError) and error.response.status_code not in (
-        401,
-        402,
-        403,
-    ):
-        return False
-    if not pdf_url and not paper.doi:
-        return False
-    return True
-
-
-def _build_ezproxy_target(prefix: str, pdf_url: str | None, paper) -> str:
-    if pdf_url:
-        return f"{prefix}{pdf_url}"
-    if paper.doi:
-        doi_url = paper.doi
-        if not doi_url.startswith("http"):
-            doi_url = f"https://doi.org/{doi_url}"
-        return f"{prefix}{doi_url}"
-    raise ValueError("EZProxy target could not be built")
-
-
-def _download_via_ezproxy(
-    ezproxy_settings: dict,
-    file_path: Path,
-    paper,
-    original_pdf_url: str | None,
-    proxy_url: str | None,
-    entry_id: int | None,
-) -> None:
-    """EZProxy üzerinden indirme. Mevcut mantık aynen korunuyor."""
-    from athena.tasks.download_strategies import _browser_headers, _download_url
-
-    target = _build_ezproxy_target(ezproxy_settings["prefix"], original_pdf_url, paper)
-    logger.info(
-        f"[Download] EZProxy fallback attempted: entry_id={entry_id}, "
-        f"target={target[:120]}"
-    )
-    headers = _browser_headers()
-    headers["Cookie"] = ezproxy_settings["cookie"]
-
-    client_kwargs: dict = {"timeout": 120.0, "follow_redirects": True}
-    if proxy_url:
-        client_kwargs["proxy"] = proxy_url
-
-    with httpx.Client(**client_kwargs) as client:
-        with client.stream("GET", target, headers=headers) as response:
-            response.raise_for_status()
-
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=8192):
-                    f.write(chunk)
@@ -0,0 +1,27 @@
+"""Metadata tamamlama Celery task modülü.
+
+Job'lar checkpoint'li calisir: task yeniden teslim edilirse (worker restart,
+acks_late) `last_entry_id` sonrasindan devam eder.
+"""
+
+from celery import shared_task
+
+from athena.tasks.jobs import run_job_task
+
+
+def _enrichment_service(db, runtime):
+    from athena.services.enrichment import MetadataEnrichmentService
+    from athena.services.saved_index import SavedPaperIndex
+
+    return MetadataEnrichmentService(db, saved_index=SavedPaperIndex(runtime.redis))
+
+
+@shared_task(bind=True, acks_late=True)
+def enrich_metadata_task(self, job_id: int) -> dict:
+    """Eksik metadata tamamlama job'ini arka planda calistirir."""
+    return run_job_task(
+        "Enrichment",
+        job_id,
+        _enrichment_service,
+        counters=("updated", "skipped", "failed"),
+    )
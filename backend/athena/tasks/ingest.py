@@ -0,0 +1,28 @@
+"""Toplu ekleme (ingest) Celery task modülü.
+
+Job'lar checkpoint'li calisir: task yeniden teslim edilirse (worker restart,
+acks_late) `next_index` sonrasindan devam eder ve commit edilip kuyruga
+eklenemeyen indirmeler tekrar kuyruga eklenir.
+"""
+
+from celery import shared_task
+
+from athena.tasks.jobs import run_job_task
+
+
+def _ingest_service(db, runtime):
+    from athena.services.ingest import IngestJobService
+    from athena.services.saved_index import SavedPaperIndex
+
+    return IngestJobService(db, saved_index=SavedPaperIndex(runtime.redis))
+
+
+@shared_task(bind=True, acks_late=True)
+def ingest_papers_task(self, job_id: int) -> dict:
+    """Toplu ekleme job'ini arka planda calistirir."""
+    return run_job_task(
+        "Ingest",
+        job_id,
+        _ingest_service,
+        counters=("added", "duplicates", "failed"),
+    )
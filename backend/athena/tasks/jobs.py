@@ -0,0 +1,48 @@
+"""Checkpoint'li job task'lari icin ortak calistirici.
+
+Job'lar worker process'inin event loop'u, engine havuzu ve Redis
+istemcisiyle calisir (bkz. `athena.core.async_worker`); task basina yeni
+engine veya Redis baglantisi kurulmaz.
+"""
+
+from collections.abc import Callable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from athena.core.async_worker import AsyncWorkerRuntime, run_in_worker_loop
+from athena.services.jobs import CheckpointedJobService
+
+ServiceFactory = Callable[[AsyncSession, AsyncWorkerRuntime], CheckpointedJobService]
+
+
+def run_job_task(
+    log_tag: str, job_id: int, make_service: ServiceFactory, counters: tuple[str, ...]
+) -> dict:
+    """Job'i calistirir; task sonucu olarak durumu ve sayaclari dondurur.
+
+    Args:
+        log_tag: Log onek'i (or. "Ingest")
+        job_id: Calistirilacak job
+        make_service: Session ve worker ortamindan job servisini olusturur
+        counters: Sonuca eklenecek job sayac kolonlari
+    """
+    logger.info(f"[{log_tag}] Starting job_id={job_id}")
+
+    async def run(runtime: AsyncWorkerRuntime) -> dict:
+        async with runtime.session_factory() as db:
+            job = await make_service(db, runtime).run_job(job_id)
+            if not job:
+                return {"status": "error", "message": f"{log_tag} job not found"}
+            return {
+                "status": job.status,
+                "job_id": job.id,
+                "processed": job.processed,
+                **{name: getattr(job, name) for name in counters},
+            }
+
+    try:
+        return run_in_worker_loop(run)
+    except Exception as e:
+        logger.error(f"[{log_tag}] Error: job_id={job_id}, {type(e).__name__} - {e}")
+        return {"status": "failed", "job_id": job_id, "message": str(e)}
@@ -0,0 +1,186 @@
+"""Dosya sistemi uzlastirma Celery task modülü.
+
+"completed" kayitlarin `file_path` degerlerini data_dir taramasiyla
+karsilastirir. Eksik dosyalar "failed" durumuna cekilir, legacy path'ler
+relative formata cevrilir ve dogrulanan kayitlarin zaman damgasi
+guncellenir. Boylece liste endpoint'i istek basina dosya sistemine
+dokunmak zorunda kalmaz.
+
+Hicbir kaydin referans vermedigi icerik adresli PDF'ler (`ref_count = 0`)
+de burada silinir.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from celery import shared_task
+from loguru import logger
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from athena.core.config import get_settings
+from athena.core.file_paths import (
+    data_path_candidates,
+    resolve_data_file_path,
+    scan_data_files,
+)
+from athena.core.sync_database import sync_pool_stats
+from athena.models.file_check import LibraryFileCheck
+from athena.models.library import DownloadStatus, LibraryEntry
+from athena.models.library_entry_pdf import LibraryEntryPdf
+from athena.models.pdf_blob import purge_orphan_blobs
+from athena.tasks.downloader import get_sync_db_session
+
+# Tek INSERT/UPDATE statement'ina konan satir sayisi
+RECONCILE_CHUNK_SIZE = 1000
+
+MISSING_FILE_MESSAGE = "PDF dosyası diskte bulunamadı"
+
+
+def _chunks(items: list, size: int = RECONCILE_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def remove_orphan_blobs(db: Session, root: Path, now: datetime) -> list[str]:
+    """Referanssiz blob'lari ve dosyalarini siler, silinen yollari dondurur.
+
+    Yeni olusturulan blob'lar `blob_gc_grace_minutes` boyunca korunur.
+    Dosyalar blob kilitleri birakilmadan (commit oncesi) silinir; o sirada
+    ayni blob'a baglanan indirme kilidi bekler ve dosyayi yeniden yerlestirir.
+    """
+    cutoff = now - timedelta(minutes=get_settings().blob_gc_grace_minutes)
+    orphan_paths = list(db.execute(purge_orphan_blobs(cutoff)).scalars().all())
+    for orphan_path in orphan_paths:
+        resolved = resolve_data_file_path(orphan_path, root)
+        if resolved is not None:
+            resolved.unlink(missing_ok=True)
+    db.commit()
+    return orphan_paths
+
+
+@shared_task(bind=True)
+def reconcile_library_files_task(self) -> dict:
+    """data_dir'i toplu tarar ve kayitlari tek transaction'da uzlastirir.
+
+    Tarama basladiktan sonra guncellenen kayitlara dokunulmaz; boylece o
+    sirada tamamlanan indirmeler yanlislikla "failed" yapilmaz.
+    """
+    settings = get_settings()
+    data_dir = Path(settings.data_dir)
+
+    # Volume baglanmamissa tum dosyalar eksik gorunur; hicbir sey yapma
+    if not data_dir.is_dir():
+        logger.warning(f"[Reconcile] data_dir not found, skipping: {data_dir}")
+        return {"status": "skipped", "message": "data_dir not found"}
+
+    started_at = datetime.now(timezone.utc)
+    root = data_dir.resolve()
+    files = scan_data_files(root)
+    logger.info(f"[Reconcile] Scanned {len(files)} files under {root}")
+
+    db: Session = get_sync_db_session()
+    try:
+        stmt = select(LibraryEntry.id, LibraryEntry.file_path).where(
+            LibraryEntry.download_status == DownloadStatus.COMPLETED,
+            LibraryEntry.file_path.is_not(None),
+            LibraryEntry.updated_at < started_at,
+        )
+        rows = db.execute(stmt).all()
+
+        verified_ids: list[int] = []
+        missing_ids: list[int] = []
+        path_updates: list[dict] = []
+
+        for entry_id, file_path in rows:
+            match = next(
+                (c for c in data_path_candidates(file_path, root) if c in files),
+                None,
+            )
+            if match is None:
+                missing_ids.append(entry_id)
+                continue
+
+            verified_ids.append(entry_id)
+            if match != file_path:
+                path_updates.append({"b_id": entry_id, "b_path": match})
+
+        entries_table = LibraryEntry.__table__
+
+        if path_updates:
+            db.execute(
+                update(entries_table)
+                .where(
+                    entries_table.c.id == bindparam("b_id"),
+                    entries_table.c.updated_at < started_at,
+                )
+                .values(file_path=bindparam("b_path")),
+                path_updates,
+            )
+
+        for chunk in _chunks(missing_ids):
+            marked_ids = (
+                db.execute(
+                    update(entries_table)
+                    .where(
+                        entries_table.c.id.in_(chunk),
+                        entries_table.c.updated_at < started_at,
+                    )
+                    .values(
+                        download_status=DownloadStatus.FAILED,
+                        file_path=None,
+                        error_message=MISSING_FILE_MESSAGE,
+                    )
+                    .returning(entries_table.c.id)
+                )
+                .scalars()
+                .all()
+            )
+            if marked_ids:
+                # Trigger blob'larin ref_count'unu dusurur
+                db.execute(
+                    delete(LibraryEntryPdf).where(
+                        LibraryEntryPdf.entry_id.in_(marked_ids)
+                    )
+                )
+
+        for chunk in _chunks(verified_ids):
+            insert_stmt = insert(LibraryFileCheck).values(
+                [
+                    {"entry_id": entry_id, "verified_at": started_at}
+                    for entry_id in chunk
+                ]
+            )
+            db.execute(
+                insert_stmt.on_conflict_do_update(
+                    index_elements=[LibraryFileCheck.entry_id],
+                    set_={"verified_at": insert_stmt.excluded.verified_at},
+                )
+            )
+
+        db.commit()
+
+        orphan_paths = remove_orphan_blobs(db, root, started_at)
+
+        logger.info(
+            f"[Reconcile] checked={len(rows)}, verified={len(verified_ids)}, "
+            f"normalized={len(path_updates)}, missing={len(missing_ids)}, "
+            f"orphans_removed={len(orphan_paths)}"
+        )
+        return {
+            "status": "ok",
+            "checked": len(rows),
+            "verified": len(verified_ids),
+            "normalized": len(path_updates),
+            "missing": len(missing_ids),
+            "orphans_removed": len(orphan_paths),
+            "db_pool": sync_pool_stats(),
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Reconcile] Error: {type(e).__name__} - {e}")
+        return {"status": "error", "message": str(e)}
+    finally:
+        db.close()
@@ -0,0 +1,29 @@
+"""Kayitli makale Bloom filtresi Celery task modülü.
+
+Filtre arama isteginde yeniden uretilmez: filtre yoksa arama sonuclari
+veritabanindan dogrulanir ve yeniden uretim bu task'a birakilir. Beat
+filtreyi `saved_index_ttl` dolmadan yeniler; silinen kayitlar bu sekilde
+filtreden temizlenir.
+"""
+
+from celery import shared_task
+from loguru import logger
+
+from athena.core.async_worker import AsyncWorkerRuntime, run_in_worker_loop
+
+
+@shared_task(bind=True)
+def rebuild_saved_index_task(self) -> dict:
+    """Filtreyi veritabanindan yeniden uretir."""
+    from athena.services.saved_index import SavedPaperIndex
+
+    async def run(runtime: AsyncWorkerRuntime) -> bool:
+        async with runtime.session_factory() as db:
+            return await SavedPaperIndex(runtime.redis).rebuild(db)
+
+    try:
+        rebuilt = run_in_worker_loop(run)
+    except Exception as e:
+        logger.error(f"[SavedIndex] Error: {type(e).__name__} - {e}")
+        return {"status": "error", "message": str(e)}
+    return {"status": "ok" if rebuilt else "skipped"}
@@ -18,6 +18,14 @@ from athena.core.database import Base
 
 # Import all models so Alembic can detect them
 from athena.models import Author, LibraryEntry, Paper, Tag  # noqa: F401
+from athena.models.download_attempt import DownloadAttempt  # noqa: F401
+from athena.models.enrichment_job import EnrichmentJob  # noqa: F401
+from athena.models.file_check import LibraryFileCheck  # noqa: F401
+from athena.models.ingest_job import IngestJob  # noqa: F401
+from athena.models.library_entry_pdf import LibraryEntryPdf  # noqa: F401
+from athena.models.library_read_model import LibraryReadModel  # noqa: F401
+from athena.models.paper_identifier import PaperIdentifier  # noqa: F401
+from athena.models.pdf_blob import PdfBlob  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
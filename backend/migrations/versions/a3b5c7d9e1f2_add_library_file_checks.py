@@ -0,0 +1,38 @@
+"""add_library_file_checks
+
+Revision ID: a3b5c7d9e1f2
+Revises: e1a7c3d9f402
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b5c7d9e1f2"
+down_revision: Union[str, Sequence[str], None] = "e1a7c3d9f402"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create library_file_checks table for the filesystem reconciler."""
+    op.create_table(
+        "library_file_checks",
+        sa.Column(
+            "entry_id",
+            sa.Integer(),
+            sa.ForeignKey("library_entries.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("verified_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop library_file_checks table."""
+    op.drop_table("library_file_checks")
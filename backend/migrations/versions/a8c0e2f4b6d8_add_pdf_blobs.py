@@ -0,0 +1,102 @@
+"""add_pdf_blobs
+
+Revision ID: a8c0e2f4b6d8
+Revises: f4b6d8f0a2c3
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c0e2f4b6d8"
+down_revision: Union[str, Sequence[str], None] = "f4b6d8f0a2c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create content-addressed PDF tables and the ref_count trigger."""
+    op.create_table(
+        "pdf_blobs",
+        sa.Column("sha256", sa.String(64), primary_key=True),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("source_url", sa.Text(), nullable=True),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    # URL'ler btree satir sinirini asabilir; yalnizca esitlik aranir
+    op.create_index(
+        "ix_pdf_blobs_source_url",
+        "pdf_blobs",
+        ["source_url"],
+        postgresql_using="hash",
+    )
+    op.create_index(
+        "ix_pdf_blobs_orphans",
+        "pdf_blobs",
+        ["created_at"],
+        postgresql_where=sa.text("ref_count = 0"),
+    )
+
+    op.create_table(
+        "library_entry_pdfs",
+        sa.Column(
+            "entry_id",
+            sa.Integer(),
+            sa.ForeignKey("library_entries.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "sha256",
+            sa.String(64),
+            sa.ForeignKey("pdf_blobs.sha256", ondelete="RESTRICT"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_library_entry_pdfs_sha256", "library_entry_pdfs", ["sha256"])
+
+    # Kayit silme (CASCADE dahil) ve blob degisiminde ref_count guncellenir
+    op.execute("""
+        CREATE OR REPLACE FUNCTION library_entry_pdfs_ref_count()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE pdf_blobs SET ref_count = ref_count - 1
+                WHERE sha256 = OLD.sha256;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE pdf_blobs SET ref_count = ref_count + 1
+                WHERE sha256 = NEW.sha256;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    op.execute("""
+        CREATE TRIGGER library_entry_pdfs_ref_count
+        AFTER INSERT OR DELETE OR UPDATE OF sha256 ON library_entry_pdfs
+        FOR EACH ROW EXECUTE FUNCTION library_entry_pdfs_ref_count()
+        """)
+
+
+def downgrade() -> None:
+    """Drop content-addressed PDF tables."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS library_entry_pdfs_ref_count ON library_entry_pdfs"
+    )
+    op.execute("DROP FUNCTION IF EXISTS library_entry_pdfs_ref_count()")
+    op.drop_index("ix_library_entry_pdfs_sha256", table_name="library_entry_pdfs")
+    op.drop_table("library_entry_pdfs")
+    op.drop_index("ix_pdf_blobs_orphans", table_name="pdf_blobs")
+    op.drop_index("ix_pdf_blobs_source_url", table_name="pdf_blobs")
+    op.drop_table("pdf_blobs")
@@ -0,0 +1,48 @@
+"""drop_unused_trigram_indexes
+
+Revision ID: a9c1e3b5d7f9
+Revises: f7a9c1e3b5d7
+Create Date: 2026-10-20 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c1e3b5d7f9"
+down_revision: Union[str, Sequence[str], None] = "f7a9c1e3b5d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# b6d8f0a2c4e5'te eklenen indexler. Kutuphane aramasi artik
+# library_read_model uzerinde calisiyor (bkz. c8e0a2b4d6f8); bu indexler
+# hicbir sorguda kullanilmiyor ama her yazmada guncelleniyordu.
+# pg_trgm eklentisi okuma modeli indexleri icin yerinde kalir.
+TRIGRAM_INDEXES = (
+    ("ix_papers_title_trgm", "papers", "title"),
+    ("ix_papers_abstract_trgm", "papers", "abstract"),
+    ("ix_authors_name_trgm", "authors", "name"),
+    ("ix_tags_name_trgm", "tags", "name"),
+)
+
+
+def upgrade() -> None:
+    """Drop trigram indexes on papers, authors and tags."""
+    for index_name, table_name, _ in TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name=table_name)
+
+
+def downgrade() -> None:
+    """Recreate the trigram indexes."""
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
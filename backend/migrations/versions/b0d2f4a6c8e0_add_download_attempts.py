@@ -0,0 +1,47 @@
+"""add_download_attempts
+
+Revision ID: b0d2f4a6c8e0
+Revises: a8c0e2f4b6d8
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b0d2f4a6c8e0"
+down_revision: Union[str, Sequence[str], None] = "a8c0e2f4b6d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the download attempt telemetry table."""
+    op.create_table(
+        "download_attempts",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("entry_id", sa.Integer(), nullable=True),
+        sa.Column("strategy", sa.String(32), nullable=False),
+        sa.Column("host", sa.String(255), nullable=False, server_default=""),
+        sa.Column("outcome", sa.String(16), nullable=False),
+        sa.Column("http_status", sa.SmallInteger(), nullable=True),
+        sa.Column("bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    # Yalnizca eklenen zaman serisi: BRIN indeksi kucuk ve yeterli
+    op.create_index(
+        "ix_download_attempts_started_at",
+        "download_attempts",
+        ["started_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    """Drop the download attempt telemetry table."""
+    op.drop_index("ix_download_attempts_started_at", table_name="download_attempts")
+    op.drop_table("download_attempts")
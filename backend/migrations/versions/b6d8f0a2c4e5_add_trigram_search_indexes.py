@@ -0,0 +1,47 @@
+"""add_trigram_search_indexes
+
+Revision ID: b6d8f0a2c4e5
+Revises: a3b5c7d9e1f2
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d8f0a2c4e5"
+down_revision: Union[str, Sequence[str], None] = "a3b5c7d9e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index adi, tablo, kolon) - kutuphane aramasindaki ILIKE '%term%' filtreleri
+TRIGRAM_INDEXES = (
+    ("ix_papers_title_trgm", "papers", "title"),
+    ("ix_papers_abstract_trgm", "papers", "abstract"),
+    ("ix_authors_name_trgm", "authors", "name"),
+    ("ix_tags_name_trgm", "tags", "name"),
+)
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add GIN trigram indexes for substring search."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop trigram indexes (pg_trgm extension is left installed)."""
+    for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
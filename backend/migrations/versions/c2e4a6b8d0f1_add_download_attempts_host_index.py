@@ -0,0 +1,33 @@
+"""add_download_attempts_host_index
+
+Revision ID: c2e4a6b8d0f1
+Revises: b0d2f4a6c8e0
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e4a6b8d0f1"
+down_revision: Union[str, Sequence[str], None] = "b0d2f4a6c8e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index download attempts by host for adaptive strategy ordering."""
+    op.create_index(
+        "ix_download_attempts_host_started_at",
+        "download_attempts",
+        ["host", "started_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the host index."""
+    op.drop_index(
+        "ix_download_attempts_host_started_at", table_name="download_attempts"
+    )
@@ -0,0 +1,348 @@
+"""add_library_read_model
+
+Revision ID: c8e0a2b4d6f8
+Revises: b6d8f0a2c4e5
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e0a2b4d6f8"
+down_revision: Union[str, Sequence[str], None] = "b6d8f0a2c4e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (trigger adi, tablo, olaylar, trigger fonksiyonu)
+READ_MODEL_TRIGGERS = (
+    (
+        "library_entries_read_model",
+        "library_entries",
+        "INSERT OR UPDATE",
+        "library_entries_read_model_trigger",
+    ),
+    ("papers_read_model", "papers", "UPDATE", "papers_read_model_trigger"),
+    (
+        "paper_authors_read_model",
+        "paper_authors",
+        "INSERT OR UPDATE OR DELETE",
+        "paper_authors_read_model_trigger",
+    ),
+    ("authors_read_model", "authors", "UPDATE OF name", "authors_read_model_trigger"),
+    (
+        "library_tags_read_model",
+        "library_tags",
+        "INSERT OR UPDATE OR DELETE",
+        "entry_link_read_model_trigger",
+    ),
+    ("tags_read_model", "tags", "UPDATE OF name", "tags_read_model_trigger"),
+    (
+        "collection_entries_read_model",
+        "collection_entries",
+        "INSERT OR UPDATE OR DELETE",
+        "entry_link_read_model_trigger",
+    ),
+)
+
+TRIGGER_FUNCTIONS = (
+    "library_entries_read_model_trigger",
+    "papers_read_model_trigger",
+    "paper_authors_read_model_trigger",
+    "authors_read_model_trigger",
+    "entry_link_read_model_trigger",
+    "tags_read_model_trigger",
+)
+
+
+def upgrade() -> None:
+    """Create trigger-maintained library_read_model table and backfill it."""
+    op.create_table(
+        "library_read_model",
+        sa.Column(
+            "entry_id",
+            sa.Integer(),
+            sa.ForeignKey("library_entries.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("paper_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("abstract", sa.Text(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("citation_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("download_status", sa.String(20), nullable=False),
+        sa.Column("source", sa.String(20), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=True),
+        sa.Column(
+            "tag_ids",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column(
+            "tag_names",
+            postgresql.ARRAY(sa.Text()),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column(
+            "collection_ids",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            server_default="{}",
+        ),
+        sa.Column("search_text", sa.Text(), nullable=False, server_default=""),
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+        sa.Column("display", postgresql.JSONB(), nullable=False),
+    )
+    op.create_index("ix_library_read_model_year", "library_read_model", ["year"])
+    op.create_index(
+        "ix_library_read_model_citation_count",
+        "library_read_model",
+        ["citation_count"],
+    )
+    op.create_index(
+        "ix_library_read_model_download_status",
+        "library_read_model",
+        ["download_status"],
+    )
+    for column_name in ("tag_names", "collection_ids", "search_vector"):
+        op.create_index(
+            f"ix_library_read_model_{column_name}",
+            "library_read_model",
+            [column_name],
+            postgresql_using="gin",
+        )
+    for column_name in ("title", "abstract", "search_text"):
+        op.create_index(
+            f"ix_library_read_model_{column_name}_trgm",
+            "library_read_model",
+            [column_name],
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+    # Verilen entry id'leri icin okuma modeli satirlarini tek sorguda yeniden uretir
+    op.execute(
+        r"""
+        CREATE OR REPLACE FUNCTION refresh_library_read_model(p_entry_ids integer[])
+        RETURNS void AS $$
+        BEGIN
+            IF p_entry_ids IS NULL OR cardinality(p_entry_ids) = 0 THEN
+                RETURN;
+            END IF;
+
+            INSERT INTO library_read_model AS rm (
+                entry_id, paper_id, title, abstract, year, citation_count,
+                download_status, source, file_path, tag_ids, tag_names,
+                collection_ids, search_text, search_vector, display
+            )
+            SELECT
+                le.id,
+                p.id,
+                p.title,
+                p.abstract,
+                p.year,
+                p.citation_count,
+                lower(le.download_status::text),
+                lower(le.source::text),
+                le.file_path,
+                coalesce(t.tag_ids, '{}'),
+                coalesce(t.tag_names, '{}'),
+                coalesce(c.collection_ids, '{}'),
+                concat_ws(E'\x1f', a.author_text, t.tag_text),
+                p.search_vector,
+                jsonb_build_object(
+                    'id', le.id,
+                    'source', lower(le.source::text),
+                    'download_status', lower(le.download_status::text),
+                    'file_path', le.file_path,
+                    'error_message', le.error_message,
+                    'is_favorite', le.is_favorite,
+                    'tags', coalesce(t.tags_json, '[]'::jsonb),
+                    'paper', jsonb_build_object(
+                        'id', p.id,
+                        'title', p.title,
+                        'abstract', p.abstract,
+                        'year', p.year,
+                        'citation_count', p.citation_count,
+                        'venue', p.venue,
+                        'doi', p.doi,
+                        'pdf_url', p.pdf_url,
+                        'authors', coalesce(a.authors_json, '[]'::jsonb),
+                        'created_at', p.created_at
+                    )
+                )
+            FROM library_entries le
+            JOIN papers p ON p.id = le.paper_id
+            LEFT JOIN LATERAL (
+                SELECT
+                    jsonb_agg(
+                        jsonb_build_object('name', au.name) ORDER BY pa.position
+                    ) AS authors_json,
+                    string_agg(au.name, E'\x1f' ORDER BY pa.position) AS author_text
+                FROM paper_authors pa
+                JOIN authors au ON au.id = pa.author_id
+                WHERE pa.paper_id = p.id
+            ) a ON true
+            LEFT JOIN LATERAL (
+                SELECT
+                    array_agg(tg.id ORDER BY tg.id) AS tag_ids,
+                    array_agg(tg.name::text ORDER BY tg.id) AS tag_names,
+                    string_agg(tg.name, E'\x1f' ORDER BY tg.id) AS tag_text,
+                    jsonb_agg(
+                        jsonb_build_object('id', tg.id, 'name', tg.name)
+                        ORDER BY tg.id
+                    ) AS tags_json
+                FROM library_tags lt
+                JOIN tags tg ON tg.id = lt.tag_id
+                WHERE lt.entry_id = le.id
+            ) t ON true
+            LEFT JOIN LATERAL (
+                SELECT array_agg(ce.collection_id ORDER BY ce.collection_id)
+                    AS collection_ids
+                FROM collection_entries ce
+                WHERE ce.entry_id = le.id
+            ) c ON true
+            WHERE le.id = ANY(p_entry_ids)
+            ON CONFLICT (entry_id) DO UPDATE SET
+                paper_id = EXCLUDED.paper_id,
+                title = EXCLUDED.title,
+                abstract = EXCLUDED.abstract,
+                year = EXCLUDED.year,
+                citation_count = EXCLUDED.citation_count,
+                download_status = EXCLUDED.download_status,
+                source = EXCLUDED.source,
+                file_path = EXCLUDED.file_path,
+                tag_ids = EXCLUDED.tag_ids,
+                tag_names = EXCLUDED.tag_names,
+                collection_ids = EXCLUDED.collection_ids,
+                search_text = EXCLUDED.search_text,
+                search_vector = EXCLUDED.search_vector,
+                display = EXCLUDED.display;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION library_entries_read_model_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_library_read_model(ARRAY[NEW.id]);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION papers_read_model_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT id FROM library_entries WHERE paper_id = NEW.id)
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION paper_authors_read_model_trigger()
+        RETURNS trigger AS $$
+        DECLARE
+            v_paper_id integer;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                v_paper_id := OLD.paper_id;
+            ELSE
+                v_paper_id := NEW.paper_id;
+            END IF;
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT id FROM library_entries WHERE paper_id = v_paper_id)
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION authors_read_model_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_library_read_model(
+                ARRAY(
+                    SELECT le.id
+                    FROM library_entries le
+                    JOIN paper_authors pa ON pa.paper_id = le.paper_id
+                    WHERE pa.author_id = NEW.id
+                )
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    # library_tags ve collection_entries: ikisinde de entry_id kolonu var
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION entry_link_read_model_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM refresh_library_read_model(ARRAY[OLD.entry_id]);
+            ELSE
+                PERFORM refresh_library_read_model(ARRAY[NEW.entry_id]);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tags_read_model_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT entry_id FROM library_tags WHERE tag_id = NEW.id)
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    for trigger_name, table_name, events, function_name in READ_MODEL_TRIGGERS:
+        op.execute(
+            f"""
+            CREATE TRIGGER {trigger_name}
+            AFTER {events} ON {table_name}
+            FOR EACH ROW EXECUTE FUNCTION {function_name}()
+            """
+        )
+
+    # Mevcut kayitlar icin tek seferlik doldurma
+    op.execute(
+        "SELECT refresh_library_read_model(ARRAY(SELECT id FROM library_entries))"
+    )
+
+
+def downgrade() -> None:
+    """Drop library_read_model table, triggers and functions."""
+    for trigger_name, table_name, _, _ in reversed(READ_MODEL_TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}")
+    for function_name in TRIGGER_FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_library_read_model(integer[])")
+    op.drop_table("library_read_model")
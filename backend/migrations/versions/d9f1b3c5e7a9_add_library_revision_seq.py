@@ -0,0 +1,54 @@
+"""add_library_revision_seq
+
+Revision ID: d9f1b3c5e7a9
+Revises: c8e0a2b4d6f8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9f1b3c5e7a9"
+down_revision: Union[str, Sequence[str], None] = "c8e0a2b4d6f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add library_revision_seq bumped on every library_read_model change.
+
+    Sequence'ler transaction disi ve kilitsiz ilerler; facet cache anahtari
+    bu degeri icerdiginden her kutuphane yazimi cache'i gecersiz kilar.
+    """
+    op.execute("CREATE SEQUENCE IF NOT EXISTS library_revision_seq")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_library_revision()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval('library_revision_seq');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER library_read_model_revision
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON library_read_model
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_library_revision()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop library revision trigger, function and sequence."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS library_read_model_revision ON library_read_model"
+    )
+    op.execute("DROP FUNCTION IF EXISTS bump_library_revision()")
+    op.execute("DROP SEQUENCE IF EXISTS library_revision_seq")
@@ -0,0 +1,56 @@
+"""add_enrichment_jobs
+
+Revision ID: e1a7c3d9f402
+Revises: 7245dcd6adc4
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c3d9f402"
+down_revision: Union[str, Sequence[str], None] = "7245dcd6adc4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create enrichment_jobs table for background metadata enrichment."""
+    op.create_table(
+        "enrichment_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("max_entries", sa.Integer(), nullable=True),
+        sa.Column("last_entry_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.String(1000), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_enrichment_jobs_status", "enrichment_jobs", ["status"])
+
+
+def downgrade() -> None:
+    """Drop enrichment_jobs table."""
+    op.drop_index("ix_enrichment_jobs_status", table_name="enrichment_jobs")
+    op.drop_table("enrichment_jobs")
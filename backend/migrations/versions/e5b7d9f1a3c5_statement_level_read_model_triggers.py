@@ -0,0 +1,295 @@
+"""statement_level_read_model_triggers
+
+Revision ID: e5b7d9f1a3c5
+Revises: c2e4a6b8d0f1
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b7d9f1a3c5"
+down_revision: Union[str, Sequence[str], None] = "c2e4a6b8d0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Okuma modelinde yer alan kolonlar; yalnizca bunlar degistiyse yenilenir
+# (or. sadece updated_at degisen UPDATE'ler atlanir)
+ENTRY_COLUMNS = (
+    "paper_id",
+    "download_status",
+    "source",
+    "file_path",
+    "error_message",
+    "is_favorite",
+)
+PAPER_COLUMNS = (
+    "title",
+    "abstract",
+    "year",
+    "citation_count",
+    "venue",
+    "doi",
+    "pdf_url",
+    "created_at",
+    "search_vector",
+)
+
+
+def _changed(columns: tuple[str, ...]) -> str:
+    """new_rows (n) ve old_rows (o) arasinda okuma modeli kolonu degisti mi?"""
+    new = ", ".join(f"n.{name}" for name in columns)
+    old = ", ".join(f"o.{name}" for name in columns)
+    return f"({new}) IS DISTINCT FROM ({old})"
+
+
+# Trigger fonksiyonu -> etkilenen entry id'lerini secen govde. Transition
+# tablolari: INSERT'te new_rows, DELETE'te old_rows, UPDATE'te ikisi de.
+STATEMENT_FUNCTIONS = {
+    "library_entries_read_model_stmt": f"""
+        IF TG_OP = 'INSERT' THEN
+            PERFORM refresh_library_read_model(ARRAY(SELECT id FROM new_rows));
+        ELSE
+            PERFORM refresh_library_read_model(ARRAY(
+                SELECT n.id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                WHERE {_changed(ENTRY_COLUMNS)}
+            ));
+        END IF;
+    """,
+    "papers_read_model_stmt": f"""
+        PERFORM refresh_library_read_model(ARRAY(
+            SELECT le.id
+            FROM library_entries le
+            JOIN new_rows n ON n.id = le.paper_id
+            JOIN old_rows o ON o.id = n.id
+            WHERE {_changed(PAPER_COLUMNS)}
+        ));
+    """,
+    "paper_authors_read_model_stmt": """
+        IF TG_OP = 'INSERT' THEN
+            PERFORM refresh_library_read_model(ARRAY(
+                SELECT le.id FROM library_entries le
+                WHERE le.paper_id IN (SELECT paper_id FROM new_rows)
+            ));
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM refresh_library_read_model(ARRAY(
+                SELECT le.id FROM library_entries le
+                WHERE le.paper_id IN (SELECT paper_id FROM old_rows)
+            ));
+        ELSE
+            PERFORM refresh_library_read_model(ARRAY(
+                SELECT le.id FROM library_entries le
+                WHERE le.paper_id IN (
+                    SELECT paper_id FROM new_rows
+                    UNION SELECT paper_id FROM old_rows
+                )
+            ));
+        END IF;
+    """,
+    "authors_read_model_stmt": """
+        PERFORM refresh_library_read_model(ARRAY(
+            SELECT DISTINCT le.id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            JOIN paper_authors pa ON pa.author_id = n.id
+            JOIN library_entries le ON le.paper_id = pa.paper_id
+            WHERE n.name IS DISTINCT FROM o.name
+        ));
+    """,
+    # library_tags ve collection_entries: ikisinde de entry_id kolonu var
+    "entry_link_read_model_stmt": """
+        IF TG_OP = 'INSERT' THEN
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT DISTINCT entry_id FROM new_rows)
+            );
+        ELSIF TG_OP = 'DELETE' THEN
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT DISTINCT entry_id FROM old_rows)
+            );
+        ELSE
+            PERFORM refresh_library_read_model(ARRAY(
+                SELECT entry_id FROM new_rows UNION SELECT entry_id FROM old_rows
+            ));
+        END IF;
+    """,
+    "tags_read_model_stmt": """
+        PERFORM refresh_library_read_model(ARRAY(
+            SELECT DISTINCT lt.entry_id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            JOIN library_tags lt ON lt.tag_id = n.id
+            WHERE n.name IS DISTINCT FROM o.name
+        ));
+    """,
+}
+
+# (tablo, olaylar, trigger fonksiyonu); transition tablolu trigger'lar tek
+# olayli olmak zorunda oldugu icin her olay ayri trigger'dir
+STATEMENT_TRIGGERS = (
+    ("library_entries", ("INSERT", "UPDATE"), "library_entries_read_model_stmt"),
+    ("papers", ("UPDATE",), "papers_read_model_stmt"),
+    (
+        "paper_authors",
+        ("INSERT", "UPDATE", "DELETE"),
+        "paper_authors_read_model_stmt",
+    ),
+    ("authors", ("UPDATE",), "authors_read_model_stmt"),
+    ("library_tags", ("INSERT", "UPDATE", "DELETE"), "entry_link_read_model_stmt"),
+    ("tags", ("UPDATE",), "tags_read_model_stmt"),
+    (
+        "collection_entries",
+        ("INSERT", "UPDATE", "DELETE"),
+        "entry_link_read_model_stmt",
+    ),
+)
+
+TRANSITION_TABLES = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+# c8e0a2b4d6f8'deki satir bazli trigger'lar: (trigger, tablo, olaylar, fonksiyon)
+ROW_TRIGGERS = (
+    (
+        "library_entries_read_model",
+        "library_entries",
+        "INSERT OR UPDATE",
+        "library_entries_read_model_trigger",
+    ),
+    ("papers_read_model", "papers", "UPDATE", "papers_read_model_trigger"),
+    (
+        "paper_authors_read_model",
+        "paper_authors",
+        "INSERT OR UPDATE OR DELETE",
+        "paper_authors_read_model_trigger",
+    ),
+    ("authors_read_model", "authors", "UPDATE OF name", "authors_read_model_trigger"),
+    (
+        "library_tags_read_model",
+        "library_tags",
+        "INSERT OR UPDATE OR DELETE",
+        "entry_link_read_model_trigger",
+    ),
+    ("tags_read_model", "tags", "UPDATE OF name", "tags_read_model_trigger"),
+    (
+        "collection_entries_read_model",
+        "collection_entries",
+        "INSERT OR UPDATE OR DELETE",
+        "entry_link_read_model_trigger",
+    ),
+)
+
+ROW_FUNCTIONS = {
+    "library_entries_read_model_trigger": """
+        PERFORM refresh_library_read_model(ARRAY[NEW.id]);
+    """,
+    "papers_read_model_trigger": """
+        PERFORM refresh_library_read_model(
+            ARRAY(SELECT id FROM library_entries WHERE paper_id = NEW.id)
+        );
+    """,
+    "paper_authors_read_model_trigger": """
+        IF TG_OP = 'DELETE' THEN
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT id FROM library_entries WHERE paper_id = OLD.paper_id)
+            );
+        ELSE
+            PERFORM refresh_library_read_model(
+                ARRAY(SELECT id FROM library_entries WHERE paper_id = NEW.paper_id)
+            );
+        END IF;
+    """,
+    "authors_read_model_trigger": """
+        PERFORM refresh_library_read_model(
+            ARRAY(
+                SELECT le.id
+                FROM library_entries le
+                JOIN paper_authors pa ON pa.paper_id = le.paper_id
+                WHERE pa.author_id = NEW.id
+            )
+        );
+    """,
+    "entry_link_read_model_trigger": """
+        IF TG_OP = 'DELETE' THEN
+            PERFORM refresh_library_read_model(ARRAY[OLD.entry_id]);
+        ELSE
+            PERFORM refresh_library_read_model(ARRAY[NEW.entry_id]);
+        END IF;
+    """,
+    "tags_read_model_trigger": """
+        PERFORM refresh_library_read_model(
+            ARRAY(SELECT entry_id FROM library_tags WHERE tag_id = NEW.id)
+        );
+    """,
+}
+
+
+def _create_function(name: str, body: str) -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {name}()
+        RETURNS trigger AS $$
+        BEGIN
+            {body}
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+
+def _statement_trigger_name(table_name: str, event: str) -> str:
+    return f"{table_name}_read_model_{event.lower()}"
+
+
+def upgrade() -> None:
+    """Replace per-row read model triggers with statement-level ones.
+
+    Toplu yazimlar (retry taramasi, uzlastirma, toplu ekleme) satir basina
+    bir `refresh_library_read_model` cagrisi yerine statement basina tek
+    cagri yapar; etkilenen entry id'leri transition tablolarindan toplanir.
+    """
+    for trigger_name, table_name, _, _ in ROW_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}")
+    for function_name in ROW_FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}()")
+
+    for function_name, body in STATEMENT_FUNCTIONS.items():
+        _create_function(function_name, body)
+    for table_name, events, function_name in STATEMENT_TRIGGERS:
+        for event in events:
+            op.execute(
+                f"""
+                CREATE TRIGGER {_statement_trigger_name(table_name, event)}
+                AFTER {event} ON {table_name}
+                REFERENCING {TRANSITION_TABLES[event]}
+                FOR EACH STATEMENT EXECUTE FUNCTION {function_name}()
+                """
+            )
+
+
+def downgrade() -> None:
+    """Restore the per-row read model triggers."""
+    for table_name, events, _ in STATEMENT_TRIGGERS:
+        for event in events:
+            trigger_name = _statement_trigger_name(table_name, event)
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}")
+    for function_name in STATEMENT_FUNCTIONS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function_name}()")
+
+    for function_name, body in ROW_FUNCTIONS.items():
+        _create_function(function_name, body)
+    for trigger_name, table_name, events, function_name in ROW_TRIGGERS:
+        op.execute(
+            f"""
+            CREATE TRIGGER {trigger_name}
+            AFTER {events} ON {table_name}
+            FOR EACH ROW EXECUTE FUNCTION {function_name}()
+            """
+        )
@@ -0,0 +1,58 @@
+"""add_paper_identifiers
+
+Revision ID: f4b6d8f0a2c3
+Revises: e3a5c7e9f1b2
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b6d8f0a2c3"
+down_revision: Union[str, Sequence[str], None] = "e3a5c7e9f1b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create paper_identifiers table and backfill it from papers.doi."""
+    op.create_table(
+        "paper_identifiers",
+        sa.Column("scheme", sa.String(20), primary_key=True),
+        sa.Column("value", sa.String(255), primary_key=True),
+        sa.Column(
+            "paper_id",
+            sa.Integer(),
+            sa.ForeignKey("papers.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_paper_identifiers_paper_id", "paper_identifiers", ["paper_id"])
+
+    # Mevcut DOI'ler (normalize: kucuk harf, doi.org oneki olmadan)
+    op.execute("""
+        INSERT INTO paper_identifiers (scheme, value, paper_id)
+        SELECT DISTINCT ON (v.value) 'doi', v.value, v.paper_id
+        FROM (
+            SELECT
+                id AS paper_id,
+                regexp_replace(
+                    lower(trim(doi)), '^(https?://(dx\\.)?doi\\.org/|doi:)', ''
+                ) AS value
+            FROM papers
+            WHERE doi IS NOT NULL
+        ) v
+        WHERE v.value LIKE '10.%'
+        ORDER BY v.value, v.paper_id
+        ON CONFLICT DO NOTHING
+        """)
+
+
+def downgrade() -> None:
+    """Drop paper_identifiers table."""
+    op.drop_index("ix_paper_identifiers_paper_id", table_name="paper_identifiers")
+    op.drop_table("paper_identifiers")
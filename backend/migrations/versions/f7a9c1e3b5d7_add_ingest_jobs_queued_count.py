@@ -0,0 +1,33 @@
+"""add_ingest_jobs_queued_count
+
+Revision ID: f7a9c1e3b5d7
+Revises: e5b7d9f1a3c5
+Create Date: 2026-10-20 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a9c1e3b5d7"
+down_revision: Union[str, Sequence[str], None] = "e5b7d9f1a3c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Track which ingested entries have had their downloads queued."""
+    op.add_column(
+        "ingest_jobs",
+        sa.Column("queued_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Mevcut job'larin indirmeleri eski akista zaten kuyruga eklendi
+    op.execute("UPDATE ingest_jobs SET queued_count = cardinality(entry_ids)")
+
+
+def downgrade() -> None:
+    """Drop queued_count from ingest_jobs."""
+    op.drop_column("ingest_jobs", "queued_count")
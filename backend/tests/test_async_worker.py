@@ -0,0 +1,31 @@
+import asyncio
+
+from athena.core import async_worker
+
+
+async def _current(runtime):
+    assert asyncio.get_running_loop() is runtime.loop
+    return runtime
+
+
+def test_runtime_is_reused_across_tasks_and_rebuilt_after_fork(monkeypatch):
+    try:
+        first = async_worker.run_in_worker_loop(_current)
+        second = async_worker.run_in_worker_loop(_current)
+
+        assert second is first
+        assert second.engine is first.engine
+        assert second.redis is first.redis
+
+        # Fork ile devralinan ortam kullanilmaz
+        monkeypatch.setattr(async_worker.os, "getpid", lambda: first.pid + 1)
+        forked = async_worker.run_in_worker_loop(_current)
+
+        assert forked is not first
+        assert forked.loop is not first.loop
+        assert forked.engine is not first.engine
+    finally:
+        async_worker.dispose_async_runtime()
+
+    assert async_worker._runtime is None
+    assert forked.loop.is_closed()
@@ -0,0 +1,212 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from athena.schemas.search import AuthorSchema, PaperResponse
+from athena.services.library import LibraryService, _paper_values
+
+PAPER_COLUMNS = (
+    "doi",
+    "title",
+    "title_slug",
+    "abstract",
+    "year",
+    "citation_count",
+    "venue",
+    "pdf_url",
+)
+
+
+def _result(rows):
+    return SimpleNamespace(all=lambda: rows, scalar_one_or_none=lambda: None)
+
+
+def _multi_rows(params: dict, column: str) -> list:
+    """Cok satirli INSERT parametrelerinden bir kolonun degerleri (sirali)."""
+    rows = []
+    while f"{column}_m{len(rows)}" in params:
+        rows.append(params[f"{column}_m{len(rows)}"])
+    return rows
+
+
+class FakeBulkSession:
+    """Toplu ekleme statement'larini kaydeden, kutuphanesi bos session.
+
+    `existing_slugs` verilen title_slug'lar papers tablosunda var sayilir.
+    """
+
+    def __init__(self, existing_slugs=None):
+        self.existing_slugs = existing_slugs or {}
+        self.statements = []
+        self.paper_rows = []
+        self.commits = 0
+        self.rollbacks = 0
+        self._next_id = 100
+
+    def _ids(self, count):
+        ids = list(range(self._next_id, self._next_id + count))
+        self._next_id += count
+        return ids
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        params = compiled.params
+        self.statements.append(str(compiled))
+
+        if not stmt.is_insert:
+            if "papers.title_slug IN" in str(compiled):
+                slugs = next(v for k, v in params.items() if "title_slug" in k)
+                return _result(
+                    [
+                        (self.existing_slugs[slug], slug)
+                        for slug in slugs
+                        if slug in self.existing_slugs
+                    ]
+                )
+            if "FROM tags" in str(compiled):
+                return _result([(1,)])
+            return _result([])
+
+        table = stmt.table.name
+        if table == "papers":
+            slugs = _multi_rows(params, "title_slug")
+            self.paper_rows.extend(
+                {column: _multi_rows(params, column)[i] for column in PAPER_COLUMNS}
+                for i in range(len(slugs))
+            )
+            return _result(list(zip(self._ids(len(slugs)), slugs)))
+        if table == "authors":
+            slugs = _multi_rows(params, "slug")
+            return _result(list(zip(self._ids(len(slugs)), slugs)))
+        if table == "library_entries":
+            return _result(
+                [(i,) for i in self._ids(len(_multi_rows(params, "paper_id")))]
+            )
+        return _result([])
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _paper(i, **values):
+    return PaperResponse(
+        title=values.pop("title", f"Paper {i}"),
+        source="semantic",
+        external_id=values.pop("external_id", f"s{i}"),
+        authors=[AuthorSchema(name=f"Author {i}")],
+        **values,
+    )
+
+
+def test_paper_values_fit_columns():
+    paper = _paper(
+        1,
+        external_id="10.1000/" + "x" * 300,
+        venue="v" * 600,
+        pdf_url="https://example.org/" + "p" * 1000,
+        citation_count=0,
+    )
+
+    values = _paper_values(paper, "paper-1")
+
+    assert values["doi"] is None
+    assert values["venue"] == "v" * 500
+    assert values["pdf_url"] is None
+    assert values["citation_count"] == 0
+    assert _paper_values(_paper(2, venue=""), "paper-2")["venue"] is None
+
+
+def test_bulk_insert_uses_shared_normalizer():
+    paper = _paper(
+        1,
+        external_id="10.1000/abc",
+        venue="v" * 600,
+        pdf_url="https://example.org/" + "p" * 1000,
+    )
+    db = FakeBulkSession()
+
+    asyncio.run(LibraryService(db).stage_bulk_papers([paper], "ml"))
+
+    assert db.paper_rows == [_paper_values(paper, "paper-1")]
+
+
+def test_single_add_uses_shared_normalizer(monkeypatch):
+    paper = _paper(1, venue="v" * 600, pdf_url="https://example.org/" + "p" * 1000)
+    added = []
+
+    class FakeSingleSession:
+        async def execute(self, stmt):
+            return _result([])
+
+        def add(self, obj):
+            added.append(obj)
+
+        async def flush(self):
+            pass
+
+    service = LibraryService(FakeSingleSession())
+
+    async def noop(*args):
+        pass
+
+    monkeypatch.setattr(service, "_add_identifiers", noop)
+    monkeypatch.setattr(service, "_add_authors", noop)
+
+    asyncio.run(service._find_or_create_paper(paper))
+
+    [created] = added
+    expected = _paper_values(paper, "paper-1")
+    assert {column: getattr(created, column) for column in PAPER_COLUMNS} == expected
+
+
+def test_bulk_dedupes_batch_and_counts_existing_papers():
+    papers = [
+        _paper(1, external_id="10.1000/a"),
+        # Ayni DOI, farkli baslik: batch ici mukerrer
+        _paper(2, external_id="10.1000/a"),
+        # Kutuphanede zaten olan baslik
+        _paper(3, title="Known Title"),
+        _paper(4),
+    ]
+    db = FakeBulkSession(existing_slugs={"known-title": 7})
+
+    result = asyncio.run(LibraryService(db).stage_bulk_papers(papers, "ml, nlp"))
+
+    assert [row["title_slug"] for row in db.paper_rows] == ["paper-1", "paper-4"]
+    # Uc paper icin entry eklendi; mukerrer sayisi batch ici tekrari kapsar
+    assert len(result.entry_ids) == 3
+    assert result.duplicate_count == 1
+    assert db.commits == 0
+
+
+def test_bulk_statement_count_does_not_grow_with_batch_size():
+    def statement_count(count):
+        db = FakeBulkSession()
+        papers = [_paper(i) for i in range(count)]
+        asyncio.run(LibraryService(db).stage_bulk_papers(papers, "ml"))
+        return len(db.statements)
+
+    assert statement_count(2) == statement_count(50)
+
+
+def test_bulk_add_papers_rolls_back_and_reports_failure():
+    db = FakeBulkSession()
+    service = LibraryService(db)
+
+    async def broken_stage(papers, search_query):
+        raise RuntimeError("db down")
+
+    service.stage_bulk_papers = broken_stage
+
+    result = asyncio.run(service.bulk_add_papers([_paper(1), _paper(2)], "ml"))
+
+    assert (result.entry_ids, result.duplicate_count, result.failed_count) == (
+        [],
+        0,
+        2,
+    )
+    assert db.rollbacks == 1
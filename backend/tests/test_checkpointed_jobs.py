@@ -0,0 +1,274 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from athena.models.ingest_job import IngestJob, IngestJobStatus
+from athena.schemas.search import PaperResponse
+from athena.services import ingest
+from athena.services.ingest import IngestJobService
+
+
+class FakeJobSession:
+    """Tek job satirini tutan ve commit anindaki durumlari kaydeden session."""
+
+    def __init__(self, job):
+        self.job = job
+        self.committed_statuses = []
+
+    async def get(self, model, job_id, populate_existing=False):
+        return self.job if job_id == self.job.id else None
+
+    async def commit(self):
+        self.committed_statuses.append(self.job.status)
+
+    async def rollback(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+def _job(**values) -> IngestJob:
+    papers = values.pop("papers", [])
+    job = IngestJob(
+        id=1,
+        status=IngestJobStatus.QUEUED.value,
+        search_query="q",
+        papers=[paper.model_dump(mode="json") for paper in papers],
+        total=len(papers),
+        next_index=0,
+        processed=0,
+        added=0,
+        duplicates=0,
+        failed=0,
+        entry_ids=[],
+        queued_count=0,
+    )
+    for name, value in values.items():
+        setattr(job, name, value)
+    return job
+
+
+def _papers(count: int) -> list[PaperResponse]:
+    return [
+        PaperResponse(title=f"Paper {i}", source="semantic", external_id=f"s{i}")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def service_for(monkeypatch):
+    queued = []
+
+    def enqueue(entry_ids, queue=None):
+        queued.append(list(entry_ids))
+
+    monkeypatch.setattr(ingest, "enqueue_downloads", enqueue)
+
+    def make(job, stage=None):
+        db = FakeJobSession(job)
+        service = IngestJobService(db, batch_size=2)
+        next_id = iter(range(100, 200))
+
+        async def stage_bulk_papers(papers, search_query):
+            if stage is not None:
+                await stage(papers)
+            return SimpleNamespace(
+                entry_ids=[next(next_id) for _ in papers], duplicate_count=0
+            )
+
+        service.library_service = SimpleNamespace(stage_bulk_papers=stage_bulk_papers)
+        return service, db
+
+    make.queued = queued
+    return make
+
+
+def test_job_runs_batches_and_queues_downloads_after_each_commit(service_for):
+    job = _job(papers=_papers(3))
+    service, db = service_for(job)
+
+    asyncio.run(service.run_job(1))
+
+    assert job.status == IngestJobStatus.COMPLETED.value
+    assert job.finished_at is not None
+    assert (job.next_index, job.processed, job.added) == (3, 3, 3)
+    assert service_for.queued == [[100, 101], [102]]
+    assert job.queued_count == 3
+    assert db.committed_statuses[0] == IngestJobStatus.RUNNING.value
+    assert db.committed_statuses[-1] == IngestJobStatus.COMPLETED.value
+
+
+def test_finished_job_is_not_rerun(service_for):
+    job = _job(papers=_papers(2), status=IngestJobStatus.COMPLETED.value)
+    service, db = service_for(job)
+
+    assert asyncio.run(service.run_job(1)) is job
+    assert db.committed_statuses == []
+
+
+def test_missing_job_returns_none(service_for):
+    service, _ = service_for(_job())
+
+    assert asyncio.run(service.run_job(42)) is None
+
+
+def test_resumed_job_queues_downloads_lost_before_crash(service_for):
+    # Son batch commit edildi ama indirmeler kuyruga eklenmeden worker oldu
+    job = _job(
+        papers=_papers(2),
+        status=IngestJobStatus.RUNNING.value,
+        next_index=2,
+        processed=2,
+        added=2,
+        entry_ids=[7, 8],
+        queued_count=0,
+    )
+    service, _ = service_for(job)
+
+    asyncio.run(service.run_job(1))
+
+    assert service_for.queued == [[7, 8]]
+    assert job.queued_count == 2
+    assert job.status == IngestJobStatus.COMPLETED.value
+
+
+def test_broker_failure_is_retried_with_next_batch(service_for, monkeypatch):
+    job = _job(papers=_papers(4))
+    service, _ = service_for(job)
+    calls = []
+
+    def flaky_enqueue(entry_ids, queue=None):
+        calls.append(list(entry_ids))
+        if len(calls) == 1:
+            raise ConnectionError("broker down")
+
+    monkeypatch.setattr(ingest, "enqueue_downloads", flaky_enqueue)
+
+    asyncio.run(service.run_job(1))
+
+    assert calls == [[100, 101], [100, 101, 102, 103]]
+    assert job.queued_count == 4
+
+
+def test_failed_batch_is_counted_and_job_continues(service_for):
+    async def stage(papers):
+        if papers[0].title == "Paper 0":
+            raise ValueError("bad batch")
+
+    job = _job(papers=_papers(3))
+    service, _ = service_for(job, stage=stage)
+
+    asyncio.run(service.run_job(1))
+
+    assert job.status == IngestJobStatus.COMPLETED.value
+    assert (job.processed, job.failed, job.added) == (3, 2, 1)
+    assert service_for.queued == [[100]]
+
+
+def test_unexpected_error_marks_job_failed(service_for):
+    async def broken_add(papers):
+        raise RuntimeError("redis down")
+
+    job = _job(papers=_papers(2))
+    service, db = service_for(job)
+    service.saved_index = SimpleNamespace(add=broken_add)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.run_job(1))
+
+    assert job.status == IngestJobStatus.FAILED.value
+    assert job.error_message == "RuntimeError: redis down"
+    assert job.finished_at is not None
+    assert db.committed_statuses[-1] == IngestJobStatus.FAILED.value
+
+
+class _NullSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def test_job_task_reports_status_and_counters(monkeypatch):
+    from athena.tasks import jobs
+
+    job = SimpleNamespace(id=1, status="completed", processed=3, added=2, failed=1)
+
+    class Service:
+        async def run_job(self, job_id):
+            if job_id == 1:
+                return job
+            raise RuntimeError("db down")
+
+    runtime = SimpleNamespace(session_factory=_NullSession)
+    monkeypatch.setattr(
+        jobs, "run_in_worker_loop", lambda run: asyncio.run(run(runtime))
+    )
+
+    def run(job_id):
+        return jobs.run_job_task(
+            "Ingest", job_id, lambda db, rt: Service(), counters=("added", "failed")
+        )
+
+    assert run(1) == {
+        "status": "completed",
+        "job_id": 1,
+        "processed": 3,
+        "added": 2,
+        "failed": 1,
+    }
+    assert run(2) == {"status": "failed", "job_id": 2, "message": "db down"}
+
+
+def test_enrichment_adds_matched_identifiers_to_saved_index_after_commit():
+    from athena.models.enrichment_job import EnrichmentJob, EnrichmentJobStatus
+    from athena.services.enrichment import MetadataEnrichmentService
+
+    job = EnrichmentJob(
+        id=1,
+        status=EnrichmentJobStatus.QUEUED.value,
+        last_entry_id=0,
+        total=1,
+        processed=0,
+        updated=0,
+        skipped=0,
+        failed=0,
+    )
+    db = FakeJobSession(job)
+    events = []
+
+    async def add_identifiers(keys):
+        events.append(("add", db.committed_statuses[-1], set(keys)))
+
+    async def preload_runtime_settings():
+        pass
+
+    service = MetadataEnrichmentService(
+        db, batch_size=10, saved_index=SimpleNamespace(add_identifiers=add_identifiers)
+    )
+    service.library_service = SimpleNamespace(
+        search_service=SimpleNamespace(
+            preload_runtime_settings=preload_runtime_settings
+        )
+    )
+    batches = [[SimpleNamespace(id=5)], []]
+
+    async def fetch_batch(after_id, limit):
+        return batches.pop(0)
+
+    async def process_batch(job, entries):
+        job.processed += len(entries)
+        return {("doi", "10.1/a")}
+
+    service._fetch_batch = fetch_batch
+    service._process_batch = process_batch
+
+    asyncio.run(service.run_job(1))
+
+    # Kimlikler batch commit'inden sonra (RUNNING durumunda) eklenir
+    assert events == [("add", EnrichmentJobStatus.RUNNING.value, {("doi", "10.1/a")})]
+    assert job.last_entry_id == 5
+    assert job.status == EnrichmentJobStatus.COMPLETED.value
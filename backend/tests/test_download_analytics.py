@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from athena.core.download_telemetry import ANALYTICS_MAX_HOURS, attempt_retention
+from athena.services.download_analytics import (
+    DownloadAnalyticsService,
+    fold_attempt_stats,
+)
+
+
+def test_fold_attempt_stats_merges_outcomes_per_key():
+    rows = [
+        ("Unpaywall", "success", 6, 6000, 120.0, 900.0),
+        ("Unpaywall", "not_found", 2, None, None, None),
+        ("Unpaywall", "cancelled", 2, 100, None, None),
+        ("CORE", "http_error", 1, 0, None, None),
+        ("CORE", "cancelled", 1, 0, None, None),
+    ]
+
+    unpaywall, core = fold_attempt_stats(rows)
+
+    assert unpaywall.key == "Unpaywall"
+    assert unpaywall.attempts == 10
+    assert unpaywall.successes == 6
+    assert unpaywall.cancelled == 2
+    assert unpaywall.bytes == 6100
+    assert unpaywall.outcomes == {"success": 6, "not_found": 2, "cancelled": 2}
+    # Iptal edilen hedged denemeler orana katilmaz; sureler basarilardan
+    assert unpaywall.success_rate == 0.75
+    assert (unpaywall.p50_ms, unpaywall.p95_ms) == (120.0, 900.0)
+
+    assert core.success_rate == 0.0
+    assert core.p50_ms is None
+
+
+def test_fold_attempt_stats_leaves_rate_empty_when_all_cancelled():
+    [item] = fold_attempt_stats([("PrimaryDownload", "cancelled", 3, 0, None, None)])
+
+    assert item.success_rate is None
+
+
+def _row(g_strategy, strategy, host, outcome, count):
+    return SimpleNamespace(
+        g_strategy=g_strategy,
+        strategy=strategy,
+        host=host,
+        outcome=outcome,
+        attempt_count=count,
+        total_bytes=0,
+        p50=None,
+        p95=None,
+    )
+
+
+class FakeAnalyticsSession:
+    """GROUPING SETS ve zaman serisi sorgularina sabit satir dondurur."""
+
+    def __init__(self, group_rows):
+        self.group_rows = group_rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        rows = self.group_rows if len(self.statements) == 1 else []
+        return SimpleNamespace(all=lambda: rows)
+
+
+def test_analytics_splits_grouping_sets_and_limits_hosts():
+    group_rows = [
+        # GROUPING(strategy) = 0: strateji grubu
+        _row(0, "PrimaryDownload", None, "success", 5),
+        _row(0, "Unpaywall", None, "not_found", 3),
+        # GROUPING(strategy) = 1: host grubu; bos host URL'siz aramadir
+        _row(1, None, "arxiv.org", "success", 4),
+        _row(1, None, "www.mdpi.com", "http_error", 2),
+        _row(1, None, "", "not_found", 3),
+    ]
+    db = FakeAnalyticsSession(group_rows)
+
+    response = asyncio.run(
+        DownloadAnalyticsService(db).get_analytics(hours=72, host_limit=1)
+    )
+
+    assert "GROUPING SETS" in db.statements[0]
+    assert [s.key for s in response.strategies] == ["PrimaryDownload", "Unpaywall"]
+    assert [h.key for h in response.hosts] == ["arxiv.org"]
+    assert response.bucket == "day"
+
+
+def test_retention_covers_longest_reader_window():
+    assert attempt_retention(7) == timedelta(hours=ANALYTICS_MAX_HOURS)
+    assert attempt_retention(60) == timedelta(days=60)
+
+
+def test_purge_deletes_old_attempts_in_chunks(monkeypatch):
+    from athena.tasks import downloader
+
+    monkeypatch.setattr(downloader, "ATTEMPT_PURGE_CHUNK", 2)
+    cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    deleted = [2, 2, 1]
+
+    class FakeDb:
+        def __init__(self):
+            self.statements = []
+            self.commits = 0
+
+        def execute(self, stmt):
+            self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+            return SimpleNamespace(rowcount=deleted[len(self.statements) - 1])
+
+        def commit(self):
+            self.commits += 1
+
+    db = FakeDb()
+
+    assert downloader._purge_attempts_before(db, cutoff) == 5
+    assert db.commits == 3
+    sql = str(db.statements[0])
+    assert sql.startswith("DELETE FROM download_attempts")
+    assert "download_attempts.started_at < " in sql
+    assert cutoff in db.statements[0].params.values()
@@ -0,0 +1,277 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from athena.core.config import get_settings
+from athena.core.host_scheduler import HostScheduler
+from athena.core.oa_cache import OaLookupCache
+from athena.core.strategy_ranking import StrategyRanking, SuccessStats
+from athena.models.library import DownloadStatus
+from athena.tasks import download_engine
+from athena.tasks.download_strategies import DownloadClients
+
+PDF_BYTES = b"%PDF-1.7\n" + b"0" * 4096
+EZPROXY = {"prefix": "https://ezproxy.example/login?url=", "cookie": "ez=1"}
+
+
+class FakeEntry:
+    """Durum gecislerini kaydeden LibraryEntry yerine gecen nesne."""
+
+    def __init__(self, entry_id, pdf_url=None, doi=None, status=None):
+        self.history = []
+        self.id = entry_id
+        self.file_path = None
+        self.error_message = None
+        self.download_status = status or DownloadStatus.PENDING
+        self.history.clear()
+        self.paper = SimpleNamespace(
+            id=entry_id,
+            title=f"Paper {entry_id}",
+            year=2024,
+            authors=[],
+            doi=doi,
+            pdf_url=pdf_url,
+        )
+
+    def __setattr__(self, name, value):
+        if name == "download_status":
+            self.history.append(value)
+        super().__setattr__(name, value)
+
+
+class FakeSession:
+    """Motorun calistirdigi statement'lari bellekteki kayitlara uygular."""
+
+    def __init__(self, store):
+        self.store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        if params is not None:
+            # download_attempts toplu INSERT'i
+            return None
+        if stmt.is_insert:
+            if stmt.table.name == "library_entry_pdfs":
+                self.store.links.append(stmt.compile().params["entry_id"])
+            return None
+        if stmt.is_update:
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            values = dict(compiled.params)
+            entry = self.store.entries[values.pop("id_1")]
+            for name, value in values.items():
+                setattr(entry, name, value)
+            return None
+        if "pg_advisory_xact_lock" in str(stmt):
+            return None
+        if len(stmt.selected_columns) == 3:
+            rows = [
+                (entry_id, entry.paper.pdf_url, entry.paper.doi)
+                for entry_id, entry in self.store.entries.items()
+            ]
+            return SimpleNamespace(all=lambda: rows)
+        if stmt.column_descriptions[0]["name"] == "LibraryEntry":
+            entry = self.store.entries.get(stmt.whereclause.right.value)
+            return SimpleNamespace(scalar_one_or_none=lambda: entry)
+        # Daha once indirilmis blob yok
+        return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+    async def commit(self):
+        pass
+
+
+class FakeStore:
+    def __init__(self, *entries):
+        self.entries = {entry.id: entry for entry in entries}
+        self.links = []
+        self.requests = []
+
+    def session_factory(self):
+        return FakeSession(self)
+
+
+def _handler(store):
+    def handle(request: httpx.Request) -> httpx.Response:
+        store.requests.append(request)
+        host = request.url.host
+        if host in ("ok.example", "ezproxy.example"):
+            return httpx.Response(200, content=PDF_BYTES)
+        if host == "forbidden.example":
+            return httpx.Response(403)
+        return httpx.Response(404)
+
+    return handle
+
+
+@pytest.fixture
+def engine_env(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "download_adaptive", False)
+    monkeypatch.setattr(settings, "download_hedged", False)
+
+    def make(*entries, ezproxy=None, ranking=None):
+        store = FakeStore(*entries)
+
+        @asynccontextmanager
+        async def clients(proxy_url=None, max_connections=10, redis=None):
+            transport = httpx.MockTransport(_handler(store))
+            hosts = HostScheduler(rate_per_second=0)
+            async with httpx.AsyncClient(
+                transport=transport,
+                event_hooks={
+                    "request": [hosts.on_request],
+                    "response": [hosts.on_response],
+                },
+            ) as client:
+                yield DownloadClients(
+                    api=client,
+                    download=client,
+                    api_semaphore=asyncio.Semaphore(2),
+                    hosts=hosts,
+                    oa_cache=OaLookupCache(),
+                )
+
+        monkeypatch.setattr(download_engine, "open_download_clients", clients)
+        engine = download_engine.AsyncDownloadEngine(
+            store.session_factory,
+            download_engine.DownloadSettings(ezproxy=ezproxy),
+            concurrency=2,
+        )
+        if ranking is not None:
+
+            async def load_ranking(hosts):
+                return ranking
+
+            monkeypatch.setattr(engine, "_load_ranking", load_ranking)
+        return engine, store
+
+    return make
+
+
+def _hosts(store):
+    return [request.url.host for request in store.requests]
+
+
+def test_successful_download_completes_entry(engine_env, tmp_path):
+    entry = FakeEntry(1, pdf_url="https://ok.example/1.pdf")
+    engine, store = engine_env(entry)
+
+    [result] = asyncio.run(engine.run([1]))
+
+    assert result.status == download_engine.RESULT_COMPLETED
+    assert entry.history == [DownloadStatus.DOWNLOADING, DownloadStatus.COMPLETED]
+    assert entry.file_path == result.file_path
+    assert (tmp_path / result.file_path).read_bytes() == PDF_BYTES
+    assert store.links == [1]
+
+
+def test_completed_entry_is_skipped_without_requests(engine_env):
+    entry = FakeEntry(
+        1, pdf_url="https://ok.example/1.pdf", status=DownloadStatus.COMPLETED
+    )
+    engine, store = engine_env(entry)
+
+    [result] = asyncio.run(engine.run([1]))
+
+    assert result.status == download_engine.RESULT_SKIPPED
+    assert entry.history == []
+    assert store.requests == []
+
+
+@pytest.mark.parametrize(
+    ("final_attempt", "expected_result", "expected_status"),
+    [
+        (False, download_engine.RESULT_RETRY, DownloadStatus.PENDING),
+        (True, download_engine.RESULT_FAILED, DownloadStatus.FAILED),
+    ],
+)
+def test_http_error_retries_unless_final_attempt(
+    engine_env, final_attempt, expected_result, expected_status
+):
+    entry = FakeEntry(1, pdf_url="https://missing.example/1.pdf")
+    engine, _ = engine_env(entry)
+
+    [result] = asyncio.run(engine.run([1], final_attempt=final_attempt))
+
+    assert result.status == expected_result
+    assert entry.history == [DownloadStatus.DOWNLOADING, expected_status]
+
+
+def test_ezproxy_fallback_after_forbidden(engine_env):
+    entry = FakeEntry(1, pdf_url="https://forbidden.example/1.pdf")
+    engine, store = engine_env(entry, ezproxy=EZPROXY)
+
+    [result] = asyncio.run(engine.run([1], final_attempt=False))
+
+    assert result.status == download_engine.RESULT_COMPLETED
+    [ezproxy_request] = [r for r in store.requests if "ezproxy" in r.url.host]
+    assert ezproxy_request.headers["Cookie"] == "ez=1"
+    assert str(ezproxy_request.url).endswith("https://forbidden.example/1.pdf")
+
+
+def test_ezproxy_not_used_for_not_found(engine_env):
+    entry = FakeEntry(1, pdf_url="https://missing.example/1.pdf")
+    engine, store = engine_env(entry, ezproxy=EZPROXY)
+
+    [result] = asyncio.run(engine.run([1], final_attempt=False))
+
+    assert result.status == download_engine.RESULT_RETRY
+    assert "ezproxy.example" not in _hosts(store)
+
+
+def test_results_follow_requested_order(engine_env):
+    entries = [
+        FakeEntry(3, pdf_url="https://ok.example/3.pdf"),
+        FakeEntry(1, pdf_url="https://missing.example/1.pdf"),
+        FakeEntry(2, pdf_url="https://ok.example/2.pdf"),
+    ]
+    engine, _ = engine_env(*entries)
+
+    results = asyncio.run(engine.run([3, 1, 2, 99], final_attempt=False))
+
+    assert [r.entry_id for r in results] == [3, 1, 2, 99]
+    assert [r.status for r in results] == [
+        download_engine.RESULT_COMPLETED,
+        download_engine.RESULT_RETRY,
+        download_engine.RESULT_COMPLETED,
+        download_engine.RESULT_ERROR,
+    ]
+
+
+def _blocking_ranking():
+    return StrategyRanking(
+        direct_by_host={
+            "forbidden.example": SuccessStats(attempts=40, successes=0),
+        },
+        rng=lambda: 0.5,
+    )
+
+
+def test_blocked_host_without_ezproxy_is_not_contacted(engine_env):
+    entry = FakeEntry(1, pdf_url="https://forbidden.example/1.pdf")
+    engine, store = engine_env(entry, ranking=_blocking_ranking())
+
+    [result] = asyncio.run(engine.run([1], final_attempt=False))
+
+    assert result.status == download_engine.RESULT_RETRY
+    assert "forbidden.example" not in _hosts(store)
+    assert entry.history == [DownloadStatus.DOWNLOADING, DownloadStatus.PENDING]
+
+
+def test_blocked_host_goes_straight_to_ezproxy(engine_env):
+    entry = FakeEntry(1, pdf_url="https://forbidden.example/1.pdf")
+    engine, store = engine_env(entry, ezproxy=EZPROXY, ranking=_blocking_ranking())
+
+    [result] = asyncio.run(engine.run([1], final_attempt=False))
+
+    assert result.status == download_engine.RESULT_COMPLETED
+    assert _hosts(store) == ["ezproxy.example"]
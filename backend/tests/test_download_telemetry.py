@@ -0,0 +1,71 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+def _load_telemetry_module():
+    module_path = (
+        Path(__file__).resolve().parents[1]
+        / "athena"
+        / "core"
+        / "download_telemetry.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "download_telemetry_for_test", module_path
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+telemetry = _load_telemetry_module()
+
+
+def test_track_records_outcome_status_and_bytes():
+    recorder = telemetry.AttemptRecorder()
+    url = "https://www.MDPI.com/paper.pdf"
+
+    with recorder.track(7, "PrimaryDownload", url) as attempt:
+        attempt.http_status = 200
+        attempt.bytes = 2048
+
+    response = httpx.Response(403, request=httpx.Request("GET", url))
+    with pytest.raises(httpx.HTTPStatusError):
+        with recorder.track(7, "Unpaywall", url):
+            response.raise_for_status()
+
+    recorder.record(7, "CoreAPI", telemetry.OUTCOME_NOT_FOUND, duration=0.25)
+
+    success, http_error, not_found = recorder.drain()
+    assert (success.outcome, success.host, success.bytes) == (
+        "success",
+        "www.mdpi.com",
+        2048,
+    )
+    assert (http_error.outcome, http_error.http_status) == ("http_error", 403)
+    assert (not_found.host, not_found.duration_ms) == ("", 250)
+    assert len(recorder) == 0
+
+
+def test_cancelled_attempt_is_recorded_as_cancelled():
+    recorder = telemetry.AttemptRecorder()
+
+    async def slow_download():
+        with recorder.track(1, "CoreAPI", "https://core.ac.uk/x.pdf"):
+            await asyncio.sleep(10)
+
+    async def scenario():
+        task = asyncio.create_task(slow_download())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    [attempt] = recorder.drain()
+    assert attempt.outcome == telemetry.OUTCOME_CANCELLED
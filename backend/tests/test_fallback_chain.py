@@ -0,0 +1,110 @@
+import asyncio
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+from athena.core.strategy_ranking import StrategyRanking, SuccessStats
+
+
+def _load_strategies_module():
+    module_path = (
+        Path(__file__).resolve().parents[1]
+        / "athena"
+        / "tasks"
+        / "download_strategies.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "download_strategies_for_chain_test", module_path
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+strategies = _load_strategies_module()
+
+PDF_BYTES = b"%PDF-1.7\n" + b"0" * 4096
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "slow.example":
+
+        async def hang():
+            await asyncio.sleep(30)
+            yield PDF_BYTES
+
+        return httpx.Response(200, content=hang())
+    if request.url.host == "api.unpaywall.org":
+        return httpx.Response(
+            200,
+            json={
+                "is_oa": True,
+                "best_oa_location": {"url_for_pdf": "https://oa.example/p.pdf"},
+            },
+        )
+    if request.url.host == "oa.example":
+        return httpx.Response(200, content=PDF_BYTES)
+    return httpx.Response(404)
+
+
+def _run_chain(tmp_path, hedged):
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            clients = strategies.DownloadClients(
+                api=client,
+                download=client,
+                api_semaphore=asyncio.Semaphore(2),
+                hosts=strategies.HostScheduler(rate_per_second=0),
+                oa_cache=strategies.OaLookupCache(),
+            )
+            meta = strategies.PaperMeta(
+                pdf_url="https://slow.example/p.pdf",
+                doi="10.1000/xyz",
+                title="Paper",
+                entry_id=1,
+            )
+            return await asyncio.wait_for(
+                strategies.run_fallback_chain(
+                    meta, tmp_path / "1" / "paper.pdf", clients, hedged=hedged
+                ),
+                timeout=2,
+            )
+
+    return asyncio.run(scenario())
+
+
+def test_hedged_chain_does_not_wait_for_hanging_primary(tmp_path, monkeypatch):
+    monkeypatch.setattr(strategies.get_settings(), "download_hedge_delay", 0.1)
+
+    started = time.monotonic()
+    downloaded = _run_chain(tmp_path, hedged=True)
+
+    assert time.monotonic() - started < 1
+    assert downloaded.url == "https://oa.example/p.pdf"
+    assert downloaded.path.read_bytes() == PDF_BYTES
+    assert list(downloaded.path.parent.iterdir()) == [downloaded.path]
+
+
+def test_doi_only_paper_is_ranked_by_doi_resolver_stats():
+    chain = [
+        SimpleNamespace(name=name) for name in ("PrimaryDownload", "Unpaywall", "CORE")
+    ]
+    ranking = StrategyRanking(
+        direct_by_host={"doi.org": SuccessStats(attempts=40, successes=0)},
+        by_strategy={"Unpaywall": SuccessStats(attempts=40, successes=20)},
+        rng=lambda: 0.5,
+    )
+    meta = strategies.PaperMeta(pdf_url=None, doi="10.1/a", title="Paper", entry_id=1)
+
+    arranged = strategies._arrange_strategies(chain, meta, ranking)
+    skipped = strategies._arrange_strategies(chain, meta, ranking, skip_direct=True)
+
+    # Motorun istatistik topladigi host ile siralamanin baktigi host aynidir
+    assert [s.name for s in arranged] == ["Unpaywall", "CORE", "PrimaryDownload"]
+    assert [s.name for s in skipped] == ["Unpaywall", "CORE"]
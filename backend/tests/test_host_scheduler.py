@@ -0,0 +1,67 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+def _load_host_scheduler_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "host_scheduler.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "host_scheduler_for_test", module_path
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+host_scheduler = _load_host_scheduler_module()
+
+
+def test_interleave_by_host_round_robins_and_keeps_host_order():
+    items = [(1, "a.org"), (2, "a.org"), (3, "a.org"), (4, "b.org"), (5, "")]
+    assert host_scheduler.interleave_by_host(items) == [1, 4, 5, 2, 3]
+    assert host_scheduler.host_of("https://ArXiv.org/pdf/1") == "arxiv.org"
+    assert host_scheduler.host_of(None) == ""
+
+
+def test_direct_download_host_falls_back_to_doi_resolver():
+    direct_download_host = host_scheduler.direct_download_host
+
+    assert (
+        direct_download_host("https://www.MDPI.com/p.pdf", "10.1/a") == "www.mdpi.com"
+    )
+    assert direct_download_host(None, "10.1/a") == "doi.org"
+    assert direct_download_host(None, None) == ""
+
+
+def test_retry_after_header_is_parsed():
+    def response(value):
+        return httpx.Response(429, headers={"Retry-After": value})
+
+    assert host_scheduler._retry_after_seconds(response("30")) == 30.0
+    assert host_scheduler._retry_after_seconds(response("soon")) is None
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert host_scheduler._retry_after_seconds(response(past)) == 0.0
+
+
+def test_throttled_host_is_backed_off_without_redis():
+    scheduler = host_scheduler.HostScheduler(
+        max_concurrency=1, rate_per_second=0, backoff_seconds=60
+    )
+    request = httpx.Request("GET", "https://mdpi.com/paper.pdf")
+
+    async def scenario():
+        await scheduler.on_request(request)
+        await scheduler.on_response(httpx.Response(429, request=request))
+        with pytest.raises(host_scheduler.HostBackoffError) as exc_info:
+            await scheduler.on_request(request)
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    assert error.host == "mdpi.com"
+    assert 0 < error.retry_after <= 60
@@ -0,0 +1,52 @@
+import importlib.util
+from pathlib import Path
+
+
+def _load_identifiers_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "identifiers.py"
+    )
+    spec = importlib.util.spec_from_file_location("identifiers_for_test", module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+identifiers = _load_identifiers_module()
+
+
+def test_doi_is_normalized_case_and_prefix_insensitive():
+    assert identifiers.external_id_key("10.1038/ABC") == ("doi", "10.1038/abc")
+    normalized = identifiers.normalize_identifier("doi", "https://doi.org/10.1038/ABC")
+    assert normalized == "10.1038/abc"
+
+
+def test_external_id_scheme_is_guessed_from_format():
+    s2_id = "649def34f8be52c8b66281af98ae884c09aef38b"
+    assert identifiers.external_id_key("2101.00001v2") == ("arxiv", "2101.00001")
+    assert identifiers.external_id_key("hep-th/9901001") == (
+        "arxiv",
+        "hep-th/9901001",
+    )
+    assert identifiers.external_id_key(s2_id) == ("s2", s2_id)
+    assert identifiers.external_id_key("https://openalex.org/W2741809807") == (
+        "openalex",
+        "W2741809807",
+    )
+    assert identifiers.external_id_key("123456") == ("core", "123456")
+    assert identifiers.external_id_key("not an id") is None
+
+
+def test_collect_identifiers_uses_source_for_non_doi_external_id():
+    keys = identifiers.collect_identifiers(
+        "649def34f8be52c8b66281af98ae884c09aef38b",
+        "semantic",
+        {"doi": "10.48550/arXiv.1706.03762", "arxiv": "1706.03762", "mag": "1"},
+    )
+    assert keys == {
+        ("s2", "649def34f8be52c8b66281af98ae884c09aef38b"),
+        ("doi", "10.48550/arxiv.1706.03762"),
+        ("arxiv", "1706.03762"),
+    }
+    assert identifiers.collect_identifiers("123", "crossref") == set()
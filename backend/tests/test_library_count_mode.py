@@ -0,0 +1,94 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+from athena.core.config import get_settings
+from athena.services.library import LibraryService
+
+
+class FakeConnection:
+    def __init__(self, plan_rows: int):
+        self.plan_rows = plan_rows
+        self.explains: list[tuple[str, object]] = []
+
+    async def exec_driver_sql(self, sql, params=None):
+        self.explains.append((sql, params))
+        plan = [{"Plan": {"Plan Rows": self.plan_rows}}]
+        return SimpleNamespace(scalar=lambda: plan)
+
+
+class FakeSession:
+    """EXPLAIN ve sayim sorgularini kaydeden AsyncSession yerine gecen nesne."""
+
+    def __init__(self, plan_rows: int = 0, exact: int = 7):
+        self.conn = FakeConnection(plan_rows)
+        self.exact = exact
+        self.counts = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=PGDialect_asyncpg())
+
+    async def connection(self):
+        return self.conn
+
+    async def execute(self, stmt):
+        self.counts += 1
+        return SimpleNamespace(scalar=lambda: self.exact)
+
+
+def _id_query(**filters):
+    from sqlalchemy import select
+
+    from athena.models.library_read_model import LibraryReadModel
+
+    query, _ = LibraryService.apply_library_filters(
+        select(LibraryReadModel.entry_id), **filters
+    )
+    return query
+
+
+def _count(session, count_mode, **filters):
+    service = LibraryService(session)
+    return asyncio.run(service._count_entries(_id_query(**filters), count_mode))
+
+
+def test_auto_mode_uses_estimate_above_threshold():
+    estimate = get_settings().library_count_exact_threshold + 1
+    session = FakeSession(plan_rows=estimate)
+
+    assert _count(session, "auto", search="deep learning") == (estimate, False)
+    assert session.counts == 0
+
+
+def test_auto_mode_counts_exactly_below_threshold():
+    session = FakeSession(plan_rows=3, exact=5)
+
+    assert _count(session, "auto", status="completed") == (5, True)
+    assert len(session.conn.explains) == 1
+    assert session.counts == 1
+
+
+def test_exact_mode_skips_explain():
+    session = FakeSession(plan_rows=10**9, exact=5)
+
+    assert _count(session, "exact", search="x") == (5, True)
+    assert session.conn.explains == []
+
+
+def test_estimate_passes_filter_values_as_bound_parameters():
+    session = FakeSession(plan_rows=42)
+    search = "O'Reilly'); DROP TABLE papers; --"
+    service = LibraryService(session)
+
+    estimate = asyncio.run(
+        service._estimate_row_count(_id_query(search=search, year_start=2020))
+    )
+
+    assert estimate == 42
+    sql, params = session.conn.explains[0]
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "O'Reilly" not in sql
+    assert "$1" in sql
+    assert search in params
+    assert 2020 in params
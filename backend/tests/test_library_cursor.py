@@ -0,0 +1,47 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from athena.core.exceptions import ValidationError
+
+
+def _load_pagination_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "pagination.py"
+    )
+    spec = importlib.util.spec_from_file_location("pagination_for_test", module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+pagination = _load_pagination_module()
+
+
+def test_cursor_roundtrip_id_only():
+    token = pagination.encode_cursor(pagination.LibraryCursor(id=4512))
+    assert "=" not in token
+    decoded = pagination.decode_cursor(token)
+    assert decoded.id == 4512
+    assert decoded.rank is None
+
+
+def test_cursor_roundtrip_preserves_rank_exactly():
+    rank = 0.0607927106320858
+    token = pagination.encode_cursor(pagination.LibraryCursor(id=7, rank=rank))
+    decoded = pagination.decode_cursor(token, require_rank=True)
+    assert decoded.id == 7
+    assert decoded.rank == rank
+
+
+def test_cursor_rejects_garbage():
+    with pytest.raises(ValidationError):
+        pagination.decode_cursor("not-a-cursor!!")
+
+
+def test_cursor_without_rank_rejected_for_search():
+    token = pagination.encode_cursor(pagination.LibraryCursor(id=10))
+    with pytest.raises(ValidationError):
+        pagination.decode_cursor(token, require_rank=True)
@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from athena.services import facets
+from athena.services.facets import FACETS_CACHE_PREFIX, LibraryFacetService
+
+GROUPING_KEYS = ("g_year", "g_tag", "g_status", "g_source", "g_collection")
+
+
+def _row(grouped: str | None, count: int, **values):
+    # grouped: bu satirin ait oldugu grouping set; None genel toplamdir
+    row = {key: int(key != grouped) for key in GROUPING_KEYS}
+    row.update(
+        year=None,
+        tag_id=None,
+        tag_name=None,
+        download_status=None,
+        source=None,
+        collection_id=None,
+        collection_name=None,
+        entry_count=count,
+    )
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+class FakeFacetSession:
+    """Revizyon sorgusuna ve GROUPING SETS sorgusuna sabit sonuc dondurur."""
+
+    def __init__(self, rows, revision=41):
+        self.rows = rows
+        self.revision = revision
+        self.statements = []
+
+    async def execute(self, stmt):
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if "library_revision_seq" in sql:
+            return SimpleNamespace(scalar=lambda: self.revision)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    store = {}
+
+    async def cache_get_json(key):
+        return store.get(key)
+
+    async def cache_set_json(key, value, ttl):
+        store[key] = value
+
+    monkeypatch.setattr(facets, "cache_get_json", cache_get_json)
+    monkeypatch.setattr(facets, "cache_set_json", cache_set_json)
+    return store
+
+
+def test_facets_split_grouping_sets_into_sorted_buckets(cache):
+    rows = [
+        _row(None, 6),
+        _row("g_year", 2, year=2019),
+        _row("g_year", 3, year=2023),
+        _row("g_year", 1, year=None),
+        # Etiketsiz kayitlar unnest'te NULL etiket satiri uretir
+        _row("g_tag", 4, tag_id=None),
+        _row("g_tag", 2, tag_id=5, tag_name="nlp"),
+        _row("g_tag", 2, tag_id=3, tag_name="ml"),
+        _row("g_status", 5, download_status="completed"),
+        _row("g_source", 6, source="semantic"),
+        _row("g_collection", 1, collection_id=9, collection_name="Thesis"),
+        _row("g_collection", 5, collection_id=None),
+    ]
+    db = FakeFacetSession(rows)
+
+    response = asyncio.run(LibraryFacetService(db).get_facets(tag="ml"))
+
+    assert "GROUPING SETS" in db.statements[1]
+    assert response.total == 6
+    assert [(b.value, b.count) for b in response.years] == [
+        (2023, 3),
+        (2019, 2),
+        (None, 1),
+    ]
+    assert [(b.value, b.label) for b in response.tags] == [(3, "ml"), (5, "nlp")]
+    assert [b.value for b in response.download_statuses] == ["completed"]
+    assert [b.value for b in response.sources] == ["semantic"]
+    assert [(b.value, b.label, b.count) for b in response.collections] == [
+        (9, "Thesis", 1)
+    ]
+
+
+def test_cached_facets_skip_grouping_query(cache):
+    db = FakeFacetSession([_row(None, 3)])
+    service = LibraryFacetService(db)
+
+    first = asyncio.run(service.get_facets(year_start=2020))
+    second = asyncio.run(service.get_facets(year_start=2020))
+
+    assert first == second
+    # Ikinci istek yalnizca revizyonu okur
+    assert len(db.statements) == 3
+    [key] = cache
+    assert key.startswith(f"{FACETS_CACHE_PREFIX}:41:")
+
+
+def test_cache_key_changes_with_revision_and_filters():
+    def key(revision, **filters):
+        service = LibraryFacetService(FakeFacetSession([], revision=revision))
+        return asyncio.run(service._cache_key({"tag": None, **filters}))
+
+    assert key(1) == key(1)
+    assert key(1) != key(2)
+    assert key(1, search="graph") != key(1, search="graphs")
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from athena.core.database import Base
+from athena.core.query_counter import count_queries, install_query_counter
+
+# Sorgu butcesi testleri gercek PostgreSQL ister (ARRAY/JSONB okuma modeli)
+PG_URL = os.environ.get("ATHENA_TEST_DATABASE_URL")
+requires_pg = pytest.mark.skipif(
+    not PG_URL, reason="ATHENA_TEST_DATABASE_URL tanimli degil"
+)
+
+
+def _async_url() -> str:
+    if "+asyncpg" in PG_URL:
+        return PG_URL
+    return PG_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+async def _seed(session, n: int) -> None:
+    from athena.models.library import DownloadStatus, LibraryEntry, SourceType
+    from athena.models.library_read_model import LibraryReadModel
+    from athena.models.paper import Paper
+
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(n):
+        paper = Paper(title=f"Paper {i}", title_slug=f"paper-{i}", citation_count=i)
+        entry = LibraryEntry(
+            paper=paper,
+            source=SourceType.MANUAL,
+            download_status=DownloadStatus.PENDING,
+            is_favorite=False,
+        )
+        session.add(entry)
+        await session.flush()
+        # create_all trigger kurmaz; okuma modeli satiri elle yazilir
+        session.add(
+            LibraryReadModel(
+                entry_id=entry.id,
+                paper_id=paper.id,
+                title=paper.title,
+                citation_count=i,
+                download_status=DownloadStatus.PENDING.value,
+                source=SourceType.MANUAL.value,
+                tag_ids=[],
+                tag_names=[],
+                collection_ids=[],
+                search_text="",
+                display={
+                    "id": entry.id,
+                    "source": SourceType.MANUAL.value,
+                    "download_status": DownloadStatus.PENDING.value,
+                    "is_favorite": False,
+                    "tags": [],
+                    "paper": {
+                        "id": paper.id,
+                        "title": paper.title,
+                        "citation_count": i,
+                        "authors": [{"name": f"Author {i}"}],
+                        "created_at": created_at.isoformat(),
+                    },
+                },
+            )
+        )
+    await session.commit()
+
+
+async def _statement_counts(n: int) -> dict[str, int]:
+    """N kayitlik kutuphanede listeleme ve disa aktarim sorgu sayilari."""
+    from athena.services.export import ExportService
+    from athena.services.library import LibraryService
+
+    schema = f"budget_test_{uuid.uuid4().hex[:8]}"
+    admin = create_async_engine(_async_url())
+    async with admin.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    engine = create_async_engine(
+        _async_url(), connect_args={"server_settings": {"search_path": schema}}
+    )
+    install_query_counter(engine.sync_engine)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            await _seed(session, n)
+
+        counts = {}
+        async with session_factory() as session:
+            with count_queries() as counter:
+                page = await LibraryService(session).get_library_entries(limit=100)
+            assert len(page.entries) == n
+            counts["list_library"] = counter.count
+
+            with count_queries() as counter:
+                await ExportService(session).export_library("csv")
+            counts["export"] = counter.count
+        return counts
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin.dispose()
+
+
+@requires_pg
+def test_library_and_export_statement_count_is_independent_of_size():
+    small = asyncio.run(_statement_counts(1))
+    large = asyncio.run(_statement_counts(50))
+
+    assert small == large
+    # Listeleme: sayim + sayfa; disa aktarim: tek okuma modeli sorgusu
+    assert small["list_library"] <= 2
+    assert small["export"] == 1
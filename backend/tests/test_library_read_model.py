@@ -0,0 +1,135 @@
+import asyncio
+import importlib.util
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from athena.core.database import Base
+
+# Okuma modeli trigger'lari gercek PostgreSQL ister
+PG_URL = os.environ.get("ATHENA_TEST_DATABASE_URL")
+requires_pg = pytest.mark.skipif(
+    not PG_URL, reason="ATHENA_TEST_DATABASE_URL tanimli degil"
+)
+
+VERSIONS_DIR = Path(__file__).resolve().parents[1] / "migrations" / "versions"
+# Okuma modeli tablosunu, fonksiyonunu ve trigger'larini kuran migration'lar
+READ_MODEL_MIGRATIONS = (
+    "c8e0a2b4d6f8_add_library_read_model.py",
+    "e5b7d9f1a3c5_statement_level_read_model_triggers.py",
+)
+
+
+def _async_url() -> str:
+    if "+asyncpg" in PG_URL:
+        return PG_URL
+    return PG_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def _load_migration(filename: str):
+    spec = importlib.util.spec_from_file_location(
+        filename.removesuffix(".py"), VERSIONS_DIR / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _create_schema(connection) -> None:
+    """Tablolari create_all ile, okuma modelini migration'larla kurar."""
+    from alembic.operations import Operations
+    from alembic.runtime.migration import MigrationContext
+
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if table.name != "library_read_model"
+    ]
+    Base.metadata.create_all(connection, tables=tables)
+    with Operations.context(MigrationContext.configure(connection)):
+        for filename in READ_MODEL_MIGRATIONS:
+            _load_migration(filename).upgrade()
+
+
+async def _list_library(session):
+    from athena.api.v2.routers.library import list_library
+
+    return await list_library(
+        page=1,
+        limit=20,
+        tag=None,
+        status=None,
+        min_citations=None,
+        year_start=None,
+        year_end=None,
+        search=None,
+        collection_id=None,
+        cursor=None,
+        count_mode="exact",
+        db=session,
+    )
+
+
+async def _error_messages_after_retry() -> tuple[str | None, str | None]:
+    """Basarisiz kaydin listedeki hata mesaji; ilk hata ve tekrar deneme sonrasi."""
+    from athena.models.library import DownloadStatus, LibraryEntry, SourceType
+    from athena.models.paper import Paper
+
+    schema = f"read_model_test_{uuid.uuid4().hex[:8]}"
+    admin = create_async_engine(_async_url())
+    async with admin.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    engine = create_async_engine(
+        _async_url(),
+        connect_args={"server_settings": {"search_path": f"{schema}, public"}},
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(_create_schema)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            entry = LibraryEntry(
+                paper=Paper(title="Paper", title_slug="paper", citation_count=0),
+                source=SourceType.MANUAL,
+                download_status=DownloadStatus.FAILED,
+                error_message="HTTP 403",
+                is_favorite=False,
+            )
+            session.add(entry)
+            await session.commit()
+
+            [first] = (await _list_library(session)).items
+
+            # Tekrar deneme ayni durumda farkli bir hatayla biter
+            await session.execute(
+                update(LibraryEntry)
+                .where(LibraryEntry.id == entry.id)
+                .values(error_message="HTTP 404")
+            )
+            await session.commit()
+
+            [second] = (await _list_library(session)).items
+        return first.error_message, second.error_message
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin.dispose()
+
+
+@requires_pg
+def test_list_returns_error_message_of_failed_entry():
+    pytest.importorskip("alembic")
+
+    first, second = asyncio.run(_error_messages_after_retry())
+
+    assert first == "HTTP 403"
+    # Yalnizca error_message degisen UPDATE de okuma modelini yeniler
+    assert second == "HTTP 404"
@@ -0,0 +1,69 @@
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_oa_cache_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "oa_cache.py"
+    )
+    spec = importlib.util.spec_from_file_location("oa_cache_for_test", module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # dataclass'lar modulu sys.modules uzerinden cozer
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+oa_cache = _load_oa_cache_module()
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+
+def test_lookups_are_cached_by_normalized_doi_with_negative_ttl():
+    redis = _FakeRedis()
+    cache = oa_cache.OaLookupCache(redis)
+    settings = oa_cache.get_settings()
+
+    async def scenario():
+        await cache.set("unpaywall", "https://doi.org/10.1/ABC", "https://x/a.pdf")
+        await cache.set("core", "10.1/abc", None)
+        hit = await cache.get("unpaywall", "10.1/abc")
+        miss = await cache.get("unpaywall", "10.1/other")
+        many = await cache.get_many(["10.1/ABC", "10.1/other"])
+        return hit, miss, many
+
+    hit, miss, many = asyncio.run(scenario())
+
+    assert hit.url == "https://x/a.pdf"
+    assert miss is None
+    assert [lookup.url for lookup in many["10.1/ABC"]] == ["https://x/a.pdf", None]
+    assert "10.1/other" not in many
+    assert redis.ttls["download:oa:unpaywall:10.1/abc"] == settings.oa_cache_ttl
+    assert redis.ttls["download:oa:core:10.1/abc"] == settings.oa_cache_negative_ttl
+
+
+def test_cache_without_redis_is_a_no_op():
+    cache = oa_cache.OaLookupCache()
+
+    async def scenario():
+        await cache.set("core", "10.1/abc", "https://x/a.pdf")
+        return await cache.get("core", "10.1/abc"), await cache.get_many(["10.1/abc"])
+
+    assert asyncio.run(scenario()) == (None, {})
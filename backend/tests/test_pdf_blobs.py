@@ -0,0 +1,238 @@
+import asyncio
+import importlib.util
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from athena.core.config import get_settings
+from athena.core.file_paths import blob_relative_path
+from athena.models.pdf_blob import lock_blob, purge_orphan_blobs
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Trigger ve kilit testleri gercek PostgreSQL ister
+PG_URL = os.environ.get("ATHENA_TEST_DATABASE_URL")
+requires_pg = pytest.mark.skipif(
+    not PG_URL, reason="ATHENA_TEST_DATABASE_URL tanimli degil"
+)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_lock_blob_uses_transaction_scoped_advisory_lock():
+    sql = _compile(lock_blob("ab" * 32))
+
+    assert "pg_advisory_xact_lock(hashtext(" in sql
+
+
+def test_purge_orphan_blobs_skips_young_and_locked_blobs():
+    cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    stmt = purge_orphan_blobs(cutoff)
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert "pdf_blobs.ref_count = " in sql
+    # Kismi `ix_pdf_blobs_orphans (created_at) WHERE ref_count = 0` indeksi
+    assert "pdf_blobs.created_at < " in sql
+    assert "pg_try_advisory_xact_lock(hashtext(pdf_blobs.sha256))" in sql
+    assert "RETURNING pdf_blobs.file_path" in sql
+    assert cutoff in compiled.params.values()
+
+
+def test_remove_orphan_blobs_unlinks_files_before_releasing_locks(tmp_path):
+    from athena.tasks.reconciler import remove_orphan_blobs
+
+    orphan = tmp_path / blob_relative_path("cd" * 32)
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"%PDF-1.4 orphan")
+    orphan_paths = [blob_relative_path("cd" * 32), blob_relative_path("ef" * 32)]
+
+    class RecordingSession:
+        def __init__(self):
+            self.statements = []
+            self.file_at_commit = None
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return SimpleNamespace(
+                scalars=lambda: SimpleNamespace(all=lambda: orphan_paths)
+            )
+
+        def commit(self):
+            self.file_at_commit = orphan.exists()
+
+    db = RecordingSession()
+    now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    removed = remove_orphan_blobs(db, tmp_path, now)
+
+    assert removed == orphan_paths
+    assert db.file_at_commit is False
+    grace = timedelta(minutes=get_settings().blob_gc_grace_minutes)
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    assert now - grace in params.values()
+
+
+def test_delete_entry_removes_last_blob_under_lock(tmp_path):
+    from athena.services.library import LibraryService
+
+    sha256 = "9f" * 32
+    blob_file = tmp_path / blob_relative_path(sha256)
+    blob_file.parent.mkdir(parents=True)
+    blob_file.write_bytes(b"%PDF-1.4")
+    events = []
+
+    class FakeAsyncSession:
+        async def execute(self, stmt):
+            sql = _compile(stmt)
+            if "pg_advisory_xact_lock" in sql:
+                events.append("lock")
+                return None
+            if sql.startswith("DELETE FROM pdf_blobs"):
+                events.append("delete_blob")
+                value = blob_relative_path(sha256)
+            else:
+                value = SimpleNamespace(file_path=blob_relative_path(sha256))
+            return SimpleNamespace(scalar_one_or_none=lambda: value)
+
+        async def scalar(self, stmt):
+            return sha256
+
+        async def delete(self, entry):
+            events.append("delete_entry")
+
+        async def commit(self):
+            events.append(("commit", blob_file.exists()))
+
+    deleted = asyncio.run(
+        LibraryService(FakeAsyncSession()).delete_library_entry(1, tmp_path)
+    )
+
+    assert deleted is True
+    # Kayit silinir, ardindan blob kilit altinda silinir ve dosya
+    # kilit birakilmadan (son commit'ten once) diskten kaldirilir
+    assert events == [
+        "delete_entry",
+        ("commit", True),
+        "lock",
+        "delete_blob",
+        ("commit", False),
+    ]
+
+
+def _load_migration(name: str):
+    path = BACKEND_DIR / "migrations" / "versions" / name
+    spec = importlib.util.spec_from_file_location(f"migration_{path.stem}", path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def pg_engine():
+    pytest.importorskip("alembic")
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    schema = f"blob_test_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(PG_URL.replace("+asyncpg", ""))
+    with admin.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    engine = create_engine(
+        PG_URL.replace("+asyncpg", ""),
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE library_entries (id integer PRIMARY KEY)"))
+        with Operations.context(MigrationContext.configure(conn)):
+            _load_migration("a8c0e2f4b6d8_add_pdf_blobs.py").upgrade()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+def _add_blob(conn, sha256: str, age: timedelta = timedelta(0)) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO pdf_blobs (sha256, file_path, size, created_at) "
+            "VALUES (:sha, :path, 1, now() - :age)"
+        ),
+        {"sha": sha256, "path": blob_relative_path(sha256), "age": age},
+    )
+
+
+def _ref_counts(conn) -> dict[str, int]:
+    rows = conn.execute(text("SELECT sha256, ref_count FROM pdf_blobs"))
+    return dict(rows.all())
+
+
+@requires_pg
+def test_ref_count_trigger_follows_references(pg_engine):
+    a, b = "a" * 64, "b" * 64
+    with pg_engine.begin() as conn:
+        _add_blob(conn, a)
+        _add_blob(conn, b)
+        conn.execute(text("INSERT INTO library_entries (id) VALUES (1), (2)"))
+        conn.execute(
+            text(
+                "INSERT INTO library_entry_pdfs (entry_id, sha256) "
+                "VALUES (1, :a), (2, :a)"
+            ),
+            {"a": a},
+        )
+        assert _ref_counts(conn) == {a: 2, b: 0}
+
+        conn.execute(
+            text("UPDATE library_entry_pdfs SET sha256 = :b WHERE entry_id = 2"),
+            {"b": b},
+        )
+        assert _ref_counts(conn) == {a: 1, b: 1}
+
+        # Kayit silinince referans CASCADE ile silinir
+        conn.execute(text("DELETE FROM library_entries WHERE id = 1"))
+        assert _ref_counts(conn) == {a: 0, b: 1}
+
+
+@requires_pg
+def test_orphan_purge_respects_grace_period_and_blob_locks(pg_engine, tmp_path):
+    from athena.tasks.reconciler import remove_orphan_blobs
+
+    old, young, locked = "1" * 64, "2" * 64, "3" * 64
+    grace = timedelta(minutes=get_settings().blob_gc_grace_minutes)
+    with pg_engine.begin() as conn:
+        _add_blob(conn, old, age=grace * 2)
+        _add_blob(conn, young)
+        _add_blob(conn, locked, age=grace * 2)
+    for sha256 in (old, young, locked):
+        path = tmp_path / blob_relative_path(sha256)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"%PDF-1.4")
+
+    # Ayni blob'a baglanan bir indirme kilidi tutuyor
+    with pg_engine.connect() as holder:
+        holder.execute(lock_blob(locked))
+        with Session(pg_engine) as db:
+            removed = remove_orphan_blobs(db, tmp_path, datetime.now(timezone.utc))
+        holder.rollback()
+
+    assert removed == [blob_relative_path(old)]
+    assert not (tmp_path / blob_relative_path(old)).exists()
+    assert (tmp_path / blob_relative_path(young)).exists()
+    assert (tmp_path / blob_relative_path(locked)).exists()
+    with pg_engine.connect() as conn:
+        assert set(_ref_counts(conn)) == {young, locked}
@@ -67,3 +67,38 @@ def test_resolve_stored_file_path_legacy_absolute(tmp_path):
 def test_resolve_stored_file_path_missing_file(tmp_path):
     resolved = resolve_data_file_path("404/missing.pdf", tmp_path)
     assert resolved is None
+
+
+file_paths = _load_file_paths_module()
+
+
+def test_data_path_candidates_normalizes_legacy_paths(tmp_path):
+    root = tmp_path.resolve()
+    assert file_paths.data_path_candidates("12/a.pdf", root) == ["12/a.pdf"]
+    assert "12/a.pdf" in file_paths.data_path_candidates("/data/library/12/a.pdf", root)
+    assert "12/a.pdf" in file_paths.data_path_candidates(f"{root}/12/a.pdf", root)
+
+
+def test_data_path_candidates_blocks_traversal(tmp_path):
+    assert file_paths.data_path_candidates("../evil.pdf", tmp_path.resolve()) == []
+    assert file_paths.data_path_candidates("", tmp_path.resolve()) == []
+
+
+def test_scan_data_files_collects_relative_paths(tmp_path):
+    (tmp_path / "1").mkdir()
+    (tmp_path / "1" / "a.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "2" / "nested").mkdir(parents=True)
+    (tmp_path / "2" / "nested" / "b.pdf").write_bytes(b"%PDF-1.4")
+
+    assert file_paths.scan_data_files(tmp_path) == {"1/a.pdf", "2/nested/b.pdf"}
+
+
+def test_blob_relative_path_fans_out_by_hash(tmp_path):
+    sha256 = "ab" + "cd" + "0" * 60
+    relative = file_paths.blob_relative_path(sha256)
+    assert relative == f"objects/ab/cd/{sha256}.pdf"
+
+    blob = tmp_path / relative
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(b"%PDF-1.4")
+    assert file_paths.resolve_data_file_path(relative, tmp_path) == blob.resolve()
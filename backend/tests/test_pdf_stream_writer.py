@@ -0,0 +1,139 @@
+import asyncio
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _load_strategies_module():
+    module_path = (
+        Path(__file__).resolve().parents[1]
+        / "athena"
+        / "tasks"
+        / "download_strategies.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "download_strategies_for_test", module_path
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    # dataclass'lar modulu sys.modules uzerinden cozer
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+strategies = _load_strategies_module()
+
+PDF_BYTES = b"%PDF-1.7\n" + b"0" * 4096
+
+
+def test_writer_commits_atomically_with_hash(tmp_path):
+    target = tmp_path / "12" / "paper.pdf"
+    writer = strategies._PdfFileWriter(target, max_bytes=1024 * 1024)
+    for i in range(0, len(PDF_BYTES), 1000):
+        writer.write(PDF_BYTES[i : i + 1000])
+    assert not target.exists()
+
+    downloaded = writer.commit()
+
+    assert target.read_bytes() == PDF_BYTES
+    assert downloaded.size == len(PDF_BYTES)
+    assert len(downloaded.sha256) == 64
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_writer_rejects_html_on_first_chunk(tmp_path):
+    target = tmp_path / "paper.pdf"
+    writer = strategies._PdfFileWriter(target, max_bytes=1024 * 1024)
+    with pytest.raises(strategies.DownloadError) as exc_info:
+        writer.write(b"<!DOCTYPE html><html>")
+    writer.discard()
+
+    assert exc_info.value.code == strategies.ErrorCode.DOWNLOAD_INVALID_PDF
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_writer_enforces_max_size(tmp_path):
+    target = tmp_path / "paper.pdf"
+    writer = strategies._PdfFileWriter(target, max_bytes=2048)
+    with pytest.raises(strategies.DownloadError) as exc_info:
+        writer.write(PDF_BYTES)
+    writer.discard()
+
+    assert exc_info.value.code == strategies.ErrorCode.DOWNLOAD_TOO_LARGE
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_writer_resumes_kept_partial(tmp_path, monkeypatch):
+    monkeypatch.setattr(strategies, "RESUME_MIN_BYTES", 1024)
+    target = tmp_path / "paper.pdf"
+    url = "https://example.org/paper.pdf"
+    response = strategies.httpx.Response(
+        200, headers={"ETag": '"v1"', "Accept-Ranges": "bytes"}
+    )
+
+    partial = strategies._PartialDownload.load(target, url)
+    writer = strategies._PdfFileWriter(target, max_bytes=1024 * 1024, partial=partial)
+    partial.save(response)
+    writer.begin()
+    writer.write(PDF_BYTES[:2048])
+    assert writer.keep()
+
+    partial = strategies._PartialDownload.load(target, url)
+    assert partial.validator == '"v1"'
+    writer = strategies._PdfFileWriter(target, max_bytes=1024 * 1024, partial=partial)
+    assert writer.resume_offset == 2048
+    assert partial.range_headers(2048)["Range"] == "bytes=2048-"
+    writer.begin(resume=True)
+    writer.write(PDF_BYTES[2048:])
+    downloaded = writer.commit()
+
+    whole = strategies._PdfFileWriter(tmp_path / "whole.pdf", max_bytes=1024 * 1024)
+    whole.write(PDF_BYTES)
+    assert downloaded.sha256 == whole.commit().sha256
+    assert target.read_bytes() == PDF_BYTES
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["paper.pdf", "whole.pdf"]
+
+
+def test_download_writes_buffered_chunks_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr(strategies, "DOWNLOAD_CHUNK_SIZE", 512)
+    monkeypatch.setattr(strategies, "WRITE_FLUSH_SIZE", 2048)
+    writes = []
+    original_write = strategies._PdfFileWriter.write
+
+    def recording_write(self, chunk):
+        writes.append((len(chunk), threading.current_thread()))
+        original_write(self, chunk)
+
+    monkeypatch.setattr(strategies._PdfFileWriter, "write", recording_write)
+    body = PDF_BYTES + b"1" * 4096
+
+    async def scenario():
+        transport = strategies.httpx.MockTransport(
+            lambda request: strategies.httpx.Response(200, content=body)
+        )
+        async with strategies.httpx.AsyncClient(transport=transport) as client:
+            clients = strategies.DownloadClients(
+                api=client,
+                download=client,
+                api_semaphore=asyncio.Semaphore(1),
+                hosts=strategies.HostScheduler(rate_per_second=0),
+                oa_cache=strategies.OaLookupCache(),
+            )
+            return (
+                await strategies._download_url(
+                    clients, "https://example.org/p.pdf", tmp_path / "p.pdf"
+                ),
+                threading.current_thread(),
+            )
+
+    downloaded, loop_thread = asyncio.run(scenario())
+
+    assert (tmp_path / "p.pdf").read_bytes() == body
+    assert downloaded.size == len(body)
+    # Ilk parca PDF kontrolu icin hemen, kalanlar tampon dolunca yazilir
+    assert [size for size, _ in writes] == [512, 2048, 2048, 2048, 1545]
+    assert all(thread is not loop_thread for _, thread in writes)
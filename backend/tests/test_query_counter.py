@@ -0,0 +1,65 @@
+import importlib.util
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+
+def _load_query_counter_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "query_counter.py"
+    )
+    spec = importlib.util.spec_from_file_location("query_counter_for_test", module_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+query_counter = _load_query_counter_module()
+
+
+def _make_engine():
+    engine = create_engine("sqlite://")
+    query_counter.install_query_counter(engine)
+    # Tekrar cagri dinleyiciyi ikinci kez eklememeli
+    query_counter.install_query_counter(engine)
+    return engine
+
+
+def test_counts_statements_inside_block():
+    engine = _make_engine()
+    with engine.connect() as conn:
+        with query_counter.count_queries(record_statements=True) as counter:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    assert counter.count == 2
+    assert counter.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_ignores_statements_outside_block():
+    engine = _make_engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with query_counter.count_queries() as counter:
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+
+    assert counter.count == 1
+    assert counter.statements == []
+    assert query_counter.query_counter_ctx.get() is None
+
+
+def test_start_and_clear_for_middleware():
+    engine = _make_engine()
+    counter = query_counter.start_query_count()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        query_counter.clear_query_count()
+
+    assert counter.count == 1
+    # Middleware SQL metinlerini tutmaz
+    assert counter.statements == []
+    assert query_counter.query_counter_ctx.get() is None
@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+from athena.core import database
+from athena.core.config import get_settings
+from athena.services import search
+from athena.services.search import SearchService
+from athena.services.settings import UserSettingsService
+
+
+class FakeReadSession:
+    """Salt okunur session: yazma cagrilari test'i bozar."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+        return False
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt))
+        rows = self.rows
+        return SimpleNamespace(
+            scalars=lambda: SimpleNamespace(first=lambda: rows[0] if rows else None)
+        )
+
+    def add(self, obj):
+        raise AssertionError("read-only session must not be written to")
+
+    async def commit(self):
+        raise AssertionError("read-only session must not be committed")
+
+
+def test_read_engine_is_read_only_snapshot():
+    options = database.read_engine.get_execution_options()
+
+    assert options["postgresql_readonly"] is True
+    assert options["isolation_level"] == "REPEATABLE READ"
+
+
+def test_get_read_db_yields_session_without_commit(monkeypatch):
+    session = FakeReadSession()
+    monkeypatch.setattr(database, "read_session_factory", lambda: session)
+
+    async def run():
+        async for db in database.get_read_db():
+            assert db is session
+            assert not session.closed
+
+    asyncio.run(run())
+
+    assert session.closed
+
+
+def test_find_settings_returns_none_without_creating_row():
+    db = FakeReadSession()
+
+    assert asyncio.run(UserSettingsService(db).find_settings()) is None
+    assert "ORDER BY user_settings.id ASC" in db.statements[0]
+
+
+def test_search_runtime_reads_settings_on_read_only_session():
+    row = SimpleNamespace(
+        id=1,
+        enabled_providers=["arxiv"],
+        semantic_scholar_api_key="s2-key",
+        core_api_key=None,
+        openalex_email="team@example.org",
+        proxy_url="http://proxy:3128",
+        proxy_enabled=True,
+    )
+    service = SearchService(FakeReadSession([row]))
+
+    runtime = asyncio.run(service._load_runtime_settings())
+
+    assert runtime.enabled_providers == ["arxiv"]
+    assert runtime.semantic_scholar_api_key == "s2-key"
+    assert runtime.contact_email == "team@example.org"
+    assert runtime.proxy_url == "http://proxy:3128"
+
+
+def test_search_runtime_falls_back_to_env_without_settings_row(monkeypatch):
+    monkeypatch.setattr(get_settings(), "outbound_proxy", "http://env-proxy:3128")
+    service = SearchService(FakeReadSession())
+
+    runtime = asyncio.run(service._load_runtime_settings())
+
+    assert runtime.enabled_providers == list(search.DEFAULT_ENABLED_PROVIDERS)
+    assert runtime.proxy_url == "http://env-proxy:3128"
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from athena.models.library import DownloadStatus, LibraryEntry
+from athena.tasks import downloader
+
+
+class FakeSweepDb:
+    """`UPDATE ... RETURNING` parcalarini sirayla donduren senkron session."""
+
+    def __init__(self, chunks, events):
+        self.chunks = list(chunks)
+        self.events = events
+        self.last_ids = []
+
+    def execute(self, stmt):
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        self.last_ids.append(params["id_1"])
+        rows = self.chunks.pop(0) if self.chunks else []
+        self.events.append(("update", len(rows)))
+        return type("Result", (), {"all": lambda _self: rows})()
+
+    def commit(self):
+        self.events.append(("commit",))
+
+
+@pytest.fixture
+def sweep(monkeypatch):
+    monkeypatch.setattr(downloader, "RETRY_SWEEP_CHUNK", 3)
+    events = []
+
+    def enqueue(entry_ids, queue=None):
+        events.append(("enqueue", list(entry_ids)))
+
+    monkeypatch.setattr(downloader, "enqueue_downloads", enqueue)
+    return events
+
+
+def _criteria():
+    return (LibraryEntry.download_status == DownloadStatus.FAILED,)
+
+
+def test_requeue_processes_chunks_in_id_order(sweep):
+    chunks = [
+        [(1, "https://a.example/1"), (2, "https://a.example/2"), (5, None)],
+        [(8, "https://b.example/8")],
+    ]
+    db = FakeSweepDb(chunks, sweep)
+
+    total = downloader._requeue_downloads(db, *_criteria())
+
+    assert total == 4
+    # Her parca bir onceki parcanin en buyuk id'sinden sonra baslar
+    assert db.last_ids == [0, 5, 8]
+    # Parca commit edilmeden kuyruga eklenmez
+    assert sweep == [
+        ("update", 3),
+        ("commit",),
+        ("enqueue", [1, 5, 2]),
+        ("update", 1),
+        ("commit",),
+        ("enqueue", [8]),
+        ("update", 0),
+        ("commit",),
+    ]
+
+
+def test_requeue_failure_leaves_remaining_chunks_pending(sweep, monkeypatch):
+    chunks = [[(1, None), (2, None), (3, None)], [(4, None)], [(5, None)]]
+    db = FakeSweepDb(chunks, sweep)
+
+    def enqueue(entry_ids, queue=None):
+        if 4 in entry_ids:
+            raise ConnectionError("broker down")
+        sweep.append(("enqueue", list(entry_ids)))
+
+    monkeypatch.setattr(downloader, "enqueue_downloads", enqueue)
+
+    with pytest.raises(ConnectionError):
+        downloader._requeue_downloads(db, *_criteria())
+
+    # Ilk parca kuyrukta; ikinci parca pending olarak commit edildi ve
+    # sonraki taramada tekrar secilir; ucuncu parcaya hic gecilmedi
+    assert sweep == [
+        ("update", 3),
+        ("commit",),
+        ("enqueue", [1, 2, 3]),
+        ("update", 1),
+        ("commit",),
+    ]
+    assert db.chunks == [[(5, None)]]
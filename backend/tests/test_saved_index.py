@@ -0,0 +1,179 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from athena.schemas.search import PaperResponse
+from athena.services import saved_index
+from athena.services.saved_index import (
+    _ADD_SCRIPT,
+    _CHECK_SCRIPT,
+    BLOOM_BITS,
+    BLOOM_HASHES,
+    SAVED_INDEX_SCHEDULED_KEY,
+    SavedPaperIndex,
+    _bit_offsets,
+    _build_bitmap,
+)
+
+REDIS_URL = os.environ.get("ATHENA_TEST_REDIS_URL")
+requires_redis = pytest.mark.skipif(
+    not REDIS_URL, reason="ATHENA_TEST_REDIS_URL tanimli degil"
+)
+
+
+def _redis_getbit(bitmap: bytes, offset: int) -> int:
+    # Redis GETBIT: byte = offset / 8, bit 0 byte'in en anlamli bitidir
+    return (bitmap[offset // 8] >> (7 - offset % 8)) & 1
+
+
+def test_bit_offsets_are_stable_and_in_range():
+    offsets = _bit_offsets("doi:10.1000/xyz")
+
+    assert offsets == _bit_offsets("doi:10.1000/xyz")
+    assert len(offsets) == BLOOM_HASHES
+    assert all(0 <= offset < BLOOM_BITS for offset in offsets)
+    assert offsets != _bit_offsets("doi:10.1000/xyw")
+
+
+def test_bitmap_uses_redis_bit_order():
+    members = ["doi:10.1000/xyz", "slug:attention-is-all-you-need"]
+
+    bitmap = _build_bitmap(members)
+
+    assert len(bitmap) * 8 == BLOOM_BITS
+    expected = {offset for member in members for offset in _bit_offsets(member)}
+    assert all(_redis_getbit(bitmap, offset) for offset in expected)
+    assert sum(bin(byte).count("1") for byte in bitmap) == len(expected)
+
+
+def test_bitmap_offset_zero_is_most_significant_bit(monkeypatch):
+    monkeypatch.setattr(saved_index, "_bit_offsets", lambda member: [0, 9])
+
+    bitmap = _build_bitmap(["x"])
+
+    assert bitmap[:2] == bytearray([0x80, 0x40])
+
+
+class FakeRedis:
+    """Filtre anahtari olmayan (suresi dolmus) Redis."""
+
+    def __init__(self):
+        self.values = {}
+        self.evals = []
+
+    async def eval(self, script, numkeys, *args):
+        self.evals.append((script, args[:numkeys], args[numkeys:]))
+        if script == _CHECK_SCRIPT:
+            return [-1]
+        return 0
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+def _papers():
+    return [
+        PaperResponse(title="Known Paper", source="semantic", external_id="s1"),
+        PaperResponse(title="Other Paper", source="semantic", external_id="s2"),
+    ]
+
+
+def test_missing_filter_confirms_via_db_and_queues_one_rebuild(monkeypatch):
+    redis = FakeRedis()
+    index = SavedPaperIndex(redis)
+    queued = []
+    confirmed = []
+
+    async def rebuild(db):
+        raise AssertionError("rebuild must not run inside the search request")
+
+    async def confirm(db, papers):
+        confirmed.append([paper.external_id for paper in papers])
+        return [paper.external_id == "s1" for paper in papers]
+
+    monkeypatch.setattr(index, "rebuild", rebuild)
+    monkeypatch.setattr(SavedPaperIndex, "_confirm", staticmethod(confirm))
+    monkeypatch.setattr(
+        saved_index,
+        "rebuild_saved_index_task",
+        SimpleNamespace(delay=lambda: queued.append(True)),
+    )
+
+    first, second = _papers(), _papers()
+    asyncio.run(index.annotate(None, first))
+    asyncio.run(index.annotate(None, second))
+
+    assert [paper.in_library for paper in first] == [True, False]
+    assert confirmed == [["s1", "s2"], ["s1", "s2"]]
+    assert queued == [True]
+    assert SAVED_INDEX_SCHEDULED_KEY in redis.values
+
+
+def test_failed_enqueue_allows_next_search_to_retry(monkeypatch):
+    redis = FakeRedis()
+    index = SavedPaperIndex(redis)
+
+    def broken_delay():
+        raise ConnectionError("broker down")
+
+    async def confirm(db, papers):
+        return [False] * len(papers)
+
+    monkeypatch.setattr(SavedPaperIndex, "_confirm", staticmethod(confirm))
+    monkeypatch.setattr(
+        saved_index, "rebuild_saved_index_task", SimpleNamespace(delay=broken_delay)
+    )
+
+    asyncio.run(index.annotate(None, _papers()))
+
+    assert SAVED_INDEX_SCHEDULED_KEY not in redis.values
+
+
+def test_add_identifiers_sets_identifier_bits():
+    redis = FakeRedis()
+
+    asyncio.run(SavedPaperIndex(redis).add_identifiers({("doi", "10.1/a")}))
+
+    [(script, keys, offsets)] = redis.evals
+    assert script == _ADD_SCRIPT
+    assert set(offsets) == set(_bit_offsets("doi:10.1/a"))
+
+
+@requires_redis
+def test_lua_scripts_read_python_bitmap():
+    from redis.asyncio import Redis
+
+    live, delta = "test:saved:bloom", "test:saved:bloom:delta"
+    member, other = "doi:10.1000/xyz", "doi:10.1000/other"
+
+    async def run():
+        redis = Redis.from_url(REDIS_URL)
+        try:
+            await redis.delete(live, delta)
+            # Filtre yokken ekleme yalnizca delta'ya yazar
+            await redis.eval(_ADD_SCRIPT, 2, live, delta, *_bit_offsets(other))
+            missing = await redis.eval(_CHECK_SCRIPT, 1, live, *_bit_offsets(member))
+            assert await redis.exists(live) == 0
+
+            await redis.set(live, bytes(_build_bitmap([member])))
+            present = await redis.eval(_CHECK_SCRIPT, 1, live, *_bit_offsets(member))
+            delta_bits = await redis.eval(_CHECK_SCRIPT, 1, delta, *_bit_offsets(other))
+            return missing, present, delta_bits
+        finally:
+            await redis.delete(live, delta)
+            await redis.aclose()
+
+    missing, present, delta_bits = asyncio.run(run())
+
+    assert missing == [-1]
+    assert present == [1] * BLOOM_HASHES
+    assert delta_bits == [1] * BLOOM_HASHES
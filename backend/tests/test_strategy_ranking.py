@@ -0,0 +1,83 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def _load_ranking_module():
+    module_path = (
+        Path(__file__).resolve().parents[1] / "athena" / "core" / "strategy_ranking.py"
+    )
+    spec = importlib.util.spec_from_file_location(
+        "strategy_ranking_for_test", module_path
+    )
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ranking_module = _load_ranking_module()
+SuccessStats = ranking_module.SuccessStats
+StrategyRanking = ranking_module.StrategyRanking
+
+CHAIN = ["PrimaryDownload", "Unpaywall", "CORE"]
+
+
+def test_arrange_keeps_default_order_without_history():
+    ranking = StrategyRanking()
+
+    assert ranking.arrange(CHAIN, "www.mdpi.com") == CHAIN
+    assert not ranking.skip_direct("www.mdpi.com")
+
+
+def test_arrange_skips_direct_for_blocking_host_and_sorts_lookups():
+    ranking = StrategyRanking(
+        direct_by_host={
+            "blocked.example": SuccessStats(attempts=40, successes=1),
+            "open.example": SuccessStats(attempts=40, successes=38),
+            "sparse.example": SuccessStats(attempts=5, successes=0),
+        },
+        by_strategy={
+            "Unpaywall": SuccessStats(attempts=200, successes=40),
+            "CORE": SuccessStats(attempts=200, successes=120),
+        },
+        min_attempts=20,
+        skip_rate=0.05,
+        rng=lambda: 0.5,
+    )
+
+    def arrange(host):
+        return ranking.arrange(CHAIN, host, ranking.skip_direct(host))
+
+    assert arrange("blocked.example") == ["CORE", "Unpaywall"]
+    assert arrange("open.example") == [
+        "PrimaryDownload",
+        "CORE",
+        "Unpaywall",
+    ]
+    # Az veriyle host engelli sayilmaz
+    assert arrange("sparse.example")[0] == "PrimaryDownload"
+
+    # Kesif: olasilik tutarsa engelli host'ta da dogrudan indirme denenir
+    ranking.rng = lambda: 0.01
+    assert "PrimaryDownload" in arrange("blocked.example")
+
+
+def test_skip_decision_is_drawn_by_caller():
+    draws = []
+
+    def rng():
+        draws.append(1)
+        return 0.5
+
+    ranking = StrategyRanking(
+        direct_by_host={"blocked.example": SuccessStats(attempts=40, successes=0)},
+        rng=rng,
+    )
+
+    # arrange kendi cekilisini yapmaz; kararin tutarliligi cagirana aittir
+    assert "PrimaryDownload" in ranking.arrange(CHAIN, "blocked.example")
+    assert draws == []
+    assert ranking.skip_direct("blocked.example")
+    assert len(draws) == 1
@@ -0,0 +1,63 @@
+import pytest
+
+from athena.core.celery_app import celery_app
+from athena.core.task_queues import (
+    QUEUE_BULK,
+    QUEUE_ENRICHMENT,
+    QUEUE_INTERACTIVE,
+    QUEUE_MAINTENANCE,
+)
+
+
+@pytest.mark.parametrize(
+    ("task_name", "queue"),
+    [
+        ("athena.tasks.downloader.download_paper_task", QUEUE_INTERACTIVE),
+        ("athena.tasks.ingest.ingest_papers_task", QUEUE_INTERACTIVE),
+        ("athena.tasks.downloader.download_papers_batch_task", QUEUE_BULK),
+        ("athena.tasks.downloader.retry_stuck_downloads", QUEUE_MAINTENANCE),
+        ("athena.tasks.downloader.purge_download_attempts", QUEUE_MAINTENANCE),
+        ("athena.tasks.enrichment.enrich_metadata_task", QUEUE_ENRICHMENT),
+        ("athena.tasks.reconciler.reconcile_library_files_task", QUEUE_MAINTENANCE),
+        ("athena.tasks.saved_index.rebuild_saved_index_task", QUEUE_MAINTENANCE),
+    ],
+)
+def test_task_routes(task_name, queue):
+    route = celery_app.amqp.router.route({}, task_name)
+
+    assert route["queue"].name == queue
+
+
+def test_batch_retry_stays_on_its_queue(monkeypatch):
+    from athena.tasks import downloader
+    from athena.tasks.download_engine import RESULT_COMPLETED, RESULT_RETRY
+
+    monkeypatch.setattr(downloader, "_load_download_settings", lambda: None)
+    monkeypatch.setattr(
+        downloader,
+        "_run_downloads",
+        lambda entry_ids, *a, **k: [
+            downloader.DownloadResult(1, RESULT_COMPLETED),
+            downloader.DownloadResult(2, RESULT_RETRY, retry_after=30),
+        ],
+    )
+    queued = []
+    monkeypatch.setattr(
+        downloader.download_papers_batch_task,
+        "apply_async",
+        lambda **kwargs: queued.append(kwargs),
+    )
+
+    result = downloader.download_papers_batch_task(
+        entry_ids=[1, 2], queue=QUEUE_INTERACTIVE
+    )
+
+    assert result["counts"] == {RESULT_COMPLETED: 1, RESULT_RETRY: 1}
+    [retry] = queued
+    assert retry["queue"] == QUEUE_INTERACTIVE
+    assert retry["kwargs"] == {
+        "entry_ids": [2],
+        "attempt": 1,
+        "queue": QUEUE_INTERACTIVE,
+    }
+    assert retry["countdown"] >= 30
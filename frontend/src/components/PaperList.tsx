@@ -20,11 +20,12 @@ import {
   DialogTitle,
 } from '@/components/ui/dialog';
 import { useUIStore } from '@/stores/ui-store';
-import { bulkIngestPapers, resolveEntryIds } from '@/services/library';
+import { bulkIngestPapers, createIngestJob, fetchIngestJob } from '@/services/library';
+import type { IngestJobResponse } from '@/types/api';
 import PaperCard from '@/components/PaperCard';
 import CollectionPickerDialog from '@/components/CollectionPickerDialog';
 
-const BATCH_SIZE = 100;
+const JOB_POLL_INTERVAL_MS = 1000;
 
 // Loading skeleton bileseni
 function PaperCardSkeleton() {
@@ -153,7 +154,7 @@ export default function PaperList() {
     }
   };
 
-  // "Tum Sonuclari Kutupaneye Ekle" - batching ile
+  // "Tum Sonuclari Kutupaneye Ekle" - arka plan ingest job'i ile
   const handleAddAll = useCallback(async () => {
     setShowAddAllDialog(false);
 
@@ -163,65 +164,40 @@ export default function PaperList() {
 
     if (totalPapers === 0) return;
 
-    let totalAdded = 0;
-    let totalDuplicate = 0;
-    let totalFailed = 0;
-    let hadBatchError = false;
-    const allSavedIds: string[] = [];
-    const allEntryIds: number[] = [];
-
-    // Batch'ler halinde gonder
-    const totalBatches = Math.ceil(totalPapers / BATCH_SIZE);
-
-    for (let i = 0; i < totalPapers; i += BATCH_SIZE) {
-      const batch = papersToAdd.slice(i, i + BATCH_SIZE);
-      const batchNum = Math.floor(i / BATCH_SIZE) + 1;
-      setAddAllProgress({ current: batchNum, total: totalBatches });
-
-      try {
-        const result = await bulkIngestPapers({
-          papers: batch,
-          search_query: lastSearchQuery,
-        });
-        totalAdded += result.added_count;
-        totalDuplicate += result.duplicate_count;
-        totalFailed += result.failed_count;
-        if (result.entry_ids.length > 0) {
-          allEntryIds.push(...result.entry_ids);
-        }
-
-        // Kaydedilen ID'leri topla
-        const batchIds = batch
-          .map((p) => p.external_id)
-          .filter((id): id is string => id !== null);
-        allSavedIds.push(...batchIds);
-      } catch {
-        totalFailed += batch.length;
-        hadBatchError = true;
-      }
-    }
+    setAddAllProgress({ current: 0, total: totalPapers });
 
-    // Batch hatasi olduysa, backend'de kaydedilmis ama entry_id'sini
-    // alamadigimiz makaleleri kurtarmak icin resolve endpoint'ini cagir
-    if (hadBatchError && papersToAdd.length > 0) {
-      try {
-        const allTitles = papersToAdd.map((p) => p.title);
-        const resolved = await resolveEntryIds(allTitles);
-        if (resolved.entry_ids.length > 0) {
-          // Batch response'larindan gelen entry_id'leri set'e cevir (dedup icin)
-          const existingIds = new Set(allEntryIds);
-          for (const id of resolved.entry_ids) {
-            if (!existingIds.has(id)) {
-              allEntryIds.push(id);
-              existingIds.add(id);
-            }
-          }
-        }
-      } catch {
-        // Kurtarma basarisiz — mevcut entry_id'lerle devam et
+    let job: IngestJobResponse | null = null;
+    try {
+      const created = await createIngestJob({
+        papers: papersToAdd,
+        search_query: lastSearchQuery,
+      });
+      if (created.status === 'error') {
+        throw new Error(created.message);
       }
+
+      // Job bitene kadar ilerlemeyi takip et
+      do {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+        job = await fetchIngestJob(created.job_id);
+        setAddAllProgress({ current: job.processed, total: job.total });
+      } while (job.status === 'queued' || job.status === 'running');
+    } catch {
+      setAddAllProgress(null);
+      toast.error('Toplu ekleme baslatilamadi');
+      return;
     }
 
+    if (!job) return;
+
+    const totalAdded = job.added_count;
+    const totalDuplicate = job.duplicate_count;
+    const totalFailed = job.failed_count + (job.total - job.processed);
+    const allEntryIds = job.entry_ids;
+    const allSavedIds = papersToAdd
+      .map((p) => p.external_id)
+      .filter((id): id is string => id !== null);
+
     setAddAllProgress(null);
 
     // Sonuc mesaji
@@ -230,10 +206,14 @@ export default function PaperList() {
     if (totalDuplicate > 0) parts.push(`${totalDuplicate} zaten kayitli`);
     if (totalFailed > 0) parts.push(`${totalFailed} basarisiz`);
     const message = parts.join(', ') || 'Islem tamamlandi';
-    toast.success(message);
+    if (job.status === 'failed') {
+      toast.error(`Toplu ekleme yarida kaldi: ${message}`);
+    } else {
+      toast.success(message);
+    }
 
     // State guncelle
-    if (allSavedIds.length > 0) {
+    if (allSavedIds.length > 0 && job.status === 'completed') {
       addSavedPaperIds(allSavedIds);
     }
     clearSelection();
@@ -319,7 +299,7 @@ export default function PaperList() {
             <DialogDescription>
               {totalResults} makale kutuphanenize eklenecek.
               {totalResults > 500 && (
-                <> Bu islem {Math.ceil(totalResults / BATCH_SIZE)} paket halinde gonderilecek ve biraz zaman alabilir.</>
+                <> Bu islem arka planda yapilacak ve biraz zaman alabilir.</>
               )}
               {' '}Devam etmek istiyor musunuz?
             </DialogDescription>
@@ -19,11 +19,6 @@ vi.mock('@/services/search', () => ({
   }),
 }))
 
-// Mock library service
-vi.mock('@/services/library', () => ({
-  checkLibraryPapers: vi.fn().mockResolvedValue({ saved_ids: [] }),
-}))
-
 function renderWithProviders() {
   const queryClient = new QueryClient({
     defaultOptions: { queries: { retry: false }, mutations: { retry: false } },
@@ -9,7 +9,6 @@ import { Search, Loader2 } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { searchPapers } from '@/services/search';
-import { checkLibraryPapers } from '@/services/library';
 import { useUIStore } from '@/stores/ui-store';
 import type { SearchFilters } from '@/types/api';
 
@@ -27,24 +26,17 @@ export default function SearchForm() {
       setSelectedPaperId(null);
       setLastSearchQuery(filters.query);
     },
-    onSuccess: async (data) => {
+    onSuccess: (data) => {
       setSearchResults(data.results);
       setSearchMeta(data.meta);
       setIsSearching(false);
 
-      // Kutuphanede kayitli makaleleri kontrol et
-      const externalIds = data.results
-        .map((p) => p.external_id)
-        .filter((id): id is string => id !== null && id.startsWith('10.'));
-
-      if (externalIds.length > 0) {
-        try {
-          const response = await checkLibraryPapers(externalIds);
-          setSavedPaperIds(response.saved_ids);
-        } catch {
-          // Check endpoint hatasi arama sonuclarini etkilemesin
-        }
-      }
+      // Kutuphanede kayitli makaleler backend tarafinda isaretlenir
+      setSavedPaperIds(
+        data.results
+          .filter((p) => p.in_library && p.external_id !== null)
+          .map((p) => p.external_id as string),
+      );
     },
     onError: () => {
       setSearchResults([]);
@@ -176,10 +176,14 @@ export default function Settings() {
   });
 
   const enrichMutation = useMutation({
-    mutationFn: () => enrichMetadata(20),
+    mutationFn: () => enrichMetadata(),
     onSuccess: (result) => {
+      if (result.status === 'error') {
+        toast.error(result.message);
+        return;
+      }
       toast.success(
-        `Metadata tamamlandi: ${result.updated} guncellendi, ${result.skipped} atlandi, ${result.failed} hata`
+        `Metadata tamamlama arka planda calisiyor (job #${result.job_id}): ${result.processed}/${result.total} islendi`
       );
       queryClient.invalidateQueries({ queryKey: ['library'] });
     },
@@ -504,6 +508,15 @@ export default function Settings() {
                       </div>
                     </div>
 
+                    {Object.keys(downloadStats.queues).length > 0 && (
+                      <p className="text-xs text-muted-foreground">
+                        Kuyrukta bekleyen:{' '}
+                        {Object.entries(downloadStats.queues)
+                          .map(([queue, depth]) => `${queue} ${depth}`)
+                          .join(' · ')}
+                      </p>
+                    )}
+
                     {(downloadStats.pending > 0 ||
                       downloadStats.downloading > 0 ||
                       downloadStats.failed > 0) && (
@@ -540,6 +553,22 @@ export default function Settings() {
                                     </span>
                                   )}
                                 </div>
+                                {entry.oa_location && (
+                                  <p className="text-xs text-muted-foreground truncate">
+                                    {entry.oa_location.url ? (
+                                      <a
+                                        href={entry.oa_location.url}
+                                        target="_blank"
+                                        rel="noopener noreferrer"
+                                        className="underline"
+                                      >
+                                        Acik erisim ({entry.oa_location.source})
+                                      </a>
+                                    ) : (
+                                      `Acik erisim bulunamadi (${entry.oa_location.source})`
+                                    )}
+                                  </p>
+                                )}
                               </div>
                             ))}
                           </div>
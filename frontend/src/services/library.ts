@@ -4,7 +4,7 @@
  */
 
 import api from '@/lib/api';
-import type { LibraryListResponse, IngestRequest, IngestResponse, BulkIngestRequest, BulkIngestResponse, CheckLibraryResponse, ResolveEntryIdsResponse } from '@/types/api';
+import type { LibraryListResponse, LibraryFacetsResponse, IngestRequest, IngestResponse, BulkIngestRequest, BulkIngestResponse, IngestJobCreateResponse, IngestJobResponse, CheckLibraryResponse, ResolveEntryIdsResponse } from '@/types/api';
 
 interface LibraryParams {
   page?: number;
@@ -16,6 +16,7 @@ interface LibraryParams {
   year_end?: number;
   search?: string;
   collection_id?: number;
+  cursor?: string;
 }
 
 /**
@@ -32,11 +33,31 @@ export async function fetchLibrary(params: LibraryParams = {}): Promise<LibraryL
   if (params.year_end != null) searchParams.set('year_end', String(params.year_end));
   if (params.search) searchParams.set('search', params.search);
   if (params.collection_id != null) searchParams.set('collection_id', String(params.collection_id));
+  if (params.cursor) searchParams.set('cursor', params.cursor);
 
   const query = searchParams.toString();
   return api.get<never, LibraryListResponse>(`/library${query ? `?${query}` : ''}`);
 }
 
+/**
+ * Filtrelere göre facet sayılarını getirir (yıl, etiket, durum, kaynak, koleksiyon)
+ */
+export async function fetchLibraryFacets(
+  params: Omit<LibraryParams, 'page' | 'limit' | 'cursor'> = {}
+): Promise<LibraryFacetsResponse> {
+  const searchParams = new URLSearchParams();
+  if (params.tag) searchParams.set('tag', params.tag);
+  if (params.status) searchParams.set('status', params.status);
+  if (params.min_citations != null) searchParams.set('min_citations', String(params.min_citations));
+  if (params.year_start != null) searchParams.set('year_start', String(params.year_start));
+  if (params.year_end != null) searchParams.set('year_end', String(params.year_end));
+  if (params.search) searchParams.set('search', params.search);
+  if (params.collection_id != null) searchParams.set('collection_id', String(params.collection_id));
+
+  const query = searchParams.toString();
+  return api.get<never, LibraryFacetsResponse>(`/library/facets${query ? `?${query}` : ''}`);
+}
+
 /**
  * Makaleyi kütüphaneye ekler
  */
@@ -51,6 +72,20 @@ export async function bulkIngestPapers(data: BulkIngestRequest): Promise<BulkIng
   return api.post<never, BulkIngestResponse>('/library/ingest/bulk', data);
 }
 
+/**
+ * Buyuk makale listelerini arka planda kutuphaneye ekleyen job baslatir
+ */
+export async function createIngestJob(data: BulkIngestRequest): Promise<IngestJobCreateResponse> {
+  return api.post<never, IngestJobCreateResponse>('/library/ingest-jobs', data);
+}
+
+/**
+ * Toplu ekleme job'inin ilerlemesini getirir
+ */
+export async function fetchIngestJob(jobId: number): Promise<IngestJobResponse> {
+  return api.get<never, IngestJobResponse>(`/library/ingest-jobs/${jobId}`);
+}
+
 /**
  * Verilen external_id'lerin kutuphanede kayitli olup olmadigini kontrol eder
  */
@@ -87,7 +122,15 @@ export interface DownloadStats {
     paper_id: number;
     title: string;
     updated_at: string | null;
+    /** Cache'lenmis Unpaywall/CORE sonucu; url null ise acik erisim bulunamadi */
+    oa_location: {
+      source: string;
+      url: string | null;
+      checked_at: string;
+    } | null;
   }>;
+  /** Celery kuyruklarinda bekleyen gorev sayisi; broker erisilemezse bos */
+  queues: Record<string, number>;
 }
 
 export async function fetchDownloadStats(): Promise<DownloadStats> {
@@ -97,23 +140,43 @@ export async function fetchDownloadStats(): Promise<DownloadStats> {
 export interface EnrichMetadataResponse {
   status: string;
   message: string;
+  job_id: number | null;
+  total: number;
   processed: number;
   updated: number;
   skipped: number;
   failed: number;
-  details: Array<{
-    entry_id: number;
-    paper_id: number;
-    status: string;
-    error?: string;
-  }>;
+}
+
+export interface EnrichmentJobResponse {
+  id: number;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  total: number;
+  processed: number;
+  updated: number;
+  skipped: number;
+  failed: number;
+  progress: number;
+  last_entry_id: number;
+  error_message: string | null;
+  created_at: string;
+  updated_at: string;
+  finished_at: string | null;
+}
+
+/**
+ * Kütüphanedeki eksik metadata alanlarını arka planda tamamlar (Celery job)
+ */
+export async function enrichMetadata(limit?: number): Promise<EnrichMetadataResponse> {
+  const query = limit ? `?limit=${limit}` : '';
+  return api.post<never, EnrichMetadataResponse>(`/library/enrich-metadata${query}`);
 }
 
 /**
- * Kütüphanedeki eksik metadata alanlarını tamamlar
+ * Metadata tamamlama job'inin ilerlemesini getirir
  */
-export async function enrichMetadata(limit = 20): Promise<EnrichMetadataResponse> {
-  return api.post<never, EnrichMetadataResponse>(`/library/enrich-metadata?limit=${limit}`);
+export async function fetchEnrichmentJob(jobId: number): Promise<EnrichmentJobResponse> {
+  return api.get<never, EnrichmentJobResponse>(`/library/enrich-metadata/jobs/${jobId}`);
 }
 
 /**
@@ -21,6 +21,8 @@ export interface PaperResponse {
   source: PaperSource;
   external_id: string | null;
   pdf_url: string | null;
+  identifiers?: Record<string, string>;
+  in_library?: boolean;
 }
 
 export interface SearchFilters {
@@ -97,8 +99,25 @@ export interface LibraryEntry {
 export interface LibraryListResponse {
   items: LibraryEntry[];
   total: number;
+  total_is_exact: boolean;
   page: number;
   limit: number;
+  next_cursor: string | null;
+}
+
+export interface FacetBucket {
+  value: number | string | null;
+  label: string | null;
+  count: number;
+}
+
+export interface LibraryFacetsResponse {
+  total: number;
+  years: FacetBucket[];
+  tags: FacetBucket[];
+  download_statuses: FacetBucket[];
+  sources: FacetBucket[];
+  collections: FacetBucket[];
 }
 
 export interface IngestRequest {
@@ -124,6 +143,29 @@ export interface BulkIngestResponse {
   entry_ids: number[];
 }
 
+export interface IngestJobCreateResponse {
+  status: string;
+  message: string;
+  job_id: number;
+  total: number;
+}
+
+export interface IngestJobResponse {
+  id: number;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  total: number;
+  processed: number;
+  added_count: number;
+  duplicate_count: number;
+  failed_count: number;
+  progress: number;
+  entry_ids: number[];
+  error_message: string | null;
+  created_at: string;
+  updated_at: string;
+  finished_at: string | null;
+}
+
 export interface CheckLibraryRequest {
   external_ids: string[];
 }